@@ -9,6 +9,7 @@ from flask_wtf.csrf import CSRFProtect
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_talisman import Talisman
+from app.page_cache import PageCache
 
 db = SQLAlchemy()
 migrate = Migrate()
@@ -24,6 +25,7 @@ limiter = Limiter(
 
 csrf = CSRFProtect()
 talisman = Talisman()
+page_cache = PageCache()
 
 
 def configure_logging(app):
@@ -82,6 +84,7 @@ def create_app(config_class=Config):
     login_manager.init_app(app)
     limiter.init_app(app)
     csrf.init_app(app)
+    page_cache.init_app(app)
 
     # Security headers via Talisman.
     # force_https and strict_transport_security are False because Render
@@ -114,6 +117,9 @@ def create_app(config_class=Config):
     from app import auth
     app.register_blueprint(auth.bp)
 
+    from app.statistics import stats_cli
+    app.cli.add_command(stats_cli)
+
     # Error handlers
     @app.errorhandler(404)
     def not_found_error(error):
@@ -2,13 +2,17 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request,
 from flask_login import login_user, logout_user, current_user, login_required
 from urllib.parse import urlparse
 from functools import wraps
-from app.models import User, Review, Judge, MediaLink, BannedUser, AdminLog, ContentFlag
+from app.models import User, Review, Judge, JudgeStats, MediaLink, BannedUser, AdminLog, ContentFlag, DailyActivity, UserStats
 from app.forms import LoginForm, RegistrationForm, FlagContentForm
 from flask_wtf.csrf import generate_csrf
-from app import db, limiter
+from app import db, limiter, page_cache
 
 bp = Blueprint('auth', __name__)
 
+ADMIN_ITEMS_PER_PAGE = 25
+FLAGS_PER_PAGE = 50
+USERS_PER_PAGE = 50
+
 
 # ============================================================================
 # DECORATOR FOR ADMIN-ONLY ROUTES
@@ -93,6 +97,7 @@ def register():
         user = User(username=form.username.data, email=form.email.data)
         user.set_password(form.password.data)
         db.session.add(user)
+        DailyActivity.record_user(user)
         db.session.commit()
         flash('Congratulations, you are now registered! Please log in.')
         return redirect(url_for('auth.login'))
@@ -136,18 +141,23 @@ def edit_review(review_id):
         return redirect(url_for('main.index'))
 
     form = ReviewForm()
-    from app.court_data import STATES, COURTS_BY_STATE
+    from app.court_data import STATES
+    from app.court_catalog import courts_for_state
     form.state.choices = STATES
-    form.court.choices = COURTS_BY_STATE.get(request.form.get('state', ''), [])
+    form.court.choices = courts_for_state(request.form.get('state', ''))
 
     if request.method == 'POST' and form.validate_on_submit():
+        previous = DailyActivity.review_deltas(review, sign=-1)
         review.rating = form.rating.data
         review.fairness_concern = form.fairness_concern.data
         review.bias_concern = form.bias_concern.data
         review.temperament_concern = form.temperament_concern.data
         review.review_text = form.review_text.data
         review.court_date = form.court_date.data
+        JudgeStats.refresh(review.judge_id)
+        DailyActivity.record_review(review, previous=previous)
         db.session.commit()
+        page_cache.invalidate_judge(review.judge_id)
 
         flash('Review updated successfully!')
         return redirect(url_for('auth.dashboard'))
@@ -157,8 +167,7 @@ def edit_review(review_id):
         form.judge_last_name.data = review.judge.last_name
         form.state.data = review.judge.state
 
-        if review.judge.state in COURTS_BY_STATE:
-            form.court.choices = COURTS_BY_STATE[review.judge.state]
+        form.court.choices = courts_for_state(review.judge.state)
 
         form.court.data = review.judge.court
         form.city.data = review.judge.city
@@ -170,7 +179,7 @@ def edit_review(review_id):
         form.review_text.data = review.review_text
         form.court_date.data = review.court_date
 
-    return render_template('edit_review.html', form=form, review=review, courts_by_state=COURTS_BY_STATE)
+    return render_template('edit_review.html', form=form, review=review)
 
 
 @bp.route('/delete_review/<int:review_id>', methods=['POST'])
@@ -182,8 +191,12 @@ def delete_review(review_id):
         flash('You can only delete your own reviews.')
         return redirect(url_for('main.index'))
 
+    DailyActivity.record_review(review, sign=-1)
     db.session.delete(review)
+    JudgeStats.refresh(review.judge_id)
+    UserStats.refresh(review.user_id)
     db.session.commit()
+    page_cache.invalidate_judge(review.judge_id)
 
     flash('Review deleted successfully.')
     return redirect(url_for('auth.dashboard'))
@@ -201,12 +214,13 @@ def edit_media_link(media_link_id):
         return redirect(url_for('main.index'))
 
     form = MediaLinkForm()
-    from app.court_data import STATES, COURTS_BY_STATE
+    from app.court_data import STATES
+    from app.court_catalog import courts_for_state
     form.state.choices = STATES
     form.court.choices = []
 
     if form.state.data:
-        form.court.choices = COURTS_BY_STATE.get(form.state.data, [])
+        form.court.choices = courts_for_state(form.state.data)
 
     if request.method == 'POST':
         if form.headline.data and form.news_source.data and form.url.data and form.publication_date.data and form.summary.data:
@@ -215,8 +229,12 @@ def edit_media_link(media_link_id):
             media_link.url = form.url.data
             media_link.publication_date = form.publication_date.data
             media_link.summary = form.summary.data
+            if media_link.is_verified:
+                DailyActivity.record_verification(media_link, sign=-1)
             media_link.is_verified = False
+            JudgeStats.refresh(media_link.judge_id)
             db.session.commit()
+            page_cache.invalidate_judge(media_link.judge_id)
 
             flash('Media link updated successfully! It will be re-verified by our team.')
             return redirect(url_for('auth.dashboard'))
@@ -236,7 +254,7 @@ def edit_media_link(media_link_id):
         form.publication_date.data = media_link.publication_date
         form.summary.data = media_link.summary
 
-    return render_template('edit_media_link.html', form=form, media_link=media_link, courts_by_state=COURTS_BY_STATE)
+    return render_template('edit_media_link.html', form=form, media_link=media_link)
 
 
 @bp.route('/delete_media_link/<int:media_link_id>', methods=['POST'])
@@ -248,8 +266,11 @@ def delete_media_link(media_link_id):
         flash('You can only delete your own media links.')
         return redirect(url_for('main.index'))
 
+    DailyActivity.record_media_link(media_link, sign=-1)
     db.session.delete(media_link)
+    JudgeStats.refresh(media_link.judge_id)
     db.session.commit()
+    page_cache.invalidate_judge(media_link.judge_id)
 
     flash('Media link deleted successfully.')
     return redirect(url_for('auth.dashboard'))
@@ -259,17 +280,25 @@ def delete_media_link(media_link_id):
 # ADMIN DASHBOARD ROUTES (Original Content Moderation)
 # ============================================================================
 
-@bp.route('/admin', methods=['GET', 'POST'])
+@bp.route('/admin')
 @admin_required
 def admin_dashboard():
     from app.forms import AdminSearchForm
+    from app.pagination import keyset_page
 
-    form = AdminSearchForm()
+    form = AdminSearchForm(request.args)
 
-    review_query = Review.query
-    media_query = MediaLink.query
+    # Judge and submitter are joined once and loaded into each row, instead
+    # of a lazy load per card; the same joins serve the name filters below
+    review_query = Review.query.join(Review.judge).outerjoin(Review.user).options(
+        db.contains_eager(Review.judge), db.contains_eager(Review.user)
+    )
+    media_query = MediaLink.query.join(MediaLink.judge).outerjoin(MediaLink.user).options(
+        db.contains_eager(MediaLink.judge), db.contains_eager(MediaLink.user)
+    )
+    sort_by = 'newest'
 
-    if form.validate_on_submit():
+    if form.validate():
         if form.search_judge.data:
             search_term = form.search_judge.data
             judge_filter = db.or_(
@@ -277,16 +306,16 @@ def admin_dashboard():
                 Judge.last_name.ilike(f'%{search_term}%'),
                 db.func.concat(Judge.first_name, ' ', Judge.last_name).ilike(f'%{search_term}%')
             )
-            review_query = review_query.join(Judge).filter(judge_filter)
-            media_query = media_query.join(Judge).filter(judge_filter)
+            review_query = review_query.filter(judge_filter)
+            media_query = media_query.filter(judge_filter)
 
         if form.search_content.data:
             review_query = review_query.filter(Review.review_text.ilike(f'%{form.search_content.data}%'))
             media_query = media_query.filter(MediaLink.summary.ilike(f'%{form.search_content.data}%'))
 
         if form.filter_username.data:
-            review_query = review_query.join(User).filter(User.username.ilike(f'%{form.filter_username.data}%'))
-            media_query = media_query.join(User).filter(User.username.ilike(f'%{form.filter_username.data}%'))
+            review_query = review_query.filter(User.username.ilike(f'%{form.filter_username.data}%'))
+            media_query = media_query.filter(User.username.ilike(f'%{form.filter_username.data}%'))
 
         if form.filter_rating.data:
             review_query = review_query.filter(Review.rating == int(form.filter_rating.data))
@@ -306,24 +335,33 @@ def admin_dashboard():
         elif form.filter_concerns.data == 'temperament':
             review_query = review_query.filter(Review.temperament_concern == True)
 
-        all_reviews = review_query.limit(100).all()
-        all_media_links = media_query.limit(100).all()
-
-        if form.sort_by.data == 'newest':
-            all_reviews.sort(key=lambda r: r.created_at, reverse=True)
-            all_media_links.sort(key=lambda m: m.created_at, reverse=True)
-        elif form.sort_by.data == 'oldest':
-            all_reviews.sort(key=lambda r: r.created_at)
-            all_media_links.sort(key=lambda m: m.created_at)
-        elif form.sort_by.data == 'rating_high':
-            all_reviews.sort(key=lambda r: r.rating, reverse=True)
-        elif form.sort_by.data == 'rating_low':
-            all_reviews.sort(key=lambda r: r.rating)
-    else:
-        all_reviews = review_query.order_by(Review.created_at.desc()).all()
-        all_media_links = media_query.order_by(MediaLink.created_at.desc()).all()
+        sort_by = form.sort_by.data
 
-    return render_template('admin_dashboard.html', reviews=all_reviews, media_links=all_media_links, form=form)
+    # Each list pages independently with seek cursors, sorted in SQL
+    review_page = keyset_page(review_query, _admin_sort_keys(Review, sort_by), per_page=ADMIN_ITEMS_PER_PAGE,
+                              after=request.args.get('reviews_after'), before=request.args.get('reviews_before'))
+    media_page = keyset_page(media_query, _admin_sort_keys(MediaLink, sort_by), per_page=ADMIN_ITEMS_PER_PAGE,
+                             after=request.args.get('media_after'), before=request.args.get('media_before'))
+
+    # Each list's page links carry the filters plus the other list's position
+    search_args = {field.name: field.data for field in form if field.name != 'admin_submit' and field.data}
+    review_link_args = dict(search_args, **{key: request.args[key] for key in ('media_after', 'media_before')
+                                            if request.args.get(key)})
+    media_link_args = dict(search_args, **{key: request.args[key] for key in ('reviews_after', 'reviews_before')
+                                           if request.args.get(key)})
+
+    return render_template('admin_dashboard.html', reviews=review_page.items, media_links=media_page.items,
+                           review_page=review_page, media_page=media_page, form=form,
+                           review_link_args=review_link_args, media_link_args=media_link_args)
+
+
+def _admin_sort_keys(model, sort_by):
+    """(expression, descending) keys for the admin dashboard lists; ratings only apply to reviews"""
+    if sort_by == 'oldest':
+        return [(model.created_at, False), (model.id, False)]
+    if model is Review and sort_by in ('rating_high', 'rating_low'):
+        return [(Review.rating, sort_by == 'rating_high'), (Review.created_at, True), (Review.id, True)]
+    return [(model.created_at, True), (model.id, True)]
 
 
 @bp.route('/admin/delete_review/<int:review_id>', methods=['POST'])
@@ -347,8 +385,12 @@ def admin_delete_review(review_id):
         except Exception as e:
             current_app.logger.error(f"Failed to send delete review notification: {str(e)}")
 
+    DailyActivity.record_review(review, sign=-1)
     db.session.delete(review)
+    JudgeStats.refresh(review.judge_id)
+    UserStats.refresh(review.user_id)
     db.session.commit()
+    page_cache.invalidate_judge(review.judge_id)
 
     flash('Review deleted by admin.')
     return redirect(url_for('auth.admin_dashboard'))
@@ -376,8 +418,11 @@ def admin_delete_media_link(media_link_id):
         except Exception as e:
             current_app.logger.error(f"Failed to send delete media link notification: {str(e)}")
 
+    DailyActivity.record_media_link(media_link, sign=-1)
     db.session.delete(media_link)
+    JudgeStats.refresh(media_link.judge_id)
     db.session.commit()
+    page_cache.invalidate_judge(media_link.judge_id)
 
     flash('Media link deleted by admin.')
     return redirect(url_for('auth.admin_dashboard'))
@@ -388,8 +433,10 @@ def admin_delete_media_link(media_link_id):
 def admin_approve_media_link(media_link_id):
     media_link = MediaLink.query.get_or_404(media_link_id)
     admin_message = request.form.get('admin_message', '').strip() or None
+    if not media_link.is_verified:
+        DailyActivity.record_verification(media_link)
     media_link.is_verified = True
-    db.session.commit()
+    JudgeStats.refresh(media_link.judge_id)
 
     AdminLog.log_action(
         admin_user=current_user,
@@ -398,6 +445,8 @@ def admin_approve_media_link(media_link_id):
         target_user=media_link.user if media_link.user else None,
         details=f'Approved media link {media_link_id} for judge {media_link.judge.full_name()}'
     )
+    db.session.commit()
+    page_cache.invalidate_judge(media_link.judge_id)
 
     if media_link.user:
         try:
@@ -433,8 +482,11 @@ def admin_reject_media_link(media_link_id):
         except Exception as e:
             current_app.logger.error(f"Failed to send reject notification: {str(e)}")
 
+    DailyActivity.record_media_link(media_link, sign=-1)
     db.session.delete(media_link)
+    JudgeStats.refresh(media_link.judge_id)
     db.session.commit()
+    page_cache.invalidate_judge(media_link.judge_id)
 
     flash('Media link rejected and deleted.')
     return redirect(url_for('auth.admin_dashboard'))
@@ -445,26 +497,11 @@ def admin_reject_media_link(media_link_id):
 def admin_delete_judge(judge_id):
     judge = Judge.query.get_or_404(judge_id)
     judge_name = judge.full_name()
-    court = judge.court
-
-    media_links = MediaLink.query.filter_by(judge_id=judge_id).all()
-    for ml in media_links:
-        ContentFlag.query.filter_by(media_link_id=ml.id).delete()
-        AdminLog.query.filter_by(target_media_link_id=ml.id).update({'target_media_link_id': None})
-        db.session.delete(ml)
-
-    for review in judge.reviews.all():
-        ContentFlag.query.filter_by(review_id=review.id).delete()
-        AdminLog.query.filter_by(target_review_id=review.id).update({'target_review_id': None})
-
-    AdminLog.log_action(
-        admin_user=current_user,
-        action_type='delete_judge',
-        details=f'Deleted judge {judge_name} (ID: {judge_id}, Court: {court})'
-    )
 
-    db.session.delete(judge)
+    from app.moderation import delete_judge
+    delete_judge(current_user, judge)
     db.session.commit()
+    page_cache.invalidate_judge(judge_id)
 
     flash(f'{judge_name} and all associated content has been permanently deleted.')
     return redirect(url_for('main.index'))
@@ -478,18 +515,35 @@ def admin_delete_judge(judge_id):
 @admin_required
 def manage_users():
     """View all users with sorting and filtering options"""
-    sort_by = request.args.get('sort', 'username_asc')
-    filter_status = request.args.get('status', 'all')
-    search_query = request.args.get('search', '')
+    from datetime import datetime
+    from app.pagination import keyset_page
+
+    sort_by = request.args.get('sort_by', 'username_asc')
+    filter_status = request.args.get('status', '')
+    search_query = request.args.get('search_query', '')
+
+    # Review counts come from user_stats; media counts are grouped once over
+    # media_link and joined in, so a page is a single query at any user count
+    media = db.session.query(
+        MediaLink.user_id.label('user_id'),
+        db.func.count(MediaLink.id).label('media_link_count'),
+        db.func.sum(db.case((MediaLink.is_verified == True, 1), else_=0)).label('verified_media_count')
+    ).filter(MediaLink.user_id.isnot(None)).group_by(MediaLink.user_id).subquery()
+
+    review_count = db.func.coalesce(UserStats.review_count, 0)
+    media_link_count = db.func.coalesce(media.c.media_link_count, 0)
+    verified_media_count = db.func.coalesce(media.c.verified_media_count, 0)
 
-    query = User.query
+    query = db.session.query(User, review_count, media_link_count, verified_media_count).outerjoin(
+        UserStats, UserStats.user_id == User.id
+    ).outerjoin(media, media.c.user_id == User.id)
 
     if filter_status == 'active':
-        query = query.filter_by(is_banned=False, is_admin=False)
+        query = query.filter(User.is_banned == False, User.is_admin == False)
     elif filter_status == 'banned':
-        query = query.filter_by(is_banned=True)
+        query = query.filter(User.is_banned == True)
     elif filter_status == 'admin':
-        query = query.filter_by(is_admin=True)
+        query = query.filter(User.is_admin == True)
 
     if search_query:
         search_term = f'%{search_query}%'
@@ -500,40 +554,43 @@ def manage_users():
             )
         )
 
-    users = query.limit(100).all()
-
-    user_data = []
-    for user in users:
-        user_data.append({
-            'user': user,
-            'review_count': user.get_review_count(),
-            'media_link_count': user.get_media_link_count(),
-            'verified_media_count': user.get_verified_media_count(),
-        })
-
-    if sort_by == 'username_asc':
-        user_data.sort(key=lambda x: x['user'].username.lower())
-    elif sort_by == 'username_desc':
-        user_data.sort(key=lambda x: x['user'].username.lower(), reverse=True)
-    elif sort_by == 'email_asc':
-        user_data.sort(key=lambda x: x['user'].email.lower())
-    elif sort_by == 'join_date_desc':
-        user_data.sort(key=lambda x: x['user'].created_at, reverse=True)
-    elif sort_by == 'join_date_asc':
-        user_data.sort(key=lambda x: x['user'].created_at)
-    elif sort_by == 'reviews_desc':
-        user_data.sort(key=lambda x: x['review_count'], reverse=True)
-    elif sort_by == 'media_desc':
-        user_data.sort(key=lambda x: x['media_link_count'], reverse=True)
-    elif sort_by == 'last_activity_desc':
-        from datetime import datetime
-        user_data.sort(key=lambda x: x['user'].last_activity or datetime.min, reverse=True)
+    # (expression, descending) keys per sort option, each ending on the primary
+    # key so keyset cursors are unique; never-active users sort last
+    sort_keys = {
+        'username_asc': [(db.func.lower(User.username), False), (User.id, False)],
+        'username_desc': [(db.func.lower(User.username), True), (User.id, True)],
+        'email_asc': [(db.func.lower(User.email), False), (User.id, False)],
+        'joined_desc': [(User.created_at, True), (User.id, True)],
+        'joined_asc': [(User.created_at, False), (User.id, False)],
+        'reviews_desc': [(review_count, True), (User.id, False)],
+        'media_desc': [(media_link_count, True), (User.id, False)],
+        'last_activity_desc': [(db.func.coalesce(User.last_activity, datetime.min), True), (User.id, True)],
+    }
+    if sort_by not in sort_keys:
+        sort_by = 'username_asc'
+
+    page = keyset_page(query, sort_keys[sort_by], per_page=USERS_PER_PAGE,
+                       after=request.args.get('after'), before=request.args.get('before'))
+
+    user_data = [{
+        'user': user,
+        'review_count': reviews,
+        'media_link_count': media_links,
+        'verified_media_count': verified_media,
+    } for user, reviews, media_links, verified_media in page.items]
+
+    # Page links keep the current filters
+    list_args = {key: value for key, value in (('search_query', search_query), ('status', filter_status),
+                                               ('sort_by', sort_by)) if value}
 
     return render_template('admin_users.html',
                            user_data=user_data,
                            sort_by=sort_by,
-                           filter_status=filter_status,
-                           search_query=search_query)
+                           status=filter_status,
+                           search_query=search_query,
+                           list_args=list_args,
+                           next_cursor=page.next_cursor,
+                           prev_cursor=page.prev_cursor)
 
 
 @bp.route('/admin/user/<int:user_id>')
@@ -578,6 +635,7 @@ def ban_user(user_id):
             target_user=user,
             details=f'Banned user {user.username} ({user.email}). Reason: {ban_reason}'
         )
+        db.session.commit()
 
         try:
             from app.email_utils import send_user_account_notification
@@ -610,6 +668,7 @@ def unban_user(user_id):
         target_user=user,
         details=f'Unbanned user {user.username} ({user.email})'
     )
+    db.session.commit()
 
     admin_message = request.form.get('admin_message', '').strip() or None
 
@@ -639,20 +698,12 @@ def delete_user(user_id):
             return redirect(url_for('auth.manage_users'))
 
         username = user.username
-        email = user.email
-
-        if not user.is_banned:
-            delete_reason = request.form.get('delete_reason', 'Account deleted by admin')
-            user.ban(current_user, delete_reason)
 
-        AdminLog.log_action(
-            admin_user=current_user,
-            action_type='delete_user',
-            target_user=user,
-            details=f'Deleted user {username} ({email})'
-        )
-
-        db.session.delete(user)
+        # Same path as bulk deletion: ban, log, adjust daily counts and clear
+        # every reference to the account, committed together
+        from app.moderation import bulk_delete
+        delete_reason = request.form.get('delete_reason', 'Account deleted by admin')
+        bulk_delete(current_user, [user], delete_reason)
         db.session.commit()
 
         flash(f'User {username} has been permanently deleted.')
@@ -677,7 +728,6 @@ def add_admin_note(user_id):
 
         admin_note = request.form.get('admin_note', '')
         user.admin_notes = admin_note
-        db.session.commit()
 
         AdminLog.log_action(
             admin_user=current_user,
@@ -685,6 +735,7 @@ def add_admin_note(user_id):
             target_user=user,
             details=f'Updated admin notes for {user.username}'
         )
+        db.session.commit()
 
         flash('Admin notes updated.')
         return redirect(url_for('auth.view_user_activity', user_id=user.id))
@@ -730,56 +781,49 @@ def bulk_actions():
         flash('You cannot perform bulk actions on yourself.')
         return redirect(url_for('auth.manage_users'))
 
+    from app.moderation import bulk_ban, bulk_unban, bulk_delete
+    from app.email_utils import user_account_notification
+
     users = User.query.filter(User.id.in_(user_ids)).all()
 
     if any(user.is_admin for user in users):
         flash('Bulk actions cannot be performed on administrators.')
         return redirect(url_for('auth.manage_users'))
 
+    # Each action is a few set-based statements committed together; account
+    # notifications are built first and sent as one batch after the commit
     if action == 'ban':
         ban_reason = request.form.get('bulk_ban_reason', 'Bulk ban by admin')
-        for user in users:
-            if not user.is_banned:
-                user.ban(current_user, ban_reason)
-                AdminLog.log_action(
-                    admin_user=current_user,
-                    action_type='ban_user',
-                    target_user=user,
-                    details=f'Bulk banned user. Reason: {ban_reason}'
-                )
-        flash(f'{len(users)} user(s) have been banned.')
+        banned = bulk_ban(current_user, users, ban_reason)
+        emails = [user_account_notification(user, 'banned') for user in banned]
+        db.session.commit()
+        _send_bulk_notifications(emails)
+        flash(f'{len(banned)} user(s) have been banned.')
 
     elif action == 'unban':
-        for user in users:
-            if user.is_banned:
-                user.unban()
-                AdminLog.log_action(
-                    admin_user=current_user,
-                    action_type='unban_user',
-                    target_user=user,
-                    details='Bulk unbanned user'
-                )
+        unbanned = bulk_unban(current_user, users)
+        emails = [user_account_notification(user, 'unbanned') for user in unbanned]
         db.session.commit()
-        flash(f'{len(users)} user(s) have been unbanned.')
+        _send_bulk_notifications(emails)
+        flash(f'{len(unbanned)} user(s) have been unbanned.')
 
     elif action == 'delete':
         delete_reason = request.form.get('bulk_delete_reason', 'Bulk delete by admin')
-        for user in users:
-            if not user.is_banned:
-                user.ban(current_user, delete_reason)
-            AdminLog.log_action(
-                admin_user=current_user,
-                action_type='delete_user',
-                target_user=user,
-                details=f'Bulk deleted user'
-            )
-            db.session.delete(user)
+        deleted = bulk_delete(current_user, users, delete_reason)
         db.session.commit()
-        flash(f'{len(users)} user(s) have been deleted.')
+        flash(f'{len(deleted)} user(s) have been deleted.')
 
     return redirect(url_for('auth.manage_users'))
 
 
+def _send_bulk_notifications(emails):
+    try:
+        from app.email_utils import send_emails
+        send_emails(emails)
+    except Exception as e:
+        current_app.logger.error(f"Failed to send bulk notifications: {str(e)}")
+
+
 @bp.route('/flag/review/<int:review_id>', methods=['GET', 'POST'])
 @login_required
 def flag_review(review_id):
@@ -878,14 +922,33 @@ def flag_media_link(media_link_id):
 @admin_required
 def moderation_queue():
     """View all flagged content"""
+    from app.pagination import keyset_page
+
     show_resolved = request.args.get('show_resolved', 'false') == 'true'
 
-    if show_resolved:
-        flags = ContentFlag.query.order_by(ContentFlag.created_at.desc()).limit(500).all()
-    else:
-        flags = ContentFlag.query.filter_by(is_resolved=False).order_by(ContentFlag.created_at.desc()).limit(500).all()
+    # The template walks flagger, resolver, the flagged content, its judge and
+    # its author for every card; load the whole graph up front so a page is a
+    # fixed number of queries: flags with their users, then reviews and media
+    # links (each with judge and author) batched by id
+    query = ContentFlag.query.options(
+        db.joinedload(ContentFlag.flagger),
+        db.joinedload(ContentFlag.resolved_by),
+        db.selectinload(ContentFlag.review).options(db.joinedload(Review.judge), db.joinedload(Review.user)),
+        db.selectinload(ContentFlag.media_link).options(db.joinedload(MediaLink.judge), db.joinedload(MediaLink.user))
+    )
+    if not show_resolved:
+        query = query.filter(ContentFlag.is_resolved == False)
+
+    page = keyset_page(
+        query,
+        [(ContentFlag.created_at, True), (ContentFlag.id, True)],
+        per_page=FLAGS_PER_PAGE,
+        after=request.args.get('after'),
+        before=request.args.get('before')
+    )
 
-    return render_template('moderation_queue.html', flags=flags, show_resolved=show_resolved)
+    return render_template('moderation_queue.html', flags=page.items, show_resolved=show_resolved,
+                           next_cursor=page.next_cursor, prev_cursor=page.prev_cursor)
 
 
 @bp.route('/admin/flag/<int:flag_id>/dismiss', methods=['GET', 'POST'])
@@ -898,13 +961,13 @@ def dismiss_flag(flag_id):
     flag.resolved_by_id = current_user.id
     flag.resolved_at = db.func.now()
     flag.resolution_action = 'dismissed'
-    db.session.commit()
 
     AdminLog.log_action(
         admin_user=current_user,
         action_type='dismiss_flag',
         details=f'Dismissed {flag.flag_type} flag on {"review" if flag.review_id else "media link"}'
     )
+    db.session.commit()
 
     flash('Flag dismissed.')
     return redirect(url_for('auth.moderation_queue'))
@@ -919,6 +982,7 @@ def flag_action(flag_id):
     admin_message = request.form.get('admin_message', '').strip() or None
 
     if action == 'delete_content':
+        affected_judge_id = None
         if flag.review_id:
             review = Review.query.get(flag.review_id)
             if review:
@@ -929,7 +993,11 @@ def flag_action(flag_id):
                                                               admin_message)
                     except Exception as e:
                         current_app.logger.error(f"Failed to send delete notification: {str(e)}")
+                DailyActivity.record_review(review, sign=-1)
                 db.session.delete(review)
+                JudgeStats.refresh(review.judge_id)
+                UserStats.refresh(review.user_id)
+                affected_judge_id = review.judge_id
                 flag.resolution_action = 'content_deleted'
                 AdminLog.log_action(current_user, 'delete_review', target_review=review)
         elif flag.media_link_id:
@@ -942,7 +1010,10 @@ def flag_action(flag_id):
                                                               admin_message)
                     except Exception as e:
                         current_app.logger.error(f"Failed to send delete notification: {str(e)}")
+                DailyActivity.record_media_link(media_link, sign=-1)
                 db.session.delete(media_link)
+                JudgeStats.refresh(media_link.judge_id)
+                affected_judge_id = media_link.judge_id
                 flag.resolution_action = 'content_deleted'
                 AdminLog.log_action(current_user, 'delete_media_link', target_media_link=media_link)
 
@@ -950,6 +1021,8 @@ def flag_action(flag_id):
         flag.resolved_by_id = current_user.id
         flag.resolved_at = db.func.now()
         db.session.commit()
+        if affected_judge_id:
+            page_cache.invalidate_judge(affected_judge_id)
         flash('Flagged content deleted.')
 
     elif action == 'ban_user':
@@ -1010,6 +1083,7 @@ def unban_from_flag(flag_id):
         target_user=user,
         details=f'Unbanned {user.username} from flag {flag.id} ({flag.flag_type})'
     )
+    db.session.commit()
 
     # Send notification email
     try:
@@ -1030,7 +1104,8 @@ def unban_from_flag(flag_id):
 def admin_statistics():
     """Comprehensive admin statistics dashboard"""
     from datetime import datetime, timedelta
-    from sqlalchemy import func, and_
+    from app.statistics import latest_snapshot, refresh_snapshot, snapshot_context, growth_metrics
+    from app.leaderboards import parse_top_n, leaderboards
 
     # Get date range parameters (default to last 8 weeks)
     start_date_str = request.args.get('start_date')
@@ -1047,277 +1122,65 @@ def admin_statistics():
         start_date = datetime.now() - timedelta(weeks=8)
         end_date = datetime.now()
 
-    # Get adjustable list size parameters
-    top_n = int(request.args.get('top_n', 10))
-
-    # ========== SUMMARY STATS ==========
-    total_users = User.query.filter_by(is_banned=False).count()
-    total_reviews = Review.query.count()
-    total_media_links = MediaLink.query.count()
-    pending_verifications = MediaLink.query.filter_by(is_verified=False).count()
-
-    # Overall average rating
-    avg_rating_result = db.session.query(func.avg(Review.rating)).scalar()
-    overall_avg_rating = round(avg_rating_result, 2) if avg_rating_result else 0
-
-    # Total concern flags
-    total_concerns = Review.query.filter(
-        db.or_(
-            Review.fairness_concern == True,
-            Review.bias_concern == True,
-            Review.temperament_concern == True
-        )
-    ).count()
-
-    # ========== GROWTH METRICS ==========
-    # Reviews in date range
-    reviews_in_range = Review.query.filter(
-        Review.created_at >= start_date,
-        Review.created_at <= end_date
-    ).count()
-
-    # Media links in date range
-    media_in_range = MediaLink.query.filter(
-        MediaLink.created_at >= start_date,
-        MediaLink.created_at <= end_date
-    ).count()
-
-    # New users in date range
-    users_in_range = User.query.filter(
-        User.created_at >= start_date,
-        User.created_at <= end_date
-    ).count()
-
-    # Judges who received first review in range
-    new_reviewed_judges = db.session.query(Judge.id).join(Review).group_by(Judge.id).having(
-        func.min(Review.created_at) >= start_date,
-        func.min(Review.created_at) <= end_date
-    ).count()
-
-    # Active contributors in date range
-    active_contributors = db.session.query(func.count(func.distinct(Review.user_id))).filter(
-        Review.created_at >= start_date,
-        Review.created_at <= end_date
-    ).scalar() or 0
-
-    # Verifications completed in range
-    verifications_in_range = MediaLink.query.filter(
-        MediaLink.is_verified == True,
-        MediaLink.created_at >= start_date,
-        MediaLink.created_at <= end_date
-    ).count()
-
-    # ========== TOP LISTS ==========
-    # Most reviewed judges
-    most_reviewed = db.session.query(
-        Judge,
-        func.count(Review.id).label('review_count')
-    ).join(Review).group_by(Judge.id).order_by(
-        func.count(Review.id).desc()
-    ).limit(top_n).all()
-
-    # Most documented judges (by verified media links)
-    most_documented = db.session.query(
-        Judge,
-        func.count(MediaLink.id).label('media_count')
-    ).join(MediaLink).filter(
-        MediaLink.is_verified == True
-    ).group_by(Judge.id).order_by(
-        func.count(MediaLink.id).desc()
-    ).limit(top_n).all()
-
-    # Highest rated judges (min 3 reviews)
-    highest_rated = db.session.query(
-        Judge,
-        func.avg(Review.rating).label('avg_rating'),
-        func.count(Review.id).label('review_count')
-    ).join(Review).group_by(Judge.id).having(
-        func.count(Review.id) >= 3
-    ).order_by(func.avg(Review.rating).desc()).limit(top_n).all()
-
-    # Lowest rated judges (min 3 reviews)
-    lowest_rated = db.session.query(
-        Judge,
-        func.avg(Review.rating).label('avg_rating'),
-        func.count(Review.id).label('review_count')
-    ).join(Review).group_by(Judge.id).having(
-        func.count(Review.id) >= 3
-    ).order_by(func.avg(Review.rating).asc()).limit(top_n).all()
-
-    # Most concerning judges
-    most_concerning = db.session.query(
-        Judge,
-        func.count(Review.id).label('concern_count')
-    ).join(Review).filter(
-        db.or_(
-            Review.fairness_concern == True,
-            Review.bias_concern == True,
-            Review.temperament_concern == True
-        )
-    ).group_by(Judge.id).order_by(
-        func.count(Review.id).desc()
-    ).limit(top_n).all()
-
-    # Most active users
-    most_active_users = db.session.query(
-        User,
-        func.count(Review.id).label('review_count')
-    ).join(Review).group_by(User.id).order_by(
-        func.count(Review.id).desc()
-    ).limit(top_n).all()
-
-    # Most flagged content
-    most_flagged = ContentFlag.query.filter_by(
-        is_resolved=False
-    ).order_by(ContentFlag.created_at.desc()).limit(top_n).all()
-
-    # ========== GEOGRAPHIC DISTRIBUTION ==========
-    judges_by_state = db.session.query(
-        Judge.state,
-        func.count(Judge.id).label('judge_count'),
-        func.count(Review.id).label('review_count'),
-        func.count(MediaLink.id).label('media_count')
-    ).outerjoin(Review).outerjoin(MediaLink).group_by(
-        Judge.state
-    ).order_by(Judge.state).all()
-
-    # ========== RATING DISTRIBUTION ==========
-    rating_dist = db.session.query(
-        Review.rating,
-        func.count(Review.id).label('count')
-    ).group_by(Review.rating).order_by(Review.rating).all()
-
-    rating_distribution = {i: 0 for i in range(1, 6)}
-    for rating, count in rating_dist:
-        rating_distribution[rating] = count
-
-    # ========== CONCERN TYPE BREAKDOWN ==========
-    fairness_count = Review.query.filter_by(fairness_concern=True).count()
-    bias_count = Review.query.filter_by(bias_concern=True).count()
-    temperament_count = Review.query.filter_by(temperament_concern=True).count()
-
-    concern_breakdown = {
-        'fairness': fairness_count,
-        'bias': bias_count,
-        'temperament': temperament_count
-    }
-
-    # Reviews with any concern
-    reviews_with_concerns = Review.query.filter(
-        db.or_(
-            Review.fairness_concern == True,
-            Review.bias_concern == True,
-            Review.temperament_concern == True
-        )
-    ).count()
-
-    # Multiple concerns (reviews with 2+ concern types)
-    multiple_concerns = Review.query.filter(
-        db.or_(
-            db.and_(Review.fairness_concern == True, Review.bias_concern == True),
-            db.and_(Review.fairness_concern == True, Review.temperament_concern == True),
-            db.and_(Review.bias_concern == True, Review.temperament_concern == True)
-        )
-    ).count()
-
-    # ========== TEMPORAL TRENDS (Last 12 months) ==========
-    twelve_months_ago = datetime.now() - timedelta(days=365)
+    # Get adjustable list size parameters (clamped to the supported range)
+    top_n = parse_top_n(request.args.get('top_n'))
 
-    # Reviews per month
-    reviews_by_month = db.session.query(
-        func.strftime('%Y-%m', Review.created_at).label('month'),
-        func.count(Review.id).label('count')
-    ).filter(Review.created_at >= twelve_months_ago).group_by('month').all()
+    # Totals and distributions come from the latest precomputed snapshot (the
+    # first visit, or a schema change, computes one); leaderboards and growth
+    # metrics are read from the incrementally maintained aggregate tables
+    snapshot = latest_snapshot() or refresh_snapshot(current_user)
 
-    # Media links per month
-    media_by_month = db.session.query(
-        func.strftime('%Y-%m', MediaLink.created_at).label('month'),
-        func.count(MediaLink.id).label('count')
-    ).filter(MediaLink.created_at >= twelve_months_ago).group_by('month').all()
-
-    # ========== FEDERAL VS STATE COMPARISON ==========
-    federal_count = Judge.query.filter_by(is_federal=True).count()
-    state_count = Judge.query.filter_by(is_federal=False).count()
-
-    federal_avg_rating = db.session.query(
-        func.avg(Review.rating)
-    ).join(Judge).filter(Judge.is_federal == True).scalar()
-
-    state_avg_rating = db.session.query(
-        func.avg(Review.rating)
-    ).join(Judge).filter(Judge.is_federal == False).scalar()
+    return render_template(
+        'admin_statistics.html',
+        snapshot=snapshot,
+        start_date=start_date,
+        end_date=end_date,
+        top_n=top_n,
+        # Judge page cache counters
+        page_cache_stats=page_cache.stats(),
+        **snapshot_context(snapshot),
+        **leaderboards(top_n),
+        **growth_metrics(start_date, end_date)
+    )
 
-    federal_review_count = db.session.query(
-        func.count(Review.id)
-    ).join(Judge).filter(Judge.is_federal == True).scalar()
 
-    state_review_count = db.session.query(
-        func.count(Review.id)
-    ).join(Judge).filter(Judge.is_federal == False).scalar()
+@bp.route('/admin/statistics/refresh', methods=['POST'])
+@admin_required
+def admin_refresh_statistics():
+    """Recompute the statistics snapshot on demand"""
+    from app.statistics import refresh_snapshot
+    snapshot = refresh_snapshot(current_user)
+    flash(f'Statistics refreshed at {snapshot.computed_at.strftime("%b %d, %Y %H:%M")} UTC.')
+    return redirect(request.referrer or url_for('auth.admin_statistics'))
 
-    # ========== RETIRED VS ACTIVE COMPARISON ==========
-    retired_count = Judge.query.filter_by(is_retired=True).count()
-    active_count = Judge.query.filter_by(is_retired=False).count()
 
-    retired_avg_rating = db.session.query(
-        func.avg(Review.rating)
-    ).join(Judge).filter(Judge.is_retired == True).scalar()
+@bp.route('/admin/export/<dataset>.<fmt>')
+@admin_required
+def admin_export(dataset, fmt):
+    """Stream a full table export as CSV or NDJSON"""
+    from datetime import datetime
+    from flask import Response, abort, stream_with_context
+    from app.exports import DATASETS, FORMATS, export_chunks
 
-    active_avg_rating = db.session.query(
-        func.avg(Review.rating)
-    ).join(Judge).filter(Judge.is_retired == False).scalar()
+    if dataset not in DATASETS or fmt not in FORMATS:
+        abort(404)
 
-    return render_template(
-        'admin_statistics.html',
-        # Summary stats
-        total_users=total_users,
-        total_reviews=total_reviews,
-        total_media_links=total_media_links,
-        pending_verifications=pending_verifications,
-        overall_avg_rating=overall_avg_rating,
-        total_concerns=total_concerns,
-        # Growth metrics
-        start_date=start_date,
-        end_date=end_date,
-        reviews_in_range=reviews_in_range,
-        media_in_range=media_in_range,
-        users_in_range=users_in_range,
-        # Top lists
-        top_n=top_n,
-        most_reviewed=most_reviewed,
-        most_documented=most_documented,
-        highest_rated=highest_rated,
-        lowest_rated=lowest_rated,
-        most_concerning=most_concerning,
-        most_active_users=most_active_users,
-        most_flagged=most_flagged,
-        # Geographic
-        judges_by_state=judges_by_state,
-        # Rating distribution
-        rating_distribution=rating_distribution,
-        # Concern breakdown
-        concern_breakdown=concern_breakdown,
-        # Temporal trends
-        reviews_by_month=reviews_by_month,
-        media_by_month=media_by_month,
-        # Comparisons
-        federal_count=federal_count,
-        state_count=state_count,
-        federal_avg_rating=round(federal_avg_rating, 2) if federal_avg_rating else 0,
-        state_avg_rating=round(state_avg_rating, 2) if state_avg_rating else 0,
-        federal_review_count=federal_review_count or 0,
-        state_review_count=state_review_count or 0,
-        retired_count=retired_count,
-        active_count=active_count,
-        retired_avg_rating=round(retired_avg_rating, 2) if retired_avg_rating else 0,
-        active_avg_rating=round(active_avg_rating, 2) if active_avg_rating else 0,
-        new_reviewed_judges=new_reviewed_judges,
-        reviews_with_concerns=reviews_with_concerns,
-        active_contributors=active_contributors,
-        verifications_in_range=verifications_in_range,
-        multiple_concerns=multiple_concerns
+    # The export itself writes nothing, so commit the entry on its own
+    AdminLog.log_action(
+        admin_user=current_user,
+        action_type='export_data',
+        details=f'Exported {dataset} as {fmt}',
+        sync=True
     )
 
+    # The generator runs after this view returns, so it needs the request
+    # (and with it the database session) kept alive while it streams
+    filename = f'judgeaccount-{dataset}-{datetime.utcnow():%Y%m%d-%H%M%S}.{fmt}'
+    response = Response(stream_with_context(export_chunks(dataset, fmt)), mimetype=FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
 
 @bp.route('/reset_password_request', methods=['GET', 'POST'])
 @limiter.limit("5 per minute")
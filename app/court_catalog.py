@@ -0,0 +1,93 @@
+import bisect
+import hashlib
+import json
+import os
+import threading
+
+# Court names per state, one JSON object keyed by state code. Edit this file
+# to add or rename courts; everything below is derived from it on first use.
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'courts.json')
+
+_catalog = None
+_lock = threading.Lock()
+
+
+class _CourtCatalog:
+    """Lookup structures built once from the packed catalog file"""
+
+    def __init__(self, raw):
+        data = json.loads(raw)
+        self.version = hashlib.sha1(raw).hexdigest()[:12]
+        self.courts_by_state = {state: tuple(courts) for state, courts in data.items()}
+        self.valid_pairs = frozenset(
+            (state, court) for state, courts in self.courts_by_state.items() for court in courts
+        )
+        self.json_by_state = {
+            state: json.dumps(courts, separators=(',', ':')) for state, courts in self.courts_by_state.items()
+        }
+
+        # Sorted (lowercase name, name) pairs for bisect-based prefix search
+        names = {court for courts in self.courts_by_state.values() for court in courts}
+        self.search_index = sorted((name.lower(), name) for name in names)
+        self.search_keys = [key for key, _ in self.search_index]
+
+
+def _get_catalog():
+    global _catalog
+    if _catalog is None:
+        with _lock:
+            if _catalog is None:
+                with open(CATALOG_PATH, 'rb') as f:
+                    _catalog = _CourtCatalog(f.read())
+    return _catalog
+
+
+def courts_for_state(state):
+    """
+    Court choices for a state, in display order.
+
+    Returns:
+        list: (value, label) pairs for a SelectField; empty for unknown states
+    """
+    return [(court, court) for court in _get_catalog().courts_by_state.get(state, ())]
+
+
+def is_valid_court(state, court):
+    """Whether the court is one of the listed courts for the state"""
+    return (state, court) in _get_catalog().valid_pairs
+
+
+def search_courts(prefix, state=None, limit=10):
+    """
+    Court names starting with a prefix (case-insensitive), alphabetically.
+
+    Args:
+        prefix (str): Leading characters of the court name
+        state (str, optional): Only return courts listed for this state
+        limit (int): Maximum number of names to return
+
+    Returns:
+        list: Matching court names
+    """
+    catalog = _get_catalog()
+    prefix = prefix.lower()
+    results = []
+    i = bisect.bisect_left(catalog.search_keys, prefix)
+    while i < len(catalog.search_index) and len(results) < limit:
+        key, name = catalog.search_index[i]
+        if not key.startswith(prefix):
+            break
+        if state is None or (state, name) in catalog.valid_pairs:
+            results.append(name)
+        i += 1
+    return results
+
+
+def courts_json(state):
+    """Pre-serialized JSON list of a state's court names, or None for unknown states"""
+    return _get_catalog().json_by_state.get(state)
+
+
+def catalog_version():
+    """Short hash of the catalog file, used to version long-cached URLs"""
+    return _get_catalog().version
@@ -38,4951 +38,5 @@ STATES = [
     ('WY', 'Wyoming')
 ]
 
-ALABAMA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eleventh Circuit', 'U.S. Court of Appeals for the Eleventh Circuit'),
-    ('Alabama Supreme Court', 'Alabama Supreme Court'),
-    ('Alabama Court of Criminal Appeals', 'Alabama Court of Criminal Appeals'),
-    ('U.S. District Court for the Northern District of Alabama', 'U.S. District Court for the Northern District of Alabama'),
-    ('U.S. District Court for the Middle District of Alabama', 'U.S. District Court for the Middle District of Alabama'),
-    ('U.S. District Court for the Southern District of Alabama', 'U.S. District Court for the Southern District of Alabama'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('31st Judicial Circuit Court', '31st Judicial Circuit Court'),
-    ('32nd Judicial Circuit Court', '32nd Judicial Circuit Court'),
-    ('33rd Judicial Circuit Court', '33rd Judicial Circuit Court'),
-    ('34th Judicial Circuit Court', '34th Judicial Circuit Court'),
-    ('35th Judicial Circuit Court', '35th Judicial Circuit Court'),
-    ('36th Judicial Circuit Court', '36th Judicial Circuit Court'),
-    ('37th Judicial Circuit Court', '37th Judicial Circuit Court'),
-    ('38th Judicial Circuit Court', '38th Judicial Circuit Court'),
-    ('39th Judicial Circuit Court', '39th Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('40th Judicial Circuit Court', '40th Judicial Circuit Court'),
-    ('41st Judicial Circuit Court', '41st Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Alabama Court of Civil Appeals', 'Alabama Court of Civil Appeals'),
-    ('Autauga County District Court', 'Autauga County District Court'),
-    ('Autauga County Probate Court', 'Autauga County Probate Court'),
-    ('Baldwin County District Court', 'Baldwin County District Court'),
-    ('Baldwin County Probate Court', 'Baldwin County Probate Court'),
-    ('Barbour County District Court', 'Barbour County District Court'),
-    ('Barbour County Probate Court', 'Barbour County Probate Court'),
-    ('Bibb County District Court', 'Bibb County District Court'),
-    ('Bibb County Probate Court', 'Bibb County Probate Court'),
-    ('Blount County District Court', 'Blount County District Court'),
-    ('Blount County Probate Court', 'Blount County Probate Court'),
-    ('Bullock County District Court', 'Bullock County District Court'),
-    ('Bullock County Probate Court', 'Bullock County Probate Court'),
-    ('Butler County District Court', 'Butler County District Court'),
-    ('Butler County Probate Court', 'Butler County Probate Court'),
-    ('Calhoun County District Court', 'Calhoun County District Court'),
-    ('Calhoun County Probate Court', 'Calhoun County Probate Court'),
-    ('Chambers County District Court', 'Chambers County District Court'),
-    ('Chambers County Probate Court', 'Chambers County Probate Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Cherokee County Probate Court', 'Cherokee County Probate Court'),
-    ('Chilton County District Court', 'Chilton County District Court'),
-    ('Chilton County Probate Court', 'Chilton County Probate Court'),
-    ('Choctaw County District Court', 'Choctaw County District Court'),
-    ('Choctaw County Probate Court', 'Choctaw County Probate Court'),
-    ('Clarke County District Court', 'Clarke County District Court'),
-    ('Clarke County Probate Court', 'Clarke County Probate Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Clay County Probate Court', 'Clay County Probate Court'),
-    ('Cleburne County District Court', 'Cleburne County District Court'),
-    ('Cleburne County Probate Court', 'Cleburne County Probate Court'),
-    ('Coffee County District Court', 'Coffee County District Court'),
-    ('Coffee County Probate Court', 'Coffee County Probate Court'),
-    ('Colbert County District Court', 'Colbert County District Court'),
-    ('Colbert County Probate Court', 'Colbert County Probate Court'),
-    ('Conecuh County District Court', 'Conecuh County District Court'),
-    ('Conecuh County Probate Court', 'Conecuh County Probate Court'),
-    ('Coosa County District Court', 'Coosa County District Court'),
-    ('Coosa County Probate Court', 'Coosa County Probate Court'),
-    ('Covington County District Court', 'Covington County District Court'),
-    ('Covington County Probate Court', 'Covington County Probate Court'),
-    ('Crenshaw County District Court', 'Crenshaw County District Court'),
-    ('Crenshaw County Probate Court', 'Crenshaw County Probate Court'),
-    ('Cullman County District Court', 'Cullman County District Court'),
-    ('Cullman County Probate Court', 'Cullman County Probate Court'),
-    ('Dale County District Court', 'Dale County District Court'),
-    ('Dale County Probate Court', 'Dale County Probate Court'),
-    ('Dallas County District Court', 'Dallas County District Court'),
-    ('Dallas County Probate Court', 'Dallas County Probate Court'),
-    ('DeKalb County District Court', 'DeKalb County District Court'),
-    ('DeKalb County Probate Court', 'DeKalb County Probate Court'),
-    ('Elmore County District Court', 'Elmore County District Court'),
-    ('Elmore County Probate Court', 'Elmore County Probate Court'),
-    ('Escambia County District Court', 'Escambia County District Court'),
-    ('Escambia County Probate Court', 'Escambia County Probate Court'),
-    ('Etowah County District Court', 'Etowah County District Court'),
-    ('Etowah County Probate Court', 'Etowah County Probate Court'),
-    ('Fayette County District Court', 'Fayette County District Court'),
-    ('Fayette County Probate Court', 'Fayette County Probate Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Geneva County District Court', 'Geneva County District Court'),
-    ('Geneva County Probate Court', 'Geneva County Probate Court'),
-    ('Greene County District Court', 'Greene County District Court'),
-    ('Greene County Probate Court', 'Greene County Probate Court'),
-    ('Hale County District Court', 'Hale County District Court'),
-    ('Hale County Probate Court', 'Hale County Probate Court'),
-    ('Henry County District Court', 'Henry County District Court'),
-    ('Henry County Probate Court', 'Henry County Probate Court'),
-    ('Houston County District Court', 'Houston County District Court'),
-    ('Houston County Probate Court', 'Houston County Probate Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Jefferson County Probate Court', 'Jefferson County Probate Court'),
-    ('Lamar County District Court', 'Lamar County District Court'),
-    ('Lamar County Probate Court', 'Lamar County Probate Court'),
-    ('Lauderdale County District Court', 'Lauderdale County District Court'),
-    ('Lauderdale County Probate Court', 'Lauderdale County Probate Court'),
-    ('Lawrence County District Court', 'Lawrence County District Court'),
-    ('Lawrence County Probate Court', 'Lawrence County Probate Court'),
-    ('Lee County District Court', 'Lee County District Court'),
-    ('Lee County Probate Court', 'Lee County Probate Court'),
-    ('Limestone County District Court', 'Limestone County District Court'),
-    ('Limestone County Probate Court', 'Limestone County Probate Court'),
-    ('Lowndes County District Court', 'Lowndes County District Court'),
-    ('Lowndes County Probate Court', 'Lowndes County Probate Court'),
-    ('Macon County District Court', 'Macon County District Court'),
-    ('Macon County Probate Court', 'Macon County Probate Court'),
-    ('Madison County District Court', 'Madison County District Court'),
-    ('Madison County Probate Court', 'Madison County Probate Court'),
-    ('Marengo County District Court', 'Marengo County District Court'),
-    ('Marengo County Probate Court', 'Marengo County Probate Court'),
-    ('Marion County District Court', 'Marion County District Court'),
-    ('Marion County Probate Court', 'Marion County Probate Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('Marshall County Probate Court', 'Marshall County Probate Court'),
-    ('Mobile County District Court', 'Mobile County District Court'),
-    ('Mobile County Probate Court', 'Mobile County Probate Court'),
-    ('Monroe County District Court', 'Monroe County District Court'),
-    ('Monroe County Probate Court', 'Monroe County Probate Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Montgomery County Probate Court', 'Montgomery County Probate Court'),
-    ('Morgan County District Court', 'Morgan County District Court'),
-    ('Morgan County Probate Court', 'Morgan County Probate Court'),
-    ('Perry County District Court', 'Perry County District Court'),
-    ('Perry County Probate Court', 'Perry County Probate Court'),
-    ('Pickens County District Court', 'Pickens County District Court'),
-    ('Pickens County Probate Court', 'Pickens County Probate Court'),
-    ('Pike County District Court', 'Pike County District Court'),
-    ('Pike County Probate Court', 'Pike County Probate Court'),
-    ('Randolph County District Court', 'Randolph County District Court'),
-    ('Randolph County Probate Court', 'Randolph County Probate Court'),
-    ('Russell County District Court', 'Russell County District Court'),
-    ('Russell County Probate Court', 'Russell County Probate Court'),
-    ('Shelby County District Court', 'Shelby County District Court'),
-    ('Shelby County Probate Court', 'Shelby County Probate Court'),
-    ('St. Clair County District Court', 'St. Clair County District Court'),
-    ('St. Clair County Probate Court', 'St. Clair County Probate Court'),
-    ('Sumter County District Court', 'Sumter County District Court'),
-    ('Sumter County Probate Court', 'Sumter County Probate Court'),
-    ('Talladega County District Court', 'Talladega County District Court'),
-    ('Talladega County Probate Court', 'Talladega County Probate Court'),
-    ('Tallapoosa County District Court', 'Tallapoosa County District Court'),
-    ('Tallapoosa County Probate Court', 'Tallapoosa County Probate Court'),
-    ('Tuscaloosa County District Court', 'Tuscaloosa County District Court'),
-    ('Tuscaloosa County Probate Court', 'Tuscaloosa County Probate Court'),
-    ('Walker County District Court', 'Walker County District Court'),
-    ('Walker County Probate Court', 'Walker County Probate Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Wilcox County District Court', 'Wilcox County District Court'),
-    ('Wilcox County Probate Court', 'Wilcox County Probate Court'),
-    ('Winston County District Court', 'Winston County District Court'),
-
-]
-
-ALASKA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Alaska Supreme Court', 'Alaska Supreme Court'),
-    ('Alaska Court of Appeals', 'Alaska Court of Appeals'),
-    ('U.S. District Court for the District of Alaska', 'U.S. District Court for the District of Alaska'),
-    ('1st Judicial District Superior Court', '1st Judicial District Superior Court'),
-    ('2nd Judicial District Superior Court', '2nd Judicial District Superior Court'),
-    ('3rd Judicial District Superior Court', '3rd Judicial District Superior Court'),
-    ('4th Judicial District Superior Court', '4th Judicial District Superior Court'),
-    ('Aleutians East Borough District Court', 'Aleutians East Borough District Court'),
-    ('Aleutians West Census Area District Court', 'Aleutians West Census Area District Court'),
-    ('Anchorage District Court', 'Anchorage District Court'),
-    ('Bethel Census Area District Court', 'Bethel Census Area District Court'),
-    ('Bristol Bay Borough District Court', 'Bristol Bay Borough District Court'),
-    ('Chugach Census Area District Court', 'Chugach Census Area District Court'),
-    ('Copper River Census Area District Court', 'Copper River Census Area District Court'),
-    ('Denali Borough District Court', 'Denali Borough District Court'),
-    ('Dillingham Census Area District Court', 'Dillingham Census Area District Court'),
-    ('Fairbanks North Star Borough District Court', 'Fairbanks North Star Borough District Court'),
-    ('Haines Borough District Court', 'Haines Borough District Court'),
-    ('Hoonah-Angoon District Court', 'Hoonah-Angoon District Court'),
-    ('Juneau City and Borough District Court', 'Juneau City and Borough District Court'),
-    ('Kenai Peninsula Borough District Court', 'Kenai Peninsula Borough District Court'),
-    ('Ketchikan Gateway Borough District Court', 'Ketchikan Gateway Borough District Court'),
-    ('Kodiak Island Borough District Court', 'Kodiak Island Borough District Court'),
-    ('Kusilvak Census Area District Court', 'Kusilvak Census Area District Court'),
-    ('Lake and Peninsula Borough District Court', 'Lake and Peninsula Borough District Court'),
-    ('Matanuska-Susitna Borough District Court', 'Matanuska-Susitna Borough District Court'),
-    ('Nome Census Area District Court', 'Nome Census Area District Court'),
-    ('North Slope Borough District Court', 'North Slope Borough District Court'),
-    ('Northwest Arctic Borough District Court', 'Northwest Arctic Borough District Court'),
-    ('Petersburg Borough District Court', 'Petersburg Borough District Court'),
-    ('Prince of Wales-Hyder Census Area District Court', 'Prince of Wales-Hyder Census Area District Court'),
-    ('Sitka City and Borough District Court', 'Sitka City and Borough District Court'),
-    ('Skagway Municipality District Court', 'Skagway Municipality District Court'),
-    ('Southeast Fairbanks Census Area District Court', 'Southeast Fairbanks Census Area District Court'),
-    ('Wrangell City and Borough District Court', 'Wrangell City and Borough District Court'),
-    ('Yakutat City and Borough District Court', 'Yakutat City and Borough District Court'),
-
-]
-
-ARIZONA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Arizona Supreme Court', 'Arizona Supreme Court'),
-    ('Arizona Court of Appeals Division One', 'Arizona Court of Appeals Division One'),
-    ('Arizona Court of Appeals Division Two', 'Arizona Court of Appeals Division Two'),
-    ('U.S. District Court for the District of Arizona', 'U.S. District Court for the District of Arizona'),
-    ('Apache County Justice Court', 'Apache County Justice Court'),
-    ('Apache County Superior Court', 'Apache County Superior Court'),
-    ('Cochise County Justice Court', 'Cochise County Justice Court'),
-    ('Cochise County Superior Court', 'Cochise County Superior Court'),
-    ('Coconino County Justice Court', 'Coconino County Justice Court'),
-    ('Coconino County Superior Court', 'Coconino County Superior Court'),
-    ('Gila County Justice Court', 'Gila County Justice Court'),
-    ('Gila County Superior Court', 'Gila County Superior Court'),
-    ('Graham County Justice Court', 'Graham County Justice Court'),
-    ('Graham County Superior Court', 'Graham County Superior Court'),
-    ('Greenlee County Justice Court', 'Greenlee County Justice Court'),
-    ('Greenlee County Superior Court', 'Greenlee County Superior Court'),
-    ('La Paz County Justice Court', 'La Paz County Justice Court'),
-    ('La Paz County Superior Court', 'La Paz County Superior Court'),
-    ('Maricopa County Justice Court', 'Maricopa County Justice Court'),
-    ('Maricopa County Superior Court', 'Maricopa County Superior Court'),
-    ('Mesa Municipal Court', 'Mesa Municipal Court'),
-    ('Mohave County Justice Court', 'Mohave County Justice Court'),
-    ('Mohave County Superior Court', 'Mohave County Superior Court'),
-    ('Navajo County Justice Court', 'Navajo County Justice Court'),
-    ('Navajo County Superior Court', 'Navajo County Superior Court'),
-    ('Phoenix Municipal Court', 'Phoenix Municipal Court'),
-    ('Pima County Justice Court', 'Pima County Justice Court'),
-    ('Pima County Superior Court', 'Pima County Superior Court'),
-    ('Pinal County Justice Court', 'Pinal County Justice Court'),
-    ('Pinal County Superior Court', 'Pinal County Superior Court'),
-    ('Santa Cruz County Justice Court', 'Santa Cruz County Justice Court'),
-    ('Santa Cruz County Superior Court', 'Santa Cruz County Superior Court'),
-    ('Scottsdale City Court', 'Scottsdale City Court'),
-    ('Tempe Municipal Court', 'Tempe Municipal Court'),
-    ('Tucson City Court', 'Tucson City Court'),
-    ('Yavapai County Justice Court', 'Yavapai County Justice Court'),
-    ('Yavapai County Superior Court', 'Yavapai County Superior Court'),
-    ('Yuma County Justice Court', 'Yuma County Justice Court'),
-    ('Yuma County Superior Court', 'Yuma County Superior Court'),
-
-]
-
-ARKANSAS_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('Arkansas Supreme Court', 'Arkansas Supreme Court'),
-    ('Arkansas Court of Appeals', 'Arkansas Court of Appeals'),
-    ('U.S. District Court for the Eastern District of Arkansas', 'U.S. District Court for the Eastern District of Arkansas'),
-    ('U.S. District Court for the Western District of Arkansas', 'U.S. District Court for the Western District of Arkansas'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('10th State District Court', '10th State District Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('11th State District Court', '11th State District Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('12th State District Court', '12th State District Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('13th State District Court', '13th State District Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('14th State District Court', '14th State District Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('15th State District Court', '15th State District Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('16th State District Court', '16th State District Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('17th State District Court', '17th State District Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('18th State District Court', '18th State District Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('19th State District Court', '19th State District Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('1st State District Court', '1st State District Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('20th State District Court', '20th State District Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('21st State District Court', '21st State District Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('22nd State District Court', '22nd State District Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('23rd State District Court', '23rd State District Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('24th State District Court', '24th State District Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('25th State District Court', '25th State District Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('26th State District Court', '26th State District Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('27th State District Court', '27th State District Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('28th State District Court', '28th State District Court'),
-    ('29th State District Court', '29th State District Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('2nd State District Court', '2nd State District Court'),
-    ('30th State District Court', '30th State District Court'),
-    ('31st State District Court', '31st State District Court'),
-    ('32nd State District Court', '32nd State District Court'),
-    ('33rd State District Court', '33rd State District Court'),
-    ('34th State District Court', '34th State District Court'),
-    ('35th State District Court', '35th State District Court'),
-    ('36th State District Court', '36th State District Court'),
-    ('37th State District Court', '37th State District Court'),
-    ('38th State District Court', '38th State District Court'),
-    ('39th State District Court', '39th State District Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('3rd State District Court', '3rd State District Court'),
-    ('40th State District Court', '40th State District Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('4th State District Court', '4th State District Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('5th State District Court', '5th State District Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('6th State District Court', '6th State District Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('7th State District Court', '7th State District Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('8th State District Court', '8th State District Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('9th State District Court', '9th State District Court'),
-
-]
-
-CALIFORNIA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('California Supreme Court', 'California Supreme Court'),
-    ('U.S. District Court for the Northern District of California', 'U.S. District Court for the Northern District of California'),
-    ('U.S. District Court for the Eastern District of California', 'U.S. District Court for the Eastern District of California'),
-    ('U.S. District Court for the Central District of California', 'U.S. District Court for the Central District of California'),
-    ('U.S. District Court for the Southern District of California', 'U.S. District Court for the Southern District of California'),
-    ('Alameda County Superior Court', 'Alameda County Superior Court'),
-    ('Alpine County Superior Court', 'Alpine County Superior Court'),
-    ('Amador County Superior Court', 'Amador County Superior Court'),
-    ('Butte County Superior Court', 'Butte County Superior Court'),
-    ('Calaveras County Superior Court', 'Calaveras County Superior Court'),
-    ('California Court of Appeal Fifth District', 'California Court of Appeal Fifth District'),
-    ('California Court of Appeal First District', 'California Court of Appeal First District'),
-    ('California Court of Appeal Fourth District', 'California Court of Appeal Fourth District'),
-    ('California Court of Appeal Second District', 'California Court of Appeal Second District'),
-    ('California Court of Appeal Sixth District', 'California Court of Appeal Sixth District'),
-    ('California Court of Appeal Third District', 'California Court of Appeal Third District'),
-    ('Colusa County Superior Court', 'Colusa County Superior Court'),
-    ('Contra Costa County Superior Court', 'Contra Costa County Superior Court'),
-    ('Del Norte County Superior Court', 'Del Norte County Superior Court'),
-    ('El Dorado County Superior Court', 'El Dorado County Superior Court'),
-    ('Fresno County Superior Court', 'Fresno County Superior Court'),
-    ('Glenn County Superior Court', 'Glenn County Superior Court'),
-    ('Humboldt County Superior Court', 'Humboldt County Superior Court'),
-    ('Imperial County Superior Court', 'Imperial County Superior Court'),
-    ('Inyo County Superior Court', 'Inyo County Superior Court'),
-    ('Kern County Superior Court', 'Kern County Superior Court'),
-    ('Kings County Superior Court', 'Kings County Superior Court'),
-    ('Lake County Superior Court', 'Lake County Superior Court'),
-    ('Lassen County Superior Court', 'Lassen County Superior Court'),
-    ('Los Angeles County Superior Court', 'Los Angeles County Superior Court'),
-    ('Madera County Superior Court', 'Madera County Superior Court'),
-    ('Marin County Superior Court', 'Marin County Superior Court'),
-    ('Mariposa County Superior Court', 'Mariposa County Superior Court'),
-    ('Mendocino County Superior Court', 'Mendocino County Superior Court'),
-    ('Merced County Superior Court', 'Merced County Superior Court'),
-    ('Modoc County Superior Court', 'Modoc County Superior Court'),
-    ('Mono County Superior Court', 'Mono County Superior Court'),
-    ('Monterey County Superior Court', 'Monterey County Superior Court'),
-    ('Napa County Superior Court', 'Napa County Superior Court'),
-    ('Nevada County Superior Court', 'Nevada County Superior Court'),
-    ('Orange County Superior Court', 'Orange County Superior Court'),
-    ('Placer County Superior Court', 'Placer County Superior Court'),
-    ('Plumas County Superior Court', 'Plumas County Superior Court'),
-    ('Riverside County Superior Court', 'Riverside County Superior Court'),
-    ('Sacramento County Superior Court', 'Sacramento County Superior Court'),
-    ('San Benito County Superior Court', 'San Benito County Superior Court'),
-    ('San Bernardino County Superior Court', 'San Bernardino County Superior Court'),
-    ('San Diego County Superior Court', 'San Diego County Superior Court'),
-    ('San Francisco County Superior Court', 'San Francisco County Superior Court'),
-    ('San Joaquin County Superior Court', 'San Joaquin County Superior Court'),
-    ('San Luis Obispo County Superior Court', 'San Luis Obispo County Superior Court'),
-    ('San Mateo County Superior Court', 'San Mateo County Superior Court'),
-    ('Santa Barbara County Superior Court', 'Santa Barbara County Superior Court'),
-    ('Santa Clara County Superior Court', 'Santa Clara County Superior Court'),
-    ('Santa Cruz County Superior Court', 'Santa Cruz County Superior Court'),
-    ('Shasta County Superior Court', 'Shasta County Superior Court'),
-    ('Sierra County Superior Court', 'Sierra County Superior Court'),
-    ('Siskiyou County Superior Court', 'Siskiyou County Superior Court'),
-    ('Solano County Superior Court', 'Solano County Superior Court'),
-    ('Sonoma County Superior Court', 'Sonoma County Superior Court'),
-    ('Stanislaus County Superior Court', 'Stanislaus County Superior Court'),
-    ('Sutter County Superior Court', 'Sutter County Superior Court'),
-    ('Tehama County Superior Court', 'Tehama County Superior Court'),
-    ('Trinity County Superior Court', 'Trinity County Superior Court'),
-    ('Tulare County Superior Court', 'Tulare County Superior Court'),
-    ('Tuolumne County Superior Court', 'Tuolumne County Superior Court'),
-    ('Ventura County Superior Court', 'Ventura County Superior Court'),
-    ('Yolo County Superior Court', 'Yolo County Superior Court'),
-
-]
-
-COLORADO_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('Colorado Supreme Court', 'Colorado Supreme Court'),
-    ('Colorado Court of Appeals', 'Colorado Court of Appeals'),
-    ('U.S. District Court for the District of Colorado', 'U.S. District Court for the District of Colorado'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('14th Judicial District Court', '14th Judicial District Court'),
-    ('15th Judicial District Court', '15th Judicial District Court'),
-    ('16th Judicial District Court', '16th Judicial District Court'),
-    ('17th Judicial District Court', '17th Judicial District Court'),
-    ('18th Judicial District Court', '18th Judicial District Court'),
-    ('19th Judicial District Court', '19th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('20th Judicial District Court', '20th Judicial District Court'),
-    ('21st Judicial District Court', '21st Judicial District Court'),
-    ('22nd Judicial District Court', '22nd Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Adams County Court', 'Adams County Court'),
-    ('Adams County Probate Court', 'Adams County Probate Court'),
-    ('Alamosa County Court', 'Alamosa County Court'),
-    ('Alamosa County Probate Court', 'Alamosa County Probate Court'),
-    ('Arapahoe County Court', 'Arapahoe County Court'),
-    ('Arapahoe County Probate Court', 'Arapahoe County Probate Court'),
-    ('Archuleta County Court', 'Archuleta County Court'),
-    ('Archuleta County Probate Court', 'Archuleta County Probate Court'),
-    ('Baca County Court', 'Baca County Court'),
-    ('Baca County Probate Court', 'Baca County Probate Court'),
-    ('Bent County Court', 'Bent County Court'),
-    ('Bent County Probate Court', 'Bent County Probate Court'),
-    ('Boulder County Court', 'Boulder County Court'),
-    ('Boulder County Probate Court', 'Boulder County Probate Court'),
-    ('Broomfield County Court', 'Broomfield County Court'),
-    ('Broomfield County Probate Court', 'Broomfield County Probate Court'),
-    ('Chaffee County Court', 'Chaffee County Court'),
-    ('Chaffee County Probate Court', 'Chaffee County Probate Court'),
-    ('Cheyenne County Court', 'Cheyenne County Court'),
-    ('Cheyenne County Probate Court', 'Cheyenne County Probate Court'),
-    ('Clear Creek County Court', 'Clear Creek County Court'),
-    ('Clear Creek County Probate Court', 'Clear Creek County Probate Court'),
-    ('Conejos County Court', 'Conejos County Court'),
-    ('Conejos County Probate Court', 'Conejos County Probate Court'),
-    ('Costilla County Court', 'Costilla County Court'),
-    ('Costilla County Probate Court', 'Costilla County Probate Court'),
-    ('Crowley County Court', 'Crowley County Court'),
-    ('Crowley County Probate Court', 'Crowley County Probate Court'),
-    ('Custer County Court', 'Custer County Court'),
-    ('Custer County Probate Court', 'Custer County Probate Court'),
-    ('Delta County Court', 'Delta County Court'),
-    ('Delta County Probate Court', 'Delta County Probate Court'),
-    ('Denver County Court', 'Denver County Court'),
-    ('Denver County Probate Court', 'Denver County Probate Court'),
-    ('Denver Municipal Court', 'Denver Municipal Court'),
-    ('Dolores County Court', 'Dolores County Court'),
-    ('Dolores County Probate Court', 'Dolores County Probate Court'),
-    ('Douglas County Court', 'Douglas County Court'),
-    ('Douglas County Probate Court', 'Douglas County Probate Court'),
-    ('Eagle County Court', 'Eagle County Court'),
-    ('Eagle County Probate Court', 'Eagle County Probate Court'),
-    ('El Paso County Court', 'El Paso County Court'),
-    ('El Paso County Probate Court', 'El Paso County Probate Court'),
-    ('Elbert County Court', 'Elbert County Court'),
-    ('Elbert County Probate Court', 'Elbert County Probate Court'),
-    ('Fremont County Court', 'Fremont County Court'),
-    ('Fremont County Probate Court', 'Fremont County Probate Court'),
-    ('Garfield County Court', 'Garfield County Court'),
-    ('Garfield County Probate Court', 'Garfield County Probate Court'),
-    ('Gilpin County Court', 'Gilpin County Court'),
-    ('Gilpin County Probate Court', 'Gilpin County Probate Court'),
-    ('Grand County Court', 'Grand County Court'),
-    ('Grand County Probate Court', 'Grand County Probate Court'),
-    ('Gunnison County Court', 'Gunnison County Court'),
-    ('Gunnison County Probate Court', 'Gunnison County Probate Court'),
-    ('Hinsdale County Court', 'Hinsdale County Court'),
-    ('Hinsdale County Probate Court', 'Hinsdale County Probate Court'),
-    ('Huerfano County Court', 'Huerfano County Court'),
-    ('Huerfano County Probate Court', 'Huerfano County Probate Court'),
-    ('Jackson County Court', 'Jackson County Court'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Jefferson County Court', 'Jefferson County Court'),
-    ('Jefferson County Probate Court', 'Jefferson County Probate Court'),
-    ('Kiowa County Court', 'Kiowa County Court'),
-    ('Kiowa County Probate Court', 'Kiowa County Probate Court'),
-    ('Kit Carson County Court', 'Kit Carson County Court'),
-    ('Kit Carson County Probate Court', 'Kit Carson County Probate Court'),
-    ('La Plata County Court', 'La Plata County Court'),
-    ('La Plata County Probate Court', 'La Plata County Probate Court'),
-    ('Lake County Court', 'Lake County Court'),
-    ('Lake County Probate Court', 'Lake County Probate Court'),
-    ('Larimer County Court', 'Larimer County Court'),
-    ('Larimer County Probate Court', 'Larimer County Probate Court'),
-    ('Las Animas County Court', 'Las Animas County Court'),
-    ('Las Animas County Probate Court', 'Las Animas County Probate Court'),
-    ('Lincoln County Court', 'Lincoln County Court'),
-    ('Lincoln County Probate Court', 'Lincoln County Probate Court'),
-    ('Logan County Court', 'Logan County Court'),
-    ('Logan County Probate Court', 'Logan County Probate Court'),
-    ('Mesa County Court', 'Mesa County Court'),
-    ('Mesa County Probate Court', 'Mesa County Probate Court'),
-    ('Mineral County Court', 'Mineral County Court'),
-    ('Mineral County Probate Court', 'Mineral County Probate Court'),
-    ('Moffat County Court', 'Moffat County Court'),
-    ('Moffat County Probate Court', 'Moffat County Probate Court'),
-    ('Montezuma County Court', 'Montezuma County Court'),
-    ('Montezuma County Probate Court', 'Montezuma County Probate Court'),
-    ('Montrose County Court', 'Montrose County Court'),
-    ('Montrose County Probate Court', 'Montrose County Probate Court'),
-    ('Morgan County Court', 'Morgan County Court'),
-    ('Morgan County Probate Court', 'Morgan County Probate Court'),
-    ('Otero County Court', 'Otero County Court'),
-    ('Otero County Probate Court', 'Otero County Probate Court'),
-    ('Ouray County Court', 'Ouray County Court'),
-    ('Ouray County Probate Court', 'Ouray County Probate Court'),
-    ('Park County Court', 'Park County Court'),
-    ('Park County Probate Court', 'Park County Probate Court'),
-    ('Phillips County Court', 'Phillips County Court'),
-    ('Phillips County Probate Court', 'Phillips County Probate Court'),
-    ('Pitkin County Court', 'Pitkin County Court'),
-    ('Pitkin County Probate Court', 'Pitkin County Probate Court'),
-    ('Prowers County Court', 'Prowers County Court'),
-    ('Prowers County Probate Court', 'Prowers County Probate Court'),
-    ('Pueblo County Court', 'Pueblo County Court'),
-    ('Pueblo County Probate Court', 'Pueblo County Probate Court'),
-    ('Rio Blanco County Court', 'Rio Blanco County Court'),
-    ('Rio Blanco County Probate Court', 'Rio Blanco County Probate Court'),
-    ('Rio Grande County Court', 'Rio Grande County Court'),
-    ('Rio Grande County Probate Court', 'Rio Grande County Probate Court'),
-    ('Routt County Court', 'Routt County Court'),
-    ('Routt County Probate Court', 'Routt County Probate Court'),
-    ('Saguache County Court', 'Saguache County Court'),
-    ('Saguache County Probate Court', 'Saguache County Probate Court'),
-    ('San Juan County Court', 'San Juan County Court'),
-    ('San Juan County Probate Court', 'San Juan County Probate Court'),
-    ('San Miguel County Court', 'San Miguel County Court'),
-    ('San Miguel County Probate Court', 'San Miguel County Probate Court'),
-    ('Sedgwick County Court', 'Sedgwick County Court'),
-    ('Sedgwick County Probate Court', 'Sedgwick County Probate Court'),
-    ('Summit County Court', 'Summit County Court'),
-    ('Summit County Probate Court', 'Summit County Probate Court'),
-    ('Teller County Court', 'Teller County Court'),
-    ('Teller County Probate Court', 'Teller County Probate Court'),
-    ('Washington County Court', 'Washington County Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Weld County Court', 'Weld County Court'),
-    ('Weld County Probate Court', 'Weld County Probate Court'),
-    ('Yuma County Court', 'Yuma County Court'),
-    ('Yuma County Probate Court', 'Yuma County Probate Court'),
-
-]
-
-CONNECTICUT_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Second Circuit', 'U.S. Court of Appeals for the Second Circuit'),
-    ('Connecticut Supreme Court', 'Connecticut Supreme Court'),
-    ('U.S. District Court for the District of Connecticut', 'U.S. District Court for the District of Connecticut'),
-    ('Andover Probate Court', 'Andover Probate Court'),
-    ('Ansonia Probate Court', 'Ansonia Probate Court'),
-    ('Ansonia-Milford Judicial District Superior Court', 'Ansonia-Milford Judicial District Superior Court'),
-    ('Avon Probate Court', 'Avon Probate Court'),
-    ('Bethel Probate Court', 'Bethel Probate Court'),
-    ('Bridgeport Probate Court', 'Bridgeport Probate Court'),
-    ('Bristol Probate Court', 'Bristol Probate Court'),
-    ('Brookfield Probate Court', 'Brookfield Probate Court'),
-    ('Canterbury Probate Court', 'Canterbury Probate Court'),
-    ('Central Manchester Probate Court', 'Central Manchester Probate Court'),
-    ('Cheshire Probate Court', 'Cheshire Probate Court'),
-    ('Clinton Probate Court', 'Clinton Probate Court'),
-    ('Colchester Probate Court', 'Colchester Probate Court'),
-    ('Connecticut Appellate Court', 'Connecticut Appellate Court'),
-    ('Danbury Judicial District Superior Court', 'Danbury Judicial District Superior Court'),
-    ('Danbury Probate Court', 'Danbury Probate Court'),
-    ('Darien Probate Court', 'Darien Probate Court'),
-    ('Deep River Probate Court', 'Deep River Probate Court'),
-    ('East Hartford Probate Court', 'East Hartford Probate Court'),
-    ('East Haven Probate Court', 'East Haven Probate Court'),
-    ('East Lyme Probate Court', 'East Lyme Probate Court'),
-    ('Ellington Probate Court', 'Ellington Probate Court'),
-    ('Enfield Probate Court', 'Enfield Probate Court'),
-    ('Fairfield Judicial District Superior Court', 'Fairfield Judicial District Superior Court'),
-    ('Fairfield Probate Court', 'Fairfield Probate Court'),
-    ('Farmington Probate Court', 'Farmington Probate Court'),
-    ('Glastonbury Probate Court', 'Glastonbury Probate Court'),
-    ('Granby Probate Court', 'Granby Probate Court'),
-    ('Greenwich Probate Court', 'Greenwich Probate Court'),
-    ('Griswold Probate Court', 'Griswold Probate Court'),
-    ('Guilford Probate Court', 'Guilford Probate Court'),
-    ('Hamden Probate Court', 'Hamden Probate Court'),
-    ('Hartford Judicial District Superior Court', 'Hartford Judicial District Superior Court'),
-    ('Hartford Probate Court', 'Hartford Probate Court'),
-    ('Killingly Probate Court', 'Killingly Probate Court'),
-    ('Ledyard Probate Court', 'Ledyard Probate Court'),
-    ('Litchfield Judicial District Superior Court', 'Litchfield Judicial District Superior Court'),
-    ('Litchfield Probate Court', 'Litchfield Probate Court'),
-    ('Madison Probate Court', 'Madison Probate Court'),
-    ('Manchester Probate Court', 'Manchester Probate Court'),
-    ('Meriden Probate Court', 'Meriden Probate Court'),
-    ('Middlesex Judicial District Superior Court', 'Middlesex Judicial District Superior Court'),
-    ('Middletown Probate Court', 'Middletown Probate Court'),
-    ('Milford Probate Court', 'Milford Probate Court'),
-    ('Naugatuck Probate Court', 'Naugatuck Probate Court'),
-    ('New Britain Judicial District Superior Court', 'New Britain Judicial District Superior Court'),
-    ('New Britain Probate Court', 'New Britain Probate Court'),
-    ('New Canaan Probate Court', 'New Canaan Probate Court'),
-    ('New Hartford Probate Court', 'New Hartford Probate Court'),
-    ('New Haven Judicial District Superior Court', 'New Haven Judicial District Superior Court'),
-    ('New Haven Probate Court', 'New Haven Probate Court'),
-    ('New London Judicial District Superior Court', 'New London Judicial District Superior Court'),
-    ('New London Probate Court', 'New London Probate Court'),
-    ('New Milford Probate Court', 'New Milford Probate Court'),
-    ('Newtown Probate Court', 'Newtown Probate Court'),
-    ('Norwalk Probate Court', 'Norwalk Probate Court'),
-    ('Norwich Probate Court', 'Norwich Probate Court'),
-    ('Old Saybrook Probate Court', 'Old Saybrook Probate Court'),
-    ('Orange Probate Court', 'Orange Probate Court'),
-    ('Plainfield Probate Court', 'Plainfield Probate Court'),
-    ('Plainville Probate Court', 'Plainville Probate Court'),
-    ('Plymouth Probate Court', 'Plymouth Probate Court'),
-    ('Pomfret Probate Court', 'Pomfret Probate Court'),
-    ('Putnam Probate Court', 'Putnam Probate Court'),
-    ('Ridgefield Probate Court', 'Ridgefield Probate Court'),
-    ('Rocky Hill Probate Court', 'Rocky Hill Probate Court'),
-    ('Seymour Probate Court', 'Seymour Probate Court'),
-    ('Shelton Probate Court', 'Shelton Probate Court'),
-    ('Simsbury Probate Court', 'Simsbury Probate Court'),
-    ('Southbury Probate Court', 'Southbury Probate Court'),
-    ('Southington Probate Court', 'Southington Probate Court'),
-    ('Stafford Probate Court', 'Stafford Probate Court'),
-    ('Stamford Probate Court', 'Stamford Probate Court'),
-    ('Stamford-Norwalk Judicial District Superior Court', 'Stamford-Norwalk Judicial District Superior Court'),
-    ('Stonington Probate Court', 'Stonington Probate Court'),
-    ('Stratford Probate Court', 'Stratford Probate Court'),
-    ('Tolland Judicial District Superior Court', 'Tolland Judicial District Superior Court'),
-    ('Torrington Probate Court', 'Torrington Probate Court'),
-    ('Trumbull Probate Court', 'Trumbull Probate Court'),
-    ('Vernon Probate Court', 'Vernon Probate Court'),
-    ('Wallingford Probate Court', 'Wallingford Probate Court'),
-    ('Waterbury Judicial District Superior Court', 'Waterbury Judicial District Superior Court'),
-    ('Waterbury Probate Court', 'Waterbury Probate Court'),
-    ('Waterford Probate Court', 'Waterford Probate Court'),
-    ('Watertown Probate Court', 'Watertown Probate Court'),
-    ('West Hartford Probate Court', 'West Hartford Probate Court'),
-    ('West Haven Probate Court', 'West Haven Probate Court'),
-    ('Westbrook Probate Court', 'Westbrook Probate Court'),
-    ('Weston Probate Court', 'Weston Probate Court'),
-    ('Westport Probate Court', 'Westport Probate Court'),
-    ('Wethersfield Probate Court', 'Wethersfield Probate Court'),
-    ('Willimantic Probate Court', 'Willimantic Probate Court'),
-    ('Wilton Probate Court', 'Wilton Probate Court'),
-    ('Winchester Probate Court', 'Winchester Probate Court'),
-    ('Windham Judicial District Superior Court', 'Windham Judicial District Superior Court'),
-    ('Windham Probate Court', 'Windham Probate Court'),
-    ('Windsor Locks Probate Court', 'Windsor Locks Probate Court'),
-    ('Windsor Probate Court', 'Windsor Probate Court'),
-    ('Wolcott Probate Court', 'Wolcott Probate Court'),
-
-]
-
-DELAWARE_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Third Circuit', 'U.S. Court of Appeals for the Third Circuit'),
-    ('Delaware Supreme Court', 'Delaware Supreme Court'),
-    ('U.S. District Court for the District of Delaware', 'U.S. District Court for the District of Delaware'),
-    ('Court of Common Pleas', 'Court of Common Pleas'),
-    ('Justice of the Peace Court 1', 'Justice of the Peace Court 1'),
-    ('Justice of the Peace Court 10', 'Justice of the Peace Court 10'),
-    ('Justice of the Peace Court 11', 'Justice of the Peace Court 11'),
-    ('Justice of the Peace Court 12', 'Justice of the Peace Court 12'),
-    ('Justice of the Peace Court 13', 'Justice of the Peace Court 13'),
-    ('Justice of the Peace Court 14', 'Justice of the Peace Court 14'),
-    ('Justice of the Peace Court 15', 'Justice of the Peace Court 15'),
-    ('Justice of the Peace Court 16', 'Justice of the Peace Court 16'),
-    ('Justice of the Peace Court 17', 'Justice of the Peace Court 17'),
-    ('Justice of the Peace Court 18', 'Justice of the Peace Court 18'),
-    ('Justice of the Peace Court 19', 'Justice of the Peace Court 19'),
-    ('Justice of the Peace Court 2', 'Justice of the Peace Court 2'),
-    ('Justice of the Peace Court 20', 'Justice of the Peace Court 20'),
-    ('Justice of the Peace Court 21', 'Justice of the Peace Court 21'),
-    ('Justice of the Peace Court 22', 'Justice of the Peace Court 22'),
-    ('Justice of the Peace Court 23', 'Justice of the Peace Court 23'),
-    ('Justice of the Peace Court 24', 'Justice of the Peace Court 24'),
-    ('Justice of the Peace Court 3', 'Justice of the Peace Court 3'),
-    ('Justice of the Peace Court 4', 'Justice of the Peace Court 4'),
-    ('Justice of the Peace Court 5', 'Justice of the Peace Court 5'),
-    ('Justice of the Peace Court 6', 'Justice of the Peace Court 6'),
-    ('Justice of the Peace Court 7', 'Justice of the Peace Court 7'),
-    ('Justice of the Peace Court 8', 'Justice of the Peace Court 8'),
-    ('Justice of the Peace Court 9', 'Justice of the Peace Court 9'),
-    ('Register of Wills for Kent County', 'Register of Wills for Kent County'),
-    ('Register of Wills for New Castle County', 'Register of Wills for New Castle County'),
-    ('Superior Court of Delaware in Kent County', 'Superior Court of Delaware in Kent County'),
-    ('Superior Court of Delaware in New Castle County', 'Superior Court of Delaware in New Castle County'),
-    ('Superior Court of Delaware in Sussex County', 'Superior Court of Delaware in Sussex County'),
-
-]
-
-FLORIDA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eleventh Circuit', 'U.S. Court of Appeals for the Eleventh Circuit'),
-    ('Florida Supreme Court', 'Florida Supreme Court'),
-    ('U.S. District Court for the Northern District of Florida', 'U.S. District Court for the Northern District of Florida'),
-    ('U.S. District Court for the Middle District of Florida', 'U.S. District Court for the Middle District of Florida'),
-    ('U.S. District Court for the Southern District of Florida', 'U.S. District Court for the Southern District of Florida'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Alachua County Court', 'Alachua County Court'),
-    ('Baker County Court', 'Baker County Court'),
-    ('Bay County Court', 'Bay County Court'),
-    ('Bradford County Court', 'Bradford County Court'),
-    ('Brevard County Court', 'Brevard County Court'),
-    ('Broward County Court', 'Broward County Court'),
-    ('Calhoun County Court', 'Calhoun County Court'),
-    ('Charlotte County Court', 'Charlotte County Court'),
-    ('Citrus County Court', 'Citrus County Court'),
-    ('Clay County Court', 'Clay County Court'),
-    ('Collier County Court', 'Collier County Court'),
-    ('Columbia County Court', 'Columbia County Court'),
-    ('DeSoto County Court', 'DeSoto County Court'),
-    ('Dixie County Court', 'Dixie County Court'),
-    ('Duval County Court', 'Duval County Court'),
-    ('Escambia County Court', 'Escambia County Court'),
-    ('Flagler County Court', 'Flagler County Court'),
-    ('Florida Fifth District Court of Appeal', 'Florida Fifth District Court of Appeal'),
-    ('Florida First District Court of Appeal', 'Florida First District Court of Appeal'),
-    ('Florida Fourth District Court of Appeal', 'Florida Fourth District Court of Appeal'),
-    ('Florida Second District Court of Appeal', 'Florida Second District Court of Appeal'),
-    ('Florida Third District Court of Appeal', 'Florida Third District Court of Appeal'),
-    ('Franklin County Court', 'Franklin County Court'),
-    ('Gadsden County Court', 'Gadsden County Court'),
-    ('Gilchrist County Court', 'Gilchrist County Court'),
-    ('Glades County Court', 'Glades County Court'),
-    ('Gulf County Court', 'Gulf County Court'),
-    ('Hamilton County Court', 'Hamilton County Court'),
-    ('Hardee County Court', 'Hardee County Court'),
-    ('Hendry County Court', 'Hendry County Court'),
-    ('Hernando County Court', 'Hernando County Court'),
-    ('Highlands County Court', 'Highlands County Court'),
-    ('Hillsborough County Court', 'Hillsborough County Court'),
-    ('Holmes County Court', 'Holmes County Court'),
-    ('Indian River County Court', 'Indian River County Court'),
-    ('Jackson County Court', 'Jackson County Court'),
-    ('Jefferson County Court', 'Jefferson County Court'),
-    ('Lafayette County Court', 'Lafayette County Court'),
-    ('Lake County Court', 'Lake County Court'),
-    ('Lee County Court', 'Lee County Court'),
-    ('Leon County Court', 'Leon County Court'),
-    ('Levy County Court', 'Levy County Court'),
-    ('Liberty County Court', 'Liberty County Court'),
-    ('Madison County Court', 'Madison County Court'),
-    ('Manatee County Court', 'Manatee County Court'),
-    ('Marion County Court', 'Marion County Court'),
-    ('Martin County Court', 'Martin County Court'),
-    ('Miami-Dade County Court', 'Miami-Dade County Court'),
-    ('Monroe County Court', 'Monroe County Court'),
-    ('Nassau County Court', 'Nassau County Court'),
-    ('Okaloosa County Court', 'Okaloosa County Court'),
-    ('Okeechobee County Court', 'Okeechobee County Court'),
-    ('Orange County Court', 'Orange County Court'),
-    ('Osceola County Court', 'Osceola County Court'),
-    ('Palm Beach County Court', 'Palm Beach County Court'),
-    ('Pasco County Court', 'Pasco County Court'),
-    ('Pinellas County Court', 'Pinellas County Court'),
-    ('Polk County Court', 'Polk County Court'),
-    ('Putnam County Court', 'Putnam County Court'),
-    ('Santa Rosa County Court', 'Santa Rosa County Court'),
-    ('Sarasota County Court', 'Sarasota County Court'),
-    ('Seminole County Court', 'Seminole County Court'),
-    ('St. Johns County Court', 'St. Johns County Court'),
-    ('St. Lucie County Court', 'St. Lucie County Court'),
-    ('Sumter County Court', 'Sumter County Court'),
-    ('Suwannee County Court', 'Suwannee County Court'),
-    ('Taylor County Court', 'Taylor County Court'),
-    ('Union County Court', 'Union County Court'),
-    ('Volusia County Court', 'Volusia County Court'),
-    ('Wakulla County Court', 'Wakulla County Court'),
-    ('Walton County Court', 'Walton County Court'),
-
-]
-
-GEORGIA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eleventh Circuit', 'U.S. Court of Appeals for the Eleventh Circuit'),
-    ('Georgia Supreme Court', 'Georgia Supreme Court'),
-    ('Georgia Court of Appeals', 'Georgia Court of Appeals'),
-    ('U.S. District Court for the Northern District of Georgia', 'U.S. District Court for the Northern District of Georgia'),
-    ('U.S. District Court for the Middle District of Georgia', 'U.S. District Court for the Middle District of Georgia'),
-    ('U.S. District Court for the Southern District of Georgia', 'U.S. District Court for the Southern District of Georgia'),
-    ('Alapaha Judicial Circuit Superior Court', 'Alapaha Judicial Circuit Superior Court'),
-    ('Alcovy Judicial Circuit Superior Court', 'Alcovy Judicial Circuit Superior Court'),
-    ('Appling County Probate Court', 'Appling County Probate Court'),
-    ('Atkinson County Probate Court', 'Atkinson County Probate Court'),
-    ('Atlanta Judicial Circuit Superior Court', 'Atlanta Judicial Circuit Superior Court'),
-    ('Atlanta Municipal Court', 'Atlanta Municipal Court'),
-    ('Atlantic Judicial Circuit Superior Court', 'Atlantic Judicial Circuit Superior Court'),
-    ('Augusta Judicial Circuit Superior Court', 'Augusta Judicial Circuit Superior Court'),
-    ('Bacon County Probate Court', 'Bacon County Probate Court'),
-    ('Baker County Probate Court', 'Baker County Probate Court'),
-    ('Baldwin County Probate Court', 'Baldwin County Probate Court'),
-    ('Banks County Probate Court', 'Banks County Probate Court'),
-    ('Barrow County Probate Court', 'Barrow County Probate Court'),
-    ('Bartow County Probate Court', 'Bartow County Probate Court'),
-    ('Bell-Forsyth Judicial Circuit Superior Court', 'Bell-Forsyth Judicial Circuit Superior Court'),
-    ('Ben Hill County Probate Court', 'Ben Hill County Probate Court'),
-    ('Berrien County Probate Court', 'Berrien County Probate Court'),
-    ('Bibb County Probate Court', 'Bibb County Probate Court'),
-    ('Bleckley County Probate Court', 'Bleckley County Probate Court'),
-    ('Blue Ridge Judicial Circuit Superior Court', 'Blue Ridge Judicial Circuit Superior Court'),
-    ('Brantley County Probate Court', 'Brantley County Probate Court'),
-    ('Brooks County Probate Court', 'Brooks County Probate Court'),
-    ('Brunswick Judicial Circuit Superior Court', 'Brunswick Judicial Circuit Superior Court'),
-    ('Bryan County Probate Court', 'Bryan County Probate Court'),
-    ('Bulloch County Probate Court', 'Bulloch County Probate Court'),
-    ('Burke County Probate Court', 'Burke County Probate Court'),
-    ('Butts County Probate Court', 'Butts County Probate Court'),
-    ('Calhoun County Probate Court', 'Calhoun County Probate Court'),
-    ('Camden County Probate Court', 'Camden County Probate Court'),
-    ('Candler County Probate Court', 'Candler County Probate Court'),
-    ('Carroll County Probate Court', 'Carroll County Probate Court'),
-    ('Catoosa County Probate Court', 'Catoosa County Probate Court'),
-    ('Charlton County Probate Court', 'Charlton County Probate Court'),
-    ('Chatham County Probate Court', 'Chatham County Probate Court'),
-    ('Chattahoochee County Probate Court', 'Chattahoochee County Probate Court'),
-    ('Chattahoochee Judicial Circuit Superior Court', 'Chattahoochee Judicial Circuit Superior Court'),
-    ('Chattooga County Probate Court', 'Chattooga County Probate Court'),
-    ('Cherokee County Probate Court', 'Cherokee County Probate Court'),
-    ('Cherokee Judicial Circuit Superior Court', 'Cherokee Judicial Circuit Superior Court'),
-    ('Clarke County Probate Court', 'Clarke County Probate Court'),
-    ('Clay County Probate Court', 'Clay County Probate Court'),
-    ('Clayton County Probate Court', 'Clayton County Probate Court'),
-    ('Clayton Judicial Circuit Superior Court', 'Clayton Judicial Circuit Superior Court'),
-    ('Clinch County Probate Court', 'Clinch County Probate Court'),
-    ('Cobb County Probate Court', 'Cobb County Probate Court'),
-    ('Cobb Judicial Circuit Superior Court', 'Cobb Judicial Circuit Superior Court'),
-    ('Coffee County Probate Court', 'Coffee County Probate Court'),
-    ('Colquitt County Probate Court', 'Colquitt County Probate Court'),
-    ('Columbia County Probate Court', 'Columbia County Probate Court'),
-    ('Conasauga Judicial Circuit Superior Court', 'Conasauga Judicial Circuit Superior Court'),
-    ('Cook County Probate Court', 'Cook County Probate Court'),
-    ('Cordele Judicial Circuit Superior Court', 'Cordele Judicial Circuit Superior Court'),
-    ('Coweta County Probate Court', 'Coweta County Probate Court'),
-    ('Coweta Judicial Circuit Superior Court', 'Coweta Judicial Circuit Superior Court'),
-    ('Crawford County Probate Court', 'Crawford County Probate Court'),
-    ('Crisp County Probate Court', 'Crisp County Probate Court'),
-    ('Dade County Probate Court', 'Dade County Probate Court'),
-    ('Dawson County Probate Court', 'Dawson County Probate Court'),
-    ('Decatur County Probate Court', 'Decatur County Probate Court'),
-    ('DeKalb County Probate Court', 'DeKalb County Probate Court'),
-    ('Dodge County Probate Court', 'Dodge County Probate Court'),
-    ('Dooly County Probate Court', 'Dooly County Probate Court'),
-    ('Dougherty County Probate Court', 'Dougherty County Probate Court'),
-    ('Dougherty Judicial Circuit Superior Court', 'Dougherty Judicial Circuit Superior Court'),
-    ('Douglas County Probate Court', 'Douglas County Probate Court'),
-    ('Douglas Judicial Circuit Superior Court', 'Douglas Judicial Circuit Superior Court'),
-    ('Dublin Judicial Circuit Superior Court', 'Dublin Judicial Circuit Superior Court'),
-    ('Early County Probate Court', 'Early County Probate Court'),
-    ('Eastern Judicial Circuit Superior Court', 'Eastern Judicial Circuit Superior Court'),
-    ('Echols County Probate Court', 'Echols County Probate Court'),
-    ('Effingham County Probate Court', 'Effingham County Probate Court'),
-    ('Elbert County Probate Court', 'Elbert County Probate Court'),
-    ('Emanuel County Probate Court', 'Emanuel County Probate Court'),
-    ('Enotah Judicial Circuit Superior Court', 'Enotah Judicial Circuit Superior Court'),
-    ('Evans County Probate Court', 'Evans County Probate Court'),
-    ('Fannin County Probate Court', 'Fannin County Probate Court'),
-    ('Fayette County Probate Court', 'Fayette County Probate Court'),
-    ('Flint Judicial Circuit Superior Court', 'Flint Judicial Circuit Superior Court'),
-    ('Floyd County Probate Court', 'Floyd County Probate Court'),
-    ('Forsyth County Probate Court', 'Forsyth County Probate Court'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Fulton County Probate Court', 'Fulton County Probate Court'),
-    ('Gilmer County Probate Court', 'Gilmer County Probate Court'),
-    ('Glascock County Probate Court', 'Glascock County Probate Court'),
-    ('Glynn County Probate Court', 'Glynn County Probate Court'),
-    ('Gordon County Probate Court', 'Gordon County Probate Court'),
-    ('Grady County Probate Court', 'Grady County Probate Court'),
-    ('Greene County Probate Court', 'Greene County Probate Court'),
-    ('Griffin Judicial Circuit Superior Court', 'Griffin Judicial Circuit Superior Court'),
-    ('Gwinnett County Probate Court', 'Gwinnett County Probate Court'),
-    ('Gwinnett Judicial Circuit Superior Court', 'Gwinnett Judicial Circuit Superior Court'),
-    ('Habersham County Probate Court', 'Habersham County Probate Court'),
-    ('Hall County Probate Court', 'Hall County Probate Court'),
-    ('Hancock County Probate Court', 'Hancock County Probate Court'),
-    ('Haralson County Probate Court', 'Haralson County Probate Court'),
-    ('Harris County Probate Court', 'Harris County Probate Court'),
-    ('Hart County Probate Court', 'Hart County Probate Court'),
-    ('Heard County Probate Court', 'Heard County Probate Court'),
-    ('Henry County Probate Court', 'Henry County Probate Court'),
-    ('Houston County Probate Court', 'Houston County Probate Court'),
-    ('Houston Judicial Circuit Superior Court', 'Houston Judicial Circuit Superior Court'),
-    ('Irwin County Probate Court', 'Irwin County Probate Court'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Jasper County Probate Court', 'Jasper County Probate Court'),
-    ('Jeff Davis County Probate Court', 'Jeff Davis County Probate Court'),
-    ('Jefferson County Probate Court', 'Jefferson County Probate Court'),
-    ('Jenkins County Probate Court', 'Jenkins County Probate Court'),
-    ('Johnson County Probate Court', 'Johnson County Probate Court'),
-    ('Jones County Probate Court', 'Jones County Probate Court'),
-    ('Lamar County Probate Court', 'Lamar County Probate Court'),
-    ('Lanier County Probate Court', 'Lanier County Probate Court'),
-    ('Laurens County Probate Court', 'Laurens County Probate Court'),
-    ('Lee County Probate Court', 'Lee County Probate Court'),
-    ('Liberty County Probate Court', 'Liberty County Probate Court'),
-    ('Lincoln County Probate Court', 'Lincoln County Probate Court'),
-    ('Long County Probate Court', 'Long County Probate Court'),
-    ('Lookout Mountain Judicial Circuit Superior Court', 'Lookout Mountain Judicial Circuit Superior Court'),
-    ('Lowndes County Probate Court', 'Lowndes County Probate Court'),
-    ('Lumpkin County Probate Court', 'Lumpkin County Probate Court'),
-    ('Macon County Probate Court', 'Macon County Probate Court'),
-    ('Macon Judicial Circuit Superior Court', 'Macon Judicial Circuit Superior Court'),
-    ('Madison County Probate Court', 'Madison County Probate Court'),
-    ('Marion County Probate Court', 'Marion County Probate Court'),
-    ('McDuffie County Probate Court', 'McDuffie County Probate Court'),
-    ('McIntosh County Probate Court', 'McIntosh County Probate Court'),
-    ('Meriwether County Probate Court', 'Meriwether County Probate Court'),
-    ('Middle Judicial Circuit Superior Court', 'Middle Judicial Circuit Superior Court'),
-    ('Miller County Probate Court', 'Miller County Probate Court'),
-    ('Mitchell County Probate Court', 'Mitchell County Probate Court'),
-    ('Monroe County Probate Court', 'Monroe County Probate Court'),
-    ('Montgomery County Probate Court', 'Montgomery County Probate Court'),
-    ('Morgan County Probate Court', 'Morgan County Probate Court'),
-    ('Mountain Judicial Circuit Superior Court', 'Mountain Judicial Circuit Superior Court'),
-    ('Murray County Probate Court', 'Murray County Probate Court'),
-    ('Muscogee County Probate Court', 'Muscogee County Probate Court'),
-    ('Newton County Probate Court', 'Newton County Probate Court'),
-    ('Northeastern Judicial Circuit Superior Court', 'Northeastern Judicial Circuit Superior Court'),
-    ('Northern Judicial Circuit Superior Court', 'Northern Judicial Circuit Superior Court'),
-    ('Ocmulgee Judicial Circuit Superior Court', 'Ocmulgee Judicial Circuit Superior Court'),
-    ('Oconee County Probate Court', 'Oconee County Probate Court'),
-    ('Oconee Judicial Circuit Superior Court', 'Oconee Judicial Circuit Superior Court'),
-    ('Ogeechee Judicial Circuit Superior Court', 'Ogeechee Judicial Circuit Superior Court'),
-    ('Oglethorpe County Probate Court', 'Oglethorpe County Probate Court'),
-    ('Pataula Judicial Circuit Superior Court', 'Pataula Judicial Circuit Superior Court'),
-    ('Paulding County Probate Court', 'Paulding County Probate Court'),
-    ('Paulding Judicial Circuit Superior Court', 'Paulding Judicial Circuit Superior Court'),
-    ('Peach County Probate Court', 'Peach County Probate Court'),
-    ('Pickens County Probate Court', 'Pickens County Probate Court'),
-    ('Piedmont Judicial Circuit Superior Court', 'Piedmont Judicial Circuit Superior Court'),
-    ('Pierce County Probate Court', 'Pierce County Probate Court'),
-    ('Pike County Probate Court', 'Pike County Probate Court'),
-    ('Polk County Probate Court', 'Polk County Probate Court'),
-    ('Pulaski County Probate Court', 'Pulaski County Probate Court'),
-    ('Putnam County Probate Court', 'Putnam County Probate Court'),
-    ('Quitman County Probate Court', 'Quitman County Probate Court'),
-    ('Rabun County Probate Court', 'Rabun County Probate Court'),
-    ('Randolph County Probate Court', 'Randolph County Probate Court'),
-    ('Richmond County Probate Court', 'Richmond County Probate Court'),
-    ('Rockdale County Probate Court', 'Rockdale County Probate Court'),
-    ('Rockdale Judicial Circuit Superior Court', 'Rockdale Judicial Circuit Superior Court'),
-    ('Rome Judicial Circuit Superior Court', 'Rome Judicial Circuit Superior Court'),
-    ('Savannah Municipal Court', 'Savannah Municipal Court'),
-    ('Schley County Probate Court', 'Schley County Probate Court'),
-    ('Screven County Probate Court', 'Screven County Probate Court'),
-    ('Seminole County Probate Court', 'Seminole County Probate Court'),
-    ('South Georgia Judicial Circuit Superior Court', 'South Georgia Judicial Circuit Superior Court'),
-    ('Southern Judicial Circuit Superior Court', 'Southern Judicial Circuit Superior Court'),
-    ('Southwestern Judicial Circuit Superior Court', 'Southwestern Judicial Circuit Superior Court'),
-    ('Spalding County Probate Court', 'Spalding County Probate Court'),
-    ('Stephens County Probate Court', 'Stephens County Probate Court'),
-    ('Stewart County Probate Court', 'Stewart County Probate Court'),
-    ('Stone Mountain Judicial Circuit Superior Court', 'Stone Mountain Judicial Circuit Superior Court'),
-    ('Sumter County Probate Court', 'Sumter County Probate Court'),
-    ('Talbot County Probate Court', 'Talbot County Probate Court'),
-    ('Taliaferro County Probate Court', 'Taliaferro County Probate Court'),
-    ('Tallapoosa Judicial Circuit Superior Court', 'Tallapoosa Judicial Circuit Superior Court'),
-    ('Tattnall County Probate Court', 'Tattnall County Probate Court'),
-    ('Taylor County Probate Court', 'Taylor County Probate Court'),
-    ('Telfair County Probate Court', 'Telfair County Probate Court'),
-    ('Terrell County Probate Court', 'Terrell County Probate Court'),
-    ('Thomas County Probate Court', 'Thomas County Probate Court'),
-    ('Tift County Probate Court', 'Tift County Probate Court'),
-    ('Tifton Judicial Circuit Superior Court', 'Tifton Judicial Circuit Superior Court'),
-    ('Toombs County Probate Court', 'Toombs County Probate Court'),
-    ('Toombs Judicial Circuit Superior Court', 'Toombs Judicial Circuit Superior Court'),
-    ('Towns County Probate Court', 'Towns County Probate Court'),
-    ('Treutlen County Probate Court', 'Treutlen County Probate Court'),
-    ('Troup County Probate Court', 'Troup County Probate Court'),
-    ('Turner County Probate Court', 'Turner County Probate Court'),
-    ('Twiggs County Probate Court', 'Twiggs County Probate Court'),
-    ('Union County Probate Court', 'Union County Probate Court'),
-    ('Upson County Probate Court', 'Upson County Probate Court'),
-    ('Walker County Probate Court', 'Walker County Probate Court'),
-    ('Walton County Probate Court', 'Walton County Probate Court'),
-    ('Ware County Probate Court', 'Ware County Probate Court'),
-    ('Warren County Probate Court', 'Warren County Probate Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Waycross Judicial Circuit Superior Court', 'Waycross Judicial Circuit Superior Court'),
-    ('Wayne County Probate Court', 'Wayne County Probate Court'),
-    ('Webster County Probate Court', 'Webster County Probate Court'),
-    ('Western Judicial Circuit Superior Court', 'Western Judicial Circuit Superior Court'),
-    ('Wheeler County Probate Court', 'Wheeler County Probate Court'),
-    ('White County Probate Court', 'White County Probate Court'),
-    ('Whitfield County Probate Court', 'Whitfield County Probate Court'),
-    ('Wilcox County Probate Court', 'Wilcox County Probate Court'),
-    ('Wilkes County Probate Court', 'Wilkes County Probate Court'),
-    ('Wilkinson County Probate Court', 'Wilkinson County Probate Court'),
-    ('Worth County Probate Court', 'Worth County Probate Court'),
-
-]
-
-HAWAII_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Hawaii Supreme Court', 'Hawaii Supreme Court'),
-    ('Hawaii Intermediate Court of Appeals', 'Hawaii Intermediate Court of Appeals'),
-    ('U.S. District Court for the District of Hawaii', 'U.S. District Court for the District of Hawaii'),
-    ('District Court of the First Circuit', 'District Court of the First Circuit'),
-    ('District Court of the Second Circuit', 'District Court of the Second Circuit'),
-    ('District Court of the Third Circuit', 'District Court of the Third Circuit'),
-    ('Fifth Circuit Court', 'Fifth Circuit Court'),
-    ('First Circuit Court', 'First Circuit Court'),
-    ('Second Circuit Court', 'Second Circuit Court'),
-    ('Third Circuit Court', 'Third Circuit Court'),
-
-]
-
-IDAHO_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Idaho Supreme Court', 'Idaho Supreme Court'),
-    ('Idaho Court of Appeals', 'Idaho Court of Appeals'),
-    ('U.S. District Court for the District of Idaho', 'U.S. District Court for the District of Idaho'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('Ada County Magistrate Court', 'Ada County Magistrate Court'),
-    ('Adams County Magistrate Court', 'Adams County Magistrate Court'),
-    ('Bannock County Magistrate Court', 'Bannock County Magistrate Court'),
-    ('Bear Lake County Magistrate Court', 'Bear Lake County Magistrate Court'),
-    ('Benewah County Magistrate Court', 'Benewah County Magistrate Court'),
-    ('Bingham County Magistrate Court', 'Bingham County Magistrate Court'),
-    ('Blaine County Magistrate Court', 'Blaine County Magistrate Court'),
-    ('Boise County Magistrate Court', 'Boise County Magistrate Court'),
-    ('Bonner County Magistrate Court', 'Bonner County Magistrate Court'),
-    ('Bonneville County Magistrate Court', 'Bonneville County Magistrate Court'),
-    ('Boundary County Magistrate Court', 'Boundary County Magistrate Court'),
-    ('Butte County Magistrate Court', 'Butte County Magistrate Court'),
-    ('Camas County Magistrate Court', 'Camas County Magistrate Court'),
-    ('Canyon County Magistrate Court', 'Canyon County Magistrate Court'),
-    ('Caribou County Magistrate Court', 'Caribou County Magistrate Court'),
-    ('Cassia County Magistrate Court', 'Cassia County Magistrate Court'),
-    ('Clark County Magistrate Court', 'Clark County Magistrate Court'),
-    ('Clearwater County Magistrate Court', 'Clearwater County Magistrate Court'),
-    ('Custer County Magistrate Court', 'Custer County Magistrate Court'),
-    ('Elmore County Magistrate Court', 'Elmore County Magistrate Court'),
-    ('Franklin County Magistrate Court', 'Franklin County Magistrate Court'),
-    ('Fremont County Magistrate Court', 'Fremont County Magistrate Court'),
-    ('Gem County Magistrate Court', 'Gem County Magistrate Court'),
-    ('Gooding County Magistrate Court', 'Gooding County Magistrate Court'),
-    ('Idaho County Magistrate Court', 'Idaho County Magistrate Court'),
-    ('Jefferson County Magistrate Court', 'Jefferson County Magistrate Court'),
-    ('Jerome County Magistrate Court', 'Jerome County Magistrate Court'),
-    ('Kootenai County Magistrate Court', 'Kootenai County Magistrate Court'),
-    ('Latah County Magistrate Court', 'Latah County Magistrate Court'),
-    ('Lemhi County Magistrate Court', 'Lemhi County Magistrate Court'),
-    ('Lewis County Magistrate Court', 'Lewis County Magistrate Court'),
-    ('Lincoln County Magistrate Court', 'Lincoln County Magistrate Court'),
-    ('Madison County Magistrate Court', 'Madison County Magistrate Court'),
-    ('Minidoka County Magistrate Court', 'Minidoka County Magistrate Court'),
-    ('Nez Perce County Magistrate Court', 'Nez Perce County Magistrate Court'),
-    ('Oneida County Magistrate Court', 'Oneida County Magistrate Court'),
-    ('Owyhee County Magistrate Court', 'Owyhee County Magistrate Court'),
-    ('Payette County Magistrate Court', 'Payette County Magistrate Court'),
-    ('Power County Magistrate Court', 'Power County Magistrate Court'),
-    ('Shoshone County Magistrate Court', 'Shoshone County Magistrate Court'),
-    ('Teton County Magistrate Court', 'Teton County Magistrate Court'),
-    ('Twin Falls County Magistrate Court', 'Twin Falls County Magistrate Court'),
-    ('Valley County Magistrate Court', 'Valley County Magistrate Court'),
-
-]
-
-ILLINOIS_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Seventh Circuit', 'U.S. Court of Appeals for the Seventh Circuit'),
-    ('Illinois Supreme Court', 'Illinois Supreme Court'),
-    ('U.S. District Court for the Northern District of Illinois', 'U.S. District Court for the Northern District of Illinois'),
-    ('U.S. District Court for the Central District of Illinois', 'U.S. District Court for the Central District of Illinois'),
-    ('U.S. District Court for the Southern District of Illinois', 'U.S. District Court for the Southern District of Illinois'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Illinois Appellate Court Fifth District', 'Illinois Appellate Court Fifth District'),
-    ('Illinois Appellate Court First District', 'Illinois Appellate Court First District'),
-    ('Illinois Appellate Court Fourth District', 'Illinois Appellate Court Fourth District'),
-    ('Illinois Appellate Court Second District', 'Illinois Appellate Court Second District'),
-    ('Illinois Appellate Court Third District', 'Illinois Appellate Court Third District'),
-
-]
-
-INDIANA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Seventh Circuit', 'U.S. Court of Appeals for the Seventh Circuit'),
-    ('Indiana Supreme Court', 'Indiana Supreme Court'),
-    ('Indiana Court of Appeals', 'Indiana Court of Appeals'),
-    ('U.S. District Court for the Northern District of Indiana', 'U.S. District Court for the Northern District of Indiana'),
-    ('U.S. District Court for the Southern District of Indiana', 'U.S. District Court for the Southern District of Indiana'),
-    ('Adams County Circuit Court', 'Adams County Circuit Court'),
-    ('Allen County Circuit Court', 'Allen County Circuit Court'),
-    ('Bartholomew County Circuit Court', 'Bartholomew County Circuit Court'),
-    ('Benton County Circuit Court', 'Benton County Circuit Court'),
-    ('Blackford County Circuit Court', 'Blackford County Circuit Court'),
-    ('Boone County Circuit Court', 'Boone County Circuit Court'),
-    ('Brown County Circuit Court', 'Brown County Circuit Court'),
-    ('Carroll County Circuit Court', 'Carroll County Circuit Court'),
-    ('Cass County Circuit Court', 'Cass County Circuit Court'),
-    ('Clark County Circuit Court', 'Clark County Circuit Court'),
-    ('Clay County Circuit Court', 'Clay County Circuit Court'),
-    ('Clinton County Circuit Court', 'Clinton County Circuit Court'),
-    ('Crawford County Circuit Court', 'Crawford County Circuit Court'),
-    ('Daviess County Circuit Court', 'Daviess County Circuit Court'),
-    ('Dearborn County Circuit Court', 'Dearborn County Circuit Court'),
-    ('Decatur County Circuit Court', 'Decatur County Circuit Court'),
-    ('DeKalb County Circuit Court', 'DeKalb County Circuit Court'),
-    ('Delaware County Circuit Court', 'Delaware County Circuit Court'),
-    ('Dubois County Circuit Court', 'Dubois County Circuit Court'),
-    ('Elkhart County Circuit Court', 'Elkhart County Circuit Court'),
-    ('Fayette County Circuit Court', 'Fayette County Circuit Court'),
-    ('Floyd County Circuit Court', 'Floyd County Circuit Court'),
-    ('Fountain County Circuit Court', 'Fountain County Circuit Court'),
-    ('Franklin County Circuit Court', 'Franklin County Circuit Court'),
-    ('Fulton County Circuit Court', 'Fulton County Circuit Court'),
-    ('Gibson County Circuit Court', 'Gibson County Circuit Court'),
-    ('Grant County Circuit Court', 'Grant County Circuit Court'),
-    ('Greene County Circuit Court', 'Greene County Circuit Court'),
-    ('Hamilton County Circuit Court', 'Hamilton County Circuit Court'),
-    ('Hancock County Circuit Court', 'Hancock County Circuit Court'),
-    ('Harrison County Circuit Court', 'Harrison County Circuit Court'),
-    ('Hendricks County Circuit Court', 'Hendricks County Circuit Court'),
-    ('Henry County Circuit Court', 'Henry County Circuit Court'),
-    ('Howard County Circuit Court', 'Howard County Circuit Court'),
-    ('Huntington County Circuit Court', 'Huntington County Circuit Court'),
-    ('Indiana Tax Court', 'Indiana Tax Court'),
-    ('Jackson County Circuit Court', 'Jackson County Circuit Court'),
-    ('Jasper County Circuit Court', 'Jasper County Circuit Court'),
-    ('Jay County Circuit Court', 'Jay County Circuit Court'),
-    ('Jefferson County Circuit Court', 'Jefferson County Circuit Court'),
-    ('Jennings County Circuit Court', 'Jennings County Circuit Court'),
-    ('Johnson County Circuit Court', 'Johnson County Circuit Court'),
-    ('Knox County Circuit Court', 'Knox County Circuit Court'),
-    ('Kosciusko County Circuit Court', 'Kosciusko County Circuit Court'),
-    ('LaGrange County Circuit Court', 'LaGrange County Circuit Court'),
-    ('Lake County Circuit Court', 'Lake County Circuit Court'),
-    ('LaPorte County Circuit Court', 'LaPorte County Circuit Court'),
-    ('Lawrence County Circuit Court', 'Lawrence County Circuit Court'),
-    ('Madison County Circuit Court', 'Madison County Circuit Court'),
-    ('Marion County Circuit Court', 'Marion County Circuit Court'),
-    ('Marshall County Circuit Court', 'Marshall County Circuit Court'),
-    ('Martin County Circuit Court', 'Martin County Circuit Court'),
-    ('Miami County Circuit Court', 'Miami County Circuit Court'),
-    ('Monroe County Circuit Court', 'Monroe County Circuit Court'),
-    ('Montgomery County Circuit Court', 'Montgomery County Circuit Court'),
-    ('Morgan County Circuit Court', 'Morgan County Circuit Court'),
-    ('Newton County Circuit Court', 'Newton County Circuit Court'),
-    ('Noble County Circuit Court', 'Noble County Circuit Court'),
-    ('Ohio County Circuit Court', 'Ohio County Circuit Court'),
-    ('Orange County Circuit Court', 'Orange County Circuit Court'),
-    ('Owen County Circuit Court', 'Owen County Circuit Court'),
-    ('Parke County Circuit Court', 'Parke County Circuit Court'),
-    ('Perry County Circuit Court', 'Perry County Circuit Court'),
-    ('Pike County Circuit Court', 'Pike County Circuit Court'),
-    ('Porter County Circuit Court', 'Porter County Circuit Court'),
-    ('Posey County Circuit Court', 'Posey County Circuit Court'),
-    ('Pulaski County Circuit Court', 'Pulaski County Circuit Court'),
-    ('Putnam County Circuit Court', 'Putnam County Circuit Court'),
-    ('Randolph County Circuit Court', 'Randolph County Circuit Court'),
-    ('Ripley County Circuit Court', 'Ripley County Circuit Court'),
-    ('Rush County Circuit Court', 'Rush County Circuit Court'),
-    ('Scott County Circuit Court', 'Scott County Circuit Court'),
-    ('Shelby County Circuit Court', 'Shelby County Circuit Court'),
-    ('Spencer County Circuit Court', 'Spencer County Circuit Court'),
-    ('St. Joseph County Circuit Court', 'St. Joseph County Circuit Court'),
-    ('Starke County Circuit Court', 'Starke County Circuit Court'),
-    ('Steuben County Circuit Court', 'Steuben County Circuit Court'),
-    ('Sullivan County Circuit Court', 'Sullivan County Circuit Court'),
-    ('Switzerland County Circuit Court', 'Switzerland County Circuit Court'),
-    ('Tippecanoe County Circuit Court', 'Tippecanoe County Circuit Court'),
-    ('Tipton County Circuit Court', 'Tipton County Circuit Court'),
-    ('Union County Circuit Court', 'Union County Circuit Court'),
-    ('Vanderburgh County Circuit Court', 'Vanderburgh County Circuit Court'),
-    ('Vermillion County Circuit Court', 'Vermillion County Circuit Court'),
-    ('Vigo County Circuit Court', 'Vigo County Circuit Court'),
-    ('Wabash County Circuit Court', 'Wabash County Circuit Court'),
-    ('Warren County Circuit Court', 'Warren County Circuit Court'),
-    ('Warrick County Circuit Court', 'Warrick County Circuit Court'),
-    ('Washington County Circuit Court', 'Washington County Circuit Court'),
-    ('Wayne County Circuit Court', 'Wayne County Circuit Court'),
-    ('Wells County Circuit Court', 'Wells County Circuit Court'),
-    ('White County Circuit Court', 'White County Circuit Court'),
-
-]
-
-IOWA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('Iowa Supreme Court', 'Iowa Supreme Court'),
-    ('Iowa Court of Appeals', 'Iowa Court of Appeals'),
-    ('U.S. District Court for the Northern District of Iowa', 'U.S. District Court for the Northern District of Iowa'),
-    ('U.S. District Court for the Southern District of Iowa', 'U.S. District Court for the Southern District of Iowa'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('Adair County District Court', 'Adair County District Court'),
-    ('Adams County District Court', 'Adams County District Court'),
-    ('Allamakee County District Court', 'Allamakee County District Court'),
-    ('Appanoose County District Court', 'Appanoose County District Court'),
-    ('Audubon County District Court', 'Audubon County District Court'),
-    ('Benton County District Court', 'Benton County District Court'),
-    ('Black Hawk County District Court', 'Black Hawk County District Court'),
-    ('Boone County District Court', 'Boone County District Court'),
-    ('Bremer County District Court', 'Bremer County District Court'),
-    ('Buchanan County District Court', 'Buchanan County District Court'),
-    ('Buena Vista County District Court', 'Buena Vista County District Court'),
-    ('Butler County District Court', 'Butler County District Court'),
-    ('Calhoun County District Court', 'Calhoun County District Court'),
-    ('Carroll County District Court', 'Carroll County District Court'),
-    ('Cass County District Court', 'Cass County District Court'),
-    ('Cedar County District Court', 'Cedar County District Court'),
-    ('Cerro Gordo County District Court', 'Cerro Gordo County District Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Chickasaw County District Court', 'Chickasaw County District Court'),
-    ('Clarke County District Court', 'Clarke County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Clayton County District Court', 'Clayton County District Court'),
-    ('Clinton County District Court', 'Clinton County District Court'),
-    ('Crawford County District Court', 'Crawford County District Court'),
-    ('Dallas County District Court', 'Dallas County District Court'),
-    ('Davis County District Court', 'Davis County District Court'),
-    ('Decatur County District Court', 'Decatur County District Court'),
-    ('Delaware County District Court', 'Delaware County District Court'),
-    ('Des Moines County District Court', 'Des Moines County District Court'),
-    ('Dickinson County District Court', 'Dickinson County District Court'),
-    ('Dubuque County District Court', 'Dubuque County District Court'),
-    ('Emmet County District Court', 'Emmet County District Court'),
-    ('Fayette County District Court', 'Fayette County District Court'),
-    ('Floyd County District Court', 'Floyd County District Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Fremont County District Court', 'Fremont County District Court'),
-    ('Greene County District Court', 'Greene County District Court'),
-    ('Grundy County District Court', 'Grundy County District Court'),
-    ('Guthrie County District Court', 'Guthrie County District Court'),
-    ('Hamilton County District Court', 'Hamilton County District Court'),
-    ('Hancock County District Court', 'Hancock County District Court'),
-    ('Hardin County District Court', 'Hardin County District Court'),
-    ('Harrison County District Court', 'Harrison County District Court'),
-    ('Henry County District Court', 'Henry County District Court'),
-    ('Howard County District Court', 'Howard County District Court'),
-    ('Humboldt County District Court', 'Humboldt County District Court'),
-    ('Ida County District Court', 'Ida County District Court'),
-    ('Iowa County District Court', 'Iowa County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jasper County District Court', 'Jasper County District Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Johnson County District Court', 'Johnson County District Court'),
-    ('Jones County District Court', 'Jones County District Court'),
-    ('Keokuk County District Court', 'Keokuk County District Court'),
-    ('Kossuth County District Court', 'Kossuth County District Court'),
-    ('Lee County District Court', 'Lee County District Court'),
-    ('Linn County District Court', 'Linn County District Court'),
-    ('Louisa County District Court', 'Louisa County District Court'),
-    ('Lucas County District Court', 'Lucas County District Court'),
-    ('Lyon County District Court', 'Lyon County District Court'),
-    ('Madison County District Court', 'Madison County District Court'),
-    ('Mahaska County District Court', 'Mahaska County District Court'),
-    ('Marion County District Court', 'Marion County District Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('Mills County District Court', 'Mills County District Court'),
-    ('Mitchell County District Court', 'Mitchell County District Court'),
-    ('Monona County District Court', 'Monona County District Court'),
-    ('Monroe County District Court', 'Monroe County District Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Muscatine County District Court', 'Muscatine County District Court'),
-    ('O\'Brien County District Court', 'O\'Brien County District Court'),
-    ('Osceola County District Court', 'Osceola County District Court'),
-    ('Page County District Court', 'Page County District Court'),
-    ('Palo Alto County District Court', 'Palo Alto County District Court'),
-    ('Plymouth County District Court', 'Plymouth County District Court'),
-    ('Pocahontas County District Court', 'Pocahontas County District Court'),
-    ('Polk County District Court', 'Polk County District Court'),
-    ('Pottawattamie County District Court', 'Pottawattamie County District Court'),
-    ('Poweshiek County District Court', 'Poweshiek County District Court'),
-    ('Ringgold County District Court', 'Ringgold County District Court'),
-    ('Sac County District Court', 'Sac County District Court'),
-    ('Scott County District Court', 'Scott County District Court'),
-    ('Shelby County District Court', 'Shelby County District Court'),
-    ('Sioux County District Court', 'Sioux County District Court'),
-    ('Story County District Court', 'Story County District Court'),
-    ('Tama County District Court', 'Tama County District Court'),
-    ('Taylor County District Court', 'Taylor County District Court'),
-    ('Union County District Court', 'Union County District Court'),
-    ('Van Buren County District Court', 'Van Buren County District Court'),
-    ('Wapello County District Court', 'Wapello County District Court'),
-    ('Warren County District Court', 'Warren County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Wayne County District Court', 'Wayne County District Court'),
-    ('Webster County District Court', 'Webster County District Court'),
-    ('Winnebago County District Court', 'Winnebago County District Court'),
-    ('Winneshiek County District Court', 'Winneshiek County District Court'),
-    ('Woodbury County District Court', 'Woodbury County District Court'),
-    ('Worth County District Court', 'Worth County District Court'),
-
-]
-
-KANSAS_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('Kansas Supreme Court', 'Kansas Supreme Court'),
-    ('Kansas Court of Appeals', 'Kansas Court of Appeals'),
-    ('U.S. District Court for the District of Kansas', 'U.S. District Court for the District of Kansas'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('14th Judicial District Court', '14th Judicial District Court'),
-    ('15th Judicial District Court', '15th Judicial District Court'),
-    ('16th Judicial District Court', '16th Judicial District Court'),
-    ('17th Judicial District Court', '17th Judicial District Court'),
-    ('18th Judicial District Court', '18th Judicial District Court'),
-    ('19th Judicial District Court', '19th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('20th Judicial District Court', '20th Judicial District Court'),
-    ('21st Judicial District Court', '21st Judicial District Court'),
-    ('22nd Judicial District Court', '22nd Judicial District Court'),
-    ('23rd Judicial District Court', '23rd Judicial District Court'),
-    ('24th Judicial District Court', '24th Judicial District Court'),
-    ('25th Judicial District Court', '25th Judicial District Court'),
-    ('26th Judicial District Court', '26th Judicial District Court'),
-    ('27th Judicial District Court', '27th Judicial District Court'),
-    ('28th Judicial District Court', '28th Judicial District Court'),
-    ('29th Judicial District Court', '29th Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('30th Judicial District Court', '30th Judicial District Court'),
-    ('31st Judicial District Court', '31st Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Allen County District Court', 'Allen County District Court'),
-    ('Anderson County District Court', 'Anderson County District Court'),
-    ('Atchison County District Court', 'Atchison County District Court'),
-    ('Barber County District Court', 'Barber County District Court'),
-    ('Barton County District Court', 'Barton County District Court'),
-    ('Bourbon County District Court', 'Bourbon County District Court'),
-    ('Brown County District Court', 'Brown County District Court'),
-    ('Butler County District Court', 'Butler County District Court'),
-    ('Chase County District Court', 'Chase County District Court'),
-    ('Chautauqua County District Court', 'Chautauqua County District Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Cheyenne County District Court', 'Cheyenne County District Court'),
-    ('Clark County District Court', 'Clark County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Cloud County District Court', 'Cloud County District Court'),
-    ('Coffey County District Court', 'Coffey County District Court'),
-    ('Comanche County District Court', 'Comanche County District Court'),
-    ('Cowley County District Court', 'Cowley County District Court'),
-    ('Crawford County District Court', 'Crawford County District Court'),
-    ('Decatur County District Court', 'Decatur County District Court'),
-    ('Dickinson County District Court', 'Dickinson County District Court'),
-    ('Doniphan County District Court', 'Doniphan County District Court'),
-    ('Douglas County District Court', 'Douglas County District Court'),
-    ('Edwards County District Court', 'Edwards County District Court'),
-    ('Elk County District Court', 'Elk County District Court'),
-    ('Ellis County District Court', 'Ellis County District Court'),
-    ('Ellsworth County District Court', 'Ellsworth County District Court'),
-    ('Finney County District Court', 'Finney County District Court'),
-    ('Ford County District Court', 'Ford County District Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Geary County District Court', 'Geary County District Court'),
-    ('Gove County District Court', 'Gove County District Court'),
-    ('Graham County District Court', 'Graham County District Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Gray County District Court', 'Gray County District Court'),
-    ('Greeley County District Court', 'Greeley County District Court'),
-    ('Greenwood County District Court', 'Greenwood County District Court'),
-    ('Hamilton County District Court', 'Hamilton County District Court'),
-    ('Harper County District Court', 'Harper County District Court'),
-    ('Harvey County District Court', 'Harvey County District Court'),
-    ('Haskell County District Court', 'Haskell County District Court'),
-    ('Hodgeman County District Court', 'Hodgeman County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Jewell County District Court', 'Jewell County District Court'),
-    ('Johnson County District Court', 'Johnson County District Court'),
-    ('Kearny County District Court', 'Kearny County District Court'),
-    ('Kingman County District Court', 'Kingman County District Court'),
-    ('Kiowa County District Court', 'Kiowa County District Court'),
-    ('Labette County District Court', 'Labette County District Court'),
-    ('Lane County District Court', 'Lane County District Court'),
-    ('Leavenworth County District Court', 'Leavenworth County District Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Linn County District Court', 'Linn County District Court'),
-    ('Logan County District Court', 'Logan County District Court'),
-    ('Lyon County District Court', 'Lyon County District Court'),
-    ('Marion County District Court', 'Marion County District Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('McPherson County District Court', 'McPherson County District Court'),
-    ('Meade County District Court', 'Meade County District Court'),
-    ('Miami County District Court', 'Miami County District Court'),
-    ('Mitchell County District Court', 'Mitchell County District Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Morris County District Court', 'Morris County District Court'),
-    ('Morton County District Court', 'Morton County District Court'),
-    ('Nemaha County District Court', 'Nemaha County District Court'),
-    ('Neosho County District Court', 'Neosho County District Court'),
-    ('Ness County District Court', 'Ness County District Court'),
-    ('Norton County District Court', 'Norton County District Court'),
-    ('Osage County District Court', 'Osage County District Court'),
-    ('Osborne County District Court', 'Osborne County District Court'),
-    ('Ottawa County District Court', 'Ottawa County District Court'),
-    ('Pawnee County District Court', 'Pawnee County District Court'),
-    ('Phillips County District Court', 'Phillips County District Court'),
-    ('Pottawatomie County District Court', 'Pottawatomie County District Court'),
-    ('Pratt County District Court', 'Pratt County District Court'),
-    ('Rawlins County District Court', 'Rawlins County District Court'),
-    ('Reno County District Court', 'Reno County District Court'),
-    ('Republic County District Court', 'Republic County District Court'),
-    ('Rice County District Court', 'Rice County District Court'),
-    ('Riley County District Court', 'Riley County District Court'),
-    ('Rooks County District Court', 'Rooks County District Court'),
-    ('Rush County District Court', 'Rush County District Court'),
-    ('Russell County District Court', 'Russell County District Court'),
-    ('Saline County District Court', 'Saline County District Court'),
-    ('Scott County District Court', 'Scott County District Court'),
-    ('Sedgwick County District Court', 'Sedgwick County District Court'),
-    ('Seward County District Court', 'Seward County District Court'),
-    ('Shawnee County District Court', 'Shawnee County District Court'),
-    ('Sheridan County District Court', 'Sheridan County District Court'),
-    ('Sherman County District Court', 'Sherman County District Court'),
-    ('Smith County District Court', 'Smith County District Court'),
-    ('Stafford County District Court', 'Stafford County District Court'),
-    ('Stanton County District Court', 'Stanton County District Court'),
-    ('Stevens County District Court', 'Stevens County District Court'),
-    ('Sumner County District Court', 'Sumner County District Court'),
-    ('Thomas County District Court', 'Thomas County District Court'),
-    ('Trego County District Court', 'Trego County District Court'),
-    ('Wabaunsee County District Court', 'Wabaunsee County District Court'),
-    ('Wallace County District Court', 'Wallace County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Wichita County District Court', 'Wichita County District Court'),
-    ('Wilson County District Court', 'Wilson County District Court'),
-    ('Woodson County District Court', 'Woodson County District Court'),
-
-]
-
-KENTUCKY_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Sixth Circuit', 'U.S. Court of Appeals for the Sixth Circuit'),
-    ('Kentucky Supreme Court', 'Kentucky Supreme Court'),
-    ('Kentucky Court of Appeals', 'Kentucky Court of Appeals'),
-    ('U.S. District Court for the Eastern District of Kentucky', 'U.S. District Court for the Eastern District of Kentucky'),
-    ('U.S. District Court for the Western District of Kentucky', 'U.S. District Court for the Western District of Kentucky'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('31st Judicial Circuit Court', '31st Judicial Circuit Court'),
-    ('32nd Judicial Circuit Court', '32nd Judicial Circuit Court'),
-    ('33rd Judicial Circuit Court', '33rd Judicial Circuit Court'),
-    ('34th Judicial Circuit Court', '34th Judicial Circuit Court'),
-    ('35th Judicial Circuit Court', '35th Judicial Circuit Court'),
-    ('36th Judicial Circuit Court', '36th Judicial Circuit Court'),
-    ('37th Judicial Circuit Court', '37th Judicial Circuit Court'),
-    ('38th Judicial Circuit Court', '38th Judicial Circuit Court'),
-    ('39th Judicial Circuit Court', '39th Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('40th Judicial Circuit Court', '40th Judicial Circuit Court'),
-    ('41st Judicial Circuit Court', '41st Judicial Circuit Court'),
-    ('42nd Judicial Circuit Court', '42nd Judicial Circuit Court'),
-    ('43rd Judicial Circuit Court', '43rd Judicial Circuit Court'),
-    ('44th Judicial Circuit Court', '44th Judicial Circuit Court'),
-    ('45th Judicial Circuit Court', '45th Judicial Circuit Court'),
-    ('46th Judicial Circuit Court', '46th Judicial Circuit Court'),
-    ('47th Judicial Circuit Court', '47th Judicial Circuit Court'),
-    ('48th Judicial Circuit Court', '48th Judicial Circuit Court'),
-    ('49th Judicial Circuit Court', '49th Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('50th Judicial Circuit Court', '50th Judicial Circuit Court'),
-    ('51st Judicial Circuit Court', '51st Judicial Circuit Court'),
-    ('52nd Judicial Circuit Court', '52nd Judicial Circuit Court'),
-    ('53rd Judicial Circuit Court', '53rd Judicial Circuit Court'),
-    ('54th Judicial Circuit Court', '54th Judicial Circuit Court'),
-    ('55th Judicial Circuit Court', '55th Judicial Circuit Court'),
-    ('56th Judicial Circuit Court', '56th Judicial Circuit Court'),
-    ('57th Judicial Circuit Court', '57th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Adair County District Court', 'Adair County District Court'),
-    ('Allen County District Court', 'Allen County District Court'),
-    ('Anderson County District Court', 'Anderson County District Court'),
-    ('Ballard County District Court', 'Ballard County District Court'),
-    ('Barren County District Court', 'Barren County District Court'),
-    ('Bath County District Court', 'Bath County District Court'),
-    ('Bell County District Court', 'Bell County District Court'),
-    ('Boone County District Court', 'Boone County District Court'),
-    ('Bourbon County District Court', 'Bourbon County District Court'),
-    ('Boyd County District Court', 'Boyd County District Court'),
-    ('Boyle County District Court', 'Boyle County District Court'),
-    ('Bracken County District Court', 'Bracken County District Court'),
-    ('Breathitt County District Court', 'Breathitt County District Court'),
-    ('Breckinridge County District Court', 'Breckinridge County District Court'),
-    ('Bullitt County District Court', 'Bullitt County District Court'),
-    ('Butler County District Court', 'Butler County District Court'),
-    ('Caldwell County District Court', 'Caldwell County District Court'),
-    ('Calloway County District Court', 'Calloway County District Court'),
-    ('Campbell County District Court', 'Campbell County District Court'),
-    ('Carlisle County District Court', 'Carlisle County District Court'),
-    ('Carroll County District Court', 'Carroll County District Court'),
-    ('Carter County District Court', 'Carter County District Court'),
-    ('Casey County District Court', 'Casey County District Court'),
-    ('Christian County District Court', 'Christian County District Court'),
-    ('Clark County District Court', 'Clark County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Clinton County District Court', 'Clinton County District Court'),
-    ('Crittenden County District Court', 'Crittenden County District Court'),
-    ('Cumberland County District Court', 'Cumberland County District Court'),
-    ('Daviess County District Court', 'Daviess County District Court'),
-    ('Edmonson County District Court', 'Edmonson County District Court'),
-    ('Elliott County District Court', 'Elliott County District Court'),
-    ('Estill County District Court', 'Estill County District Court'),
-    ('Fayette County District Court', 'Fayette County District Court'),
-    ('Fleming County District Court', 'Fleming County District Court'),
-    ('Floyd County District Court', 'Floyd County District Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Fulton County District Court', 'Fulton County District Court'),
-    ('Gallatin County District Court', 'Gallatin County District Court'),
-    ('Garrard County District Court', 'Garrard County District Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Graves County District Court', 'Graves County District Court'),
-    ('Grayson County District Court', 'Grayson County District Court'),
-    ('Green County District Court', 'Green County District Court'),
-    ('Greenup County District Court', 'Greenup County District Court'),
-    ('Hancock County District Court', 'Hancock County District Court'),
-    ('Hardin County District Court', 'Hardin County District Court'),
-    ('Harlan County District Court', 'Harlan County District Court'),
-    ('Harrison County District Court', 'Harrison County District Court'),
-    ('Hart County District Court', 'Hart County District Court'),
-    ('Henderson County District Court', 'Henderson County District Court'),
-    ('Henry County District Court', 'Henry County District Court'),
-    ('Hickman County District Court', 'Hickman County District Court'),
-    ('Hopkins County District Court', 'Hopkins County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Jessamine County District Court', 'Jessamine County District Court'),
-    ('Johnson County District Court', 'Johnson County District Court'),
-    ('Kenton County District Court', 'Kenton County District Court'),
-    ('Knott County District Court', 'Knott County District Court'),
-    ('Knox County District Court', 'Knox County District Court'),
-    ('Larue County District Court', 'Larue County District Court'),
-    ('Laurel County District Court', 'Laurel County District Court'),
-    ('Lawrence County District Court', 'Lawrence County District Court'),
-    ('Lee County District Court', 'Lee County District Court'),
-    ('Leslie County District Court', 'Leslie County District Court'),
-    ('Letcher County District Court', 'Letcher County District Court'),
-    ('Lewis County District Court', 'Lewis County District Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Livingston County District Court', 'Livingston County District Court'),
-    ('Logan County District Court', 'Logan County District Court'),
-    ('Lyon County District Court', 'Lyon County District Court'),
-    ('Madison County District Court', 'Madison County District Court'),
-    ('Magoffin County District Court', 'Magoffin County District Court'),
-    ('Marion County District Court', 'Marion County District Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('Martin County District Court', 'Martin County District Court'),
-    ('Mason County District Court', 'Mason County District Court'),
-    ('McCracken County District Court', 'McCracken County District Court'),
-    ('McCreary County District Court', 'McCreary County District Court'),
-    ('McLean County District Court', 'McLean County District Court'),
-    ('Meade County District Court', 'Meade County District Court'),
-    ('Menifee County District Court', 'Menifee County District Court'),
-    ('Mercer County District Court', 'Mercer County District Court'),
-    ('Metcalfe County District Court', 'Metcalfe County District Court'),
-    ('Monroe County District Court', 'Monroe County District Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Morgan County District Court', 'Morgan County District Court'),
-    ('Muhlenberg County District Court', 'Muhlenberg County District Court'),
-    ('Nelson County District Court', 'Nelson County District Court'),
-    ('Nicholas County District Court', 'Nicholas County District Court'),
-    ('Ohio County District Court', 'Ohio County District Court'),
-    ('Oldham County District Court', 'Oldham County District Court'),
-    ('Owen County District Court', 'Owen County District Court'),
-    ('Owsley County District Court', 'Owsley County District Court'),
-    ('Pendleton County District Court', 'Pendleton County District Court'),
-    ('Perry County District Court', 'Perry County District Court'),
-    ('Pike County District Court', 'Pike County District Court'),
-    ('Powell County District Court', 'Powell County District Court'),
-    ('Pulaski County District Court', 'Pulaski County District Court'),
-    ('Robertson County District Court', 'Robertson County District Court'),
-    ('Rockcastle County District Court', 'Rockcastle County District Court'),
-    ('Rowan County District Court', 'Rowan County District Court'),
-    ('Russell County District Court', 'Russell County District Court'),
-    ('Scott County District Court', 'Scott County District Court'),
-    ('Shelby County District Court', 'Shelby County District Court'),
-    ('Simpson County District Court', 'Simpson County District Court'),
-    ('Spencer County District Court', 'Spencer County District Court'),
-    ('Taylor County District Court', 'Taylor County District Court'),
-    ('Todd County District Court', 'Todd County District Court'),
-    ('Trigg County District Court', 'Trigg County District Court'),
-    ('Trimble County District Court', 'Trimble County District Court'),
-    ('Union County District Court', 'Union County District Court'),
-    ('Warren County District Court', 'Warren County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Wayne County District Court', 'Wayne County District Court'),
-    ('Webster County District Court', 'Webster County District Court'),
-    ('Whitley County District Court', 'Whitley County District Court'),
-    ('Wolfe County District Court', 'Wolfe County District Court'),
-
-]
-
-LOUISIANA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fifth Circuit', 'U.S. Court of Appeals for the Fifth Circuit'),
-    ('Louisiana Supreme Court', 'Louisiana Supreme Court'),
-    ('U.S. District Court for the Eastern District of Louisiana', 'U.S. District Court for the Eastern District of Louisiana'),
-    ('U.S. District Court for the Middle District of Louisiana', 'U.S. District Court for the Middle District of Louisiana'),
-    ('U.S. District Court for the Western District of Louisiana', 'U.S. District Court for the Western District of Louisiana'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('14th Judicial District Court', '14th Judicial District Court'),
-    ('15th Judicial District Court', '15th Judicial District Court'),
-    ('16th Judicial District Court', '16th Judicial District Court'),
-    ('17th Judicial District Court', '17th Judicial District Court'),
-    ('18th Judicial District Court', '18th Judicial District Court'),
-    ('19th Judicial District Court', '19th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('20th Judicial District Court', '20th Judicial District Court'),
-    ('21st Judicial District Court', '21st Judicial District Court'),
-    ('22nd Judicial District Court', '22nd Judicial District Court'),
-    ('23rd Judicial District Court', '23rd Judicial District Court'),
-    ('24th Judicial District Court', '24th Judicial District Court'),
-    ('25th Judicial District Court', '25th Judicial District Court'),
-    ('26th Judicial District Court', '26th Judicial District Court'),
-    ('27th Judicial District Court', '27th Judicial District Court'),
-    ('28th Judicial District Court', '28th Judicial District Court'),
-    ('29th Judicial District Court', '29th Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('30th Judicial District Court', '30th Judicial District Court'),
-    ('31st Judicial District Court', '31st Judicial District Court'),
-    ('32nd Judicial District Court', '32nd Judicial District Court'),
-    ('33rd Judicial District Court', '33rd Judicial District Court'),
-    ('34th Judicial District Court', '34th Judicial District Court'),
-    ('35th Judicial District Court', '35th Judicial District Court'),
-    ('36th Judicial District Court', '36th Judicial District Court'),
-    ('37th Judicial District Court', '37th Judicial District Court'),
-    ('38th Judicial District Court', '38th Judicial District Court'),
-    ('39th Judicial District Court', '39th Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('40th Judicial District Court', '40th Judicial District Court'),
-    ('41st Judicial District Court', '41st Judicial District Court'),
-    ('42nd Judicial District Court', '42nd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Acadia Parish Court', 'Acadia Parish Court'),
-    ('Allen Parish Court', 'Allen Parish Court'),
-    ('Ascension Parish Court', 'Ascension Parish Court'),
-    ('Assumption Parish Court', 'Assumption Parish Court'),
-    ('Avoyelles Parish Court', 'Avoyelles Parish Court'),
-    ('Beauregard Parish Court', 'Beauregard Parish Court'),
-    ('Bienville Parish Court', 'Bienville Parish Court'),
-    ('Bossier Parish Court', 'Bossier Parish Court'),
-    ('Caddo Parish Court', 'Caddo Parish Court'),
-    ('Calcasieu Parish Court', 'Calcasieu Parish Court'),
-    ('Caldwell Parish Court', 'Caldwell Parish Court'),
-    ('Cameron Parish Court', 'Cameron Parish Court'),
-    ('Catahoula Parish Court', 'Catahoula Parish Court'),
-    ('Claiborne Parish Court', 'Claiborne Parish Court'),
-    ('Concordia Parish Court', 'Concordia Parish Court'),
-    ('De Soto Parish Court', 'De Soto Parish Court'),
-    ('East Baton Rouge Parish Court', 'East Baton Rouge Parish Court'),
-    ('East Carroll Parish Court', 'East Carroll Parish Court'),
-    ('East Feliciana Parish Court', 'East Feliciana Parish Court'),
-    ('Evangeline Parish Court', 'Evangeline Parish Court'),
-    ('Franklin Parish Court', 'Franklin Parish Court'),
-    ('Grant Parish Court', 'Grant Parish Court'),
-    ('Iberia Parish Court', 'Iberia Parish Court'),
-    ('Iberville Parish Court', 'Iberville Parish Court'),
-    ('Jackson Parish Court', 'Jackson Parish Court'),
-    ('Jefferson Davis Parish Court', 'Jefferson Davis Parish Court'),
-    ('Jefferson Parish Court', 'Jefferson Parish Court'),
-    ('Lafayette Parish Court', 'Lafayette Parish Court'),
-    ('Lafourche Parish Court', 'Lafourche Parish Court'),
-    ('LaSalle Parish Court', 'LaSalle Parish Court'),
-    ('Lincoln Parish Court', 'Lincoln Parish Court'),
-    ('Livingston Parish Court', 'Livingston Parish Court'),
-    ('Louisiana Fifth Circuit Court of Appeal', 'Louisiana Fifth Circuit Court of Appeal'),
-    ('Louisiana First Circuit Court of Appeal', 'Louisiana First Circuit Court of Appeal'),
-    ('Louisiana Fourth Circuit Court of Appeal', 'Louisiana Fourth Circuit Court of Appeal'),
-    ('Louisiana Second Circuit Court of Appeal', 'Louisiana Second Circuit Court of Appeal'),
-    ('Louisiana Third Circuit Court of Appeal', 'Louisiana Third Circuit Court of Appeal'),
-    ('Madison Parish Court', 'Madison Parish Court'),
-    ('Morehouse Parish Court', 'Morehouse Parish Court'),
-    ('Natchitoches Parish Court', 'Natchitoches Parish Court'),
-    ('Orleans Parish Court', 'Orleans Parish Court'),
-    ('Ouachita Parish Court', 'Ouachita Parish Court'),
-    ('Plaquemines Parish Court', 'Plaquemines Parish Court'),
-    ('Pointe Coupee Parish Court', 'Pointe Coupee Parish Court'),
-    ('Rapides Parish Court', 'Rapides Parish Court'),
-    ('Red River Parish Court', 'Red River Parish Court'),
-    ('Richland Parish Court', 'Richland Parish Court'),
-    ('Sabine Parish Court', 'Sabine Parish Court'),
-    ('St. Bernard Parish Court', 'St. Bernard Parish Court'),
-    ('St. Charles Parish Court', 'St. Charles Parish Court'),
-    ('St. Helena Parish Court', 'St. Helena Parish Court'),
-    ('St. James Parish Court', 'St. James Parish Court'),
-    ('St. John the Baptist Parish Court', 'St. John the Baptist Parish Court'),
-    ('St. Landry Parish Court', 'St. Landry Parish Court'),
-    ('St. Martin Parish Court', 'St. Martin Parish Court'),
-    ('St. Mary Parish Court', 'St. Mary Parish Court'),
-    ('St. Tammany Parish Court', 'St. Tammany Parish Court'),
-    ('Tangipahoa Parish Court', 'Tangipahoa Parish Court'),
-    ('Tensas Parish Court', 'Tensas Parish Court'),
-    ('Terrebonne Parish Court', 'Terrebonne Parish Court'),
-    ('Union Parish Court', 'Union Parish Court'),
-    ('Vermilion Parish Court', 'Vermilion Parish Court'),
-    ('Vernon Parish Court', 'Vernon Parish Court'),
-    ('Washington Parish Court', 'Washington Parish Court'),
-    ('Webster Parish Court', 'Webster Parish Court'),
-    ('West Baton Rouge Parish Court', 'West Baton Rouge Parish Court'),
-    ('West Carroll Parish Court', 'West Carroll Parish Court'),
-    ('West Feliciana Parish Court', 'West Feliciana Parish Court'),
-
-]
-
-MAINE_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the First Circuit', 'U.S. Court of Appeals for the First Circuit'),
-    ('Maine Supreme Judicial Court', 'Maine Supreme Judicial Court'),
-    ('U.S. District Court for the District of Maine', 'U.S. District Court for the District of Maine'),
-    ('Androscoggin County District Court', 'Androscoggin County District Court'),
-    ('Androscoggin County Probate Court', 'Androscoggin County Probate Court'),
-    ('Androscoggin County Superior Court', 'Androscoggin County Superior Court'),
-    ('Aroostook County District Court', 'Aroostook County District Court'),
-    ('Aroostook County Probate Court', 'Aroostook County Probate Court'),
-    ('Aroostook County Superior Court', 'Aroostook County Superior Court'),
-    ('Cumberland County District Court', 'Cumberland County District Court'),
-    ('Cumberland County Probate Court', 'Cumberland County Probate Court'),
-    ('Cumberland County Superior Court', 'Cumberland County Superior Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Franklin County Superior Court', 'Franklin County Superior Court'),
-    ('Hancock County District Court', 'Hancock County District Court'),
-    ('Hancock County Probate Court', 'Hancock County Probate Court'),
-    ('Hancock County Superior Court', 'Hancock County Superior Court'),
-    ('Kennebec County District Court', 'Kennebec County District Court'),
-    ('Kennebec County Probate Court', 'Kennebec County Probate Court'),
-    ('Kennebec County Superior Court', 'Kennebec County Superior Court'),
-    ('Knox County District Court', 'Knox County District Court'),
-    ('Knox County Probate Court', 'Knox County Probate Court'),
-    ('Knox County Superior Court', 'Knox County Superior Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Lincoln County Probate Court', 'Lincoln County Probate Court'),
-    ('Lincoln County Superior Court', 'Lincoln County Superior Court'),
-    ('Oxford County District Court', 'Oxford County District Court'),
-    ('Oxford County Probate Court', 'Oxford County Probate Court'),
-    ('Oxford County Superior Court', 'Oxford County Superior Court'),
-    ('Penobscot County District Court', 'Penobscot County District Court'),
-    ('Penobscot County Probate Court', 'Penobscot County Probate Court'),
-    ('Penobscot County Superior Court', 'Penobscot County Superior Court'),
-    ('Piscataquis County District Court', 'Piscataquis County District Court'),
-    ('Piscataquis County Probate Court', 'Piscataquis County Probate Court'),
-    ('Piscataquis County Superior Court', 'Piscataquis County Superior Court'),
-    ('Sagadahoc County District Court', 'Sagadahoc County District Court'),
-    ('Sagadahoc County Probate Court', 'Sagadahoc County Probate Court'),
-    ('Sagadahoc County Superior Court', 'Sagadahoc County Superior Court'),
-    ('Somerset County District Court', 'Somerset County District Court'),
-    ('Somerset County Probate Court', 'Somerset County Probate Court'),
-    ('Somerset County Superior Court', 'Somerset County Superior Court'),
-    ('Waldo County District Court', 'Waldo County District Court'),
-    ('Waldo County Probate Court', 'Waldo County Probate Court'),
-    ('Waldo County Superior Court', 'Waldo County Superior Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Washington County Superior Court', 'Washington County Superior Court'),
-    ('York County District Court', 'York County District Court'),
-    ('York County Superior Court', 'York County Superior Court'),
-
-]
-
-MARYLAND_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fourth Circuit', 'U.S. Court of Appeals for the Fourth Circuit'),
-    ('Maryland Supreme Court', 'Maryland Supreme Court'),
-    ('U.S. District Court for the District of Maryland', 'U.S. District Court for the District of Maryland'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('Allegany County District Court', 'Allegany County District Court'),
-    ('Allegany County Orphans\' Court', 'Allegany County Orphans\' Court'),
-    ('Anne Arundel County District Court', 'Anne Arundel County District Court'),
-    ('Anne Arundel County Orphans\' Court', 'Anne Arundel County Orphans\' Court'),
-    ('Baltimore City District Court', 'Baltimore City District Court'),
-    ('Baltimore City Orphans\' Court', 'Baltimore City Orphans\' Court'),
-    ('Baltimore County District Court', 'Baltimore County District Court'),
-    ('Baltimore County Orphans\' Court', 'Baltimore County Orphans\' Court'),
-    ('Calvert County District Court', 'Calvert County District Court'),
-    ('Calvert County Orphans\' Court', 'Calvert County Orphans\' Court'),
-    ('Caroline County District Court', 'Caroline County District Court'),
-    ('Caroline County Orphans\' Court', 'Caroline County Orphans\' Court'),
-    ('Carroll County District Court', 'Carroll County District Court'),
-    ('Carroll County Orphans\' Court', 'Carroll County Orphans\' Court'),
-    ('Cecil County District Court', 'Cecil County District Court'),
-    ('Cecil County Orphans\' Court', 'Cecil County Orphans\' Court'),
-    ('Charles County District Court', 'Charles County District Court'),
-    ('Charles County Orphans\' Court', 'Charles County Orphans\' Court'),
-    ('Dorchester County District Court', 'Dorchester County District Court'),
-    ('Dorchester County Orphans\' Court', 'Dorchester County Orphans\' Court'),
-    ('Frederick County District Court', 'Frederick County District Court'),
-    ('Frederick County Orphans\' Court', 'Frederick County Orphans\' Court'),
-    ('Garrett County District Court', 'Garrett County District Court'),
-    ('Garrett County Orphans\' Court', 'Garrett County Orphans\' Court'),
-    ('Harford County District Court', 'Harford County District Court'),
-    ('Harford County Orphans\' Court', 'Harford County Orphans\' Court'),
-    ('Howard County District Court', 'Howard County District Court'),
-    ('Howard County Orphans\' Court', 'Howard County Orphans\' Court'),
-    ('Kent County District Court', 'Kent County District Court'),
-    ('Kent County Orphans\' Court', 'Kent County Orphans\' Court'),
-    ('Maryland Appellate Court', 'Maryland Appellate Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Montgomery County Orphans\' Court', 'Montgomery County Orphans\' Court'),
-    ('Prince George\'s County District Court', 'Prince George\'s County District Court'),
-    ('Prince George\'s County Orphans\' Court', 'Prince George\'s County Orphans\' Court'),
-    ('Queen Anne\'s County District Court', 'Queen Anne\'s County District Court'),
-    ('Queen Anne\'s County Orphans\' Court', 'Queen Anne\'s County Orphans\' Court'),
-    ('Somerset County District Court', 'Somerset County District Court'),
-    ('Somerset County Orphans\' Court', 'Somerset County Orphans\' Court'),
-    ('St. Mary\'s County District Court', 'St. Mary\'s County District Court'),
-    ('St. Mary\'s County Orphans\' Court', 'St. Mary\'s County Orphans\' Court'),
-    ('Talbot County District Court', 'Talbot County District Court'),
-    ('Talbot County Orphans\' Court', 'Talbot County Orphans\' Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Washington County Orphans\' Court', 'Washington County Orphans\' Court'),
-    ('Wicomico County District Court', 'Wicomico County District Court'),
-    ('Wicomico County Orphans\' Court', 'Wicomico County Orphans\' Court'),
-    ('Worcester County District Court', 'Worcester County District Court'),
-
-]
-
-MASSACHUSETTS_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the First Circuit', 'U.S. Court of Appeals for the First Circuit'),
-    ('Massachusetts Supreme Judicial Court', 'Massachusetts Supreme Judicial Court'),
-    ('U.S. District Court for the District of Massachusetts', 'U.S. District Court for the District of Massachusetts'),
-    ('Barnstable County District Court', 'Barnstable County District Court'),
-    ('Barnstable County Probate and Family Court', 'Barnstable County Probate and Family Court'),
-    ('Barnstable County Superior Court', 'Barnstable County Superior Court'),
-    ('Berkshire County District Court', 'Berkshire County District Court'),
-    ('Berkshire County Probate and Family Court', 'Berkshire County Probate and Family Court'),
-    ('Berkshire County Superior Court', 'Berkshire County Superior Court'),
-    ('Boston Municipal Court', 'Boston Municipal Court'),
-    ('Bristol County District Court', 'Bristol County District Court'),
-    ('Bristol County Probate and Family Court', 'Bristol County Probate and Family Court'),
-    ('Bristol County Superior Court', 'Bristol County Superior Court'),
-    ('Dukes County District Court', 'Dukes County District Court'),
-    ('Dukes County Probate and Family Court', 'Dukes County Probate and Family Court'),
-    ('Dukes County Superior Court', 'Dukes County Superior Court'),
-    ('Essex County District Court', 'Essex County District Court'),
-    ('Essex County Probate and Family Court', 'Essex County Probate and Family Court'),
-    ('Essex County Superior Court', 'Essex County Superior Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Franklin County Probate and Family Court', 'Franklin County Probate and Family Court'),
-    ('Franklin County Superior Court', 'Franklin County Superior Court'),
-    ('Hampden County District Court', 'Hampden County District Court'),
-    ('Hampden County Probate and Family Court', 'Hampden County Probate and Family Court'),
-    ('Hampden County Superior Court', 'Hampden County Superior Court'),
-    ('Hampshire County District Court', 'Hampshire County District Court'),
-    ('Hampshire County Probate and Family Court', 'Hampshire County Probate and Family Court'),
-    ('Hampshire County Superior Court', 'Hampshire County Superior Court'),
-    ('Massachusetts Appeals Court', 'Massachusetts Appeals Court'),
-    ('Middlesex County District Court', 'Middlesex County District Court'),
-    ('Middlesex County Probate and Family Court', 'Middlesex County Probate and Family Court'),
-    ('Middlesex County Superior Court', 'Middlesex County Superior Court'),
-    ('Nantucket County District Court', 'Nantucket County District Court'),
-    ('Nantucket County Probate and Family Court', 'Nantucket County Probate and Family Court'),
-    ('Nantucket County Superior Court', 'Nantucket County Superior Court'),
-    ('Norfolk County District Court', 'Norfolk County District Court'),
-    ('Norfolk County Probate and Family Court', 'Norfolk County Probate and Family Court'),
-    ('Norfolk County Superior Court', 'Norfolk County Superior Court'),
-    ('Plymouth County District Court', 'Plymouth County District Court'),
-    ('Plymouth County Probate and Family Court', 'Plymouth County Probate and Family Court'),
-    ('Plymouth County Superior Court', 'Plymouth County Superior Court'),
-    ('Suffolk County District Court', 'Suffolk County District Court'),
-    ('Suffolk County Probate and Family Court', 'Suffolk County Probate and Family Court'),
-    ('Suffolk County Superior Court', 'Suffolk County Superior Court'),
-    ('Worcester County District Court', 'Worcester County District Court'),
-    ('Worcester County Probate and Family Court', 'Worcester County Probate and Family Court'),
-    ('Worcester County Superior Court', 'Worcester County Superior Court'),
-
-]
-
-MICHIGAN_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Sixth Circuit', 'U.S. Court of Appeals for the Sixth Circuit'),
-    ('Michigan Supreme Court', 'Michigan Supreme Court'),
-    ('Michigan Court of Appeals', 'Michigan Court of Appeals'),
-    ('U.S. District Court for the Eastern District of Michigan', 'U.S. District Court for the Eastern District of Michigan'),
-    ('U.S. District Court for the Western District of Michigan', 'U.S. District Court for the Western District of Michigan'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('31st Judicial Circuit Court', '31st Judicial Circuit Court'),
-    ('32nd Judicial Circuit Court', '32nd Judicial Circuit Court'),
-    ('33rd Judicial Circuit Court', '33rd Judicial Circuit Court'),
-    ('34th Judicial Circuit Court', '34th Judicial Circuit Court'),
-    ('35th Judicial Circuit Court', '35th Judicial Circuit Court'),
-    ('36th Judicial Circuit Court', '36th Judicial Circuit Court'),
-    ('37th Judicial Circuit Court', '37th Judicial Circuit Court'),
-    ('38th Judicial Circuit Court', '38th Judicial Circuit Court'),
-    ('39th Judicial Circuit Court', '39th Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('40th Judicial Circuit Court', '40th Judicial Circuit Court'),
-    ('41st Judicial Circuit Court', '41st Judicial Circuit Court'),
-    ('42nd Judicial Circuit Court', '42nd Judicial Circuit Court'),
-    ('43rd Judicial Circuit Court', '43rd Judicial Circuit Court'),
-    ('44th Judicial Circuit Court', '44th Judicial Circuit Court'),
-    ('45th Judicial Circuit Court', '45th Judicial Circuit Court'),
-    ('46th Judicial Circuit Court', '46th Judicial Circuit Court'),
-    ('47th Judicial Circuit Court', '47th Judicial Circuit Court'),
-    ('48th Judicial Circuit Court', '48th Judicial Circuit Court'),
-    ('49th Judicial Circuit Court', '49th Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('50th Judicial Circuit Court', '50th Judicial Circuit Court'),
-    ('51st Judicial Circuit Court', '51st Judicial Circuit Court'),
-    ('52nd Judicial Circuit Court', '52nd Judicial Circuit Court'),
-    ('53rd Judicial Circuit Court', '53rd Judicial Circuit Court'),
-    ('54th Judicial Circuit Court', '54th Judicial Circuit Court'),
-    ('55th Judicial Circuit Court', '55th Judicial Circuit Court'),
-    ('56th Judicial Circuit Court', '56th Judicial Circuit Court'),
-    ('57th Judicial Circuit Court', '57th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Alcona County Probate Court', 'Alcona County Probate Court'),
-    ('Alger County Probate Court', 'Alger County Probate Court'),
-    ('Allegan County Probate Court', 'Allegan County Probate Court'),
-    ('Alpena County Probate Court', 'Alpena County Probate Court'),
-    ('Antrim County Probate Court', 'Antrim County Probate Court'),
-    ('Arenac County Probate Court', 'Arenac County Probate Court'),
-    ('Baraga County Probate Court', 'Baraga County Probate Court'),
-    ('Barry County Probate Court', 'Barry County Probate Court'),
-    ('Bay County Probate Court', 'Bay County Probate Court'),
-    ('Benzie County Probate Court', 'Benzie County Probate Court'),
-    ('Berrien County Probate Court', 'Berrien County Probate Court'),
-    ('Branch County Probate Court', 'Branch County Probate Court'),
-    ('Calhoun County Probate Court', 'Calhoun County Probate Court'),
-    ('Cass County Probate Court', 'Cass County Probate Court'),
-    ('Charlevoix County Probate Court', 'Charlevoix County Probate Court'),
-    ('Cheboygan County Probate Court', 'Cheboygan County Probate Court'),
-    ('Chippewa County Probate Court', 'Chippewa County Probate Court'),
-    ('Clare County Probate Court', 'Clare County Probate Court'),
-    ('Clinton County Probate Court', 'Clinton County Probate Court'),
-    ('Crawford County Probate Court', 'Crawford County Probate Court'),
-    ('Delta County Probate Court', 'Delta County Probate Court'),
-    ('Dickinson County Probate Court', 'Dickinson County Probate Court'),
-    ('Eaton County Probate Court', 'Eaton County Probate Court'),
-    ('Emmet County Probate Court', 'Emmet County Probate Court'),
-    ('Genesee County Probate Court', 'Genesee County Probate Court'),
-    ('Gladwin County Probate Court', 'Gladwin County Probate Court'),
-    ('Gogebic County Probate Court', 'Gogebic County Probate Court'),
-    ('Grand Traverse County Probate Court', 'Grand Traverse County Probate Court'),
-    ('Gratiot County Probate Court', 'Gratiot County Probate Court'),
-    ('Hillsdale County Probate Court', 'Hillsdale County Probate Court'),
-    ('Houghton County Probate Court', 'Houghton County Probate Court'),
-    ('Huron County Probate Court', 'Huron County Probate Court'),
-    ('Ingham County Probate Court', 'Ingham County Probate Court'),
-    ('Ionia County Probate Court', 'Ionia County Probate Court'),
-    ('Iosco County Probate Court', 'Iosco County Probate Court'),
-    ('Iron County Probate Court', 'Iron County Probate Court'),
-    ('Isabella County Probate Court', 'Isabella County Probate Court'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Kalamazoo County Probate Court', 'Kalamazoo County Probate Court'),
-    ('Kalkaska County Probate Court', 'Kalkaska County Probate Court'),
-    ('Kent County Probate Court', 'Kent County Probate Court'),
-    ('Keweenaw County Probate Court', 'Keweenaw County Probate Court'),
-    ('Lake County Probate Court', 'Lake County Probate Court'),
-    ('Lapeer County Probate Court', 'Lapeer County Probate Court'),
-    ('Leelanau County Probate Court', 'Leelanau County Probate Court'),
-    ('Lenawee County Probate Court', 'Lenawee County Probate Court'),
-    ('Livingston County Probate Court', 'Livingston County Probate Court'),
-    ('Luce County Probate Court', 'Luce County Probate Court'),
-    ('Mackinac County Probate Court', 'Mackinac County Probate Court'),
-    ('Macomb County Probate Court', 'Macomb County Probate Court'),
-    ('Manistee County Probate Court', 'Manistee County Probate Court'),
-    ('Marquette County Probate Court', 'Marquette County Probate Court'),
-    ('Mason County Probate Court', 'Mason County Probate Court'),
-    ('Mecosta County Probate Court', 'Mecosta County Probate Court'),
-    ('Menominee County Probate Court', 'Menominee County Probate Court'),
-    ('Midland County Probate Court', 'Midland County Probate Court'),
-    ('Missaukee County Probate Court', 'Missaukee County Probate Court'),
-    ('Monroe County Probate Court', 'Monroe County Probate Court'),
-    ('Montcalm County Probate Court', 'Montcalm County Probate Court'),
-    ('Montmorency County Probate Court', 'Montmorency County Probate Court'),
-    ('Muskegon County Probate Court', 'Muskegon County Probate Court'),
-    ('Newaygo County Probate Court', 'Newaygo County Probate Court'),
-    ('Oakland County Probate Court', 'Oakland County Probate Court'),
-    ('Oceana County Probate Court', 'Oceana County Probate Court'),
-    ('Ogemaw County Probate Court', 'Ogemaw County Probate Court'),
-    ('Ontonagon County Probate Court', 'Ontonagon County Probate Court'),
-    ('Osceola County Probate Court', 'Osceola County Probate Court'),
-    ('Oscoda County Probate Court', 'Oscoda County Probate Court'),
-    ('Otsego County Probate Court', 'Otsego County Probate Court'),
-    ('Ottawa County Probate Court', 'Ottawa County Probate Court'),
-    ('Presque Isle County Probate Court', 'Presque Isle County Probate Court'),
-    ('Roscommon County Probate Court', 'Roscommon County Probate Court'),
-    ('Saginaw County Probate Court', 'Saginaw County Probate Court'),
-    ('Sanilac County Probate Court', 'Sanilac County Probate Court'),
-    ('Schoolcraft County Probate Court', 'Schoolcraft County Probate Court'),
-    ('Shiawassee County Probate Court', 'Shiawassee County Probate Court'),
-    ('St. Clair County Probate Court', 'St. Clair County Probate Court'),
-    ('St. Joseph County Probate Court', 'St. Joseph County Probate Court'),
-    ('Tuscola County Probate Court', 'Tuscola County Probate Court'),
-    ('Van Buren County Probate Court', 'Van Buren County Probate Court'),
-    ('Washtenaw County Probate Court', 'Washtenaw County Probate Court'),
-    ('Wayne County Probate Court', 'Wayne County Probate Court'),
-
-]
-
-MINNESOTA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('Minnesota Supreme Court', 'Minnesota Supreme Court'),
-    ('Minnesota Court of Appeals', 'Minnesota Court of Appeals'),
-    ('U.S. District Court for the District of Minnesota', 'U.S. District Court for the District of Minnesota'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Aitkin County District Court', 'Aitkin County District Court'),
-    ('Anoka County District Court', 'Anoka County District Court'),
-    ('Becker County District Court', 'Becker County District Court'),
-    ('Beltrami County District Court', 'Beltrami County District Court'),
-    ('Benton County District Court', 'Benton County District Court'),
-    ('Big Stone County District Court', 'Big Stone County District Court'),
-    ('Blue Earth County District Court', 'Blue Earth County District Court'),
-    ('Brown County District Court', 'Brown County District Court'),
-    ('Carlton County District Court', 'Carlton County District Court'),
-    ('Carver County District Court', 'Carver County District Court'),
-    ('Cass County District Court', 'Cass County District Court'),
-    ('Chippewa County District Court', 'Chippewa County District Court'),
-    ('Chisago County District Court', 'Chisago County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Clearwater County District Court', 'Clearwater County District Court'),
-    ('Cook County District Court', 'Cook County District Court'),
-    ('Cottonwood County District Court', 'Cottonwood County District Court'),
-    ('Crow Wing County District Court', 'Crow Wing County District Court'),
-    ('Dakota County District Court', 'Dakota County District Court'),
-    ('Dodge County District Court', 'Dodge County District Court'),
-    ('Douglas County District Court', 'Douglas County District Court'),
-    ('Faribault County District Court', 'Faribault County District Court'),
-    ('Fillmore County District Court', 'Fillmore County District Court'),
-    ('Freeborn County District Court', 'Freeborn County District Court'),
-    ('Goodhue County District Court', 'Goodhue County District Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Hennepin County District Court', 'Hennepin County District Court'),
-    ('Houston County District Court', 'Houston County District Court'),
-    ('Hubbard County District Court', 'Hubbard County District Court'),
-    ('Isanti County District Court', 'Isanti County District Court'),
-    ('Itasca County District Court', 'Itasca County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Kanabec County District Court', 'Kanabec County District Court'),
-    ('Kandiyohi County District Court', 'Kandiyohi County District Court'),
-    ('Kittson County District Court', 'Kittson County District Court'),
-    ('Koochiching County District Court', 'Koochiching County District Court'),
-    ('Lac qui Parle County District Court', 'Lac qui Parle County District Court'),
-    ('Lake County District Court', 'Lake County District Court'),
-    ('Lake of the Woods County District Court', 'Lake of the Woods County District Court'),
-    ('Le Sueur County District Court', 'Le Sueur County District Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Lyon County District Court', 'Lyon County District Court'),
-    ('Mahnomen County District Court', 'Mahnomen County District Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('Martin County District Court', 'Martin County District Court'),
-    ('McLeod County District Court', 'McLeod County District Court'),
-    ('Meeker County District Court', 'Meeker County District Court'),
-    ('Mille Lacs County District Court', 'Mille Lacs County District Court'),
-    ('Morrison County District Court', 'Morrison County District Court'),
-    ('Mower County District Court', 'Mower County District Court'),
-    ('Murray County District Court', 'Murray County District Court'),
-    ('Nicollet County District Court', 'Nicollet County District Court'),
-    ('Nobles County District Court', 'Nobles County District Court'),
-    ('Norman County District Court', 'Norman County District Court'),
-    ('Olmsted County District Court', 'Olmsted County District Court'),
-    ('Otter Tail County District Court', 'Otter Tail County District Court'),
-    ('Pennington County District Court', 'Pennington County District Court'),
-    ('Pine County District Court', 'Pine County District Court'),
-    ('Pipestone County District Court', 'Pipestone County District Court'),
-    ('Polk County District Court', 'Polk County District Court'),
-    ('Pope County District Court', 'Pope County District Court'),
-    ('Ramsey County District Court', 'Ramsey County District Court'),
-    ('Red Lake County District Court', 'Red Lake County District Court'),
-    ('Redwood County District Court', 'Redwood County District Court'),
-    ('Renville County District Court', 'Renville County District Court'),
-    ('Rice County District Court', 'Rice County District Court'),
-    ('Rock County District Court', 'Rock County District Court'),
-    ('Roseau County District Court', 'Roseau County District Court'),
-    ('Scott County District Court', 'Scott County District Court'),
-    ('Sherburne County District Court', 'Sherburne County District Court'),
-    ('Sibley County District Court', 'Sibley County District Court'),
-    ('St. Louis County District Court', 'St. Louis County District Court'),
-    ('Stearns County District Court', 'Stearns County District Court'),
-    ('Steele County District Court', 'Steele County District Court'),
-    ('Stevens County District Court', 'Stevens County District Court'),
-    ('Swift County District Court', 'Swift County District Court'),
-    ('Todd County District Court', 'Todd County District Court'),
-    ('Traverse County District Court', 'Traverse County District Court'),
-    ('Wabasha County District Court', 'Wabasha County District Court'),
-    ('Wadena County District Court', 'Wadena County District Court'),
-    ('Waseca County District Court', 'Waseca County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Watonwan County District Court', 'Watonwan County District Court'),
-    ('Wilkin County District Court', 'Wilkin County District Court'),
-    ('Winona County District Court', 'Winona County District Court'),
-    ('Wright County District Court', 'Wright County District Court'),
-
-]
-
-MISSISSIPPI_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fifth Circuit', 'U.S. Court of Appeals for the Fifth Circuit'),
-    ('Mississippi Supreme Court', 'Mississippi Supreme Court'),
-    ('Mississippi Court of Appeals', 'Mississippi Court of Appeals'),
-    ('U.S. District Court for the Northern District of Mississippi', 'U.S. District Court for the Northern District of Mississippi'),
-    ('U.S. District Court for the Southern District of Mississippi', 'U.S. District Court for the Southern District of Mississippi'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Adams County Chancery Court', 'Adams County Chancery Court'),
-    ('Alcorn County Chancery Court', 'Alcorn County Chancery Court'),
-    ('Amite County Chancery Court', 'Amite County Chancery Court'),
-    ('Attala County Chancery Court', 'Attala County Chancery Court'),
-    ('Benton County Chancery Court', 'Benton County Chancery Court'),
-    ('Bolivar County Chancery Court', 'Bolivar County Chancery Court'),
-    ('Calhoun County Chancery Court', 'Calhoun County Chancery Court'),
-    ('Carroll County Chancery Court', 'Carroll County Chancery Court'),
-    ('Chickasaw County Chancery Court', 'Chickasaw County Chancery Court'),
-    ('Choctaw County Chancery Court', 'Choctaw County Chancery Court'),
-    ('Claiborne County Chancery Court', 'Claiborne County Chancery Court'),
-    ('Clarke County Chancery Court', 'Clarke County Chancery Court'),
-    ('Clay County Chancery Court', 'Clay County Chancery Court'),
-    ('Coahoma County Chancery Court', 'Coahoma County Chancery Court'),
-    ('Copiah County Chancery Court', 'Copiah County Chancery Court'),
-    ('Covington County Chancery Court', 'Covington County Chancery Court'),
-    ('DeSoto County Chancery Court', 'DeSoto County Chancery Court'),
-    ('Forrest County Chancery Court', 'Forrest County Chancery Court'),
-    ('Franklin County Chancery Court', 'Franklin County Chancery Court'),
-    ('George County Chancery Court', 'George County Chancery Court'),
-    ('Greene County Chancery Court', 'Greene County Chancery Court'),
-    ('Grenada County Chancery Court', 'Grenada County Chancery Court'),
-    ('Hancock County Chancery Court', 'Hancock County Chancery Court'),
-    ('Harrison County Chancery Court', 'Harrison County Chancery Court'),
-    ('Hinds County Chancery Court', 'Hinds County Chancery Court'),
-    ('Holmes County Chancery Court', 'Holmes County Chancery Court'),
-    ('Humphreys County Chancery Court', 'Humphreys County Chancery Court'),
-    ('Issaquena County Chancery Court', 'Issaquena County Chancery Court'),
-    ('Itawamba County Chancery Court', 'Itawamba County Chancery Court'),
-    ('Jackson County Chancery Court', 'Jackson County Chancery Court'),
-    ('Jasper County Chancery Court', 'Jasper County Chancery Court'),
-    ('Jefferson County Chancery Court', 'Jefferson County Chancery Court'),
-    ('Jefferson Davis County Chancery Court', 'Jefferson Davis County Chancery Court'),
-    ('Jones County Chancery Court', 'Jones County Chancery Court'),
-    ('Kemper County Chancery Court', 'Kemper County Chancery Court'),
-    ('Lafayette County Chancery Court', 'Lafayette County Chancery Court'),
-    ('Lamar County Chancery Court', 'Lamar County Chancery Court'),
-    ('Lauderdale County Chancery Court', 'Lauderdale County Chancery Court'),
-    ('Lawrence County Chancery Court', 'Lawrence County Chancery Court'),
-    ('Leake County Chancery Court', 'Leake County Chancery Court'),
-    ('Lee County Chancery Court', 'Lee County Chancery Court'),
-    ('Leflore County Chancery Court', 'Leflore County Chancery Court'),
-    ('Lincoln County Chancery Court', 'Lincoln County Chancery Court'),
-    ('Lowndes County Chancery Court', 'Lowndes County Chancery Court'),
-    ('Madison County Chancery Court', 'Madison County Chancery Court'),
-    ('Marion County Chancery Court', 'Marion County Chancery Court'),
-    ('Marshall County Chancery Court', 'Marshall County Chancery Court'),
-    ('Monroe County Chancery Court', 'Monroe County Chancery Court'),
-    ('Montgomery County Chancery Court', 'Montgomery County Chancery Court'),
-    ('Neshoba County Chancery Court', 'Neshoba County Chancery Court'),
-    ('Newton County Chancery Court', 'Newton County Chancery Court'),
-    ('Noxubee County Chancery Court', 'Noxubee County Chancery Court'),
-    ('Oktibbeha County Chancery Court', 'Oktibbeha County Chancery Court'),
-    ('Panola County Chancery Court', 'Panola County Chancery Court'),
-    ('Pearl River County Chancery Court', 'Pearl River County Chancery Court'),
-    ('Perry County Chancery Court', 'Perry County Chancery Court'),
-    ('Pike County Chancery Court', 'Pike County Chancery Court'),
-    ('Pontotoc County Chancery Court', 'Pontotoc County Chancery Court'),
-    ('Prentiss County Chancery Court', 'Prentiss County Chancery Court'),
-    ('Quitman County Chancery Court', 'Quitman County Chancery Court'),
-    ('Rankin County Chancery Court', 'Rankin County Chancery Court'),
-    ('Scott County Chancery Court', 'Scott County Chancery Court'),
-    ('Sharkey County Chancery Court', 'Sharkey County Chancery Court'),
-    ('Simpson County Chancery Court', 'Simpson County Chancery Court'),
-    ('Smith County Chancery Court', 'Smith County Chancery Court'),
-    ('Stone County Chancery Court', 'Stone County Chancery Court'),
-    ('Sunflower County Chancery Court', 'Sunflower County Chancery Court'),
-    ('Tallahatchie County Chancery Court', 'Tallahatchie County Chancery Court'),
-    ('Tate County Chancery Court', 'Tate County Chancery Court'),
-    ('Tippah County Chancery Court', 'Tippah County Chancery Court'),
-    ('Tishomingo County Chancery Court', 'Tishomingo County Chancery Court'),
-    ('Tunica County Chancery Court', 'Tunica County Chancery Court'),
-    ('Union County Chancery Court', 'Union County Chancery Court'),
-    ('Walthall County Chancery Court', 'Walthall County Chancery Court'),
-    ('Warren County Chancery Court', 'Warren County Chancery Court'),
-    ('Washington County Chancery Court', 'Washington County Chancery Court'),
-    ('Wayne County Chancery Court', 'Wayne County Chancery Court'),
-    ('Webster County Chancery Court', 'Webster County Chancery Court'),
-    ('Wilkinson County Chancery Court', 'Wilkinson County Chancery Court'),
-    ('Winston County Chancery Court', 'Winston County Chancery Court'),
-    ('Yalobusha County Chancery Court', 'Yalobusha County Chancery Court'),
-
-]
-
-MISSOURI_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('Missouri Supreme Court', 'Missouri Supreme Court'),
-    ('Missouri Court of Appeals Eastern District', 'Missouri Court of Appeals Eastern District'),
-    ('Missouri Court of Appeals Western District', 'Missouri Court of Appeals Western District'),
-    ('Missouri Court of Appeals Southern District', 'Missouri Court of Appeals Southern District'),
-    ('U.S. District Court for the Eastern District of Missouri', 'U.S. District Court for the Eastern District of Missouri'),
-    ('U.S. District Court for the Western District of Missouri', 'U.S. District Court for the Western District of Missouri'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('31st Judicial Circuit Court', '31st Judicial Circuit Court'),
-    ('32nd Judicial Circuit Court', '32nd Judicial Circuit Court'),
-    ('33rd Judicial Circuit Court', '33rd Judicial Circuit Court'),
-    ('34th Judicial Circuit Court', '34th Judicial Circuit Court'),
-    ('35th Judicial Circuit Court', '35th Judicial Circuit Court'),
-    ('36th Judicial Circuit Court', '36th Judicial Circuit Court'),
-    ('37th Judicial Circuit Court', '37th Judicial Circuit Court'),
-    ('38th Judicial Circuit Court', '38th Judicial Circuit Court'),
-    ('39th Judicial Circuit Court', '39th Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('40th Judicial Circuit Court', '40th Judicial Circuit Court'),
-    ('41st Judicial Circuit Court', '41st Judicial Circuit Court'),
-    ('42nd Judicial Circuit Court', '42nd Judicial Circuit Court'),
-    ('43rd Judicial Circuit Court', '43rd Judicial Circuit Court'),
-    ('44th Judicial Circuit Court', '44th Judicial Circuit Court'),
-    ('45th Judicial Circuit Court', '45th Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Adair County Probate Court', 'Adair County Probate Court'),
-    ('Andrew County Probate Court', 'Andrew County Probate Court'),
-    ('Atchison County Probate Court', 'Atchison County Probate Court'),
-    ('Audrain County Probate Court', 'Audrain County Probate Court'),
-    ('Barry County Probate Court', 'Barry County Probate Court'),
-    ('Barton County Probate Court', 'Barton County Probate Court'),
-    ('Bates County Probate Court', 'Bates County Probate Court'),
-    ('Benton County Probate Court', 'Benton County Probate Court'),
-    ('Bollinger County Probate Court', 'Bollinger County Probate Court'),
-    ('Boone County Probate Court', 'Boone County Probate Court'),
-    ('Buchanan County Probate Court', 'Buchanan County Probate Court'),
-    ('Butler County Probate Court', 'Butler County Probate Court'),
-    ('Caldwell County Probate Court', 'Caldwell County Probate Court'),
-    ('Callaway County Probate Court', 'Callaway County Probate Court'),
-    ('Camden County Probate Court', 'Camden County Probate Court'),
-    ('Cape Girardeau County Probate Court', 'Cape Girardeau County Probate Court'),
-    ('Carroll County Probate Court', 'Carroll County Probate Court'),
-    ('Carter County Probate Court', 'Carter County Probate Court'),
-    ('Cass County Probate Court', 'Cass County Probate Court'),
-    ('Cedar County Probate Court', 'Cedar County Probate Court'),
-    ('Chariton County Probate Court', 'Chariton County Probate Court'),
-    ('Christian County Probate Court', 'Christian County Probate Court'),
-    ('Clark County Probate Court', 'Clark County Probate Court'),
-    ('Clay County Probate Court', 'Clay County Probate Court'),
-    ('Clinton County Probate Court', 'Clinton County Probate Court'),
-    ('Cole County Probate Court', 'Cole County Probate Court'),
-    ('Cooper County Probate Court', 'Cooper County Probate Court'),
-    ('Crawford County Probate Court', 'Crawford County Probate Court'),
-    ('Dade County Probate Court', 'Dade County Probate Court'),
-    ('Dallas County Probate Court', 'Dallas County Probate Court'),
-    ('Daviess County Probate Court', 'Daviess County Probate Court'),
-    ('DeKalb County Probate Court', 'DeKalb County Probate Court'),
-    ('Dent County Probate Court', 'Dent County Probate Court'),
-    ('Douglas County Probate Court', 'Douglas County Probate Court'),
-    ('Dunklin County Probate Court', 'Dunklin County Probate Court'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Gasconade County Probate Court', 'Gasconade County Probate Court'),
-    ('Gentry County Probate Court', 'Gentry County Probate Court'),
-    ('Greene County Probate Court', 'Greene County Probate Court'),
-    ('Grundy County Probate Court', 'Grundy County Probate Court'),
-    ('Harrison County Probate Court', 'Harrison County Probate Court'),
-    ('Henry County Probate Court', 'Henry County Probate Court'),
-    ('Hickory County Probate Court', 'Hickory County Probate Court'),
-    ('Holt County Probate Court', 'Holt County Probate Court'),
-    ('Howard County Probate Court', 'Howard County Probate Court'),
-    ('Howell County Probate Court', 'Howell County Probate Court'),
-    ('Iron County Probate Court', 'Iron County Probate Court'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Jasper County Probate Court', 'Jasper County Probate Court'),
-    ('Jefferson County Probate Court', 'Jefferson County Probate Court'),
-    ('Johnson County Probate Court', 'Johnson County Probate Court'),
-    ('Kansas City Municipal Court', 'Kansas City Municipal Court'),
-    ('Knox County Probate Court', 'Knox County Probate Court'),
-    ('Laclede County Probate Court', 'Laclede County Probate Court'),
-    ('Lafayette County Probate Court', 'Lafayette County Probate Court'),
-    ('Lawrence County Probate Court', 'Lawrence County Probate Court'),
-    ('Lewis County Probate Court', 'Lewis County Probate Court'),
-    ('Lincoln County Probate Court', 'Lincoln County Probate Court'),
-    ('Linn County Probate Court', 'Linn County Probate Court'),
-    ('Livingston County Probate Court', 'Livingston County Probate Court'),
-    ('Macon County Probate Court', 'Macon County Probate Court'),
-    ('Madison County Probate Court', 'Madison County Probate Court'),
-    ('Maries County Probate Court', 'Maries County Probate Court'),
-    ('Marion County Probate Court', 'Marion County Probate Court'),
-    ('McDonald County Probate Court', 'McDonald County Probate Court'),
-    ('Mercer County Probate Court', 'Mercer County Probate Court'),
-    ('Miller County Probate Court', 'Miller County Probate Court'),
-    ('Mississippi County Probate Court', 'Mississippi County Probate Court'),
-    ('Moniteau County Probate Court', 'Moniteau County Probate Court'),
-    ('Monroe County Probate Court', 'Monroe County Probate Court'),
-    ('Montgomery County Probate Court', 'Montgomery County Probate Court'),
-    ('Morgan County Probate Court', 'Morgan County Probate Court'),
-    ('New Madrid County Probate Court', 'New Madrid County Probate Court'),
-    ('Newton County Probate Court', 'Newton County Probate Court'),
-    ('Nodaway County Probate Court', 'Nodaway County Probate Court'),
-    ('Oregon County Probate Court', 'Oregon County Probate Court'),
-    ('Osage County Probate Court', 'Osage County Probate Court'),
-    ('Ozark County Probate Court', 'Ozark County Probate Court'),
-    ('Pemiscot County Probate Court', 'Pemiscot County Probate Court'),
-    ('Perry County Probate Court', 'Perry County Probate Court'),
-    ('Pettis County Probate Court', 'Pettis County Probate Court'),
-    ('Phelps County Probate Court', 'Phelps County Probate Court'),
-    ('Pike County Probate Court', 'Pike County Probate Court'),
-    ('Platte County Probate Court', 'Platte County Probate Court'),
-    ('Polk County Probate Court', 'Polk County Probate Court'),
-    ('Pulaski County Probate Court', 'Pulaski County Probate Court'),
-    ('Putnam County Probate Court', 'Putnam County Probate Court'),
-    ('Ralls County Probate Court', 'Ralls County Probate Court'),
-    ('Randolph County Probate Court', 'Randolph County Probate Court'),
-    ('Ray County Probate Court', 'Ray County Probate Court'),
-    ('Reynolds County Probate Court', 'Reynolds County Probate Court'),
-    ('Ripley County Probate Court', 'Ripley County Probate Court'),
-    ('Saline County Probate Court', 'Saline County Probate Court'),
-    ('Schuyler County Probate Court', 'Schuyler County Probate Court'),
-    ('Scotland County Probate Court', 'Scotland County Probate Court'),
-    ('Scott County Probate Court', 'Scott County Probate Court'),
-    ('Shannon County Probate Court', 'Shannon County Probate Court'),
-    ('Shelby County Probate Court', 'Shelby County Probate Court'),
-    ('St. Charles County Probate Court', 'St. Charles County Probate Court'),
-    ('St. Clair County Probate Court', 'St. Clair County Probate Court'),
-    ('St. Francois County Probate Court', 'St. Francois County Probate Court'),
-    ('St. Louis City Probate Court', 'St. Louis City Probate Court'),
-    ('St. Louis County Probate Court', 'St. Louis County Probate Court'),
-    ('St. Louis Municipal Court', 'St. Louis Municipal Court'),
-    ('Ste. Genevieve County Probate Court', 'Ste. Genevieve County Probate Court'),
-    ('Stoddard County Probate Court', 'Stoddard County Probate Court'),
-    ('Stone County Probate Court', 'Stone County Probate Court'),
-    ('Sullivan County Probate Court', 'Sullivan County Probate Court'),
-    ('Taney County Probate Court', 'Taney County Probate Court'),
-    ('Texas County Probate Court', 'Texas County Probate Court'),
-    ('Vernon County Probate Court', 'Vernon County Probate Court'),
-    ('Warren County Probate Court', 'Warren County Probate Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Wayne County Probate Court', 'Wayne County Probate Court'),
-    ('Webster County Probate Court', 'Webster County Probate Court'),
-    ('Worth County Probate Court', 'Worth County Probate Court'),
-    ('Wright County Probate Court', 'Wright County Probate Court'),
-
-]
-
-MONTANA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Montana Supreme Court', 'Montana Supreme Court'),
-    ('U.S. District Court for the District of Montana', 'U.S. District Court for the District of Montana'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('14th Judicial District Court', '14th Judicial District Court'),
-    ('15th Judicial District Court', '15th Judicial District Court'),
-    ('16th Judicial District Court', '16th Judicial District Court'),
-    ('17th Judicial District Court', '17th Judicial District Court'),
-    ('18th Judicial District Court', '18th Judicial District Court'),
-    ('19th Judicial District Court', '19th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('20th Judicial District Court', '20th Judicial District Court'),
-    ('21st Judicial District Court', '21st Judicial District Court'),
-    ('22nd Judicial District Court', '22nd Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Beaverhead County Justice Court', 'Beaverhead County Justice Court'),
-    ('Big Horn County Justice Court', 'Big Horn County Justice Court'),
-    ('Blaine County Justice Court', 'Blaine County Justice Court'),
-    ('Broadwater County Justice Court', 'Broadwater County Justice Court'),
-    ('Carbon County Justice Court', 'Carbon County Justice Court'),
-    ('Carter County Justice Court', 'Carter County Justice Court'),
-    ('Cascade County Justice Court', 'Cascade County Justice Court'),
-    ('Chouteau County Justice Court', 'Chouteau County Justice Court'),
-    ('Custer County Justice Court', 'Custer County Justice Court'),
-    ('Daniels County Justice Court', 'Daniels County Justice Court'),
-    ('Dawson County Justice Court', 'Dawson County Justice Court'),
-    ('Deer Lodge County Justice Court', 'Deer Lodge County Justice Court'),
-    ('Fallon County Justice Court', 'Fallon County Justice Court'),
-    ('Fergus County Justice Court', 'Fergus County Justice Court'),
-    ('Flathead County Justice Court', 'Flathead County Justice Court'),
-    ('Gallatin County Justice Court', 'Gallatin County Justice Court'),
-    ('Garfield County Justice Court', 'Garfield County Justice Court'),
-    ('Glacier County Justice Court', 'Glacier County Justice Court'),
-    ('Golden Valley County Justice Court', 'Golden Valley County Justice Court'),
-    ('Granite County Justice Court', 'Granite County Justice Court'),
-    ('Hill County Justice Court', 'Hill County Justice Court'),
-    ('Jefferson County Justice Court', 'Jefferson County Justice Court'),
-    ('Judith Basin County Justice Court', 'Judith Basin County Justice Court'),
-    ('Lake County Justice Court', 'Lake County Justice Court'),
-    ('Lewis and Clark County Justice Court', 'Lewis and Clark County Justice Court'),
-    ('Liberty County Justice Court', 'Liberty County Justice Court'),
-    ('Lincoln County Justice Court', 'Lincoln County Justice Court'),
-    ('Madison County Justice Court', 'Madison County Justice Court'),
-    ('McCone County Justice Court', 'McCone County Justice Court'),
-    ('Meagher County Justice Court', 'Meagher County Justice Court'),
-    ('Mineral County Justice Court', 'Mineral County Justice Court'),
-    ('Missoula County Justice Court', 'Missoula County Justice Court'),
-    ('Musselshell County Justice Court', 'Musselshell County Justice Court'),
-    ('Park County Justice Court', 'Park County Justice Court'),
-    ('Petroleum County Justice Court', 'Petroleum County Justice Court'),
-    ('Phillips County Justice Court', 'Phillips County Justice Court'),
-    ('Pondera County Justice Court', 'Pondera County Justice Court'),
-    ('Powder River County Justice Court', 'Powder River County Justice Court'),
-    ('Powell County Justice Court', 'Powell County Justice Court'),
-    ('Prairie County Justice Court', 'Prairie County Justice Court'),
-    ('Ravalli County Justice Court', 'Ravalli County Justice Court'),
-    ('Richland County Justice Court', 'Richland County Justice Court'),
-    ('Roosevelt County Justice Court', 'Roosevelt County Justice Court'),
-    ('Rosebud County Justice Court', 'Rosebud County Justice Court'),
-    ('Sanders County Justice Court', 'Sanders County Justice Court'),
-    ('Sheridan County Justice Court', 'Sheridan County Justice Court'),
-    ('Silver Bow County Justice Court', 'Silver Bow County Justice Court'),
-    ('Stillwater County Justice Court', 'Stillwater County Justice Court'),
-    ('Sweet Grass County Justice Court', 'Sweet Grass County Justice Court'),
-    ('Teton County Justice Court', 'Teton County Justice Court'),
-    ('Toole County Justice Court', 'Toole County Justice Court'),
-    ('Treasure County Justice Court', 'Treasure County Justice Court'),
-    ('Valley County Justice Court', 'Valley County Justice Court'),
-    ('Wheatland County Justice Court', 'Wheatland County Justice Court'),
-    ('Wibaux County Justice Court', 'Wibaux County Justice Court'),
-
-]
-
-NEBRASKA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('Nebraska Supreme Court', 'Nebraska Supreme Court'),
-    ('Nebraska Court of Appeals', 'Nebraska Court of Appeals'),
-    ('U.S. District Court for the District of Nebraska', 'U.S. District Court for the District of Nebraska'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Adams County Court', 'Adams County Court'),
-    ('Antelope County Court', 'Antelope County Court'),
-    ('Arthur County Court', 'Arthur County Court'),
-    ('Banner County Court', 'Banner County Court'),
-    ('Blaine County Court', 'Blaine County Court'),
-    ('Boone County Court', 'Boone County Court'),
-    ('Box Butte County Court', 'Box Butte County Court'),
-    ('Boyd County Court', 'Boyd County Court'),
-    ('Brown County Court', 'Brown County Court'),
-    ('Buffalo County Court', 'Buffalo County Court'),
-    ('Burt County Court', 'Burt County Court'),
-    ('Butler County Court', 'Butler County Court'),
-    ('Cass County Court', 'Cass County Court'),
-    ('Cedar County Court', 'Cedar County Court'),
-    ('Chase County Court', 'Chase County Court'),
-    ('Cherry County Court', 'Cherry County Court'),
-    ('Cheyenne County Court', 'Cheyenne County Court'),
-    ('Clay County Court', 'Clay County Court'),
-    ('Colfax County Court', 'Colfax County Court'),
-    ('Cuming County Court', 'Cuming County Court'),
-    ('Custer County Court', 'Custer County Court'),
-    ('Dakota County Court', 'Dakota County Court'),
-    ('Dawes County Court', 'Dawes County Court'),
-    ('Dawson County Court', 'Dawson County Court'),
-    ('Deuel County Court', 'Deuel County Court'),
-    ('Dixon County Court', 'Dixon County Court'),
-    ('Dodge County Court', 'Dodge County Court'),
-    ('Douglas County Court', 'Douglas County Court'),
-    ('Douglas County Separate Juvenile Court', 'Douglas County Separate Juvenile Court'),
-    ('Dundy County Court', 'Dundy County Court'),
-    ('Fillmore County Court', 'Fillmore County Court'),
-    ('Franklin County Court', 'Franklin County Court'),
-    ('Frontier County Court', 'Frontier County Court'),
-    ('Furnas County Court', 'Furnas County Court'),
-    ('Gage County Court', 'Gage County Court'),
-    ('Garden County Court', 'Garden County Court'),
-    ('Garfield County Court', 'Garfield County Court'),
-    ('Gosper County Court', 'Gosper County Court'),
-    ('Grant County Court', 'Grant County Court'),
-    ('Greeley County Court', 'Greeley County Court'),
-    ('Hall County Court', 'Hall County Court'),
-    ('Hamilton County Court', 'Hamilton County Court'),
-    ('Harlan County Court', 'Harlan County Court'),
-    ('Hayes County Court', 'Hayes County Court'),
-    ('Hitchcock County Court', 'Hitchcock County Court'),
-    ('Holt County Court', 'Holt County Court'),
-    ('Hooker County Court', 'Hooker County Court'),
-    ('Howard County Court', 'Howard County Court'),
-    ('Jefferson County Court', 'Jefferson County Court'),
-    ('Johnson County Court', 'Johnson County Court'),
-    ('Kearney County Court', 'Kearney County Court'),
-    ('Keith County Court', 'Keith County Court'),
-    ('Keya Paha County Court', 'Keya Paha County Court'),
-    ('Kimball County Court', 'Kimball County Court'),
-    ('Knox County Court', 'Knox County Court'),
-    ('Lancaster County Court', 'Lancaster County Court'),
-    ('Lincoln County Court', 'Lincoln County Court'),
-    ('Logan County Court', 'Logan County Court'),
-    ('Loup County Court', 'Loup County Court'),
-    ('Madison County Court', 'Madison County Court'),
-    ('McPherson County Court', 'McPherson County Court'),
-    ('Merrick County Court', 'Merrick County Court'),
-    ('Morrill County Court', 'Morrill County Court'),
-    ('Nance County Court', 'Nance County Court'),
-    ('Nemaha County Court', 'Nemaha County Court'),
-    ('Nuckolls County Court', 'Nuckolls County Court'),
-    ('Omaha Municipal Court', 'Omaha Municipal Court'),
-    ('Otoe County Court', 'Otoe County Court'),
-    ('Pawnee County Court', 'Pawnee County Court'),
-    ('Perkins County Court', 'Perkins County Court'),
-    ('Phelps County Court', 'Phelps County Court'),
-    ('Pierce County Court', 'Pierce County Court'),
-    ('Platte County Court', 'Platte County Court'),
-    ('Polk County Court', 'Polk County Court'),
-    ('Red Willow County Court', 'Red Willow County Court'),
-    ('Richardson County Court', 'Richardson County Court'),
-    ('Rock County Court', 'Rock County Court'),
-    ('Saline County Court', 'Saline County Court'),
-    ('Sarpy County Court', 'Sarpy County Court'),
-    ('Saunders County Court', 'Saunders County Court'),
-    ('Scotts Bluff County Court', 'Scotts Bluff County Court'),
-    ('Seward County Court', 'Seward County Court'),
-    ('Sheridan County Court', 'Sheridan County Court'),
-    ('Sherman County Court', 'Sherman County Court'),
-    ('Sioux County Court', 'Sioux County Court'),
-    ('Stanton County Court', 'Stanton County Court'),
-    ('Thayer County Court', 'Thayer County Court'),
-    ('Thomas County Court', 'Thomas County Court'),
-    ('Thurston County Court', 'Thurston County Court'),
-    ('Valley County Court', 'Valley County Court'),
-    ('Washington County Court', 'Washington County Court'),
-    ('Wayne County Court', 'Wayne County Court'),
-    ('Webster County Court', 'Webster County Court'),
-    ('Wheeler County Court', 'Wheeler County Court'),
-    ('York County Court', 'York County Court'),
-
-]
-
-NEVADA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Nevada Supreme Court', 'Nevada Supreme Court'),
-    ('Nevada Court of Appeals', 'Nevada Court of Appeals'),
-    ('U.S. District Court for the District of Nevada', 'U.S. District Court for the District of Nevada'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Carson City Justice Court', 'Carson City Justice Court'),
-    ('Churchill County Justice Court', 'Churchill County Justice Court'),
-    ('Clark County Justice Court', 'Clark County Justice Court'),
-    ('Douglas County Justice Court', 'Douglas County Justice Court'),
-    ('Elko County Justice Court', 'Elko County Justice Court'),
-    ('Esmeralda County Justice Court', 'Esmeralda County Justice Court'),
-    ('Eureka County Justice Court', 'Eureka County Justice Court'),
-    ('Henderson Municipal Court', 'Henderson Municipal Court'),
-    ('Humboldt County Justice Court', 'Humboldt County Justice Court'),
-    ('Lander County Justice Court', 'Lander County Justice Court'),
-    ('Las Vegas Justice Court', 'Las Vegas Justice Court'),
-    ('Lincoln County Justice Court', 'Lincoln County Justice Court'),
-    ('Lyon County Justice Court', 'Lyon County Justice Court'),
-    ('Mineral County Justice Court', 'Mineral County Justice Court'),
-    ('Nye County Justice Court', 'Nye County Justice Court'),
-    ('Pershing County Justice Court', 'Pershing County Justice Court'),
-    ('Storey County Justice Court', 'Storey County Justice Court'),
-    ('Washoe County Justice Court', 'Washoe County Justice Court'),
-    ('White Pine County Justice Court', 'White Pine County Justice Court'),
-
-]
-
-NEW_HAMPSHIRE_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the First Circuit', 'U.S. Court of Appeals for the First Circuit'),
-    ('New Hampshire Supreme Court', 'New Hampshire Supreme Court'),
-    ('U.S. District Court for the District of New Hampshire', 'U.S. District Court for the District of New Hampshire'),
-    ('Belknap County Probate Court', 'Belknap County Probate Court'),
-    ('Belknap County Superior Court', 'Belknap County Superior Court'),
-    ('Berlin District Court', 'Berlin District Court'),
-    ('Carroll County Probate Court', 'Carroll County Probate Court'),
-    ('Carroll County Superior Court', 'Carroll County Superior Court'),
-    ('Cheshire County Probate Court', 'Cheshire County Probate Court'),
-    ('Cheshire County Superior Court', 'Cheshire County Superior Court'),
-    ('Claremont District Court', 'Claremont District Court'),
-    ('Concord District Court', 'Concord District Court'),
-    ('Conway District Court', 'Conway District Court'),
-    ('Coos County Probate Court', 'Coos County Probate Court'),
-    ('Coos County Superior Court', 'Coos County Superior Court'),
-    ('Derry District Court', 'Derry District Court'),
-    ('Dover District Court', 'Dover District Court'),
-    ('Franklin District Court', 'Franklin District Court'),
-    ('Goffstown District Court', 'Goffstown District Court'),
-    ('Grafton County Probate Court', 'Grafton County Probate Court'),
-    ('Grafton County Superior Court', 'Grafton County Superior Court'),
-    ('Haverhill District Court', 'Haverhill District Court'),
-    ('Hillsborough County Probate Court', 'Hillsborough County Probate Court'),
-    ('Hillsborough County Superior Court', 'Hillsborough County Superior Court'),
-    ('Hillsborough District Court', 'Hillsborough District Court'),
-    ('Jaffrey-Peterborough District Court', 'Jaffrey-Peterborough District Court'),
-    ('Keene District Court', 'Keene District Court'),
-    ('Laconia District Court', 'Laconia District Court'),
-    ('Lancaster District Court', 'Lancaster District Court'),
-    ('Lebanon District Court', 'Lebanon District Court'),
-    ('Littleton District Court', 'Littleton District Court'),
-    ('Manchester District Court', 'Manchester District Court'),
-    ('Merrimack County Probate Court', 'Merrimack County Probate Court'),
-    ('Merrimack County Superior Court', 'Merrimack County Superior Court'),
-    ('Milford District Court', 'Milford District Court'),
-    ('Nashua District Court', 'Nashua District Court'),
-    ('Newport District Court', 'Newport District Court'),
-    ('North Hampton District Court', 'North Hampton District Court'),
-    ('Plymouth District Court', 'Plymouth District Court'),
-    ('Portsmouth District Court', 'Portsmouth District Court'),
-    ('Rochester District Court', 'Rochester District Court'),
-    ('Rockingham County Probate Court', 'Rockingham County Probate Court'),
-    ('Rockingham County Superior Court', 'Rockingham County Superior Court'),
-    ('Salem District Court', 'Salem District Court'),
-    ('Somersworth District Court', 'Somersworth District Court'),
-    ('Strafford County Probate Court', 'Strafford County Probate Court'),
-    ('Strafford County Superior Court', 'Strafford County Superior Court'),
-    ('Sullivan County Superior Court', 'Sullivan County Superior Court'),
-
-]
-
-NEW_JERSEY_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Third Circuit', 'U.S. Court of Appeals for the Third Circuit'),
-    ('New Jersey Supreme Court', 'New Jersey Supreme Court'),
-    ('U.S. District Court for the District of New Jersey', 'U.S. District Court for the District of New Jersey'),
-    ('Atlantic County Superior Court', 'Atlantic County Superior Court'),
-    ('Atlantic County Surrogate Court', 'Atlantic County Surrogate Court'),
-    ('Bergen County Superior Court', 'Bergen County Superior Court'),
-    ('Bergen County Surrogate Court', 'Bergen County Surrogate Court'),
-    ('Burlington County Superior Court', 'Burlington County Superior Court'),
-    ('Burlington County Surrogate Court', 'Burlington County Surrogate Court'),
-    ('Camden County Superior Court', 'Camden County Superior Court'),
-    ('Camden County Surrogate Court', 'Camden County Surrogate Court'),
-    ('Cape May County Superior Court', 'Cape May County Superior Court'),
-    ('Cape May County Surrogate Court', 'Cape May County Surrogate Court'),
-    ('Cumberland County Superior Court', 'Cumberland County Superior Court'),
-    ('Cumberland County Surrogate Court', 'Cumberland County Surrogate Court'),
-    ('Essex County Superior Court', 'Essex County Superior Court'),
-    ('Essex County Surrogate Court', 'Essex County Surrogate Court'),
-    ('Gloucester County Superior Court', 'Gloucester County Superior Court'),
-    ('Gloucester County Surrogate Court', 'Gloucester County Surrogate Court'),
-    ('Hudson County Superior Court', 'Hudson County Superior Court'),
-    ('Hudson County Surrogate Court', 'Hudson County Surrogate Court'),
-    ('Hunterdon County Superior Court', 'Hunterdon County Superior Court'),
-    ('Hunterdon County Surrogate Court', 'Hunterdon County Surrogate Court'),
-    ('Jersey City Municipal Court', 'Jersey City Municipal Court'),
-    ('Mercer County Superior Court', 'Mercer County Superior Court'),
-    ('Mercer County Surrogate Court', 'Mercer County Surrogate Court'),
-    ('Middlesex County Superior Court', 'Middlesex County Superior Court'),
-    ('Middlesex County Surrogate Court', 'Middlesex County Surrogate Court'),
-    ('Monmouth County Superior Court', 'Monmouth County Superior Court'),
-    ('Monmouth County Surrogate Court', 'Monmouth County Surrogate Court'),
-    ('Morris County Superior Court', 'Morris County Superior Court'),
-    ('Morris County Surrogate Court', 'Morris County Surrogate Court'),
-    ('New Jersey Superior Court Appellate Division', 'New Jersey Superior Court Appellate Division'),
-    ('Newark Municipal Court', 'Newark Municipal Court'),
-    ('Ocean County Superior Court', 'Ocean County Superior Court'),
-    ('Ocean County Surrogate Court', 'Ocean County Surrogate Court'),
-    ('Passaic County Superior Court', 'Passaic County Superior Court'),
-    ('Passaic County Surrogate Court', 'Passaic County Surrogate Court'),
-    ('Paterson Municipal Court', 'Paterson Municipal Court'),
-    ('Salem County Superior Court', 'Salem County Superior Court'),
-    ('Salem County Surrogate Court', 'Salem County Surrogate Court'),
-    ('Somerset County Superior Court', 'Somerset County Superior Court'),
-    ('Somerset County Surrogate Court', 'Somerset County Surrogate Court'),
-    ('Sussex County Superior Court', 'Sussex County Superior Court'),
-    ('Sussex County Surrogate Court', 'Sussex County Surrogate Court'),
-    ('Union County Superior Court', 'Union County Superior Court'),
-    ('Union County Surrogate Court', 'Union County Surrogate Court'),
-    ('Warren County Superior Court', 'Warren County Superior Court'),
-    ('Warren County Surrogate Court', 'Warren County Surrogate Court'),
-
-]
-
-NEW_MEXICO_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('New Mexico Supreme Court', 'New Mexico Supreme Court'),
-    ('New Mexico Court of Appeals', 'New Mexico Court of Appeals'),
-    ('U.S. District Court for the District of New Mexico', 'U.S. District Court for the District of New Mexico'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Bernalillo County Metropolitan Court', 'Bernalillo County Metropolitan Court'),
-    ('Catron County Magistrate Court', 'Catron County Magistrate Court'),
-    ('Chaves County Magistrate Court', 'Chaves County Magistrate Court'),
-    ('Cibola County Magistrate Court', 'Cibola County Magistrate Court'),
-    ('Colfax County Magistrate Court', 'Colfax County Magistrate Court'),
-    ('Curry County Magistrate Court', 'Curry County Magistrate Court'),
-    ('De Baca County Magistrate Court', 'De Baca County Magistrate Court'),
-    ('Dona Ana County Magistrate Court', 'Dona Ana County Magistrate Court'),
-    ('Eddy County Magistrate Court', 'Eddy County Magistrate Court'),
-    ('Grant County Magistrate Court', 'Grant County Magistrate Court'),
-    ('Guadalupe County Magistrate Court', 'Guadalupe County Magistrate Court'),
-    ('Harding County Magistrate Court', 'Harding County Magistrate Court'),
-    ('Hidalgo County Magistrate Court', 'Hidalgo County Magistrate Court'),
-    ('Lea County Magistrate Court', 'Lea County Magistrate Court'),
-    ('Lincoln County Magistrate Court', 'Lincoln County Magistrate Court'),
-    ('Los Alamos County Magistrate Court', 'Los Alamos County Magistrate Court'),
-    ('Luna County Magistrate Court', 'Luna County Magistrate Court'),
-    ('McKinley County Magistrate Court', 'McKinley County Magistrate Court'),
-    ('Mora County Magistrate Court', 'Mora County Magistrate Court'),
-    ('Otero County Magistrate Court', 'Otero County Magistrate Court'),
-    ('Quay County Magistrate Court', 'Quay County Magistrate Court'),
-    ('Rio Arriba County Magistrate Court', 'Rio Arriba County Magistrate Court'),
-    ('Roosevelt County Magistrate Court', 'Roosevelt County Magistrate Court'),
-    ('San Juan County Magistrate Court', 'San Juan County Magistrate Court'),
-    ('San Miguel County Magistrate Court', 'San Miguel County Magistrate Court'),
-    ('Sandoval County Magistrate Court', 'Sandoval County Magistrate Court'),
-    ('Santa Fe County Magistrate Court', 'Santa Fe County Magistrate Court'),
-    ('Sierra County Magistrate Court', 'Sierra County Magistrate Court'),
-    ('Socorro County Magistrate Court', 'Socorro County Magistrate Court'),
-    ('Taos County Magistrate Court', 'Taos County Magistrate Court'),
-    ('Torrance County Magistrate Court', 'Torrance County Magistrate Court'),
-    ('Union County Magistrate Court', 'Union County Magistrate Court'),
-
-]
-
-NEW_YORK_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Second Circuit', 'U.S. Court of Appeals for the Second Circuit'),
-    ('New York Court of Appeals', 'New York Court of Appeals'),
-    ('New York Supreme Court Appellate Division First Department', 'New York Supreme Court Appellate Division First Department'),
-    ('New York Supreme Court Appellate Division Second Department', 'New York Supreme Court Appellate Division Second Department'),
-    ('New York Supreme Court Appellate Division Third Department', 'New York Supreme Court Appellate Division Third Department'),
-    ('New York Supreme Court Appellate Division Fourth Department', 'New York Supreme Court Appellate Division Fourth Department'),
-    ('U.S. District Court for the Northern District of New York', 'U.S. District Court for the Northern District of New York'),
-    ('U.S. District Court for the Southern District of New York', 'U.S. District Court for the Southern District of New York'),
-    ('U.S. District Court for the Eastern District of New York', 'U.S. District Court for the Eastern District of New York'),
-    ('U.S. District Court for the Western District of New York', 'U.S. District Court for the Western District of New York'),
-    ('Albany County Supreme Court', 'Albany County Supreme Court'),
-    ('Allegany County Supreme Court', 'Allegany County Supreme Court'),
-    ('Bronx County Supreme Court', 'Bronx County Supreme Court'),
-    ('Broome County Supreme Court', 'Broome County Supreme Court'),
-    ('Cattaraugus County Supreme Court', 'Cattaraugus County Supreme Court'),
-    ('Cayuga County Supreme Court', 'Cayuga County Supreme Court'),
-    ('Chautauqua County Supreme Court', 'Chautauqua County Supreme Court'),
-    ('Chemung County Supreme Court', 'Chemung County Supreme Court'),
-    ('Chenango County Supreme Court', 'Chenango County Supreme Court'),
-    ('Clinton County Supreme Court', 'Clinton County Supreme Court'),
-    ('Columbia County Supreme Court', 'Columbia County Supreme Court'),
-    ('Cortland County Supreme Court', 'Cortland County Supreme Court'),
-    ('Delaware County Supreme Court', 'Delaware County Supreme Court'),
-    ('Dutchess County Supreme Court', 'Dutchess County Supreme Court'),
-    ('Erie County Supreme Court', 'Erie County Supreme Court'),
-    ('Essex County Supreme Court', 'Essex County Supreme Court'),
-    ('Franklin County Supreme Court', 'Franklin County Supreme Court'),
-    ('Fulton County Supreme Court', 'Fulton County Supreme Court'),
-    ('Genesee County Supreme Court', 'Genesee County Supreme Court'),
-    ('Greene County Supreme Court', 'Greene County Supreme Court'),
-    ('Hamilton County Supreme Court', 'Hamilton County Supreme Court'),
-    ('Herkimer County Supreme Court', 'Herkimer County Supreme Court'),
-    ('Jefferson County Supreme Court', 'Jefferson County Supreme Court'),
-    ('Kings County Supreme Court', 'Kings County Supreme Court'),
-    ('Lewis County Supreme Court', 'Lewis County Supreme Court'),
-    ('Livingston County Supreme Court', 'Livingston County Supreme Court'),
-    ('Madison County Supreme Court', 'Madison County Supreme Court'),
-    ('Monroe County Supreme Court', 'Monroe County Supreme Court'),
-    ('Montgomery County Supreme Court', 'Montgomery County Supreme Court'),
-    ('Nassau County Supreme Court', 'Nassau County Supreme Court'),
-    ('New York County Supreme Court', 'New York County Supreme Court'),
-    ('Niagara County Supreme Court', 'Niagara County Supreme Court'),
-    ('Oneida County Supreme Court', 'Oneida County Supreme Court'),
-    ('Onondaga County Supreme Court', 'Onondaga County Supreme Court'),
-    ('Ontario County Supreme Court', 'Ontario County Supreme Court'),
-    ('Orange County Supreme Court', 'Orange County Supreme Court'),
-    ('Orleans County Supreme Court', 'Orleans County Supreme Court'),
-    ('Oswego County Supreme Court', 'Oswego County Supreme Court'),
-    ('Otsego County Supreme Court', 'Otsego County Supreme Court'),
-    ('Putnam County Supreme Court', 'Putnam County Supreme Court'),
-    ('Queens County Supreme Court', 'Queens County Supreme Court'),
-    ('Rensselaer County Supreme Court', 'Rensselaer County Supreme Court'),
-    ('Richmond County Supreme Court', 'Richmond County Supreme Court'),
-    ('Rockland County Supreme Court', 'Rockland County Supreme Court'),
-    ('St. Lawrence County Supreme Court', 'St. Lawrence County Supreme Court'),
-    ('Saratoga County Supreme Court', 'Saratoga County Supreme Court'),
-    ('Schenectady County Supreme Court', 'Schenectady County Supreme Court'),
-    ('Schoharie County Supreme Court', 'Schoharie County Supreme Court'),
-    ('Schuyler County Supreme Court', 'Schuyler County Supreme Court'),
-    ('Seneca County Supreme Court', 'Seneca County Supreme Court'),
-    ('Steuben County Supreme Court', 'Steuben County Supreme Court'),
-    ('Suffolk County Supreme Court', 'Suffolk County Supreme Court'),
-    ('Sullivan County Supreme Court', 'Sullivan County Supreme Court'),
-    ('Tioga County Supreme Court', 'Tioga County Supreme Court'),
-    ('Tompkins County Supreme Court', 'Tompkins County Supreme Court'),
-    ('Ulster County Supreme Court', 'Ulster County Supreme Court'),
-    ('Warren County Supreme Court', 'Warren County Supreme Court'),
-    ('Washington County Supreme Court', 'Washington County Supreme Court'),
-    ('Wayne County Supreme Court', 'Wayne County Supreme Court'),
-    ('Westchester County Supreme Court', 'Westchester County Supreme Court'),
-    ('Wyoming County Supreme Court', 'Wyoming County Supreme Court'),
-    ('Yates County Supreme Court', 'Yates County Supreme Court'),
-    ('Albany County Surrogate\'s Court', 'Albany County Surrogate\'s Court'),
-    ('Allegany County Surrogate\'s Court', 'Allegany County Surrogate\'s Court'),
-    ('Bronx County Surrogate\'s Court', 'Bronx County Surrogate\'s Court'),
-    ('Broome County Surrogate\'s Court', 'Broome County Surrogate\'s Court'),
-    ('Buffalo City Court', 'Buffalo City Court'),
-    ('Cattaraugus County Surrogate\'s Court', 'Cattaraugus County Surrogate\'s Court'),
-    ('Cayuga County Surrogate\'s Court', 'Cayuga County Surrogate\'s Court'),
-    ('Chautauqua County Surrogate\'s Court', 'Chautauqua County Surrogate\'s Court'),
-    ('Chemung County Surrogate\'s Court', 'Chemung County Surrogate\'s Court'),
-    ('Chenango County Surrogate\'s Court', 'Chenango County Surrogate\'s Court'),
-    ('Clinton County Surrogate\'s Court', 'Clinton County Surrogate\'s Court'),
-    ('Columbia County Surrogate\'s Court', 'Columbia County Surrogate\'s Court'),
-    ('Cortland County Surrogate\'s Court', 'Cortland County Surrogate\'s Court'),
-    ('Delaware County Surrogate\'s Court', 'Delaware County Surrogate\'s Court'),
-    ('Dutchess County Surrogate\'s Court', 'Dutchess County Surrogate\'s Court'),
-    ('Erie County Surrogate\'s Court', 'Erie County Surrogate\'s Court'),
-    ('Essex County Surrogate\'s Court', 'Essex County Surrogate\'s Court'),
-    ('Franklin County Surrogate\'s Court', 'Franklin County Surrogate\'s Court'),
-    ('Fulton County Surrogate\'s Court', 'Fulton County Surrogate\'s Court'),
-    ('Genesee County Surrogate\'s Court', 'Genesee County Surrogate\'s Court'),
-    ('Greene County Surrogate\'s Court', 'Greene County Surrogate\'s Court'),
-    ('Hamilton County Surrogate\'s Court', 'Hamilton County Surrogate\'s Court'),
-    ('Herkimer County Surrogate\'s Court', 'Herkimer County Surrogate\'s Court'),
-    ('Jefferson County Surrogate\'s Court', 'Jefferson County Surrogate\'s Court'),
-    ('Kings County Surrogate\'s Court', 'Kings County Surrogate\'s Court'),
-    ('Lewis County Surrogate\'s Court', 'Lewis County Surrogate\'s Court'),
-    ('Livingston County Surrogate\'s Court', 'Livingston County Surrogate\'s Court'),
-    ('Madison County Surrogate\'s Court', 'Madison County Surrogate\'s Court'),
-    ('Monroe County Surrogate\'s Court', 'Monroe County Surrogate\'s Court'),
-    ('Montgomery County Surrogate\'s Court', 'Montgomery County Surrogate\'s Court'),
-    ('Nassau County Surrogate\'s Court', 'Nassau County Surrogate\'s Court'),
-    ('New York City Criminal Court', 'New York City Criminal Court'),
-    ('New York County Surrogate\'s Court', 'New York County Surrogate\'s Court'),
-    ('Niagara County Surrogate\'s Court', 'Niagara County Surrogate\'s Court'),
-    ('Oneida County Surrogate\'s Court', 'Oneida County Surrogate\'s Court'),
-    ('Onondaga County Surrogate\'s Court', 'Onondaga County Surrogate\'s Court'),
-    ('Ontario County Surrogate\'s Court', 'Ontario County Surrogate\'s Court'),
-    ('Orange County Surrogate\'s Court', 'Orange County Surrogate\'s Court'),
-    ('Orleans County Surrogate\'s Court', 'Orleans County Surrogate\'s Court'),
-    ('Oswego County Surrogate\'s Court', 'Oswego County Surrogate\'s Court'),
-    ('Otsego County Surrogate\'s Court', 'Otsego County Surrogate\'s Court'),
-    ('Putnam County Surrogate\'s Court', 'Putnam County Surrogate\'s Court'),
-    ('Queens County Surrogate\'s Court', 'Queens County Surrogate\'s Court'),
-    ('Rensselaer County Surrogate\'s Court', 'Rensselaer County Surrogate\'s Court'),
-    ('Richmond County Surrogate\'s Court', 'Richmond County Surrogate\'s Court'),
-    ('Rochester City Court', 'Rochester City Court'),
-    ('Rockland County Surrogate\'s Court', 'Rockland County Surrogate\'s Court'),
-    ('Saratoga County Surrogate\'s Court', 'Saratoga County Surrogate\'s Court'),
-    ('Schenectady County Surrogate\'s Court', 'Schenectady County Surrogate\'s Court'),
-    ('Schoharie County Surrogate\'s Court', 'Schoharie County Surrogate\'s Court'),
-    ('Schuyler County Surrogate\'s Court', 'Schuyler County Surrogate\'s Court'),
-    ('Seneca County Surrogate\'s Court', 'Seneca County Surrogate\'s Court'),
-    ('St. Lawrence County Surrogate\'s Court', 'St. Lawrence County Surrogate\'s Court'),
-    ('Steuben County Surrogate\'s Court', 'Steuben County Surrogate\'s Court'),
-    ('Suffolk County Surrogate\'s Court', 'Suffolk County Surrogate\'s Court'),
-    ('Sullivan County Surrogate\'s Court', 'Sullivan County Surrogate\'s Court'),
-    ('Tioga County Surrogate\'s Court', 'Tioga County Surrogate\'s Court'),
-    ('Tompkins County Surrogate\'s Court', 'Tompkins County Surrogate\'s Court'),
-    ('Ulster County Surrogate\'s Court', 'Ulster County Surrogate\'s Court'),
-    ('Warren County Surrogate\'s Court', 'Warren County Surrogate\'s Court'),
-    ('Washington County Surrogate\'s Court', 'Washington County Surrogate\'s Court'),
-    ('Wayne County Surrogate\'s Court', 'Wayne County Surrogate\'s Court'),
-    ('Westchester County Surrogate\'s Court', 'Westchester County Surrogate\'s Court'),
-    ('Wyoming County Surrogate\'s Court', 'Wyoming County Surrogate\'s Court'),
-    ('Yates County Surrogate\'s Court', 'Yates County Surrogate\'s Court'),
-    ('Yonkers City Court', 'Yonkers City Court'),
-
-]
-
-NORTH_CAROLINA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fourth Circuit', 'U.S. Court of Appeals for the Fourth Circuit'),
-    ('North Carolina Supreme Court', 'North Carolina Supreme Court'),
-    ('North Carolina Court of Appeals', 'North Carolina Court of Appeals'),
-    ('U.S. District Court for the Eastern District of North Carolina', 'U.S. District Court for the Eastern District of North Carolina'),
-    ('U.S. District Court for the Middle District of North Carolina', 'U.S. District Court for the Middle District of North Carolina'),
-    ('U.S. District Court for the Western District of North Carolina', 'U.S. District Court for the Western District of North Carolina'),
-    ('10th Judicial District Superior Court', '10th Judicial District Superior Court'),
-    ('11th Judicial District Superior Court', '11th Judicial District Superior Court'),
-    ('12th Judicial District Superior Court', '12th Judicial District Superior Court'),
-    ('13th Judicial District Superior Court', '13th Judicial District Superior Court'),
-    ('14th Judicial District Superior Court', '14th Judicial District Superior Court'),
-    ('15th Judicial District Superior Court', '15th Judicial District Superior Court'),
-    ('16th Judicial District Superior Court', '16th Judicial District Superior Court'),
-    ('17th Judicial District Superior Court', '17th Judicial District Superior Court'),
-    ('18th Judicial District Superior Court', '18th Judicial District Superior Court'),
-    ('19th Judicial District Superior Court', '19th Judicial District Superior Court'),
-    ('1st Judicial District Superior Court', '1st Judicial District Superior Court'),
-    ('20th Judicial District Superior Court', '20th Judicial District Superior Court'),
-    ('21st Judicial District Superior Court', '21st Judicial District Superior Court'),
-    ('22nd Judicial District Superior Court', '22nd Judicial District Superior Court'),
-    ('23rd Judicial District Superior Court', '23rd Judicial District Superior Court'),
-    ('24th Judicial District Superior Court', '24th Judicial District Superior Court'),
-    ('25th Judicial District Superior Court', '25th Judicial District Superior Court'),
-    ('26th Judicial District Superior Court', '26th Judicial District Superior Court'),
-    ('27th Judicial District Superior Court', '27th Judicial District Superior Court'),
-    ('28th Judicial District Superior Court', '28th Judicial District Superior Court'),
-    ('29th Judicial District Superior Court', '29th Judicial District Superior Court'),
-    ('2nd Judicial District Superior Court', '2nd Judicial District Superior Court'),
-    ('30th Judicial District Superior Court', '30th Judicial District Superior Court'),
-    ('3rd Judicial District Superior Court', '3rd Judicial District Superior Court'),
-    ('4th Judicial District Superior Court', '4th Judicial District Superior Court'),
-    ('5th Judicial District Superior Court', '5th Judicial District Superior Court'),
-    ('6th Judicial District Superior Court', '6th Judicial District Superior Court'),
-    ('7th Judicial District Superior Court', '7th Judicial District Superior Court'),
-    ('8th Judicial District Superior Court', '8th Judicial District Superior Court'),
-    ('9th Judicial District Superior Court', '9th Judicial District Superior Court'),
-    ('Alamance County District Court', 'Alamance County District Court'),
-    ('Alexander County District Court', 'Alexander County District Court'),
-    ('Alleghany County District Court', 'Alleghany County District Court'),
-    ('Anson County District Court', 'Anson County District Court'),
-    ('Ashe County District Court', 'Ashe County District Court'),
-    ('Avery County District Court', 'Avery County District Court'),
-    ('Beaufort County District Court', 'Beaufort County District Court'),
-    ('Bertie County District Court', 'Bertie County District Court'),
-    ('Bladen County District Court', 'Bladen County District Court'),
-    ('Brunswick County District Court', 'Brunswick County District Court'),
-    ('Buncombe County District Court', 'Buncombe County District Court'),
-    ('Burke County District Court', 'Burke County District Court'),
-    ('Cabarrus County District Court', 'Cabarrus County District Court'),
-    ('Caldwell County District Court', 'Caldwell County District Court'),
-    ('Camden County District Court', 'Camden County District Court'),
-    ('Carteret County District Court', 'Carteret County District Court'),
-    ('Caswell County District Court', 'Caswell County District Court'),
-    ('Catawba County District Court', 'Catawba County District Court'),
-    ('Chatham County District Court', 'Chatham County District Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Chowan County District Court', 'Chowan County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Cleveland County District Court', 'Cleveland County District Court'),
-    ('Columbus County District Court', 'Columbus County District Court'),
-    ('Craven County District Court', 'Craven County District Court'),
-    ('Cumberland County District Court', 'Cumberland County District Court'),
-    ('Currituck County District Court', 'Currituck County District Court'),
-    ('Dare County District Court', 'Dare County District Court'),
-    ('Davidson County District Court', 'Davidson County District Court'),
-    ('Davie County District Court', 'Davie County District Court'),
-    ('Duplin County District Court', 'Duplin County District Court'),
-    ('Durham County District Court', 'Durham County District Court'),
-    ('Edgecombe County District Court', 'Edgecombe County District Court'),
-    ('Forsyth County District Court', 'Forsyth County District Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Gaston County District Court', 'Gaston County District Court'),
-    ('Gates County District Court', 'Gates County District Court'),
-    ('Graham County District Court', 'Graham County District Court'),
-    ('Granville County District Court', 'Granville County District Court'),
-    ('Greene County District Court', 'Greene County District Court'),
-    ('Guilford County District Court', 'Guilford County District Court'),
-    ('Halifax County District Court', 'Halifax County District Court'),
-    ('Harnett County District Court', 'Harnett County District Court'),
-    ('Haywood County District Court', 'Haywood County District Court'),
-    ('Henderson County District Court', 'Henderson County District Court'),
-    ('Hertford County District Court', 'Hertford County District Court'),
-    ('Hoke County District Court', 'Hoke County District Court'),
-    ('Hyde County District Court', 'Hyde County District Court'),
-    ('Iredell County District Court', 'Iredell County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Johnston County District Court', 'Johnston County District Court'),
-    ('Jones County District Court', 'Jones County District Court'),
-    ('Lee County District Court', 'Lee County District Court'),
-    ('Lenoir County District Court', 'Lenoir County District Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Macon County District Court', 'Macon County District Court'),
-    ('Madison County District Court', 'Madison County District Court'),
-    ('Martin County District Court', 'Martin County District Court'),
-    ('McDowell County District Court', 'McDowell County District Court'),
-    ('Mecklenburg County District Court', 'Mecklenburg County District Court'),
-    ('Mitchell County District Court', 'Mitchell County District Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Moore County District Court', 'Moore County District Court'),
-    ('Nash County District Court', 'Nash County District Court'),
-    ('New Hanover County District Court', 'New Hanover County District Court'),
-    ('Northampton County District Court', 'Northampton County District Court'),
-    ('Onslow County District Court', 'Onslow County District Court'),
-    ('Orange County District Court', 'Orange County District Court'),
-    ('Pamlico County District Court', 'Pamlico County District Court'),
-    ('Pasquotank County District Court', 'Pasquotank County District Court'),
-    ('Pender County District Court', 'Pender County District Court'),
-    ('Perquimans County District Court', 'Perquimans County District Court'),
-    ('Person County District Court', 'Person County District Court'),
-    ('Pitt County District Court', 'Pitt County District Court'),
-    ('Polk County District Court', 'Polk County District Court'),
-    ('Randolph County District Court', 'Randolph County District Court'),
-    ('Richmond County District Court', 'Richmond County District Court'),
-    ('Robeson County District Court', 'Robeson County District Court'),
-    ('Rockingham County District Court', 'Rockingham County District Court'),
-    ('Rowan County District Court', 'Rowan County District Court'),
-    ('Rutherford County District Court', 'Rutherford County District Court'),
-    ('Sampson County District Court', 'Sampson County District Court'),
-    ('Scotland County District Court', 'Scotland County District Court'),
-    ('Stanly County District Court', 'Stanly County District Court'),
-    ('Stokes County District Court', 'Stokes County District Court'),
-    ('Surry County District Court', 'Surry County District Court'),
-    ('Swain County District Court', 'Swain County District Court'),
-    ('Transylvania County District Court', 'Transylvania County District Court'),
-    ('Tyrrell County District Court', 'Tyrrell County District Court'),
-    ('Union County District Court', 'Union County District Court'),
-    ('Vance County District Court', 'Vance County District Court'),
-    ('Wake County District Court', 'Wake County District Court'),
-    ('Warren County District Court', 'Warren County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Watauga County District Court', 'Watauga County District Court'),
-    ('Wayne County District Court', 'Wayne County District Court'),
-    ('Wilkes County District Court', 'Wilkes County District Court'),
-    ('Wilson County District Court', 'Wilson County District Court'),
-    ('Yadkin County District Court', 'Yadkin County District Court'),
-
-]
-
-NORTH_DAKOTA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('North Dakota Supreme Court', 'North Dakota Supreme Court'),
-    ('North Dakota Court of Appeals', 'North Dakota Court of Appeals'),
-    ('U.S. District Court for the District of North Dakota', 'U.S. District Court for the District of North Dakota'),
-    ('Adams County District Court', 'Adams County District Court'),
-    ('Barnes County District Court', 'Barnes County District Court'),
-    ('Benson County District Court', 'Benson County District Court'),
-    ('Billings County District Court', 'Billings County District Court'),
-    ('Bottineau County District Court', 'Bottineau County District Court'),
-    ('Bowman County District Court', 'Bowman County District Court'),
-    ('Burke County District Court', 'Burke County District Court'),
-    ('Burleigh County District Court', 'Burleigh County District Court'),
-    ('Cass County District Court', 'Cass County District Court'),
-    ('Cavalier County District Court', 'Cavalier County District Court'),
-    ('Dickey County District Court', 'Dickey County District Court'),
-    ('Divide County District Court', 'Divide County District Court'),
-    ('Dunn County District Court', 'Dunn County District Court'),
-    ('East Central Judicial District Court', 'East Central Judicial District Court'),
-    ('Eddy County District Court', 'Eddy County District Court'),
-    ('Emmons County District Court', 'Emmons County District Court'),
-    ('Foster County District Court', 'Foster County District Court'),
-    ('Golden Valley County District Court', 'Golden Valley County District Court'),
-    ('Grand Forks County District Court', 'Grand Forks County District Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Griggs County District Court', 'Griggs County District Court'),
-    ('Hettinger County District Court', 'Hettinger County District Court'),
-    ('Kidder County District Court', 'Kidder County District Court'),
-    ('LaMoure County District Court', 'LaMoure County District Court'),
-    ('Logan County District Court', 'Logan County District Court'),
-    ('McHenry County District Court', 'McHenry County District Court'),
-    ('McIntosh County District Court', 'McIntosh County District Court'),
-    ('McKenzie County District Court', 'McKenzie County District Court'),
-    ('McLean County District Court', 'McLean County District Court'),
-    ('Mercer County District Court', 'Mercer County District Court'),
-    ('Morton County District Court', 'Morton County District Court'),
-    ('Mountrail County District Court', 'Mountrail County District Court'),
-    ('Nelson County District Court', 'Nelson County District Court'),
-    ('North Central Judicial District Court', 'North Central Judicial District Court'),
-    ('Northeast Judicial District Court', 'Northeast Judicial District Court'),
-    ('Northwest Judicial District Court', 'Northwest Judicial District Court'),
-    ('Oliver County District Court', 'Oliver County District Court'),
-    ('Pembina County District Court', 'Pembina County District Court'),
-    ('Pierce County District Court', 'Pierce County District Court'),
-    ('Ramsey County District Court', 'Ramsey County District Court'),
-    ('Ransom County District Court', 'Ransom County District Court'),
-    ('Renville County District Court', 'Renville County District Court'),
-    ('Richland County District Court', 'Richland County District Court'),
-    ('Rolette County District Court', 'Rolette County District Court'),
-    ('Sargent County District Court', 'Sargent County District Court'),
-    ('Sheridan County District Court', 'Sheridan County District Court'),
-    ('Sioux County District Court', 'Sioux County District Court'),
-    ('Slope County District Court', 'Slope County District Court'),
-    ('South Central Judicial District Court', 'South Central Judicial District Court'),
-    ('Southeast Judicial District Court', 'Southeast Judicial District Court'),
-    ('Southwest Judicial District Court', 'Southwest Judicial District Court'),
-    ('Stark County District Court', 'Stark County District Court'),
-    ('Steele County District Court', 'Steele County District Court'),
-    ('Stutsman County District Court', 'Stutsman County District Court'),
-    ('Towner County District Court', 'Towner County District Court'),
-    ('Traill County District Court', 'Traill County District Court'),
-    ('Walsh County District Court', 'Walsh County District Court'),
-    ('Ward County District Court', 'Ward County District Court'),
-    ('Wells County District Court', 'Wells County District Court'),
-
-]
-
-OHIO_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Sixth Circuit', 'U.S. Court of Appeals for the Sixth Circuit'),
-    ('Ohio Supreme Court', 'Ohio Supreme Court'),
-    ('Ohio First District Court of Appeals', 'Ohio First District Court of Appeals'),
-    ('Ohio Second District Court of Appeals', 'Ohio Second District Court of Appeals'),
-    ('Ohio Third District Court of Appeals', 'Ohio Third District Court of Appeals'),
-    ('Ohio Fourth District Court of Appeals', 'Ohio Fourth District Court of Appeals'),
-    ('Ohio Fifth District Court of Appeals', 'Ohio Fifth District Court of Appeals'),
-    ('Ohio Sixth District Court of Appeals', 'Ohio Sixth District Court of Appeals'),
-    ('Ohio Seventh District Court of Appeals', 'Ohio Seventh District Court of Appeals'),
-    ('Ohio Eighth District Court of Appeals', 'Ohio Eighth District Court of Appeals'),
-    ('Ohio Ninth District Court of Appeals', 'Ohio Ninth District Court of Appeals'),
-    ('Ohio Tenth District Court of Appeals', 'Ohio Tenth District Court of Appeals'),
-    ('Ohio Eleventh District Court of Appeals', 'Ohio Eleventh District Court of Appeals'),
-    ('Ohio Twelfth District Court of Appeals', 'Ohio Twelfth District Court of Appeals'),
-    ('U.S. District Court for the Northern District of Ohio', 'U.S. District Court for the Northern District of Ohio'),
-    ('U.S. District Court for the Southern District of Ohio', 'U.S. District Court for the Southern District of Ohio'),
-    ('Adams County Court of Common Pleas', 'Adams County Court of Common Pleas'),
-    ('Adams County Probate Court', 'Adams County Probate Court'),
-    ('Akron Municipal Court', 'Akron Municipal Court'),
-    ('Allen County Court of Common Pleas', 'Allen County Court of Common Pleas'),
-    ('Allen County Probate Court', 'Allen County Probate Court'),
-    ('Ashland County Court of Common Pleas', 'Ashland County Court of Common Pleas'),
-    ('Ashland County Probate Court', 'Ashland County Probate Court'),
-    ('Ashtabula County Court of Common Pleas', 'Ashtabula County Court of Common Pleas'),
-    ('Ashtabula County Probate Court', 'Ashtabula County Probate Court'),
-    ('Athens County Court of Common Pleas', 'Athens County Court of Common Pleas'),
-    ('Athens County Probate Court', 'Athens County Probate Court'),
-    ('Auglaize County Court of Common Pleas', 'Auglaize County Court of Common Pleas'),
-    ('Auglaize County Probate Court', 'Auglaize County Probate Court'),
-    ('Belmont County Court of Common Pleas', 'Belmont County Court of Common Pleas'),
-    ('Belmont County Probate Court', 'Belmont County Probate Court'),
-    ('Brown County Court of Common Pleas', 'Brown County Court of Common Pleas'),
-    ('Brown County Probate Court', 'Brown County Probate Court'),
-    ('Butler County Court of Common Pleas', 'Butler County Court of Common Pleas'),
-    ('Butler County Probate Court', 'Butler County Probate Court'),
-    ('Carroll County Court of Common Pleas', 'Carroll County Court of Common Pleas'),
-    ('Carroll County Probate Court', 'Carroll County Probate Court'),
-    ('Champaign County Court of Common Pleas', 'Champaign County Court of Common Pleas'),
-    ('Champaign County Probate Court', 'Champaign County Probate Court'),
-    ('Cincinnati Municipal Court', 'Cincinnati Municipal Court'),
-    ('Clark County Court of Common Pleas', 'Clark County Court of Common Pleas'),
-    ('Clark County Probate Court', 'Clark County Probate Court'),
-    ('Clermont County Court of Common Pleas', 'Clermont County Court of Common Pleas'),
-    ('Clermont County Probate Court', 'Clermont County Probate Court'),
-    ('Cleveland Municipal Court', 'Cleveland Municipal Court'),
-    ('Clinton County Court of Common Pleas', 'Clinton County Court of Common Pleas'),
-    ('Clinton County Probate Court', 'Clinton County Probate Court'),
-    ('Columbiana County Court of Common Pleas', 'Columbiana County Court of Common Pleas'),
-    ('Columbiana County Probate Court', 'Columbiana County Probate Court'),
-    ('Columbus Municipal Court', 'Columbus Municipal Court'),
-    ('Coshocton County Court of Common Pleas', 'Coshocton County Court of Common Pleas'),
-    ('Coshocton County Probate Court', 'Coshocton County Probate Court'),
-    ('Crawford County Court of Common Pleas', 'Crawford County Court of Common Pleas'),
-    ('Crawford County Probate Court', 'Crawford County Probate Court'),
-    ('Cuyahoga County Court of Common Pleas', 'Cuyahoga County Court of Common Pleas'),
-    ('Cuyahoga County Probate Court', 'Cuyahoga County Probate Court'),
-    ('Darke County Court of Common Pleas', 'Darke County Court of Common Pleas'),
-    ('Darke County Probate Court', 'Darke County Probate Court'),
-    ('Dayton Municipal Court', 'Dayton Municipal Court'),
-    ('Defiance County Court of Common Pleas', 'Defiance County Court of Common Pleas'),
-    ('Defiance County Probate Court', 'Defiance County Probate Court'),
-    ('Delaware County Court of Common Pleas', 'Delaware County Court of Common Pleas'),
-    ('Delaware County Probate Court', 'Delaware County Probate Court'),
-    ('Erie County Court of Common Pleas', 'Erie County Court of Common Pleas'),
-    ('Erie County Probate Court', 'Erie County Probate Court'),
-    ('Fairfield County Court of Common Pleas', 'Fairfield County Court of Common Pleas'),
-    ('Fairfield County Probate Court', 'Fairfield County Probate Court'),
-    ('Fayette County Court of Common Pleas', 'Fayette County Court of Common Pleas'),
-    ('Fayette County Probate Court', 'Fayette County Probate Court'),
-    ('Franklin County Court of Common Pleas', 'Franklin County Court of Common Pleas'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Fulton County Court of Common Pleas', 'Fulton County Court of Common Pleas'),
-    ('Fulton County Probate Court', 'Fulton County Probate Court'),
-    ('Gallia County Court of Common Pleas', 'Gallia County Court of Common Pleas'),
-    ('Gallia County Probate Court', 'Gallia County Probate Court'),
-    ('Geauga County Court of Common Pleas', 'Geauga County Court of Common Pleas'),
-    ('Geauga County Probate Court', 'Geauga County Probate Court'),
-    ('Greene County Court of Common Pleas', 'Greene County Court of Common Pleas'),
-    ('Greene County Probate Court', 'Greene County Probate Court'),
-    ('Guernsey County Court of Common Pleas', 'Guernsey County Court of Common Pleas'),
-    ('Guernsey County Probate Court', 'Guernsey County Probate Court'),
-    ('Hamilton County Court of Common Pleas', 'Hamilton County Court of Common Pleas'),
-    ('Hamilton County Probate Court', 'Hamilton County Probate Court'),
-    ('Hancock County Court of Common Pleas', 'Hancock County Court of Common Pleas'),
-    ('Hancock County Probate Court', 'Hancock County Probate Court'),
-    ('Hardin County Court of Common Pleas', 'Hardin County Court of Common Pleas'),
-    ('Hardin County Probate Court', 'Hardin County Probate Court'),
-    ('Harrison County Court of Common Pleas', 'Harrison County Court of Common Pleas'),
-    ('Harrison County Probate Court', 'Harrison County Probate Court'),
-    ('Henry County Court of Common Pleas', 'Henry County Court of Common Pleas'),
-    ('Henry County Probate Court', 'Henry County Probate Court'),
-    ('Highland County Court of Common Pleas', 'Highland County Court of Common Pleas'),
-    ('Highland County Probate Court', 'Highland County Probate Court'),
-    ('Hocking County Court of Common Pleas', 'Hocking County Court of Common Pleas'),
-    ('Hocking County Probate Court', 'Hocking County Probate Court'),
-    ('Holmes County Court of Common Pleas', 'Holmes County Court of Common Pleas'),
-    ('Holmes County Probate Court', 'Holmes County Probate Court'),
-    ('Huron County Court of Common Pleas', 'Huron County Court of Common Pleas'),
-    ('Huron County Probate Court', 'Huron County Probate Court'),
-    ('Jackson County Court of Common Pleas', 'Jackson County Court of Common Pleas'),
-    ('Jackson County Probate Court', 'Jackson County Probate Court'),
-    ('Jefferson County Court of Common Pleas', 'Jefferson County Court of Common Pleas'),
-    ('Jefferson County Probate Court', 'Jefferson County Probate Court'),
-    ('Knox County Court of Common Pleas', 'Knox County Court of Common Pleas'),
-    ('Knox County Probate Court', 'Knox County Probate Court'),
-    ('Lake County Court of Common Pleas', 'Lake County Court of Common Pleas'),
-    ('Lake County Probate Court', 'Lake County Probate Court'),
-    ('Lawrence County Court of Common Pleas', 'Lawrence County Court of Common Pleas'),
-    ('Lawrence County Probate Court', 'Lawrence County Probate Court'),
-    ('Licking County Court of Common Pleas', 'Licking County Court of Common Pleas'),
-    ('Licking County Probate Court', 'Licking County Probate Court'),
-    ('Logan County Court of Common Pleas', 'Logan County Court of Common Pleas'),
-    ('Logan County Probate Court', 'Logan County Probate Court'),
-    ('Lorain County Court of Common Pleas', 'Lorain County Court of Common Pleas'),
-    ('Lorain County Probate Court', 'Lorain County Probate Court'),
-    ('Lucas County Court of Common Pleas', 'Lucas County Court of Common Pleas'),
-    ('Lucas County Probate Court', 'Lucas County Probate Court'),
-    ('Madison County Court of Common Pleas', 'Madison County Court of Common Pleas'),
-    ('Madison County Probate Court', 'Madison County Probate Court'),
-    ('Mahoning County Court of Common Pleas', 'Mahoning County Court of Common Pleas'),
-    ('Mahoning County Probate Court', 'Mahoning County Probate Court'),
-    ('Marion County Court of Common Pleas', 'Marion County Court of Common Pleas'),
-    ('Marion County Probate Court', 'Marion County Probate Court'),
-    ('Medina County Court of Common Pleas', 'Medina County Court of Common Pleas'),
-    ('Medina County Probate Court', 'Medina County Probate Court'),
-    ('Meigs County Court of Common Pleas', 'Meigs County Court of Common Pleas'),
-    ('Meigs County Probate Court', 'Meigs County Probate Court'),
-    ('Mercer County Court of Common Pleas', 'Mercer County Court of Common Pleas'),
-    ('Mercer County Probate Court', 'Mercer County Probate Court'),
-    ('Miami County Court of Common Pleas', 'Miami County Court of Common Pleas'),
-    ('Miami County Probate Court', 'Miami County Probate Court'),
-    ('Monroe County Court of Common Pleas', 'Monroe County Court of Common Pleas'),
-    ('Monroe County Probate Court', 'Monroe County Probate Court'),
-    ('Montgomery County Court of Common Pleas', 'Montgomery County Court of Common Pleas'),
-    ('Montgomery County Probate Court', 'Montgomery County Probate Court'),
-    ('Morgan County Court of Common Pleas', 'Morgan County Court of Common Pleas'),
-    ('Morgan County Probate Court', 'Morgan County Probate Court'),
-    ('Morrow County Court of Common Pleas', 'Morrow County Court of Common Pleas'),
-    ('Morrow County Probate Court', 'Morrow County Probate Court'),
-    ('Muskingum County Court of Common Pleas', 'Muskingum County Court of Common Pleas'),
-    ('Muskingum County Probate Court', 'Muskingum County Probate Court'),
-    ('Noble County Court of Common Pleas', 'Noble County Court of Common Pleas'),
-    ('Noble County Probate Court', 'Noble County Probate Court'),
-    ('Ottawa County Court of Common Pleas', 'Ottawa County Court of Common Pleas'),
-    ('Ottawa County Probate Court', 'Ottawa County Probate Court'),
-    ('Paulding County Court of Common Pleas', 'Paulding County Court of Common Pleas'),
-    ('Paulding County Probate Court', 'Paulding County Probate Court'),
-    ('Perry County Court of Common Pleas', 'Perry County Court of Common Pleas'),
-    ('Perry County Probate Court', 'Perry County Probate Court'),
-    ('Pickaway County Court of Common Pleas', 'Pickaway County Court of Common Pleas'),
-    ('Pickaway County Probate Court', 'Pickaway County Probate Court'),
-    ('Pike County Court of Common Pleas', 'Pike County Court of Common Pleas'),
-    ('Pike County Probate Court', 'Pike County Probate Court'),
-    ('Portage County Court of Common Pleas', 'Portage County Court of Common Pleas'),
-    ('Portage County Probate Court', 'Portage County Probate Court'),
-    ('Preble County Court of Common Pleas', 'Preble County Court of Common Pleas'),
-    ('Preble County Probate Court', 'Preble County Probate Court'),
-    ('Putnam County Court of Common Pleas', 'Putnam County Court of Common Pleas'),
-    ('Putnam County Probate Court', 'Putnam County Probate Court'),
-    ('Richland County Court of Common Pleas', 'Richland County Court of Common Pleas'),
-    ('Richland County Probate Court', 'Richland County Probate Court'),
-    ('Ross County Court of Common Pleas', 'Ross County Court of Common Pleas'),
-    ('Ross County Probate Court', 'Ross County Probate Court'),
-    ('Sandusky County Court of Common Pleas', 'Sandusky County Court of Common Pleas'),
-    ('Sandusky County Probate Court', 'Sandusky County Probate Court'),
-    ('Scioto County Court of Common Pleas', 'Scioto County Court of Common Pleas'),
-    ('Scioto County Probate Court', 'Scioto County Probate Court'),
-    ('Seneca County Court of Common Pleas', 'Seneca County Court of Common Pleas'),
-    ('Seneca County Probate Court', 'Seneca County Probate Court'),
-    ('Shelby County Court of Common Pleas', 'Shelby County Court of Common Pleas'),
-    ('Shelby County Probate Court', 'Shelby County Probate Court'),
-    ('Stark County Court of Common Pleas', 'Stark County Court of Common Pleas'),
-    ('Stark County Probate Court', 'Stark County Probate Court'),
-    ('Summit County Court of Common Pleas', 'Summit County Court of Common Pleas'),
-    ('Summit County Probate Court', 'Summit County Probate Court'),
-    ('Toledo Municipal Court', 'Toledo Municipal Court'),
-    ('Trumbull County Court of Common Pleas', 'Trumbull County Court of Common Pleas'),
-    ('Trumbull County Probate Court', 'Trumbull County Probate Court'),
-    ('Tuscarawas County Court of Common Pleas', 'Tuscarawas County Court of Common Pleas'),
-    ('Tuscarawas County Probate Court', 'Tuscarawas County Probate Court'),
-    ('Union County Court of Common Pleas', 'Union County Court of Common Pleas'),
-    ('Union County Probate Court', 'Union County Probate Court'),
-    ('Van Wert County Court of Common Pleas', 'Van Wert County Court of Common Pleas'),
-    ('Van Wert County Probate Court', 'Van Wert County Probate Court'),
-    ('Vinton County Court of Common Pleas', 'Vinton County Court of Common Pleas'),
-    ('Vinton County Probate Court', 'Vinton County Probate Court'),
-    ('Warren County Court of Common Pleas', 'Warren County Court of Common Pleas'),
-    ('Warren County Probate Court', 'Warren County Probate Court'),
-    ('Washington County Court of Common Pleas', 'Washington County Court of Common Pleas'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Wayne County Court of Common Pleas', 'Wayne County Court of Common Pleas'),
-    ('Wayne County Probate Court', 'Wayne County Probate Court'),
-    ('Williams County Court of Common Pleas', 'Williams County Court of Common Pleas'),
-    ('Williams County Probate Court', 'Williams County Probate Court'),
-    ('Wood County Court of Common Pleas', 'Wood County Court of Common Pleas'),
-    ('Wood County Probate Court', 'Wood County Probate Court'),
-    ('Wyandot County Court of Common Pleas', 'Wyandot County Court of Common Pleas'),
-    ('Wyandot County Probate Court', 'Wyandot County Probate Court'),
-
-]
-
-OKLAHOMA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('Oklahoma Supreme Court', 'Oklahoma Supreme Court'),
-    ('Oklahoma Court of Criminal Appeals', 'Oklahoma Court of Criminal Appeals'),
-    ('U.S. District Court for the Northern District of Oklahoma', 'U.S. District Court for the Northern District of Oklahoma'),
-    ('U.S. District Court for the Eastern District of Oklahoma', 'U.S. District Court for the Eastern District of Oklahoma'),
-    ('U.S. District Court for the Western District of Oklahoma', 'U.S. District Court for the Western District of Oklahoma'),
-    ('10th Judicial District Court', '10th Judicial District Court'),
-    ('11th Judicial District Court', '11th Judicial District Court'),
-    ('12th Judicial District Court', '12th Judicial District Court'),
-    ('13th Judicial District Court', '13th Judicial District Court'),
-    ('14th Judicial District Court', '14th Judicial District Court'),
-    ('15th Judicial District Court', '15th Judicial District Court'),
-    ('16th Judicial District Court', '16th Judicial District Court'),
-    ('17th Judicial District Court', '17th Judicial District Court'),
-    ('18th Judicial District Court', '18th Judicial District Court'),
-    ('19th Judicial District Court', '19th Judicial District Court'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('20th Judicial District Court', '20th Judicial District Court'),
-    ('21st Judicial District Court', '21st Judicial District Court'),
-    ('22nd Judicial District Court', '22nd Judicial District Court'),
-    ('23rd Judicial District Court', '23rd Judicial District Court'),
-    ('24th Judicial District Court', '24th Judicial District Court'),
-    ('25th Judicial District Court', '25th Judicial District Court'),
-    ('26th Judicial District Court', '26th Judicial District Court'),
-    ('27th Judicial District Court', '27th Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Adair County District Court', 'Adair County District Court'),
-    ('Alfalfa County District Court', 'Alfalfa County District Court'),
-    ('Atoka County District Court', 'Atoka County District Court'),
-    ('Beaver County District Court', 'Beaver County District Court'),
-    ('Beckham County District Court', 'Beckham County District Court'),
-    ('Blaine County District Court', 'Blaine County District Court'),
-    ('Bryan County District Court', 'Bryan County District Court'),
-    ('Caddo County District Court', 'Caddo County District Court'),
-    ('Canadian County District Court', 'Canadian County District Court'),
-    ('Carter County District Court', 'Carter County District Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Choctaw County District Court', 'Choctaw County District Court'),
-    ('Cimarron County District Court', 'Cimarron County District Court'),
-    ('Cleveland County District Court', 'Cleveland County District Court'),
-    ('Coal County District Court', 'Coal County District Court'),
-    ('Comanche County District Court', 'Comanche County District Court'),
-    ('Cotton County District Court', 'Cotton County District Court'),
-    ('Craig County District Court', 'Craig County District Court'),
-    ('Creek County District Court', 'Creek County District Court'),
-    ('Custer County District Court', 'Custer County District Court'),
-    ('Delaware County District Court', 'Delaware County District Court'),
-    ('Dewey County District Court', 'Dewey County District Court'),
-    ('Ellis County District Court', 'Ellis County District Court'),
-    ('Garfield County District Court', 'Garfield County District Court'),
-    ('Garvin County District Court', 'Garvin County District Court'),
-    ('Grady County District Court', 'Grady County District Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Greer County District Court', 'Greer County District Court'),
-    ('Harmon County District Court', 'Harmon County District Court'),
-    ('Harper County District Court', 'Harper County District Court'),
-    ('Haskell County District Court', 'Haskell County District Court'),
-    ('Hughes County District Court', 'Hughes County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Johnston County District Court', 'Johnston County District Court'),
-    ('Kay County District Court', 'Kay County District Court'),
-    ('Kingfisher County District Court', 'Kingfisher County District Court'),
-    ('Kiowa County District Court', 'Kiowa County District Court'),
-    ('Latimer County District Court', 'Latimer County District Court'),
-    ('Le Flore County District Court', 'Le Flore County District Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Logan County District Court', 'Logan County District Court'),
-    ('Love County District Court', 'Love County District Court'),
-    ('Major County District Court', 'Major County District Court'),
-    ('Marshall County District Court', 'Marshall County District Court'),
-    ('Mayes County District Court', 'Mayes County District Court'),
-    ('McClain County District Court', 'McClain County District Court'),
-    ('McCurtain County District Court', 'McCurtain County District Court'),
-    ('McIntosh County District Court', 'McIntosh County District Court'),
-    ('Murray County District Court', 'Murray County District Court'),
-    ('Muskogee County District Court', 'Muskogee County District Court'),
-    ('Noble County District Court', 'Noble County District Court'),
-    ('Nowata County District Court', 'Nowata County District Court'),
-    ('Okfuskee County District Court', 'Okfuskee County District Court'),
-    ('Oklahoma City Municipal Court', 'Oklahoma City Municipal Court'),
-    ('Oklahoma County District Court', 'Oklahoma County District Court'),
-    ('Oklahoma Court of Civil Appeals', 'Oklahoma Court of Civil Appeals'),
-    ('Okmulgee County District Court', 'Okmulgee County District Court'),
-    ('Osage County District Court', 'Osage County District Court'),
-    ('Ottawa County District Court', 'Ottawa County District Court'),
-    ('Pawnee County District Court', 'Pawnee County District Court'),
-    ('Payne County District Court', 'Payne County District Court'),
-    ('Pittsburg County District Court', 'Pittsburg County District Court'),
-    ('Pontotoc County District Court', 'Pontotoc County District Court'),
-    ('Pottawatomie County District Court', 'Pottawatomie County District Court'),
-    ('Pushmataha County District Court', 'Pushmataha County District Court'),
-    ('Roger Mills County District Court', 'Roger Mills County District Court'),
-    ('Rogers County District Court', 'Rogers County District Court'),
-    ('Seminole County District Court', 'Seminole County District Court'),
-    ('Sequoyah County District Court', 'Sequoyah County District Court'),
-    ('Stephens County District Court', 'Stephens County District Court'),
-    ('Texas County District Court', 'Texas County District Court'),
-    ('Tillman County District Court', 'Tillman County District Court'),
-    ('Tulsa County District Court', 'Tulsa County District Court'),
-    ('Tulsa Municipal Court', 'Tulsa Municipal Court'),
-    ('Wagoner County District Court', 'Wagoner County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Washita County District Court', 'Washita County District Court'),
-    ('Woods County District Court', 'Woods County District Court'),
-    ('Woodward County District Court', 'Woodward County District Court'),
-
-]
-
-OREGON_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Oregon Supreme Court', 'Oregon Supreme Court'),
-    ('Oregon Court of Appeals', 'Oregon Court of Appeals'),
-    ('U.S. District Court for the District of Oregon', 'U.S. District Court for the District of Oregon'),
-    ('10th Judicial District Circuit Court', '10th Judicial District Circuit Court'),
-    ('11th Judicial District Circuit Court', '11th Judicial District Circuit Court'),
-    ('12th Judicial District Circuit Court', '12th Judicial District Circuit Court'),
-    ('13th Judicial District Circuit Court', '13th Judicial District Circuit Court'),
-    ('14th Judicial District Circuit Court', '14th Judicial District Circuit Court'),
-    ('15th Judicial District Circuit Court', '15th Judicial District Circuit Court'),
-    ('16th Judicial District Circuit Court', '16th Judicial District Circuit Court'),
-    ('17th Judicial District Circuit Court', '17th Judicial District Circuit Court'),
-    ('18th Judicial District Circuit Court', '18th Judicial District Circuit Court'),
-    ('19th Judicial District Circuit Court', '19th Judicial District Circuit Court'),
-    ('1st Judicial District Circuit Court', '1st Judicial District Circuit Court'),
-    ('20th Judicial District Circuit Court', '20th Judicial District Circuit Court'),
-    ('21st Judicial District Circuit Court', '21st Judicial District Circuit Court'),
-    ('22nd Judicial District Circuit Court', '22nd Judicial District Circuit Court'),
-    ('23rd Judicial District Circuit Court', '23rd Judicial District Circuit Court'),
-    ('24th Judicial District Circuit Court', '24th Judicial District Circuit Court'),
-    ('25th Judicial District Circuit Court', '25th Judicial District Circuit Court'),
-    ('26th Judicial District Circuit Court', '26th Judicial District Circuit Court'),
-    ('2nd Judicial District Circuit Court', '2nd Judicial District Circuit Court'),
-    ('3rd Judicial District Circuit Court', '3rd Judicial District Circuit Court'),
-    ('4th Judicial District Circuit Court', '4th Judicial District Circuit Court'),
-    ('5th Judicial District Circuit Court', '5th Judicial District Circuit Court'),
-    ('6th Judicial District Circuit Court', '6th Judicial District Circuit Court'),
-    ('7th Judicial District Circuit Court', '7th Judicial District Circuit Court'),
-    ('8th Judicial District Circuit Court', '8th Judicial District Circuit Court'),
-    ('9th Judicial District Circuit Court', '9th Judicial District Circuit Court'),
-
-]
-
-PENNSYLVANIA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Third Circuit', 'U.S. Court of Appeals for the Third Circuit'),
-    ('Pennsylvania Supreme Court', 'Pennsylvania Supreme Court'),
-    ('Pennsylvania Commonwealth Court', 'Pennsylvania Commonwealth Court'),
-    ('U.S. District Court for the Eastern District of Pennsylvania', 'U.S. District Court for the Eastern District of Pennsylvania'),
-    ('U.S. District Court for the Middle District of Pennsylvania', 'U.S. District Court for the Middle District of Pennsylvania'),
-    ('U.S. District Court for the Western District of Pennsylvania', 'U.S. District Court for the Western District of Pennsylvania'),
-    ('10th Judicial District Court of Common Pleas', '10th Judicial District Court of Common Pleas'),
-    ('11th Judicial District Court of Common Pleas', '11th Judicial District Court of Common Pleas'),
-    ('12th Judicial District Court of Common Pleas', '12th Judicial District Court of Common Pleas'),
-    ('13th Judicial District Court of Common Pleas', '13th Judicial District Court of Common Pleas'),
-    ('14th Judicial District Court of Common Pleas', '14th Judicial District Court of Common Pleas'),
-    ('15th Judicial District Court of Common Pleas', '15th Judicial District Court of Common Pleas'),
-    ('16th Judicial District Court of Common Pleas', '16th Judicial District Court of Common Pleas'),
-    ('17th Judicial District Court of Common Pleas', '17th Judicial District Court of Common Pleas'),
-    ('18th Judicial District Court of Common Pleas', '18th Judicial District Court of Common Pleas'),
-    ('19th Judicial District Court of Common Pleas', '19th Judicial District Court of Common Pleas'),
-    ('1st Judicial District Court of Common Pleas', '1st Judicial District Court of Common Pleas'),
-    ('20th Judicial District Court of Common Pleas', '20th Judicial District Court of Common Pleas'),
-    ('21st Judicial District Court of Common Pleas', '21st Judicial District Court of Common Pleas'),
-    ('22nd Judicial District Court of Common Pleas', '22nd Judicial District Court of Common Pleas'),
-    ('23rd Judicial District Court of Common Pleas', '23rd Judicial District Court of Common Pleas'),
-    ('24th Judicial District Court of Common Pleas', '24th Judicial District Court of Common Pleas'),
-    ('25th Judicial District Court of Common Pleas', '25th Judicial District Court of Common Pleas'),
-    ('26th Judicial District Court of Common Pleas', '26th Judicial District Court of Common Pleas'),
-    ('27th Judicial District Court of Common Pleas', '27th Judicial District Court of Common Pleas'),
-    ('28th Judicial District Court of Common Pleas', '28th Judicial District Court of Common Pleas'),
-    ('29th Judicial District Court of Common Pleas', '29th Judicial District Court of Common Pleas'),
-    ('2nd Judicial District Court of Common Pleas', '2nd Judicial District Court of Common Pleas'),
-    ('30th Judicial District Court of Common Pleas', '30th Judicial District Court of Common Pleas'),
-    ('31st Judicial District Court of Common Pleas', '31st Judicial District Court of Common Pleas'),
-    ('32nd Judicial District Court of Common Pleas', '32nd Judicial District Court of Common Pleas'),
-    ('33rd Judicial District Court of Common Pleas', '33rd Judicial District Court of Common Pleas'),
-    ('34th Judicial District Court of Common Pleas', '34th Judicial District Court of Common Pleas'),
-    ('35th Judicial District Court of Common Pleas', '35th Judicial District Court of Common Pleas'),
-    ('36th Judicial District Court of Common Pleas', '36th Judicial District Court of Common Pleas'),
-    ('37th Judicial District Court of Common Pleas', '37th Judicial District Court of Common Pleas'),
-    ('38th Judicial District Court of Common Pleas', '38th Judicial District Court of Common Pleas'),
-    ('39th Judicial District Court of Common Pleas', '39th Judicial District Court of Common Pleas'),
-    ('3rd Judicial District Court of Common Pleas', '3rd Judicial District Court of Common Pleas'),
-    ('40th Judicial District Court of Common Pleas', '40th Judicial District Court of Common Pleas'),
-    ('41st Judicial District Court of Common Pleas', '41st Judicial District Court of Common Pleas'),
-    ('42nd Judicial District Court of Common Pleas', '42nd Judicial District Court of Common Pleas'),
-    ('43rd Judicial District Court of Common Pleas', '43rd Judicial District Court of Common Pleas'),
-    ('44th Judicial District Court of Common Pleas', '44th Judicial District Court of Common Pleas'),
-    ('45th Judicial District Court of Common Pleas', '45th Judicial District Court of Common Pleas'),
-    ('46th Judicial District Court of Common Pleas', '46th Judicial District Court of Common Pleas'),
-    ('47th Judicial District Court of Common Pleas', '47th Judicial District Court of Common Pleas'),
-    ('48th Judicial District Court of Common Pleas', '48th Judicial District Court of Common Pleas'),
-    ('49th Judicial District Court of Common Pleas', '49th Judicial District Court of Common Pleas'),
-    ('4th Judicial District Court of Common Pleas', '4th Judicial District Court of Common Pleas'),
-    ('50th Judicial District Court of Common Pleas', '50th Judicial District Court of Common Pleas'),
-    ('51st Judicial District Court of Common Pleas', '51st Judicial District Court of Common Pleas'),
-    ('52nd Judicial District Court of Common Pleas', '52nd Judicial District Court of Common Pleas'),
-    ('53rd Judicial District Court of Common Pleas', '53rd Judicial District Court of Common Pleas'),
-    ('54th Judicial District Court of Common Pleas', '54th Judicial District Court of Common Pleas'),
-    ('55th Judicial District Court of Common Pleas', '55th Judicial District Court of Common Pleas'),
-    ('56th Judicial District Court of Common Pleas', '56th Judicial District Court of Common Pleas'),
-    ('57th Judicial District Court of Common Pleas', '57th Judicial District Court of Common Pleas'),
-    ('58th Judicial District Court of Common Pleas', '58th Judicial District Court of Common Pleas'),
-    ('59th Judicial District Court of Common Pleas', '59th Judicial District Court of Common Pleas'),
-    ('5th Judicial District Court of Common Pleas', '5th Judicial District Court of Common Pleas'),
-    ('60th Judicial District Court of Common Pleas', '60th Judicial District Court of Common Pleas'),
-    ('6th Judicial District Court of Common Pleas', '6th Judicial District Court of Common Pleas'),
-    ('7th Judicial District Court of Common Pleas', '7th Judicial District Court of Common Pleas'),
-    ('8th Judicial District Court of Common Pleas', '8th Judicial District Court of Common Pleas'),
-    ('9th Judicial District Court of Common Pleas', '9th Judicial District Court of Common Pleas'),
-    ('Adams County Orphans\' Court', 'Adams County Orphans\' Court'),
-    ('Allegheny County Orphans\' Court', 'Allegheny County Orphans\' Court'),
-    ('Armstrong County Orphans\' Court', 'Armstrong County Orphans\' Court'),
-    ('Beaver County Orphans\' Court', 'Beaver County Orphans\' Court'),
-    ('Bedford County Orphans\' Court', 'Bedford County Orphans\' Court'),
-    ('Berks County Orphans\' Court', 'Berks County Orphans\' Court'),
-    ('Blair County Orphans\' Court', 'Blair County Orphans\' Court'),
-    ('Bradford County Orphans\' Court', 'Bradford County Orphans\' Court'),
-    ('Bucks County Orphans\' Court', 'Bucks County Orphans\' Court'),
-    ('Butler County Orphans\' Court', 'Butler County Orphans\' Court'),
-    ('Cambria County Orphans\' Court', 'Cambria County Orphans\' Court'),
-    ('Cameron County Orphans\' Court', 'Cameron County Orphans\' Court'),
-    ('Carbon County Orphans\' Court', 'Carbon County Orphans\' Court'),
-    ('Centre County Orphans\' Court', 'Centre County Orphans\' Court'),
-    ('Chester County Orphans\' Court', 'Chester County Orphans\' Court'),
-    ('Clarion County Orphans\' Court', 'Clarion County Orphans\' Court'),
-    ('Clearfield County Orphans\' Court', 'Clearfield County Orphans\' Court'),
-    ('Clinton County Orphans\' Court', 'Clinton County Orphans\' Court'),
-    ('Columbia County Orphans\' Court', 'Columbia County Orphans\' Court'),
-    ('Crawford County Orphans\' Court', 'Crawford County Orphans\' Court'),
-    ('Cumberland County Orphans\' Court', 'Cumberland County Orphans\' Court'),
-    ('Dauphin County Orphans\' Court', 'Dauphin County Orphans\' Court'),
-    ('Delaware County Orphans\' Court', 'Delaware County Orphans\' Court'),
-    ('Elk County Orphans\' Court', 'Elk County Orphans\' Court'),
-    ('Erie County Orphans\' Court', 'Erie County Orphans\' Court'),
-    ('Fayette County Orphans\' Court', 'Fayette County Orphans\' Court'),
-    ('Forest County Orphans\' Court', 'Forest County Orphans\' Court'),
-    ('Franklin County Orphans\' Court', 'Franklin County Orphans\' Court'),
-    ('Fulton County Orphans\' Court', 'Fulton County Orphans\' Court'),
-    ('Greene County Orphans\' Court', 'Greene County Orphans\' Court'),
-    ('Huntingdon County Orphans\' Court', 'Huntingdon County Orphans\' Court'),
-    ('Indiana County Orphans\' Court', 'Indiana County Orphans\' Court'),
-    ('Jefferson County Orphans\' Court', 'Jefferson County Orphans\' Court'),
-    ('Juniata County Orphans\' Court', 'Juniata County Orphans\' Court'),
-    ('Lackawanna County Orphans\' Court', 'Lackawanna County Orphans\' Court'),
-    ('Lancaster County Orphans\' Court', 'Lancaster County Orphans\' Court'),
-    ('Lawrence County Orphans\' Court', 'Lawrence County Orphans\' Court'),
-    ('Lebanon County Orphans\' Court', 'Lebanon County Orphans\' Court'),
-    ('Lehigh County Orphans\' Court', 'Lehigh County Orphans\' Court'),
-    ('Luzerne County Orphans\' Court', 'Luzerne County Orphans\' Court'),
-    ('Lycoming County Orphans\' Court', 'Lycoming County Orphans\' Court'),
-    ('McKean County Orphans\' Court', 'McKean County Orphans\' Court'),
-    ('Mercer County Orphans\' Court', 'Mercer County Orphans\' Court'),
-    ('Mifflin County Orphans\' Court', 'Mifflin County Orphans\' Court'),
-    ('Monroe County Orphans\' Court', 'Monroe County Orphans\' Court'),
-    ('Montgomery County Orphans\' Court', 'Montgomery County Orphans\' Court'),
-    ('Montour County Orphans\' Court', 'Montour County Orphans\' Court'),
-    ('Northampton County Orphans\' Court', 'Northampton County Orphans\' Court'),
-    ('Northumberland County Orphans\' Court', 'Northumberland County Orphans\' Court'),
-    ('Pennsylvania Superior Court', 'Pennsylvania Superior Court'),
-    ('Perry County Orphans\' Court', 'Perry County Orphans\' Court'),
-    ('Philadelphia County Orphans\' Court', 'Philadelphia County Orphans\' Court'),
-    ('Philadelphia Municipal Court', 'Philadelphia Municipal Court'),
-    ('Pike County Orphans\' Court', 'Pike County Orphans\' Court'),
-    ('Potter County Orphans\' Court', 'Potter County Orphans\' Court'),
-    ('Schuylkill County Orphans\' Court', 'Schuylkill County Orphans\' Court'),
-    ('Snyder County Orphans\' Court', 'Snyder County Orphans\' Court'),
-    ('Somerset County Orphans\' Court', 'Somerset County Orphans\' Court'),
-    ('Sullivan County Orphans\' Court', 'Sullivan County Orphans\' Court'),
-    ('Susquehanna County Orphans\' Court', 'Susquehanna County Orphans\' Court'),
-    ('Tioga County Orphans\' Court', 'Tioga County Orphans\' Court'),
-    ('Union County Orphans\' Court', 'Union County Orphans\' Court'),
-    ('Venango County Orphans\' Court', 'Venango County Orphans\' Court'),
-    ('Warren County Orphans\' Court', 'Warren County Orphans\' Court'),
-    ('Washington County Orphans\' Court', 'Washington County Orphans\' Court'),
-    ('Wayne County Orphans\' Court', 'Wayne County Orphans\' Court'),
-    ('Westmoreland County Orphans\' Court', 'Westmoreland County Orphans\' Court'),
-    ('Wyoming County Orphans\' Court', 'Wyoming County Orphans\' Court'),
-    ('York County Orphans\' Court', 'York County Orphans\' Court'),
-
-]
-
-RHODE_ISLAND_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the First Circuit', 'U.S. Court of Appeals for the First Circuit'),
-    ('Rhode Island Supreme Court', 'Rhode Island Supreme Court'),
-    ('U.S. District Court for the District of Rhode Island', 'U.S. District Court for the District of Rhode Island'),
-    ('Bristol County District Court', 'Bristol County District Court'),
-    ('Bristol County Probate Court', 'Bristol County Probate Court'),
-    ('Bristol County Superior Court', 'Bristol County Superior Court'),
-    ('Kent County District Court', 'Kent County District Court'),
-    ('Kent County Probate Court', 'Kent County Probate Court'),
-    ('Kent County Superior Court', 'Kent County Superior Court'),
-    ('Newport County District Court', 'Newport County District Court'),
-    ('Newport County Probate Court', 'Newport County Probate Court'),
-    ('Newport County Superior Court', 'Newport County Superior Court'),
-    ('Providence County District Court', 'Providence County District Court'),
-    ('Providence County Probate Court', 'Providence County Probate Court'),
-    ('Providence County Superior Court', 'Providence County Superior Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Washington County Superior Court', 'Washington County Superior Court'),
-
-]
-
-SOUTH_CAROLINA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fourth Circuit', 'U.S. Court of Appeals for the Fourth Circuit'),
-    ('South Carolina Supreme Court', 'South Carolina Supreme Court'),
-    ('South Carolina Court of Appeals', 'South Carolina Court of Appeals'),
-    ('U.S. District Court for the District of South Carolina', 'U.S. District Court for the District of South Carolina'),
-    ('10th Judicial Circuit Court of Common Pleas', '10th Judicial Circuit Court of Common Pleas'),
-    ('11th Judicial Circuit Court of Common Pleas', '11th Judicial Circuit Court of Common Pleas'),
-    ('12th Judicial Circuit Court of Common Pleas', '12th Judicial Circuit Court of Common Pleas'),
-    ('13th Judicial Circuit Court of Common Pleas', '13th Judicial Circuit Court of Common Pleas'),
-    ('14th Judicial Circuit Court of Common Pleas', '14th Judicial Circuit Court of Common Pleas'),
-    ('15th Judicial Circuit Court of Common Pleas', '15th Judicial Circuit Court of Common Pleas'),
-    ('16th Judicial Circuit Court of Common Pleas', '16th Judicial Circuit Court of Common Pleas'),
-    ('1st Judicial Circuit Court of Common Pleas', '1st Judicial Circuit Court of Common Pleas'),
-    ('2nd Judicial Circuit Court of Common Pleas', '2nd Judicial Circuit Court of Common Pleas'),
-    ('3rd Judicial Circuit Court of Common Pleas', '3rd Judicial Circuit Court of Common Pleas'),
-    ('4th Judicial Circuit Court of Common Pleas', '4th Judicial Circuit Court of Common Pleas'),
-    ('5th Judicial Circuit Court of Common Pleas', '5th Judicial Circuit Court of Common Pleas'),
-    ('6th Judicial Circuit Court of Common Pleas', '6th Judicial Circuit Court of Common Pleas'),
-    ('7th Judicial Circuit Court of Common Pleas', '7th Judicial Circuit Court of Common Pleas'),
-    ('8th Judicial Circuit Court of Common Pleas', '8th Judicial Circuit Court of Common Pleas'),
-    ('9th Judicial Circuit Court of Common Pleas', '9th Judicial Circuit Court of Common Pleas'),
-    ('Abbeville County Probate Court', 'Abbeville County Probate Court'),
-    ('Aiken County Probate Court', 'Aiken County Probate Court'),
-    ('Allendale County Probate Court', 'Allendale County Probate Court'),
-    ('Anderson County Probate Court', 'Anderson County Probate Court'),
-    ('Bamberg County Probate Court', 'Bamberg County Probate Court'),
-    ('Barnwell County Probate Court', 'Barnwell County Probate Court'),
-    ('Beaufort County Probate Court', 'Beaufort County Probate Court'),
-    ('Berkeley County Probate Court', 'Berkeley County Probate Court'),
-    ('Calhoun County Probate Court', 'Calhoun County Probate Court'),
-    ('Charleston County Probate Court', 'Charleston County Probate Court'),
-    ('Cherokee County Probate Court', 'Cherokee County Probate Court'),
-    ('Chester County Probate Court', 'Chester County Probate Court'),
-    ('Chesterfield County Probate Court', 'Chesterfield County Probate Court'),
-    ('Clarendon County Probate Court', 'Clarendon County Probate Court'),
-    ('Colleton County Probate Court', 'Colleton County Probate Court'),
-    ('Darlington County Probate Court', 'Darlington County Probate Court'),
-    ('Dillon County Probate Court', 'Dillon County Probate Court'),
-    ('Dorchester County Probate Court', 'Dorchester County Probate Court'),
-    ('Edgefield County Probate Court', 'Edgefield County Probate Court'),
-    ('Fairfield County Probate Court', 'Fairfield County Probate Court'),
-    ('Florence County Probate Court', 'Florence County Probate Court'),
-    ('Georgetown County Probate Court', 'Georgetown County Probate Court'),
-    ('Greenville County Probate Court', 'Greenville County Probate Court'),
-    ('Greenwood County Probate Court', 'Greenwood County Probate Court'),
-    ('Hampton County Probate Court', 'Hampton County Probate Court'),
-    ('Horry County Probate Court', 'Horry County Probate Court'),
-    ('Jasper County Probate Court', 'Jasper County Probate Court'),
-    ('Kershaw County Probate Court', 'Kershaw County Probate Court'),
-    ('Lancaster County Probate Court', 'Lancaster County Probate Court'),
-    ('Laurens County Probate Court', 'Laurens County Probate Court'),
-    ('Lee County Probate Court', 'Lee County Probate Court'),
-    ('Lexington County Probate Court', 'Lexington County Probate Court'),
-    ('Marion County Probate Court', 'Marion County Probate Court'),
-    ('Marlboro County Probate Court', 'Marlboro County Probate Court'),
-    ('McCormick County Probate Court', 'McCormick County Probate Court'),
-    ('Newberry County Probate Court', 'Newberry County Probate Court'),
-    ('Oconee County Probate Court', 'Oconee County Probate Court'),
-    ('Orangeburg County Probate Court', 'Orangeburg County Probate Court'),
-    ('Pickens County Probate Court', 'Pickens County Probate Court'),
-    ('Richland County Probate Court', 'Richland County Probate Court'),
-    ('Saluda County Probate Court', 'Saluda County Probate Court'),
-    ('Spartanburg County Probate Court', 'Spartanburg County Probate Court'),
-    ('Sumter County Probate Court', 'Sumter County Probate Court'),
-    ('Union County Probate Court', 'Union County Probate Court'),
-    ('Williamsburg County Probate Court', 'Williamsburg County Probate Court'),
-
-]
-
-SOUTH_DAKOTA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Eighth Circuit', 'U.S. Court of Appeals for the Eighth Circuit'),
-    ('South Dakota Supreme Court', 'South Dakota Supreme Court'),
-    ('U.S. District Court for the District of South Dakota', 'U.S. District Court for the District of South Dakota'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('Aurora County Court', 'Aurora County Court'),
-    ('Beadle County Court', 'Beadle County Court'),
-    ('Bennett County Court', 'Bennett County Court'),
-    ('Bon Homme County Court', 'Bon Homme County Court'),
-    ('Brookings County Court', 'Brookings County Court'),
-    ('Brown County Court', 'Brown County Court'),
-    ('Brule County Court', 'Brule County Court'),
-    ('Buffalo County Court', 'Buffalo County Court'),
-    ('Butte County Court', 'Butte County Court'),
-    ('Campbell County Court', 'Campbell County Court'),
-    ('Charles Mix County Court', 'Charles Mix County Court'),
-    ('Clark County Court', 'Clark County Court'),
-    ('Clay County Court', 'Clay County Court'),
-    ('Codington County Court', 'Codington County Court'),
-    ('Corson County Court', 'Corson County Court'),
-    ('Custer County Court', 'Custer County Court'),
-    ('Davison County Court', 'Davison County Court'),
-    ('Day County Court', 'Day County Court'),
-    ('Deuel County Court', 'Deuel County Court'),
-    ('Dewey County Court', 'Dewey County Court'),
-    ('Douglas County Court', 'Douglas County Court'),
-    ('Edmunds County Court', 'Edmunds County Court'),
-    ('Fall River County Court', 'Fall River County Court'),
-    ('Faulk County Court', 'Faulk County Court'),
-    ('Grant County Court', 'Grant County Court'),
-    ('Gregory County Court', 'Gregory County Court'),
-    ('Haakon County Court', 'Haakon County Court'),
-    ('Hamlin County Court', 'Hamlin County Court'),
-    ('Hand County Court', 'Hand County Court'),
-    ('Hanson County Court', 'Hanson County Court'),
-    ('Harding County Court', 'Harding County Court'),
-    ('Hughes County Court', 'Hughes County Court'),
-    ('Hutchinson County Court', 'Hutchinson County Court'),
-    ('Hyde County Court', 'Hyde County Court'),
-    ('Jackson County Court', 'Jackson County Court'),
-    ('Jerauld County Court', 'Jerauld County Court'),
-    ('Jones County Court', 'Jones County Court'),
-    ('Kingsbury County Court', 'Kingsbury County Court'),
-    ('Lake County Court', 'Lake County Court'),
-    ('Lawrence County Court', 'Lawrence County Court'),
-    ('Lincoln County Court', 'Lincoln County Court'),
-    ('Lyman County Court', 'Lyman County Court'),
-    ('Marshall County Court', 'Marshall County Court'),
-    ('McCook County Court', 'McCook County Court'),
-    ('McPherson County Court', 'McPherson County Court'),
-    ('Meade County Court', 'Meade County Court'),
-    ('Mellette County Court', 'Mellette County Court'),
-    ('Miner County Court', 'Miner County Court'),
-    ('Minnehaha County Court', 'Minnehaha County Court'),
-    ('Moody County Court', 'Moody County Court'),
-    ('Oglala Lakota County Court', 'Oglala Lakota County Court'),
-    ('Pennington County Court', 'Pennington County Court'),
-    ('Perkins County Court', 'Perkins County Court'),
-    ('Potter County Court', 'Potter County Court'),
-    ('Roberts County Court', 'Roberts County Court'),
-    ('Sanborn County Court', 'Sanborn County Court'),
-    ('Spink County Court', 'Spink County Court'),
-    ('Stanley County Court', 'Stanley County Court'),
-    ('Sully County Court', 'Sully County Court'),
-    ('Todd County Court', 'Todd County Court'),
-    ('Tripp County Court', 'Tripp County Court'),
-    ('Turner County Court', 'Turner County Court'),
-    ('Union County Court', 'Union County Court'),
-    ('Walworth County Court', 'Walworth County Court'),
-    ('Yankton County Court', 'Yankton County Court'),
-
-]
-
-TENNESSEE_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Sixth Circuit', 'U.S. Court of Appeals for the Sixth Circuit'),
-    ('Tennessee Supreme Court', 'Tennessee Supreme Court'),
-    ('Tennessee Court of Appeals', 'Tennessee Court of Appeals'),
-    ('Tennessee Court of Criminal Appeals', 'Tennessee Court of Criminal Appeals'),
-    ('U.S. District Court for the Eastern District of Tennessee', 'U.S. District Court for the Eastern District of Tennessee'),
-    ('U.S. District Court for the Middle District of Tennessee', 'U.S. District Court for the Middle District of Tennessee'),
-    ('U.S. District Court for the Western District of Tennessee', 'U.S. District Court for the Western District of Tennessee'),
-    ('10th Judicial District Circuit Court', '10th Judicial District Circuit Court'),
-    ('11th Judicial District Circuit Court', '11th Judicial District Circuit Court'),
-    ('12th Judicial District Circuit Court', '12th Judicial District Circuit Court'),
-    ('13th Judicial District Circuit Court', '13th Judicial District Circuit Court'),
-    ('14th Judicial District Circuit Court', '14th Judicial District Circuit Court'),
-    ('15th Judicial District Circuit Court', '15th Judicial District Circuit Court'),
-    ('16th Judicial District Circuit Court', '16th Judicial District Circuit Court'),
-    ('17th Judicial District Circuit Court', '17th Judicial District Circuit Court'),
-    ('18th Judicial District Circuit Court', '18th Judicial District Circuit Court'),
-    ('19th Judicial District Circuit Court', '19th Judicial District Circuit Court'),
-    ('1st Judicial District Circuit Court', '1st Judicial District Circuit Court'),
-    ('20th Judicial District Circuit Court', '20th Judicial District Circuit Court'),
-    ('21st Judicial District Circuit Court', '21st Judicial District Circuit Court'),
-    ('22nd Judicial District Circuit Court', '22nd Judicial District Circuit Court'),
-    ('23rd Judicial District Circuit Court', '23rd Judicial District Circuit Court'),
-    ('24th Judicial District Circuit Court', '24th Judicial District Circuit Court'),
-    ('25th Judicial District Circuit Court', '25th Judicial District Circuit Court'),
-    ('26th Judicial District Circuit Court', '26th Judicial District Circuit Court'),
-    ('27th Judicial District Circuit Court', '27th Judicial District Circuit Court'),
-    ('28th Judicial District Circuit Court', '28th Judicial District Circuit Court'),
-    ('29th Judicial District Circuit Court', '29th Judicial District Circuit Court'),
-    ('2nd Judicial District Circuit Court', '2nd Judicial District Circuit Court'),
-    ('30th Judicial District Circuit Court', '30th Judicial District Circuit Court'),
-    ('31st Judicial District Circuit Court', '31st Judicial District Circuit Court'),
-    ('3rd Judicial District Circuit Court', '3rd Judicial District Circuit Court'),
-    ('4th Judicial District Circuit Court', '4th Judicial District Circuit Court'),
-    ('5th Judicial District Circuit Court', '5th Judicial District Circuit Court'),
-    ('6th Judicial District Circuit Court', '6th Judicial District Circuit Court'),
-    ('7th Judicial District Circuit Court', '7th Judicial District Circuit Court'),
-    ('8th Judicial District Circuit Court', '8th Judicial District Circuit Court'),
-    ('9th Judicial District Circuit Court', '9th Judicial District Circuit Court'),
-    ('Anderson County Chancery Court', 'Anderson County Chancery Court'),
-    ('Bedford County Chancery Court', 'Bedford County Chancery Court'),
-    ('Benton County Chancery Court', 'Benton County Chancery Court'),
-    ('Bledsoe County Chancery Court', 'Bledsoe County Chancery Court'),
-    ('Blount County Chancery Court', 'Blount County Chancery Court'),
-    ('Bradley County Chancery Court', 'Bradley County Chancery Court'),
-    ('Campbell County Chancery Court', 'Campbell County Chancery Court'),
-    ('Cannon County Chancery Court', 'Cannon County Chancery Court'),
-    ('Carroll County Chancery Court', 'Carroll County Chancery Court'),
-    ('Carter County Chancery Court', 'Carter County Chancery Court'),
-    ('Cheatham County Chancery Court', 'Cheatham County Chancery Court'),
-    ('Chester County Chancery Court', 'Chester County Chancery Court'),
-    ('Claiborne County Chancery Court', 'Claiborne County Chancery Court'),
-    ('Clay County Chancery Court', 'Clay County Chancery Court'),
-    ('Cocke County Chancery Court', 'Cocke County Chancery Court'),
-    ('Coffee County Chancery Court', 'Coffee County Chancery Court'),
-    ('Crockett County Chancery Court', 'Crockett County Chancery Court'),
-    ('Cumberland County Chancery Court', 'Cumberland County Chancery Court'),
-    ('Davidson County Chancery Court', 'Davidson County Chancery Court'),
-    ('Decatur County Chancery Court', 'Decatur County Chancery Court'),
-    ('DeKalb County Chancery Court', 'DeKalb County Chancery Court'),
-    ('Dickson County Chancery Court', 'Dickson County Chancery Court'),
-    ('Dyer County Chancery Court', 'Dyer County Chancery Court'),
-    ('Fayette County Chancery Court', 'Fayette County Chancery Court'),
-    ('Fentress County Chancery Court', 'Fentress County Chancery Court'),
-    ('Franklin County Chancery Court', 'Franklin County Chancery Court'),
-    ('Gibson County Chancery Court', 'Gibson County Chancery Court'),
-    ('Giles County Chancery Court', 'Giles County Chancery Court'),
-    ('Grainger County Chancery Court', 'Grainger County Chancery Court'),
-    ('Greene County Chancery Court', 'Greene County Chancery Court'),
-    ('Grundy County Chancery Court', 'Grundy County Chancery Court'),
-    ('Hamblen County Chancery Court', 'Hamblen County Chancery Court'),
-    ('Hamilton County Chancery Court', 'Hamilton County Chancery Court'),
-    ('Hancock County Chancery Court', 'Hancock County Chancery Court'),
-    ('Hardeman County Chancery Court', 'Hardeman County Chancery Court'),
-    ('Hardin County Chancery Court', 'Hardin County Chancery Court'),
-    ('Hawkins County Chancery Court', 'Hawkins County Chancery Court'),
-    ('Haywood County Chancery Court', 'Haywood County Chancery Court'),
-    ('Henderson County Chancery Court', 'Henderson County Chancery Court'),
-    ('Henry County Chancery Court', 'Henry County Chancery Court'),
-    ('Hickman County Chancery Court', 'Hickman County Chancery Court'),
-    ('Houston County Chancery Court', 'Houston County Chancery Court'),
-    ('Humphreys County Chancery Court', 'Humphreys County Chancery Court'),
-    ('Jackson County Chancery Court', 'Jackson County Chancery Court'),
-    ('Jefferson County Chancery Court', 'Jefferson County Chancery Court'),
-    ('Johnson County Chancery Court', 'Johnson County Chancery Court'),
-    ('Knox County Chancery Court', 'Knox County Chancery Court'),
-    ('Lake County Chancery Court', 'Lake County Chancery Court'),
-    ('Lauderdale County Chancery Court', 'Lauderdale County Chancery Court'),
-    ('Lawrence County Chancery Court', 'Lawrence County Chancery Court'),
-    ('Lewis County Chancery Court', 'Lewis County Chancery Court'),
-    ('Lincoln County Chancery Court', 'Lincoln County Chancery Court'),
-    ('Loudon County Chancery Court', 'Loudon County Chancery Court'),
-    ('Macon County Chancery Court', 'Macon County Chancery Court'),
-    ('Madison County Chancery Court', 'Madison County Chancery Court'),
-    ('Marion County Chancery Court', 'Marion County Chancery Court'),
-    ('Marshall County Chancery Court', 'Marshall County Chancery Court'),
-    ('Maury County Chancery Court', 'Maury County Chancery Court'),
-    ('McMinn County Chancery Court', 'McMinn County Chancery Court'),
-    ('McNairy County Chancery Court', 'McNairy County Chancery Court'),
-    ('Meigs County Chancery Court', 'Meigs County Chancery Court'),
-    ('Monroe County Chancery Court', 'Monroe County Chancery Court'),
-    ('Montgomery County Chancery Court', 'Montgomery County Chancery Court'),
-    ('Montgomery County General Sessions Court', 'Montgomery County General Sessions Court'),
-    ('Moore County Chancery Court', 'Moore County Chancery Court'),
-    ('Morgan County Chancery Court', 'Morgan County Chancery Court'),
-    ('Obion County Chancery Court', 'Obion County Chancery Court'),
-    ('Overton County Chancery Court', 'Overton County Chancery Court'),
-    ('Perry County Chancery Court', 'Perry County Chancery Court'),
-    ('Pickett County Chancery Court', 'Pickett County Chancery Court'),
-    ('Polk County Chancery Court', 'Polk County Chancery Court'),
-    ('Putnam County Chancery Court', 'Putnam County Chancery Court'),
-    ('Rhea County Chancery Court', 'Rhea County Chancery Court'),
-    ('Roane County Chancery Court', 'Roane County Chancery Court'),
-    ('Robertson County Chancery Court', 'Robertson County Chancery Court'),
-    ('Rutherford County Chancery Court', 'Rutherford County Chancery Court'),
-    ('Scott County Chancery Court', 'Scott County Chancery Court'),
-    ('Sequatchie County Chancery Court', 'Sequatchie County Chancery Court'),
-    ('Sevier County Chancery Court', 'Sevier County Chancery Court'),
-    ('Shelby County Chancery Court', 'Shelby County Chancery Court'),
-    ('Smith County Chancery Court', 'Smith County Chancery Court'),
-    ('Stewart County Chancery Court', 'Stewart County Chancery Court'),
-    ('Sullivan County Chancery Court', 'Sullivan County Chancery Court'),
-    ('Sumner County Chancery Court', 'Sumner County Chancery Court'),
-    ('Tipton County Chancery Court', 'Tipton County Chancery Court'),
-    ('Trousdale County Chancery Court', 'Trousdale County Chancery Court'),
-    ('Unicoi County Chancery Court', 'Unicoi County Chancery Court'),
-    ('Union County Chancery Court', 'Union County Chancery Court'),
-    ('Van Buren County Chancery Court', 'Van Buren County Chancery Court'),
-    ('Warren County Chancery Court', 'Warren County Chancery Court'),
-    ('Washington County Chancery Court', 'Washington County Chancery Court'),
-    ('Wayne County Chancery Court', 'Wayne County Chancery Court'),
-    ('Weakley County Chancery Court', 'Weakley County Chancery Court'),
-    ('White County Chancery Court', 'White County Chancery Court'),
-    ('Williamson County Chancery Court', 'Williamson County Chancery Court'),
-
-]
-
-TEXAS_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fifth Circuit', 'U.S. Court of Appeals for the Fifth Circuit'),
-    ('Texas Supreme Court', 'Texas Supreme Court'),
-    ('Texas Court of Criminal Appeals', 'Texas Court of Criminal Appeals'),
-    ('Texas First District Court of Appeals', 'Texas First District Court of Appeals'),
-    ('Texas Second District Court of Appeals', 'Texas Second District Court of Appeals'),
-    ('Texas Third District Court of Appeals', 'Texas Third District Court of Appeals'),
-    ('Texas Fourth District Court of Appeals', 'Texas Fourth District Court of Appeals'),
-    ('Texas Fifth District Court of Appeals', 'Texas Fifth District Court of Appeals'),
-    ('Texas Sixth District Court of Appeals', 'Texas Sixth District Court of Appeals'),
-    ('Texas Seventh District Court of Appeals', 'Texas Seventh District Court of Appeals'),
-    ('Texas Eighth District Court of Appeals', 'Texas Eighth District Court of Appeals'),
-    ('Texas Ninth District Court of Appeals', 'Texas Ninth District Court of Appeals'),
-    ('Texas Tenth District Court of Appeals', 'Texas Tenth District Court of Appeals'),
-    ('Texas Eleventh District Court of Appeals', 'Texas Eleventh District Court of Appeals'),
-    ('Texas Twelfth District Court of Appeals', 'Texas Twelfth District Court of Appeals'),
-    ('Texas Thirteenth District Court of Appeals', 'Texas Thirteenth District Court of Appeals'),
-    ('Texas Fourteenth District Court of Appeals', 'Texas Fourteenth District Court of Appeals'),
-    ('U.S. District Court for the Northern District of Texas', 'U.S. District Court for the Northern District of Texas'),
-    ('U.S. District Court for the Eastern District of Texas', 'U.S. District Court for the Eastern District of Texas'),
-    ('U.S. District Court for the Southern District of Texas', 'U.S. District Court for the Southern District of Texas'),
-    ('U.S. District Court for the Western District of Texas', 'U.S. District Court for the Western District of Texas'),
-    ('Anderson County District Court', 'Anderson County District Court'),
-    ('Andrews County District Court', 'Andrews County District Court'),
-    ('Angelina County District Court', 'Angelina County District Court'),
-    ('Aransas County District Court', 'Aransas County District Court'),
-    ('Archer County District Court', 'Archer County District Court'),
-    ('Armstrong County District Court', 'Armstrong County District Court'),
-    ('Atascosa County District Court', 'Atascosa County District Court'),
-    ('Austin County District Court', 'Austin County District Court'),
-    ('Austin Municipal Court', 'Austin Municipal Court'),
-    ('Bailey County District Court', 'Bailey County District Court'),
-    ('Bandera County District Court', 'Bandera County District Court'),
-    ('Bastrop County District Court', 'Bastrop County District Court'),
-    ('Baylor County District Court', 'Baylor County District Court'),
-    ('Bee County District Court', 'Bee County District Court'),
-    ('Bell County District Court', 'Bell County District Court'),
-    ('Bexar County District Court', 'Bexar County District Court'),
-    ('Blanco County District Court', 'Blanco County District Court'),
-    ('Borden County District Court', 'Borden County District Court'),
-    ('Bosque County District Court', 'Bosque County District Court'),
-    ('Bowie County District Court', 'Bowie County District Court'),
-    ('Brazoria County District Court', 'Brazoria County District Court'),
-    ('Brazos County District Court', 'Brazos County District Court'),
-    ('Brewster County District Court', 'Brewster County District Court'),
-    ('Briscoe County District Court', 'Briscoe County District Court'),
-    ('Brooks County District Court', 'Brooks County District Court'),
-    ('Brown County District Court', 'Brown County District Court'),
-    ('Burleson County District Court', 'Burleson County District Court'),
-    ('Burnet County District Court', 'Burnet County District Court'),
-    ('Caldwell County District Court', 'Caldwell County District Court'),
-    ('Calhoun County District Court', 'Calhoun County District Court'),
-    ('Callahan County District Court', 'Callahan County District Court'),
-    ('Cameron County District Court', 'Cameron County District Court'),
-    ('Camp County District Court', 'Camp County District Court'),
-    ('Carson County District Court', 'Carson County District Court'),
-    ('Cass County District Court', 'Cass County District Court'),
-    ('Castro County District Court', 'Castro County District Court'),
-    ('Chambers County District Court', 'Chambers County District Court'),
-    ('Cherokee County District Court', 'Cherokee County District Court'),
-    ('Childress County District Court', 'Childress County District Court'),
-    ('Clay County District Court', 'Clay County District Court'),
-    ('Cochran County District Court', 'Cochran County District Court'),
-    ('Coke County District Court', 'Coke County District Court'),
-    ('Coleman County District Court', 'Coleman County District Court'),
-    ('Collin County District Court', 'Collin County District Court'),
-    ('Collingsworth County District Court', 'Collingsworth County District Court'),
-    ('Colorado County District Court', 'Colorado County District Court'),
-    ('Comal County District Court', 'Comal County District Court'),
-    ('Comanche County District Court', 'Comanche County District Court'),
-    ('Concho County District Court', 'Concho County District Court'),
-    ('Cooke County District Court', 'Cooke County District Court'),
-    ('Coryell County District Court', 'Coryell County District Court'),
-    ('Cottle County District Court', 'Cottle County District Court'),
-    ('Crane County District Court', 'Crane County District Court'),
-    ('Crockett County District Court', 'Crockett County District Court'),
-    ('Crosby County District Court', 'Crosby County District Court'),
-    ('Culberson County District Court', 'Culberson County District Court'),
-    ('Dallam County District Court', 'Dallam County District Court'),
-    ('Dallas County District Court', 'Dallas County District Court'),
-    ('Dallas Municipal Courts', 'Dallas Municipal Courts'),
-    ('Dawson County District Court', 'Dawson County District Court'),
-    ('Deaf Smith County District Court', 'Deaf Smith County District Court'),
-    ('Delta County District Court', 'Delta County District Court'),
-    ('Denton County District Court', 'Denton County District Court'),
-    ('DeWitt County District Court', 'DeWitt County District Court'),
-    ('Dickens County District Court', 'Dickens County District Court'),
-    ('Dimmit County District Court', 'Dimmit County District Court'),
-    ('Donley County District Court', 'Donley County District Court'),
-    ('Duval County District Court', 'Duval County District Court'),
-    ('Eastland County District Court', 'Eastland County District Court'),
-    ('Ector County District Court', 'Ector County District Court'),
-    ('Edwards County District Court', 'Edwards County District Court'),
-    ('El Paso County District Court', 'El Paso County District Court'),
-    ('El Paso Municipal Courts', 'El Paso Municipal Courts'),
-    ('Ellis County District Court', 'Ellis County District Court'),
-    ('Erath County District Court', 'Erath County District Court'),
-    ('Falls County District Court', 'Falls County District Court'),
-    ('Fannin County District Court', 'Fannin County District Court'),
-    ('Fayette County District Court', 'Fayette County District Court'),
-    ('Fisher County District Court', 'Fisher County District Court'),
-    ('Floyd County District Court', 'Floyd County District Court'),
-    ('Foard County District Court', 'Foard County District Court'),
-    ('Fort Bend County District Court', 'Fort Bend County District Court'),
-    ('Fort Worth Municipal Courts', 'Fort Worth Municipal Courts'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Freestone County District Court', 'Freestone County District Court'),
-    ('Frio County District Court', 'Frio County District Court'),
-    ('Gaines County District Court', 'Gaines County District Court'),
-    ('Galveston County District Court', 'Galveston County District Court'),
-    ('Garza County District Court', 'Garza County District Court'),
-    ('Gillespie County District Court', 'Gillespie County District Court'),
-    ('Glasscock County District Court', 'Glasscock County District Court'),
-    ('Goliad County District Court', 'Goliad County District Court'),
-    ('Gonzales County District Court', 'Gonzales County District Court'),
-    ('Gray County District Court', 'Gray County District Court'),
-    ('Grayson County District Court', 'Grayson County District Court'),
-    ('Gregg County District Court', 'Gregg County District Court'),
-    ('Grimes County District Court', 'Grimes County District Court'),
-    ('Guadalupe County District Court', 'Guadalupe County District Court'),
-    ('Hale County District Court', 'Hale County District Court'),
-    ('Hall County District Court', 'Hall County District Court'),
-    ('Hamilton County District Court', 'Hamilton County District Court'),
-    ('Hansford County District Court', 'Hansford County District Court'),
-    ('Hardeman County District Court', 'Hardeman County District Court'),
-    ('Hardin County District Court', 'Hardin County District Court'),
-    ('Harris County District Court', 'Harris County District Court'),
-    ('Harrison County District Court', 'Harrison County District Court'),
-    ('Hartley County District Court', 'Hartley County District Court'),
-    ('Haskell County District Court', 'Haskell County District Court'),
-    ('Hays County District Court', 'Hays County District Court'),
-    ('Hemphill County District Court', 'Hemphill County District Court'),
-    ('Henderson County District Court', 'Henderson County District Court'),
-    ('Hidalgo County District Court', 'Hidalgo County District Court'),
-    ('Hill County District Court', 'Hill County District Court'),
-    ('Hockley County District Court', 'Hockley County District Court'),
-    ('Hood County District Court', 'Hood County District Court'),
-    ('Hopkins County District Court', 'Hopkins County District Court'),
-    ('Houston County District Court', 'Houston County District Court'),
-    ('Houston Municipal Courts', 'Houston Municipal Courts'),
-    ('Howard County District Court', 'Howard County District Court'),
-    ('Hudspeth County District Court', 'Hudspeth County District Court'),
-    ('Hunt County District Court', 'Hunt County District Court'),
-    ('Hutchinson County District Court', 'Hutchinson County District Court'),
-    ('Irion County District Court', 'Irion County District Court'),
-    ('Jack County District Court', 'Jack County District Court'),
-    ('Jackson County District Court', 'Jackson County District Court'),
-    ('Jasper County District Court', 'Jasper County District Court'),
-    ('Jeff Davis County District Court', 'Jeff Davis County District Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Jim Hogg County District Court', 'Jim Hogg County District Court'),
-    ('Jim Wells County District Court', 'Jim Wells County District Court'),
-    ('Johnson County District Court', 'Johnson County District Court'),
-    ('Jones County District Court', 'Jones County District Court'),
-    ('Karnes County District Court', 'Karnes County District Court'),
-    ('Kaufman County District Court', 'Kaufman County District Court'),
-    ('Kendall County District Court', 'Kendall County District Court'),
-    ('Kenedy County District Court', 'Kenedy County District Court'),
-    ('Kent County District Court', 'Kent County District Court'),
-    ('Kerr County District Court', 'Kerr County District Court'),
-    ('Kimble County District Court', 'Kimble County District Court'),
-    ('King County District Court', 'King County District Court'),
-    ('Kinney County District Court', 'Kinney County District Court'),
-    ('Kleberg County District Court', 'Kleberg County District Court'),
-    ('Knox County District Court', 'Knox County District Court'),
-    ('La Salle County District Court', 'La Salle County District Court'),
-    ('Lamar County District Court', 'Lamar County District Court'),
-    ('Lamb County District Court', 'Lamb County District Court'),
-    ('Lampasas County District Court', 'Lampasas County District Court'),
-    ('Lavaca County District Court', 'Lavaca County District Court'),
-    ('Lee County District Court', 'Lee County District Court'),
-    ('Leon County District Court', 'Leon County District Court'),
-    ('Liberty County District Court', 'Liberty County District Court'),
-    ('Limestone County District Court', 'Limestone County District Court'),
-    ('Lipscomb County District Court', 'Lipscomb County District Court'),
-    ('Live Oak County District Court', 'Live Oak County District Court'),
-    ('Llano County District Court', 'Llano County District Court'),
-    ('Loving County District Court', 'Loving County District Court'),
-    ('Lubbock County District Court', 'Lubbock County District Court'),
-    ('Lynn County District Court', 'Lynn County District Court'),
-    ('Madison County District Court', 'Madison County District Court'),
-    ('Marion County District Court', 'Marion County District Court'),
-    ('Martin County District Court', 'Martin County District Court'),
-    ('Mason County District Court', 'Mason County District Court'),
-    ('Matagorda County District Court', 'Matagorda County District Court'),
-    ('Maverick County District Court', 'Maverick County District Court'),
-    ('McCulloch County District Court', 'McCulloch County District Court'),
-    ('McLennan County District Court', 'McLennan County District Court'),
-    ('McMullen County District Court', 'McMullen County District Court'),
-    ('Medina County District Court', 'Medina County District Court'),
-    ('Menard County District Court', 'Menard County District Court'),
-    ('Midland County District Court', 'Midland County District Court'),
-    ('Milam County District Court', 'Milam County District Court'),
-    ('Mills County District Court', 'Mills County District Court'),
-    ('Mitchell County District Court', 'Mitchell County District Court'),
-    ('Montague County District Court', 'Montague County District Court'),
-    ('Montgomery County District Court', 'Montgomery County District Court'),
-    ('Moore County District Court', 'Moore County District Court'),
-    ('Morris County District Court', 'Morris County District Court'),
-    ('Motley County District Court', 'Motley County District Court'),
-    ('Nacogdoches County District Court', 'Nacogdoches County District Court'),
-    ('Navarro County District Court', 'Navarro County District Court'),
-    ('Newton County District Court', 'Newton County District Court'),
-    ('Nolan County District Court', 'Nolan County District Court'),
-    ('Nueces County District Court', 'Nueces County District Court'),
-    ('Ochiltree County District Court', 'Ochiltree County District Court'),
-    ('Oldham County District Court', 'Oldham County District Court'),
-    ('Orange County District Court', 'Orange County District Court'),
-    ('Palo Pinto County District Court', 'Palo Pinto County District Court'),
-    ('Panola County District Court', 'Panola County District Court'),
-    ('Parker County District Court', 'Parker County District Court'),
-    ('Parmer County District Court', 'Parmer County District Court'),
-    ('Pecos County District Court', 'Pecos County District Court'),
-    ('Polk County District Court', 'Polk County District Court'),
-    ('Potter County District Court', 'Potter County District Court'),
-    ('Presidio County District Court', 'Presidio County District Court'),
-    ('Rains County District Court', 'Rains County District Court'),
-    ('Randall County District Court', 'Randall County District Court'),
-    ('Reagan County District Court', 'Reagan County District Court'),
-    ('Real County District Court', 'Real County District Court'),
-    ('Red River County District Court', 'Red River County District Court'),
-    ('Reeves County District Court', 'Reeves County District Court'),
-    ('Refugio County District Court', 'Refugio County District Court'),
-    ('Roberts County District Court', 'Roberts County District Court'),
-    ('Robertson County District Court', 'Robertson County District Court'),
-    ('Rockwall County District Court', 'Rockwall County District Court'),
-    ('Runnels County District Court', 'Runnels County District Court'),
-    ('Rusk County District Court', 'Rusk County District Court'),
-    ('Sabine County District Court', 'Sabine County District Court'),
-    ('San Antonio Municipal Courts', 'San Antonio Municipal Courts'),
-    ('San Augustine County District Court', 'San Augustine County District Court'),
-    ('San Jacinto County District Court', 'San Jacinto County District Court'),
-    ('San Patricio County District Court', 'San Patricio County District Court'),
-    ('San Saba County District Court', 'San Saba County District Court'),
-    ('Schleicher County District Court', 'Schleicher County District Court'),
-    ('Scurry County District Court', 'Scurry County District Court'),
-    ('Shackelford County District Court', 'Shackelford County District Court'),
-    ('Shelby County District Court', 'Shelby County District Court'),
-    ('Sherman County District Court', 'Sherman County District Court'),
-    ('Smith County District Court', 'Smith County District Court'),
-    ('Somervell County District Court', 'Somervell County District Court'),
-    ('Starr County District Court', 'Starr County District Court'),
-    ('Stephens County District Court', 'Stephens County District Court'),
-    ('Sterling County District Court', 'Sterling County District Court'),
-    ('Stonewall County District Court', 'Stonewall County District Court'),
-    ('Sutton County District Court', 'Sutton County District Court'),
-    ('Swisher County District Court', 'Swisher County District Court'),
-    ('Tarrant County District Court', 'Tarrant County District Court'),
-    ('Taylor County District Court', 'Taylor County District Court'),
-    ('Terrell County District Court', 'Terrell County District Court'),
-    ('Terry County District Court', 'Terry County District Court'),
-    ('Throckmorton County District Court', 'Throckmorton County District Court'),
-    ('Titus County District Court', 'Titus County District Court'),
-    ('Tom Green County District Court', 'Tom Green County District Court'),
-    ('Travis County District Court', 'Travis County District Court'),
-    ('Trinity County District Court', 'Trinity County District Court'),
-    ('Tyler County District Court', 'Tyler County District Court'),
-    ('Upshur County District Court', 'Upshur County District Court'),
-    ('Upton County District Court', 'Upton County District Court'),
-    ('Uvalde County District Court', 'Uvalde County District Court'),
-    ('Val Verde County District Court', 'Val Verde County District Court'),
-    ('Van Zandt County District Court', 'Van Zandt County District Court'),
-    ('Victoria County District Court', 'Victoria County District Court'),
-    ('Walker County District Court', 'Walker County District Court'),
-    ('Waller County District Court', 'Waller County District Court'),
-    ('Ward County District Court', 'Ward County District Court'),
-    ('Washington County District Court', 'Washington County District Court'),
-    ('Webb County District Court', 'Webb County District Court'),
-    ('Wharton County District Court', 'Wharton County District Court'),
-    ('Wheeler County District Court', 'Wheeler County District Court'),
-    ('Wichita County District Court', 'Wichita County District Court'),
-    ('Wilbarger County District Court', 'Wilbarger County District Court'),
-    ('Willacy County District Court', 'Willacy County District Court'),
-    ('Williamson County District Court', 'Williamson County District Court'),
-    ('Wilson County District Court', 'Wilson County District Court'),
-    ('Winkler County District Court', 'Winkler County District Court'),
-    ('Wise County District Court', 'Wise County District Court'),
-    ('Wood County District Court', 'Wood County District Court'),
-    ('Yoakum County District Court', 'Yoakum County District Court'),
-    ('Young County District Court', 'Young County District Court'),
-    ('Zapata County District Court', 'Zapata County District Court'),
-    ('Zavala County District Court', 'Zavala County District Court'),
-
-]
-
-UTAH_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('Utah Supreme Court', 'Utah Supreme Court'),
-    ('Utah Court of Appeals', 'Utah Court of Appeals'),
-    ('U.S. District Court for the District of Utah', 'U.S. District Court for the District of Utah'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('Beaver County Justice Court', 'Beaver County Justice Court'),
-    ('Box Elder County Justice Court', 'Box Elder County Justice Court'),
-    ('Cache County Justice Court', 'Cache County Justice Court'),
-    ('Carbon County Justice Court', 'Carbon County Justice Court'),
-    ('Daggett County Justice Court', 'Daggett County Justice Court'),
-    ('Davis County Justice Court', 'Davis County Justice Court'),
-    ('Duchesne County Justice Court', 'Duchesne County Justice Court'),
-    ('Emery County Justice Court', 'Emery County Justice Court'),
-    ('Garfield County Justice Court', 'Garfield County Justice Court'),
-    ('Grand County Justice Court', 'Grand County Justice Court'),
-    ('Iron County Justice Court', 'Iron County Justice Court'),
-    ('Juab County Justice Court', 'Juab County Justice Court'),
-    ('Kane County Justice Court', 'Kane County Justice Court'),
-    ('Millard County Justice Court', 'Millard County Justice Court'),
-    ('Morgan County Justice Court', 'Morgan County Justice Court'),
-    ('Piute County Justice Court', 'Piute County Justice Court'),
-    ('Rich County Justice Court', 'Rich County Justice Court'),
-    ('Salt Lake County Justice Court', 'Salt Lake County Justice Court'),
-    ('San Juan County Justice Court', 'San Juan County Justice Court'),
-    ('Sanpete County Justice Court', 'Sanpete County Justice Court'),
-    ('Sevier County Justice Court', 'Sevier County Justice Court'),
-    ('Summit County Justice Court', 'Summit County Justice Court'),
-    ('Tooele County Justice Court', 'Tooele County Justice Court'),
-    ('Uintah County Justice Court', 'Uintah County Justice Court'),
-    ('Utah County Justice Court', 'Utah County Justice Court'),
-    ('Wasatch County Justice Court', 'Wasatch County Justice Court'),
-    ('Washington County Justice Court', 'Washington County Justice Court'),
-    ('Wayne County Justice Court', 'Wayne County Justice Court'),
-
-]
-
-VERMONT_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Second Circuit', 'U.S. Court of Appeals for the Second Circuit'),
-    ('Vermont Supreme Court', 'Vermont Supreme Court'),
-    ('U.S. District Court for the District of Vermont', 'U.S. District Court for the District of Vermont'),
-    ('Addison County Probate Court', 'Addison County Probate Court'),
-    ('Addison County Superior Court', 'Addison County Superior Court'),
-    ('Bennington County Probate Court', 'Bennington County Probate Court'),
-    ('Bennington County Superior Court', 'Bennington County Superior Court'),
-    ('Caledonia County Probate Court', 'Caledonia County Probate Court'),
-    ('Caledonia County Superior Court', 'Caledonia County Superior Court'),
-    ('Chittenden County Probate Court', 'Chittenden County Probate Court'),
-    ('Chittenden County Superior Court', 'Chittenden County Superior Court'),
-    ('Essex County Probate Court', 'Essex County Probate Court'),
-    ('Essex County Superior Court', 'Essex County Superior Court'),
-    ('Franklin County Probate Court', 'Franklin County Probate Court'),
-    ('Franklin County Superior Court', 'Franklin County Superior Court'),
-    ('Grand Isle County Probate Court', 'Grand Isle County Probate Court'),
-    ('Grand Isle County Superior Court', 'Grand Isle County Superior Court'),
-    ('Lamoille County Probate Court', 'Lamoille County Probate Court'),
-    ('Lamoille County Superior Court', 'Lamoille County Superior Court'),
-    ('Orange County Probate Court', 'Orange County Probate Court'),
-    ('Orange County Superior Court', 'Orange County Superior Court'),
-    ('Orleans County Probate Court', 'Orleans County Probate Court'),
-    ('Orleans County Superior Court', 'Orleans County Superior Court'),
-    ('Rutland County Probate Court', 'Rutland County Probate Court'),
-    ('Rutland County Superior Court', 'Rutland County Superior Court'),
-    ('Washington County Probate Court', 'Washington County Probate Court'),
-    ('Washington County Superior Court', 'Washington County Superior Court'),
-    ('Windham County Probate Court', 'Windham County Probate Court'),
-    ('Windham County Superior Court', 'Windham County Superior Court'),
-    ('Windsor County Superior Court', 'Windsor County Superior Court'),
-
-]
-
-VIRGINIA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fourth Circuit', 'U.S. Court of Appeals for the Fourth Circuit'),
-    ('Virginia Supreme Court', 'Virginia Supreme Court'),
-    ('Virginia Court of Appeals', 'Virginia Court of Appeals'),
-    ('U.S. District Court for the Eastern District of Virginia', 'U.S. District Court for the Eastern District of Virginia'),
-    ('U.S. District Court for the Western District of Virginia', 'U.S. District Court for the Western District of Virginia'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('31st Judicial Circuit Court', '31st Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-    ('Accomack County General District Court', 'Accomack County General District Court'),
-    ('Albemarle County General District Court', 'Albemarle County General District Court'),
-    ('Alexandria City General District Court', 'Alexandria City General District Court'),
-    ('Alleghany County General District Court', 'Alleghany County General District Court'),
-    ('Amelia County General District Court', 'Amelia County General District Court'),
-    ('Amherst County General District Court', 'Amherst County General District Court'),
-    ('Appomattox County General District Court', 'Appomattox County General District Court'),
-    ('Arlington County General District Court', 'Arlington County General District Court'),
-    ('Augusta County General District Court', 'Augusta County General District Court'),
-    ('Bath County General District Court', 'Bath County General District Court'),
-    ('Bedford County General District Court', 'Bedford County General District Court'),
-    ('Bland County General District Court', 'Bland County General District Court'),
-    ('Botetourt County General District Court', 'Botetourt County General District Court'),
-    ('Bristol City General District Court', 'Bristol City General District Court'),
-    ('Brunswick County General District Court', 'Brunswick County General District Court'),
-    ('Buchanan County General District Court', 'Buchanan County General District Court'),
-    ('Buckingham County General District Court', 'Buckingham County General District Court'),
-    ('Buena Vista City General District Court', 'Buena Vista City General District Court'),
-    ('Campbell County General District Court', 'Campbell County General District Court'),
-    ('Caroline County General District Court', 'Caroline County General District Court'),
-    ('Carroll County General District Court', 'Carroll County General District Court'),
-    ('Charles City County General District Court', 'Charles City County General District Court'),
-    ('Charlotte County General District Court', 'Charlotte County General District Court'),
-    ('Charlottesville City General District Court', 'Charlottesville City General District Court'),
-    ('Chesapeake City General District Court', 'Chesapeake City General District Court'),
-    ('Chesterfield County General District Court', 'Chesterfield County General District Court'),
-    ('Clarke County General District Court', 'Clarke County General District Court'),
-    ('Colonial Heights City General District Court', 'Colonial Heights City General District Court'),
-    ('Covington City General District Court', 'Covington City General District Court'),
-    ('Craig County General District Court', 'Craig County General District Court'),
-    ('Culpeper County General District Court', 'Culpeper County General District Court'),
-    ('Cumberland County General District Court', 'Cumberland County General District Court'),
-    ('Danville City General District Court', 'Danville City General District Court'),
-    ('Dickenson County General District Court', 'Dickenson County General District Court'),
-    ('Dinwiddie County General District Court', 'Dinwiddie County General District Court'),
-    ('Emporia City General District Court', 'Emporia City General District Court'),
-    ('Essex County General District Court', 'Essex County General District Court'),
-    ('Fairfax City General District Court', 'Fairfax City General District Court'),
-    ('Fairfax County General District Court', 'Fairfax County General District Court'),
-    ('Falls Church City General District Court', 'Falls Church City General District Court'),
-    ('Fauquier County General District Court', 'Fauquier County General District Court'),
-    ('Floyd County General District Court', 'Floyd County General District Court'),
-    ('Fluvanna County General District Court', 'Fluvanna County General District Court'),
-    ('Franklin City General District Court', 'Franklin City General District Court'),
-    ('Franklin County General District Court', 'Franklin County General District Court'),
-    ('Frederick County General District Court', 'Frederick County General District Court'),
-    ('Fredericksburg City General District Court', 'Fredericksburg City General District Court'),
-    ('Galax City General District Court', 'Galax City General District Court'),
-    ('Giles County General District Court', 'Giles County General District Court'),
-    ('Gloucester County General District Court', 'Gloucester County General District Court'),
-    ('Goochland County General District Court', 'Goochland County General District Court'),
-    ('Grayson County General District Court', 'Grayson County General District Court'),
-    ('Greene County General District Court', 'Greene County General District Court'),
-    ('Greensville County General District Court', 'Greensville County General District Court'),
-    ('Halifax County General District Court', 'Halifax County General District Court'),
-    ('Hampton City General District Court', 'Hampton City General District Court'),
-    ('Hanover County General District Court', 'Hanover County General District Court'),
-    ('Harrisonburg City General District Court', 'Harrisonburg City General District Court'),
-    ('Henrico County General District Court', 'Henrico County General District Court'),
-    ('Henry County General District Court', 'Henry County General District Court'),
-    ('Highland County General District Court', 'Highland County General District Court'),
-    ('Hopewell City General District Court', 'Hopewell City General District Court'),
-    ('Isle of Wight County General District Court', 'Isle of Wight County General District Court'),
-    ('James City County General District Court', 'James City County General District Court'),
-    ('King and Queen County General District Court', 'King and Queen County General District Court'),
-    ('King George County General District Court', 'King George County General District Court'),
-    ('King William County General District Court', 'King William County General District Court'),
-    ('Lancaster County General District Court', 'Lancaster County General District Court'),
-    ('Lee County General District Court', 'Lee County General District Court'),
-    ('Lexington City General District Court', 'Lexington City General District Court'),
-    ('Loudoun County General District Court', 'Loudoun County General District Court'),
-    ('Louisa County General District Court', 'Louisa County General District Court'),
-    ('Lunenburg County General District Court', 'Lunenburg County General District Court'),
-    ('Lynchburg City General District Court', 'Lynchburg City General District Court'),
-    ('Madison County General District Court', 'Madison County General District Court'),
-    ('Manassas City General District Court', 'Manassas City General District Court'),
-    ('Manassas Park City General District Court', 'Manassas Park City General District Court'),
-    ('Martinsville City General District Court', 'Martinsville City General District Court'),
-    ('Mathews County General District Court', 'Mathews County General District Court'),
-    ('Mecklenburg County General District Court', 'Mecklenburg County General District Court'),
-    ('Middlesex County General District Court', 'Middlesex County General District Court'),
-    ('Montgomery County General District Court', 'Montgomery County General District Court'),
-    ('Nelson County General District Court', 'Nelson County General District Court'),
-    ('New Kent County General District Court', 'New Kent County General District Court'),
-    ('Newport News City General District Court', 'Newport News City General District Court'),
-    ('Norfolk City General District Court', 'Norfolk City General District Court'),
-    ('Northampton County General District Court', 'Northampton County General District Court'),
-    ('Northumberland County General District Court', 'Northumberland County General District Court'),
-    ('Norton City General District Court', 'Norton City General District Court'),
-    ('Nottoway County General District Court', 'Nottoway County General District Court'),
-    ('Orange County General District Court', 'Orange County General District Court'),
-    ('Page County General District Court', 'Page County General District Court'),
-    ('Patrick County General District Court', 'Patrick County General District Court'),
-    ('Petersburg City General District Court', 'Petersburg City General District Court'),
-    ('Pittsylvania County General District Court', 'Pittsylvania County General District Court'),
-    ('Poquoson City General District Court', 'Poquoson City General District Court'),
-    ('Portsmouth City General District Court', 'Portsmouth City General District Court'),
-    ('Powhatan County General District Court', 'Powhatan County General District Court'),
-    ('Prince Edward County General District Court', 'Prince Edward County General District Court'),
-    ('Prince George County General District Court', 'Prince George County General District Court'),
-    ('Prince William County General District Court', 'Prince William County General District Court'),
-    ('Pulaski County General District Court', 'Pulaski County General District Court'),
-    ('Radford City General District Court', 'Radford City General District Court'),
-    ('Rappahannock County General District Court', 'Rappahannock County General District Court'),
-    ('Richmond City General District Court', 'Richmond City General District Court'),
-    ('Richmond County General District Court', 'Richmond County General District Court'),
-    ('Roanoke City General District Court', 'Roanoke City General District Court'),
-    ('Roanoke County General District Court', 'Roanoke County General District Court'),
-    ('Rockbridge County General District Court', 'Rockbridge County General District Court'),
-    ('Rockingham County General District Court', 'Rockingham County General District Court'),
-    ('Russell County General District Court', 'Russell County General District Court'),
-    ('Salem City General District Court', 'Salem City General District Court'),
-    ('Scott County General District Court', 'Scott County General District Court'),
-    ('Shenandoah County General District Court', 'Shenandoah County General District Court'),
-    ('Smyth County General District Court', 'Smyth County General District Court'),
-    ('Southampton County General District Court', 'Southampton County General District Court'),
-    ('Spotsylvania County General District Court', 'Spotsylvania County General District Court'),
-    ('Stafford County General District Court', 'Stafford County General District Court'),
-    ('Staunton City General District Court', 'Staunton City General District Court'),
-    ('Suffolk City General District Court', 'Suffolk City General District Court'),
-    ('Surry County General District Court', 'Surry County General District Court'),
-    ('Sussex County General District Court', 'Sussex County General District Court'),
-    ('Tazewell County General District Court', 'Tazewell County General District Court'),
-    ('Virginia Beach City General District Court', 'Virginia Beach City General District Court'),
-    ('Warren County General District Court', 'Warren County General District Court'),
-    ('Washington County General District Court', 'Washington County General District Court'),
-    ('Waynesboro City General District Court', 'Waynesboro City General District Court'),
-    ('Westmoreland County General District Court', 'Westmoreland County General District Court'),
-    ('Williamsburg City General District Court', 'Williamsburg City General District Court'),
-    ('Winchester City General District Court', 'Winchester City General District Court'),
-    ('Wise County General District Court', 'Wise County General District Court'),
-    ('Wythe County General District Court', 'Wythe County General District Court'),
-
-]
-
-WASHINGTON_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Ninth Circuit', 'U.S. Court of Appeals for the Ninth Circuit'),
-    ('Washington Supreme Court', 'Washington Supreme Court'),
-    ('Washington Court of Appeals Division One', 'Washington Court of Appeals Division One'),
-    ('Washington Court of Appeals Division Two', 'Washington Court of Appeals Division Two'),
-    ('Washington Court of Appeals Division Three', 'Washington Court of Appeals Division Three'),
-    ('U.S. District Court for the Eastern District of Washington', 'U.S. District Court for the Eastern District of Washington'),
-    ('U.S. District Court for the Western District of Washington', 'U.S. District Court for the Western District of Washington'),
-    ('Adams County District Court', 'Adams County District Court'),
-    ('Adams County Superior Court', 'Adams County Superior Court'),
-    ('Asotin County District Court', 'Asotin County District Court'),
-    ('Asotin County Superior Court', 'Asotin County Superior Court'),
-    ('Benton County District Court', 'Benton County District Court'),
-    ('Benton County Superior Court', 'Benton County Superior Court'),
-    ('Bremerton Municipal Court', 'Bremerton Municipal Court'),
-    ('Chelan County District Court', 'Chelan County District Court'),
-    ('Chelan County Superior Court', 'Chelan County Superior Court'),
-    ('Clallam County District Court', 'Clallam County District Court'),
-    ('Clallam County Superior Court', 'Clallam County Superior Court'),
-    ('Clark County District Court', 'Clark County District Court'),
-    ('Clark County Superior Court', 'Clark County Superior Court'),
-    ('Columbia County District Court', 'Columbia County District Court'),
-    ('Columbia County Superior Court', 'Columbia County Superior Court'),
-    ('Cowlitz County District Court', 'Cowlitz County District Court'),
-    ('Cowlitz County Superior Court', 'Cowlitz County Superior Court'),
-    ('Douglas County District Court', 'Douglas County District Court'),
-    ('Douglas County Superior Court', 'Douglas County Superior Court'),
-    ('Ferry County District Court', 'Ferry County District Court'),
-    ('Ferry County Superior Court', 'Ferry County Superior Court'),
-    ('Franklin County District Court', 'Franklin County District Court'),
-    ('Franklin County Superior Court', 'Franklin County Superior Court'),
-    ('Garfield County District Court', 'Garfield County District Court'),
-    ('Garfield County Superior Court', 'Garfield County Superior Court'),
-    ('Grant County District Court', 'Grant County District Court'),
-    ('Grant County Superior Court', 'Grant County Superior Court'),
-    ('Grays Harbor County District Court', 'Grays Harbor County District Court'),
-    ('Grays Harbor County Superior Court', 'Grays Harbor County Superior Court'),
-    ('Island County District Court', 'Island County District Court'),
-    ('Island County Superior Court', 'Island County Superior Court'),
-    ('Jefferson County District Court', 'Jefferson County District Court'),
-    ('Jefferson County Superior Court', 'Jefferson County Superior Court'),
-    ('King County District Court', 'King County District Court'),
-    ('King County Superior Court', 'King County Superior Court'),
-    ('Kitsap County District Court', 'Kitsap County District Court'),
-    ('Kitsap County Superior Court', 'Kitsap County Superior Court'),
-    ('Kittitas County District Court', 'Kittitas County District Court'),
-    ('Kittitas County Superior Court', 'Kittitas County Superior Court'),
-    ('Klickitat County District Court', 'Klickitat County District Court'),
-    ('Klickitat County Superior Court', 'Klickitat County Superior Court'),
-    ('Lewis County District Court', 'Lewis County District Court'),
-    ('Lewis County Superior Court', 'Lewis County Superior Court'),
-    ('Lincoln County District Court', 'Lincoln County District Court'),
-    ('Lincoln County Superior Court', 'Lincoln County Superior Court'),
-    ('Mason County District Court', 'Mason County District Court'),
-    ('Mason County Superior Court', 'Mason County Superior Court'),
-    ('Okanogan County District Court', 'Okanogan County District Court'),
-    ('Okanogan County Superior Court', 'Okanogan County Superior Court'),
-    ('Pacific County District Court', 'Pacific County District Court'),
-    ('Pacific County Superior Court', 'Pacific County Superior Court'),
-    ('Pend Oreille County District Court', 'Pend Oreille County District Court'),
-    ('Pend Oreille County Superior Court', 'Pend Oreille County Superior Court'),
-    ('Pierce County District Court', 'Pierce County District Court'),
-    ('Pierce County Superior Court', 'Pierce County Superior Court'),
-    ('San Juan County District Court', 'San Juan County District Court'),
-    ('San Juan County Superior Court', 'San Juan County Superior Court'),
-    ('Seattle Municipal Court', 'Seattle Municipal Court'),
-    ('Skagit County District Court', 'Skagit County District Court'),
-    ('Skagit County Superior Court', 'Skagit County Superior Court'),
-    ('Skamania County District Court', 'Skamania County District Court'),
-    ('Skamania County Superior Court', 'Skamania County Superior Court'),
-    ('Snohomish County District Court', 'Snohomish County District Court'),
-    ('Snohomish County Superior Court', 'Snohomish County Superior Court'),
-    ('Spokane County District Court', 'Spokane County District Court'),
-    ('Spokane County Superior Court', 'Spokane County Superior Court'),
-    ('Stevens County District Court', 'Stevens County District Court'),
-    ('Stevens County Superior Court', 'Stevens County Superior Court'),
-    ('Thurston County District Court', 'Thurston County District Court'),
-    ('Thurston County Superior Court', 'Thurston County Superior Court'),
-    ('Wahkiakum County District Court', 'Wahkiakum County District Court'),
-    ('Wahkiakum County Superior Court', 'Wahkiakum County Superior Court'),
-    ('Walla Walla County District Court', 'Walla Walla County District Court'),
-    ('Walla Walla County Superior Court', 'Walla Walla County Superior Court'),
-    ('Whatcom County District Court', 'Whatcom County District Court'),
-    ('Whatcom County Superior Court', 'Whatcom County Superior Court'),
-    ('Whitman County District Court', 'Whitman County District Court'),
-    ('Whitman County Superior Court', 'Whitman County Superior Court'),
-    ('Yakima County District Court', 'Yakima County District Court'),
-    ('Yakima County Superior Court', 'Yakima County Superior Court'),
-
-]
-
-WEST_VIRGINIA_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Fourth Circuit', 'U.S. Court of Appeals for the Fourth Circuit'),
-    ('West Virginia Supreme Court of Appeals', 'West Virginia Supreme Court of Appeals'),
-    ('West Virginia Intermediate Court of Appeals', 'West Virginia Intermediate Court of Appeals'),
-    ('U.S. District Court for the Northern District of West Virginia', 'U.S. District Court for the Northern District of West Virginia'),
-    ('U.S. District Court for the Southern District of West Virginia', 'U.S. District Court for the Southern District of West Virginia'),
-    ('10th Judicial Circuit Court', '10th Judicial Circuit Court'),
-    ('11th Judicial Circuit Court', '11th Judicial Circuit Court'),
-    ('12th Judicial Circuit Court', '12th Judicial Circuit Court'),
-    ('13th Judicial Circuit Court', '13th Judicial Circuit Court'),
-    ('14th Judicial Circuit Court', '14th Judicial Circuit Court'),
-    ('15th Judicial Circuit Court', '15th Judicial Circuit Court'),
-    ('16th Judicial Circuit Court', '16th Judicial Circuit Court'),
-    ('17th Judicial Circuit Court', '17th Judicial Circuit Court'),
-    ('18th Judicial Circuit Court', '18th Judicial Circuit Court'),
-    ('19th Judicial Circuit Court', '19th Judicial Circuit Court'),
-    ('1st Judicial Circuit Court', '1st Judicial Circuit Court'),
-    ('20th Judicial Circuit Court', '20th Judicial Circuit Court'),
-    ('21st Judicial Circuit Court', '21st Judicial Circuit Court'),
-    ('22nd Judicial Circuit Court', '22nd Judicial Circuit Court'),
-    ('23rd Judicial Circuit Court', '23rd Judicial Circuit Court'),
-    ('24th Judicial Circuit Court', '24th Judicial Circuit Court'),
-    ('25th Judicial Circuit Court', '25th Judicial Circuit Court'),
-    ('26th Judicial Circuit Court', '26th Judicial Circuit Court'),
-    ('27th Judicial Circuit Court', '27th Judicial Circuit Court'),
-    ('28th Judicial Circuit Court', '28th Judicial Circuit Court'),
-    ('29th Judicial Circuit Court', '29th Judicial Circuit Court'),
-    ('2nd Judicial Circuit Court', '2nd Judicial Circuit Court'),
-    ('30th Judicial Circuit Court', '30th Judicial Circuit Court'),
-    ('3rd Judicial Circuit Court', '3rd Judicial Circuit Court'),
-    ('4th Judicial Circuit Court', '4th Judicial Circuit Court'),
-    ('5th Judicial Circuit Court', '5th Judicial Circuit Court'),
-    ('6th Judicial Circuit Court', '6th Judicial Circuit Court'),
-    ('7th Judicial Circuit Court', '7th Judicial Circuit Court'),
-    ('8th Judicial Circuit Court', '8th Judicial Circuit Court'),
-    ('9th Judicial Circuit Court', '9th Judicial Circuit Court'),
-
-]
-
-WISCONSIN_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Seventh Circuit', 'U.S. Court of Appeals for the Seventh Circuit'),
-    ('Wisconsin Supreme Court', 'Wisconsin Supreme Court'),
-    ('Wisconsin Court of Appeals District I', 'Wisconsin Court of Appeals District I'),
-    ('Wisconsin Court of Appeals District II', 'Wisconsin Court of Appeals District II'),
-    ('Wisconsin Court of Appeals District III', 'Wisconsin Court of Appeals District III'),
-    ('Wisconsin Court of Appeals District IV', 'Wisconsin Court of Appeals District IV'),
-    ('U.S. District Court for the Eastern District of Wisconsin', 'U.S. District Court for the Eastern District of Wisconsin'),
-    ('U.S. District Court for the Western District of Wisconsin', 'U.S. District Court for the Western District of Wisconsin'),
-    ('Adams County Circuit Court', 'Adams County Circuit Court'),
-    ('Ashland County Circuit Court', 'Ashland County Circuit Court'),
-    ('Barron County Circuit Court', 'Barron County Circuit Court'),
-    ('Bayfield County Circuit Court', 'Bayfield County Circuit Court'),
-    ('Brown County Circuit Court', 'Brown County Circuit Court'),
-    ('Buffalo County Circuit Court', 'Buffalo County Circuit Court'),
-    ('Burnett County Circuit Court', 'Burnett County Circuit Court'),
-    ('Calumet County Circuit Court', 'Calumet County Circuit Court'),
-    ('Chippewa County Circuit Court', 'Chippewa County Circuit Court'),
-    ('Clark County Circuit Court', 'Clark County Circuit Court'),
-    ('Columbia County Circuit Court', 'Columbia County Circuit Court'),
-    ('Crawford County Circuit Court', 'Crawford County Circuit Court'),
-    ('Dane County Circuit Court', 'Dane County Circuit Court'),
-    ('Dodge County Circuit Court', 'Dodge County Circuit Court'),
-    ('Door County Circuit Court', 'Door County Circuit Court'),
-    ('Douglas County Circuit Court', 'Douglas County Circuit Court'),
-    ('Dunn County Circuit Court', 'Dunn County Circuit Court'),
-    ('Eau Claire County Circuit Court', 'Eau Claire County Circuit Court'),
-    ('Florence County Circuit Court', 'Florence County Circuit Court'),
-    ('Fond du Lac County Circuit Court', 'Fond du Lac County Circuit Court'),
-    ('Forest County Circuit Court', 'Forest County Circuit Court'),
-    ('Grant County Circuit Court', 'Grant County Circuit Court'),
-    ('Green County Circuit Court', 'Green County Circuit Court'),
-    ('Green Lake County Circuit Court', 'Green Lake County Circuit Court'),
-    ('Iowa County Circuit Court', 'Iowa County Circuit Court'),
-    ('Iron County Circuit Court', 'Iron County Circuit Court'),
-    ('Jackson County Circuit Court', 'Jackson County Circuit Court'),
-    ('Jefferson County Circuit Court', 'Jefferson County Circuit Court'),
-    ('Juneau County Circuit Court', 'Juneau County Circuit Court'),
-    ('Kenosha County Circuit Court', 'Kenosha County Circuit Court'),
-    ('Kewaunee County Circuit Court', 'Kewaunee County Circuit Court'),
-    ('La Crosse County Circuit Court', 'La Crosse County Circuit Court'),
-    ('Lafayette County Circuit Court', 'Lafayette County Circuit Court'),
-    ('Langlade County Circuit Court', 'Langlade County Circuit Court'),
-    ('Lincoln County Circuit Court', 'Lincoln County Circuit Court'),
-    ('Manitowoc County Circuit Court', 'Manitowoc County Circuit Court'),
-    ('Marathon County Circuit Court', 'Marathon County Circuit Court'),
-    ('Marinette County Circuit Court', 'Marinette County Circuit Court'),
-    ('Marquette County Circuit Court', 'Marquette County Circuit Court'),
-    ('Menominee County Circuit Court', 'Menominee County Circuit Court'),
-    ('Milwaukee County Circuit Court', 'Milwaukee County Circuit Court'),
-    ('Milwaukee Municipal Court', 'Milwaukee Municipal Court'),
-    ('Monroe County Circuit Court', 'Monroe County Circuit Court'),
-    ('Oconto County Circuit Court', 'Oconto County Circuit Court'),
-    ('Oneida County Circuit Court', 'Oneida County Circuit Court'),
-    ('Outagamie County Circuit Court', 'Outagamie County Circuit Court'),
-    ('Ozaukee County Circuit Court', 'Ozaukee County Circuit Court'),
-    ('Pepin County Circuit Court', 'Pepin County Circuit Court'),
-    ('Pierce County Circuit Court', 'Pierce County Circuit Court'),
-    ('Polk County Circuit Court', 'Polk County Circuit Court'),
-    ('Portage County Circuit Court', 'Portage County Circuit Court'),
-    ('Price County Circuit Court', 'Price County Circuit Court'),
-    ('Racine County Circuit Court', 'Racine County Circuit Court'),
-    ('Richland County Circuit Court', 'Richland County Circuit Court'),
-    ('Rock County Circuit Court', 'Rock County Circuit Court'),
-    ('Rusk County Circuit Court', 'Rusk County Circuit Court'),
-    ('Sauk County Circuit Court', 'Sauk County Circuit Court'),
-    ('Sawyer County Circuit Court', 'Sawyer County Circuit Court'),
-    ('Shawano County Circuit Court', 'Shawano County Circuit Court'),
-    ('Sheboygan County Circuit Court', 'Sheboygan County Circuit Court'),
-    ('St. Croix County Circuit Court', 'St. Croix County Circuit Court'),
-    ('Taylor County Circuit Court', 'Taylor County Circuit Court'),
-    ('Trempealeau County Circuit Court', 'Trempealeau County Circuit Court'),
-    ('Vernon County Circuit Court', 'Vernon County Circuit Court'),
-    ('Vilas County Circuit Court', 'Vilas County Circuit Court'),
-    ('Walworth County Circuit Court', 'Walworth County Circuit Court'),
-    ('Washburn County Circuit Court', 'Washburn County Circuit Court'),
-    ('Washington County Circuit Court', 'Washington County Circuit Court'),
-    ('Waukesha County Circuit Court', 'Waukesha County Circuit Court'),
-    ('Waupaca County Circuit Court', 'Waupaca County Circuit Court'),
-    ('Waushara County Circuit Court', 'Waushara County Circuit Court'),
-    ('Winnebago County Circuit Court', 'Winnebago County Circuit Court'),
-    ('Wood County Circuit Court', 'Wood County Circuit Court'),
-
-]
-
-WYOMING_COURTS = [
-    ('U.S. Supreme Court', 'U.S. Supreme Court'),
-    ('U.S. Court of Appeals for the Tenth Circuit', 'U.S. Court of Appeals for the Tenth Circuit'),
-    ('Wyoming Supreme Court', 'Wyoming Supreme Court'),
-    ('U.S. District Court for the District of Wyoming', 'U.S. District Court for the District of Wyoming'),
-    ('1st Judicial District Court', '1st Judicial District Court'),
-    ('2nd Judicial District Court', '2nd Judicial District Court'),
-    ('3rd Judicial District Court', '3rd Judicial District Court'),
-    ('4th Judicial District Court', '4th Judicial District Court'),
-    ('5th Judicial District Court', '5th Judicial District Court'),
-    ('6th Judicial District Court', '6th Judicial District Court'),
-    ('7th Judicial District Court', '7th Judicial District Court'),
-    ('8th Judicial District Court', '8th Judicial District Court'),
-    ('9th Judicial District Court', '9th Judicial District Court'),
-    ('Albany County Circuit Court', 'Albany County Circuit Court'),
-    ('Big Horn County Circuit Court', 'Big Horn County Circuit Court'),
-    ('Campbell County Circuit Court', 'Campbell County Circuit Court'),
-    ('Carbon County Circuit Court', 'Carbon County Circuit Court'),
-    ('Converse County Circuit Court', 'Converse County Circuit Court'),
-    ('Crook County Circuit Court', 'Crook County Circuit Court'),
-    ('Fremont County Circuit Court', 'Fremont County Circuit Court'),
-    ('Goshen County Circuit Court', 'Goshen County Circuit Court'),
-    ('Hot Springs County Circuit Court', 'Hot Springs County Circuit Court'),
-    ('Johnson County Circuit Court', 'Johnson County Circuit Court'),
-    ('Laramie County Circuit Court', 'Laramie County Circuit Court'),
-    ('Lincoln County Circuit Court', 'Lincoln County Circuit Court'),
-    ('Natrona County Circuit Court', 'Natrona County Circuit Court'),
-    ('Niobrara County Circuit Court', 'Niobrara County Circuit Court'),
-    ('Park County Circuit Court', 'Park County Circuit Court'),
-    ('Platte County Circuit Court', 'Platte County Circuit Court'),
-    ('Sheridan County Circuit Court', 'Sheridan County Circuit Court'),
-    ('Sublette County Circuit Court', 'Sublette County Circuit Court'),
-    ('Sweetwater County Circuit Court', 'Sweetwater County Circuit Court'),
-    ('Teton County Circuit Court', 'Teton County Circuit Court'),
-    ('Uinta County Circuit Court', 'Uinta County Circuit Court'),
-    ('Washakie County Circuit Court', 'Washakie County Circuit Court'),
-
-]
-
-
-COURTS_BY_STATE = {
-    'AL': ALABAMA_COURTS,
-    'AK': ALASKA_COURTS,
-    'AZ': ARIZONA_COURTS,
-    'AR': ARKANSAS_COURTS,
-    'CA': CALIFORNIA_COURTS,
-    'CO': COLORADO_COURTS,
-    'CT': CONNECTICUT_COURTS,
-    'DE': DELAWARE_COURTS,
-    'FL': FLORIDA_COURTS,
-    'GA': GEORGIA_COURTS,
-    'HI': HAWAII_COURTS,
-    'ID': IDAHO_COURTS,
-    'IL': ILLINOIS_COURTS,
-    'IN': INDIANA_COURTS,
-    'IA': IOWA_COURTS,
-    'KS': KANSAS_COURTS,
-    'KY': KENTUCKY_COURTS,
-    'LA': LOUISIANA_COURTS,
-    'ME': MAINE_COURTS,
-    'MD': MARYLAND_COURTS,
-    'MA': MASSACHUSETTS_COURTS,
-    'MI': MICHIGAN_COURTS,
-    'MN': MINNESOTA_COURTS,
-    'MS': MISSISSIPPI_COURTS,
-    'MO': MISSOURI_COURTS,
-    'MT': MONTANA_COURTS,
-    'NE': NEBRASKA_COURTS,
-    'NV': NEVADA_COURTS,
-    'NH': NEW_HAMPSHIRE_COURTS,
-    'NJ': NEW_JERSEY_COURTS,
-    'NM': NEW_MEXICO_COURTS,
-    'NY': NEW_YORK_COURTS,
-    'NC': NORTH_CAROLINA_COURTS,
-    'ND': NORTH_DAKOTA_COURTS,
-    'OH': OHIO_COURTS,
-    'OK': OKLAHOMA_COURTS,
-    'OR': OREGON_COURTS,
-    'PA': PENNSYLVANIA_COURTS,
-    'RI': RHODE_ISLAND_COURTS,
-    'SC': SOUTH_CAROLINA_COURTS,
-    'SD': SOUTH_DAKOTA_COURTS,
-    'TN': TENNESSEE_COURTS,
-    'TX': TEXAS_COURTS,
-    'UT': UTAH_COURTS,
-    'VT': VERMONT_COURTS,
-    'VA': VIRGINIA_COURTS,
-    'WA': WASHINGTON_COURTS,
-    'WV': WEST_VIRGINIA_COURTS,
-    'WI': WISCONSIN_COURTS,
-    'WY': WYOMING_COURTS
-}
\ No newline at end of file
+# Court lists per state live in app/data/courts.json and are loaded on first
+# use by app/court_catalog.py (courts_for_state, is_valid_court, search_courts)
@@ -10,6 +10,19 @@ def init_mail(app):
     mail.init_app(app)
 
 
+def _build_message(app, subject, recipient, html_body, text_body=None):
+    import re
+
+    msg = Message(
+        subject=subject,
+        sender=app.config['MAIL_DEFAULT_SENDER'],
+        recipients=[recipient]
+    )
+    msg.html = html_body
+    msg.body = text_body if text_body else re.sub('<.*?>', '', html_body)
+    return msg
+
+
 def send_email(subject, recipient, html_body, text_body=None):
     """
     Send an email using Flask-Mail in a background thread.
@@ -24,17 +37,9 @@ def send_email(subject, recipient, html_body, text_body=None):
         bool: True if dispatched successfully, False otherwise
     """
     from threading import Thread
-    import re
 
     app = current_app._get_current_object()
-
-    msg = Message(
-        subject=subject,
-        sender=app.config['MAIL_DEFAULT_SENDER'],
-        recipients=[recipient]
-    )
-    msg.html = html_body
-    msg.body = text_body if text_body else re.sub('<.*?>', '', html_body)
+    msg = _build_message(app, subject, recipient, html_body, text_body)
 
     def send_async(app, msg):
         with app.app_context():
@@ -53,6 +58,47 @@ def send_email(subject, recipient, html_body, text_body=None):
         return False
 
 
+def send_emails(emails):
+    """
+    Send a batch of emails from one background thread over a single SMTP
+    connection, instead of a thread and connection per message.
+
+    Args:
+        emails (list): (subject, recipient, html_body) tuples
+
+    Returns:
+        bool: True if dispatched successfully (or nothing to send), False otherwise
+    """
+    from threading import Thread
+
+    if not emails:
+        return True
+
+    app = current_app._get_current_object()
+    messages = [_build_message(app, subject, recipient, html_body) for subject, recipient, html_body in emails]
+
+    def send_async(app, messages):
+        with app.app_context():
+            try:
+                with mail.connect() as connection:
+                    for msg in messages:
+                        try:
+                            connection.send(msg)
+                            app.logger.info(f"Email sent: {msg.subject} to {msg.recipients[0]}")
+                        except Exception as e:
+                            app.logger.error(f"Failed to send email: {msg.subject} to {msg.recipients[0]} — {str(e)}")
+            except Exception as e:
+                app.logger.error(f"Failed to send email batch of {len(messages)}: {str(e)}")
+
+    try:
+        thread = Thread(target=send_async, args=[app, messages])
+        thread.start()
+        return True
+    except Exception as e:
+        current_app.logger.error(f"Failed to dispatch email thread: {str(e)}")
+        return False
+
+
 def send_password_reset_email(user):
     """
     Send a password reset email with a signed time-limited token.
@@ -324,14 +370,13 @@ def send_user_content_action_notification(user, content, judge, action_type, adm
     )
 
 
-def send_user_account_notification(user, action_type, admin_message=None):
+def user_account_notification(user, action_type, admin_message=None):
     """
-    Send notification to user about their account status change.
+    Build the notification about a user's account status change without
+    sending it, e.g. to queue several for send_emails().
 
-    Args:
-        user: User object
-        action_type: 'banned' or 'unbanned'
-        admin_message: Optional message from admin
+    Returns:
+        tuple: (subject, recipient, html_body)
     """
     if action_type == 'banned':
         subject = "Account Status Notification"
@@ -383,8 +428,21 @@ def send_user_account_notification(user, action_type, admin_message=None):
     </html>
     """
 
+    return subject, user.email, html_body
+
+
+def send_user_account_notification(user, action_type, admin_message=None):
+    """
+    Send notification to user about their account status change.
+
+    Args:
+        user: User object
+        action_type: 'banned' or 'unbanned'
+        admin_message: Optional message from admin
+    """
+    subject, recipient, html_body = user_account_notification(user, action_type, admin_message)
     return send_email(
         subject=subject,
-        recipient=user.email,
+        recipient=recipient,
         html_body=html_body
-    )
\ No newline at end of file
+    )
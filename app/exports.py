@@ -0,0 +1,152 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from app import db
+from app.models import Judge, JudgeStats, Review, MediaLink, User, ContentFlag, AdminLog
+
+# Rows fetched per round trip; on PostgreSQL this also switches to a
+# server-side cursor, so only one batch is held in memory at a time
+EXPORT_BATCH_SIZE = 1000
+
+# Rows written per chunk handed to the WSGI server
+CSV_ROWS_PER_CHUNK = 200
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _reviews():
+    author = db.aliased(User)
+    return db.select(
+        Review.id, Review.judge_id,
+        (Judge.first_name + ' ' + Judge.last_name).label('judge_name'),
+        Review.user_id, author.username,
+        Review.rating, Review.fairness_concern, Review.bias_concern, Review.temperament_concern,
+        Review.court_date, Review.created_at, Review.review_text
+    ).join(Judge, Review.judge_id == Judge.id).outerjoin(
+        author, Review.user_id == author.id
+    ).order_by(Review.id)
+
+
+def _media_links():
+    author = db.aliased(User)
+    return db.select(
+        MediaLink.id, MediaLink.judge_id,
+        (Judge.first_name + ' ' + Judge.last_name).label('judge_name'),
+        MediaLink.user_id, author.username,
+        MediaLink.headline, MediaLink.news_source, MediaLink.url, MediaLink.publication_date,
+        MediaLink.is_verified, MediaLink.created_at, MediaLink.summary
+    ).join(Judge, MediaLink.judge_id == Judge.id).outerjoin(
+        author, MediaLink.user_id == author.id
+    ).order_by(MediaLink.id)
+
+
+def _judges():
+    return db.select(
+        Judge.id, Judge.first_name, Judge.last_name, Judge.court, Judge.city, Judge.state,
+        Judge.is_federal, Judge.is_retired,
+        db.func.coalesce(JudgeStats.review_count, 0).label('review_count'),
+        db.func.coalesce(JudgeStats.avg_rating, 0).label('avg_rating'),
+        db.func.coalesce(JudgeStats.concern_count, 0).label('concern_count'),
+        db.func.coalesce(JudgeStats.verified_media_count, 0).label('verified_media_count')
+    ).outerjoin(JudgeStats, JudgeStats.judge_id == Judge.id).order_by(Judge.id)
+
+
+def _flags():
+    flagger = db.aliased(User)
+    resolver = db.aliased(User)
+    return db.select(
+        ContentFlag.id, ContentFlag.review_id, ContentFlag.media_link_id,
+        ContentFlag.user_id, flagger.username.label('flagged_by'),
+        ContentFlag.flag_type, ContentFlag.description, ContentFlag.created_at,
+        ContentFlag.is_resolved, resolver.username.label('resolved_by'), ContentFlag.resolved_at,
+        ContentFlag.resolution_action, ContentFlag.resolution_notes
+    ).outerjoin(flagger, ContentFlag.user_id == flagger.id).outerjoin(
+        resolver, ContentFlag.resolved_by_id == resolver.id
+    ).order_by(ContentFlag.id)
+
+
+def _admin_logs():
+    admin = db.aliased(User)
+    return db.select(
+        AdminLog.id, AdminLog.timestamp, AdminLog.admin_id, admin.username.label('admin'),
+        AdminLog.action_type, AdminLog.target_user_id, AdminLog.target_review_id,
+        AdminLog.target_media_link_id, AdminLog.details
+    ).outerjoin(admin, AdminLog.admin_id == admin.id).order_by(AdminLog.id)
+
+
+# Dataset name -> statement builder. Each selects plain columns rather than
+# ORM entities, so streamed rows never accumulate in the session.
+DATASETS = {
+    'reviews': _reviews,
+    'media_links': _media_links,
+    'judges': _judges,
+    'flags': _flags,
+    'admin_logs': _admin_logs,
+}
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+
+# Leading characters that make spreadsheet applications evaluate a cell
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_value(value):
+    """Blank for NULL, and a leading quote on text a spreadsheet would evaluate as a formula"""
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _rows(dataset):
+    result = db.session.execute(DATASETS[dataset]().execution_options(yield_per=EXPORT_BATCH_SIZE))
+    return result.keys(), result
+
+
+def _csv_chunks(dataset):
+    columns, rows = _rows(dataset)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([_csv_value(value) for value in row])
+        if count % CSV_ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(dataset):
+    columns, rows = _rows(dataset)
+    columns = list(columns)
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), default=_json_value) + '\n'
+
+
+def export_chunks(dataset, fmt):
+    """
+    Generator of text chunks for a streaming export.
+
+    Args:
+        dataset (str): Key of DATASETS
+        fmt (str): 'csv' or 'ndjson'
+
+    Returns:
+        generator: Chunks to pass to a streamed Response; rows are read from
+        the database in batches as the client consumes them
+    """
+    if fmt == 'csv':
+        return _csv_chunks(dataset)
+    return _ndjson_chunks(dataset)
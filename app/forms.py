@@ -7,25 +7,30 @@ from app.court_data import SHORTENED_URL_DOMAINS
 
 
 class SearchForm(FlaskForm):
+    # Read-only search submitted via GET so result pages can be linked and paged
+    class Meta:
+        csrf = False
+
     search_query = StringField('Search Judges', validators=[Length(max=100)])
-    filter_state = SelectField('Filter by State', choices=[('', 'All States')])
+    filter_state = SelectField('Filter by State', choices=[('', 'All States')], default='')
     filter_federal = SelectField('Judge Type', choices=[
         ('', 'All Judges'),
         ('federal', 'Federal Court Judges'),
         ('state', 'State Court Judges')
-    ])
+    ], default='')
     filter_retired = SelectField('Retired Status', choices=[
         ('', 'All Judges'),
         ('active', 'Active Judges Only'),
         ('retired', 'Retired Judges Only')
-    ])
+    ], default='')
     filter_content = SelectField('Content Filter', choices=[
         ('', 'All Judges'),
         ('has_reviews', 'Judges with Reviews'),
         ('has_media', 'Judges with Media Links'),
         ('has_both', 'Judges with Both')
-    ])
-    sort_by = SelectField('Sort By', choices=[
+    ], default='')
+    sort_by = SelectField('Sort By', default='relevance', choices=[
+        ('relevance', 'Best Match'),
         ('name_asc', 'Name (A-Z)'),
         ('name_desc', 'Name (Z-A)'),
         ('rating_desc', 'Rating (High to Low)'),
@@ -195,6 +200,10 @@ class LoginForm(FlaskForm):
 
 
 class AdminSearchForm(FlaskForm):
+    # Read-only search submitted via GET so filtered listings can be paged
+    class Meta:
+        csrf = False
+
     search_judge = StringField('Search Judge Name', validators=[Length(max=100)])
     search_content = StringField('Search Review & Media Link Summaries', validators=[Length(max=200)])
     filter_username = StringField('Filter by Username', validators=[Length(max=64)])
@@ -205,20 +214,20 @@ class AdminSearchForm(FlaskForm):
         ('3', '3 Stars'),
         ('4', '4 Stars'),
         ('5', '5 Stars')
-    ])
+    ], default='')
     filter_concerns = SelectField('Concerns', choices=[
         ('', 'All Reviews'),
         ('any', 'Any Concern Flagged'),
         ('fairness', 'Fairness Concern'),
         ('bias', 'Bias Concern'),
         ('temperament', 'Temperament Concern')
-    ])
+    ], default='')
     sort_by = SelectField('Sort By', choices=[
         ('newest', 'Newest First'),
         ('oldest', 'Oldest First'),
         ('rating_high', 'Rating: High to Low'),
         ('rating_low', 'Rating: Low to High')
-    ])
+    ], default='newest')
     admin_submit = SubmitField('Search & Filter')
 
 
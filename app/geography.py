@@ -0,0 +1,39 @@
+from sqlalchemy import func
+
+from app import db
+from app.models import Judge, JudgeStats
+
+
+def geographic_rollup(by_court=False, verified_only=True, state=None):
+    """
+    Judge, review and media link totals per state (or per state and court).
+
+    Sums the per-judge judge_stats aggregates over the judge's location in
+    one grouped query, so the review and media_link tables are never read.
+    Judges without a judge_stats row yet count as having no content.
+
+    Args:
+        by_court (bool): Group by (state, court) instead of state alone
+        verified_only (bool): Count only verified media links, as shown publicly
+        state (str, optional): Restrict the rollup to one state
+
+    Returns:
+        list: Rows with state, court (None unless by_court), judge_count,
+        review_count, avg_rating and media_count, ordered by location
+    """
+    location = [Judge.state, Judge.court] if by_court else [Judge.state]
+    review_count = func.coalesce(func.sum(JudgeStats.review_count), 0)
+    media_column = JudgeStats.verified_media_count if verified_only else JudgeStats.media_count
+
+    query = db.session.query(
+        Judge.state.label('state'),
+        (Judge.court if by_court else db.null()).label('court'),
+        func.count(Judge.id).label('judge_count'),
+        review_count.label('review_count'),
+        (db.cast(func.sum(JudgeStats.rating_sum), db.Float) / func.nullif(review_count, 0)).label('avg_rating'),
+        func.coalesce(func.sum(media_column), 0).label('media_count')
+    ).outerjoin(JudgeStats, JudgeStats.judge_id == Judge.id)
+    if state:
+        query = query.filter(Judge.state == state)
+
+    return query.group_by(*location).order_by(*location).all()
@@ -0,0 +1,71 @@
+import hashlib
+import os
+from datetime import timezone
+
+from flask import current_app, request, session, make_response
+from flask_login import current_user
+from werkzeug.http import is_resource_modified
+
+
+def build_hash():
+    """
+    Identifier for the deployed code and templates. Uses the commit Render
+    deploys from when available, otherwise a digest of the template and
+    static files, computed once per process.
+    """
+    cached = current_app.extensions.get('build_hash')
+    if cached is None:
+        cached = current_app.config.get('BUILD_HASH')
+        if not cached:
+            digest = hashlib.sha1()
+            for folder in (current_app.template_folder, current_app.static_folder):
+                folder = os.path.join(current_app.root_path, folder)
+                for root, dirs, files in sorted(os.walk(folder)):
+                    dirs.sort()
+                    for name in sorted(files):
+                        with open(os.path.join(root, name), 'rb') as f:
+                            digest.update(name.encode('utf-8'))
+                            digest.update(f.read())
+            cached = digest.hexdigest()
+        current_app.extensions['build_hash'] = cached
+    return cached
+
+
+def conditional_page(render, *validators, last_modified=None):
+    """
+    Serve a public page with ETag / Last-Modified validators, answering
+    304 Not Modified without calling render() when the client's copy is current.
+
+    Only anonymous requests are handled: logged-in pages carry per-user
+    navigation, flag state and CSRF tokens that the validators don't cover.
+
+    Args:
+        render: Zero-argument callable producing the full response
+        *validators: Values that change whenever the page content does
+            (the build hash, path and query string are always included)
+        last_modified (datetime, optional): Naive UTC time the content last changed
+
+    Returns:
+        Response
+    """
+    if request.method != 'GET' or current_user.is_authenticated or '_flashes' in session:
+        return render()
+
+    parts = [build_hash(), request.full_path] + [str(v) for v in validators]
+    etag = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response(render())
+    else:
+        response = current_app.response_class(status=304)
+
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Clients may keep the page but must revalidate before reusing it, and
+    # shared caches must not hand an anonymous copy to a logged-in user
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response
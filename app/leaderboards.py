@@ -0,0 +1,73 @@
+from app import db
+from app.models import Judge, JudgeStats, User, UserStats
+
+# Bounds for the admin-selectable leaderboard size
+TOP_N_DEFAULT = 10
+TOP_N_MIN = 5
+TOP_N_MAX = 100
+
+# Judges need this many reviews to appear in the rating leaderboards
+MIN_RATED_REVIEWS = 3
+
+
+def parse_top_n(value):
+    """
+    Leaderboard size from a query string value, clamped to TOP_N_MIN..TOP_N_MAX.
+    Missing or non-numeric values give TOP_N_DEFAULT.
+    """
+    try:
+        top_n = int(value)
+    except (TypeError, ValueError):
+        return TOP_N_DEFAULT
+    return max(TOP_N_MIN, min(top_n, TOP_N_MAX))
+
+
+def _judge_board(top_n, column, descending=True, rated=False):
+    # The per-judge aggregates live in judge_stats, which is kept current by
+    # every content change; each board is the top of one of its indexes
+    columns = [Judge.id, Judge.first_name, Judge.last_name, Judge.court]
+    if rated:
+        columns += [JudgeStats.avg_rating, JudgeStats.review_count]
+        criterion = JudgeStats.review_count >= MIN_RATED_REVIEWS
+    else:
+        columns.append(column)
+        criterion = column > 0
+
+    rows = db.session.query(*columns).join(JudgeStats, JudgeStats.judge_id == Judge.id).filter(
+        criterion
+    ).order_by(
+        column.desc() if descending else column.asc(), JudgeStats.judge_id
+    ).limit(top_n).all()
+
+    return [[{'id': judge_id, 'name': f'{first_name} {last_name}', 'court': court}, *values]
+            for judge_id, first_name, last_name, court, *values in rows]
+
+
+def leaderboards(top_n):
+    """
+    Admin statistics leaderboards, read from the judge_stats and user_stats
+    aggregate tables. Each board is a single LIMIT top_n query in index order.
+
+    Args:
+        top_n (int): Board size; pass it through parse_top_n() first
+
+    Returns:
+        dict: most_reviewed, most_documented, highest_rated, lowest_rated,
+        most_concerning and most_active_users lists, in the shapes the
+        admin statistics template expects
+    """
+    most_active_users = db.session.query(User.id, User.username, UserStats.review_count).join(
+        UserStats, UserStats.user_id == User.id
+    ).filter(UserStats.review_count > 0).order_by(
+        UserStats.review_count.desc(), UserStats.user_id
+    ).limit(top_n).all()
+
+    return {
+        'most_reviewed': _judge_board(top_n, JudgeStats.review_count),
+        'most_documented': _judge_board(top_n, JudgeStats.verified_media_count),
+        'highest_rated': _judge_board(top_n, JudgeStats.avg_rating, rated=True),
+        'lowest_rated': _judge_board(top_n, JudgeStats.avg_rating, descending=False, rated=True),
+        'most_concerning': _judge_board(top_n, JudgeStats.concern_count),
+        'most_active_users': [[{'id': user_id, 'username': username}, count]
+                              for user_id, username, count in most_active_users],
+    }
@@ -1,5 +1,6 @@
 from app import db
 from datetime import datetime
+from sqlalchemy import event
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -20,6 +21,7 @@ class Judge(db.Model):
     )
 
     reviews = db.relationship('Review', backref='judge', lazy='dynamic', cascade='all, delete-orphan')
+    stats = db.relationship('JudgeStats', backref='judge', uselist=False, cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Judge {self.first_name} {self.last_name}>'
@@ -27,6 +29,10 @@ class Judge(db.Model):
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
+    def get_stats(self):
+        """Return the aggregate row for this judge, or an empty one if none exists yet"""
+        return self.stats or JudgeStats.empty(self.id)
+
     def average_rating(self):
         from sqlalchemy import func
         result = db.session.query(func.avg(Review.rating)).filter(
@@ -43,7 +49,7 @@ class Judge(db.Model):
 
 class Review(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    judge_id = db.Column(db.Integer, db.ForeignKey('judge.id'), nullable=False, index=True)
+    judge_id = db.Column(db.Integer, db.ForeignKey('judge.id', ondelete='CASCADE'), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True, index=True)
 
     # Rating and concerns
@@ -56,8 +62,13 @@ class Review(db.Model):
     review_text = db.Column(db.Text, nullable=False)
     court_date = db.Column(db.Date, nullable=False)
 
-    # Timestamp
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Timestamp (indexed for date-range statistics)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    # Serves the newest-first, per-judge review pages on the judge profile
+    __table_args__ = (
+        db.Index('ix_review_judge_id_created_at', 'judge_id', 'created_at', 'id'),
+    )
 
     def __repr__(self):
         return f'<Review {self.id} for Judge {self.judge_id}>'
@@ -65,8 +76,8 @@ class Review(db.Model):
 
 class MediaLink(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    judge_id = db.Column(db.Integer, db.ForeignKey('judge.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    judge_id = db.Column(db.Integer, db.ForeignKey('judge.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True, index=True)
 
     # Media Link Details
     headline = db.Column(db.String(500), nullable=False)
@@ -77,16 +88,121 @@ class MediaLink(db.Model):
 
     # Moderation
     is_verified = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
     # Relationships
     judge = db.relationship('Judge', backref='media_links')
     user = db.relationship('User', backref='media_links', foreign_keys=[user_id])
 
+    # Serves the newest-first, per-judge verified media pages on the judge profile
+    __table_args__ = (
+        db.Index('ix_media_link_judge_id_is_verified_created_at', 'judge_id', 'is_verified', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f'<MediaLink {self.headline}>'
 
 
+class JudgeStats(db.Model):
+    """
+    Denormalized per-judge aggregates so listing pages can read counts and
+    ratings in a single query. Recomputed via refresh() whenever a review or
+    media link for the judge is created, edited, deleted, approved or rejected.
+    """
+    __tablename__ = 'judge_stats'
+
+    judge_id = db.Column(db.Integer, db.ForeignKey('judge.id', ondelete='CASCADE'), primary_key=True)
+
+    # Review aggregates
+    review_count = db.Column(db.Integer, default=0, nullable=False, index=True)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+    avg_rating = db.Column(db.Float, default=0, nullable=False, index=True)
+    fairness_count = db.Column(db.Integer, default=0, nullable=False)
+    bias_count = db.Column(db.Integer, default=0, nullable=False)
+    temperament_count = db.Column(db.Integer, default=0, nullable=False)
+    concern_count = db.Column(db.Integer, default=0, nullable=False, index=True)  # Reviews with any concern
+
+    # Media link aggregates (verified only — unverified links are not public)
+    verified_media_count = db.Column(db.Integer, default=0, nullable=False, index=True)
+    media_count = db.Column(db.Integer, default=0, nullable=False)  # All submitted, for admin statistics
+
+    # Most recent public submission, and when this row was last recomputed
+    last_activity_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<JudgeStats {self.judge_id}: {self.review_count} reviews, {self.verified_media_count} media>'
+
+    def average_rating(self):
+        return round(self.avg_rating, 1) if self.review_count else 0
+
+    @staticmethod
+    def empty(judge_id=None):
+        """Transient zero-valued row for judges that have no aggregate yet"""
+        return JudgeStats(
+            judge_id=judge_id, review_count=0, rating_sum=0, avg_rating=0,
+            fairness_count=0, bias_count=0, temperament_count=0, concern_count=0,
+            verified_media_count=0, media_count=0, last_activity_at=None, updated_at=None
+        )
+
+    @staticmethod
+    def refresh(judge_id):
+        """
+        Recompute the aggregate row for a judge from the review and media_link
+        tables. Adds the row to the session but does not commit, so the update
+        lands in the same transaction as the change that triggered it.
+
+        The judge row is locked first, so concurrent refreshes for one judge
+        run one after another and each counts the content the other committed
+        (and finds the judge_stats row the other inserted). FOR NO KEY UPDATE
+        does not block other transactions inserting content for the judge.
+        """
+        from sqlalchemy import func, case
+
+        db.session.query(Judge.id).filter(Judge.id == judge_id).with_for_update(key_share=True).one_or_none()
+
+        review_totals = db.session.query(
+            func.count(Review.id),
+            func.coalesce(func.sum(Review.rating), 0),
+            func.coalesce(func.sum(case((Review.fairness_concern == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((Review.bias_concern == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((Review.temperament_concern == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((db.or_(
+                Review.fairness_concern == True,
+                Review.bias_concern == True,
+                Review.temperament_concern == True
+            ), 1), else_=0)), 0),
+            func.max(Review.created_at)
+        ).filter(Review.judge_id == judge_id).one()
+
+        media_totals = db.session.query(
+            func.coalesce(func.sum(case((MediaLink.is_verified == True, 1), else_=0)), 0),
+            func.count(MediaLink.id),
+            func.max(case((MediaLink.is_verified == True, MediaLink.created_at)))
+        ).filter(MediaLink.judge_id == judge_id).one()
+
+        stats = db.session.get(JudgeStats, judge_id)
+        if stats is None:
+            stats = JudgeStats(judge_id=judge_id)
+            db.session.add(stats)
+
+        review_count, rating_sum, fairness, bias, temperament, concerns, last_review = review_totals
+        verified_media_count, media_count, last_media = media_totals
+
+        stats.review_count = review_count
+        stats.rating_sum = rating_sum
+        stats.avg_rating = float(rating_sum) / review_count if review_count else 0
+        stats.fairness_count = fairness
+        stats.bias_count = bias
+        stats.temperament_count = temperament
+        stats.concern_count = concerns
+        stats.verified_media_count = verified_media_count
+        stats.media_count = media_count
+        stats.last_activity_at = max([d for d in (last_review, last_media) if d is not None], default=None)
+        stats.updated_at = datetime.utcnow()
+        return stats
+
+
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(64), unique=True, nullable=False, index=True)
@@ -111,6 +227,7 @@ class User(UserMixin, db.Model):
     # Relationships
     reviews = db.relationship('Review', backref='user', lazy='dynamic',
                               foreign_keys='Review.user_id')
+    stats = db.relationship('UserStats', backref='user', uselist=False, cascade='all, delete-orphan')
     # media_links relationship already defined in MediaLink model
 
     # Self-referential relationship for banned_by
@@ -143,7 +260,7 @@ class User(UserMixin, db.Model):
         db.session.commit()
 
     def ban(self, banned_by_user, reason):
-        """Ban this user"""
+        """Ban this user; the caller commits"""
         self.is_banned = True
         self.ban_reason = reason
         self.banned_at = datetime.utcnow()
@@ -158,10 +275,9 @@ class User(UserMixin, db.Model):
             banned_by_id=banned_by_user.id
         )
         db.session.add(banned_record)
-        db.session.commit()
 
     def unban(self):
-        """Unban this user"""
+        """Unban this user; the caller commits"""
         self.is_banned = False
         self.ban_reason = None
         self.banned_at = None
@@ -177,12 +293,59 @@ class User(UserMixin, db.Model):
             banned_record.is_unbanned = True
             banned_record.unbanned_at = datetime.utcnow()
 
-        db.session.commit()
-
     def __repr__(self):
         return f'<User {self.username}>'
 
 
+class UserStats(db.Model):
+    """
+    Denormalized per-user review count, so the most-active-users leaderboard
+    reads the top rows of an index instead of grouping the review table.
+    Recomputed via refresh() whenever one of the user's reviews is created
+    or deleted.
+    """
+    __tablename__ = 'user_stats'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    review_count = db.Column(db.Integer, default=0, nullable=False, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<UserStats {self.user_id}: {self.review_count} reviews>'
+
+    @staticmethod
+    def refresh(*user_ids):
+        """
+        Recompute the rows for the given users (None entries, from anonymous
+        reviews, are skipped). Adds to the session without committing.
+
+        Locks the user rows first, in id order, for the same reason as
+        JudgeStats.refresh(): concurrent refreshes for a user are serialized
+        and never lose each other's reviews or insert the same row twice.
+        """
+        from sqlalchemy import func
+
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        if not user_ids:
+            return
+
+        db.session.query(User.id).filter(User.id.in_(user_ids)).order_by(User.id).with_for_update(
+            key_share=True
+        ).all()
+
+        counts = dict(db.session.query(Review.user_id, func.count(Review.id)).filter(
+            Review.user_id.in_(user_ids)
+        ).group_by(Review.user_id).all())
+
+        for user_id in user_ids:
+            stats = db.session.get(UserStats, user_id)
+            if stats is None:
+                stats = UserStats(user_id=user_id)
+                db.session.add(stats)
+            stats.review_count = counts.get(user_id, 0)
+            stats.updated_at = datetime.utcnow()
+
+
 class BannedUser(db.Model):
     """
     Track banned users to prevent re-registration with same username/email.
@@ -197,7 +360,7 @@ class BannedUser(db.Model):
 
     # Ban details
     ban_reason = db.Column(db.Text, nullable=False)
-    banned_by_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    banned_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # None once the admin account is deleted
     banned_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
     # Unban tracking
@@ -240,19 +403,22 @@ class AdminLog(db.Model):
     __tablename__ = 'admin_log'
 
     id = db.Column(db.Integer, primary_key=True)
-    admin_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    admin_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # None once the admin account is deleted
     action_type = db.Column(db.String(50), nullable=False, index=True)
     # Action types: 'ban_user', 'unban_user', 'delete_user', 'delete_review',
     #               'delete_media_link', 'approve_media_link', 'reject_media_link',
-    #               'add_admin_note', 'edit_content'
+    #               'add_admin_note', 'edit_content', 'export_data'
 
     target_user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
-    target_review_id = db.Column(db.Integer, db.ForeignKey('review.id'))
-    target_media_link_id = db.Column(db.Integer, db.ForeignKey('media_link.id'))
+    target_review_id = db.Column(db.Integer, db.ForeignKey('review.id', ondelete='SET NULL'))
+    target_media_link_id = db.Column(db.Integer, db.ForeignKey('media_link.id', ondelete='SET NULL'))
 
     details = db.Column(db.Text)  # JSON or text description of the action
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Session.info key for entries buffered by log_action() until commit
+    PENDING_KEY = 'admin_log_pending'
+
     # Relationships
     admin = db.relationship('User', foreign_keys=[admin_id])
     target_user = db.relationship('User', foreign_keys=[target_user_id])
@@ -261,36 +427,99 @@ class AdminLog(db.Model):
 
     @staticmethod
     def log_action(admin_user, action_type, details=None, target_user=None,
-                   target_review=None, target_media_link=None):
+                   target_review=None, target_media_link=None, sync=False):
         """
-        Create a new admin log entry.
+        Record an admin action as part of the current transaction.
+
+        The entry is buffered on the session and written, together with any
+        other buffered entries, by a single bulk insert when the handler
+        commits, so the audit row is committed with the action it describes
+        (and discarded with it on rollback). Targets deleted in the same
+        transaction are recorded as None, as their foreign keys would be.
+
+        Pass sync=True to insert and commit the entry immediately instead,
+        e.g. when the action itself writes nothing.
+
+        Returns:
+            AdminLog or None: The committed entry in sync mode
         """
-        log_entry = AdminLog(
-            admin_id=admin_user.id,
-            action_type=action_type,
-            target_user_id=target_user.id if target_user else None,
-            target_review_id=target_review.id if target_review else None,
-            target_media_link_id=target_media_link.id if target_media_link else None,
-            details=details
-        )
-        db.session.add(log_entry)
-        db.session.commit()
-        return log_entry
+        if sync:
+            log_entry = AdminLog(
+                admin_id=admin_user.id,
+                action_type=action_type,
+                target_user_id=target_user.id if target_user else None,
+                target_review_id=target_review.id if target_review else None,
+                target_media_link_id=target_media_link.id if target_media_link else None,
+                details=details
+            )
+            db.session.add(log_entry)
+            db.session.commit()
+            return log_entry
+
+        db.session.info.setdefault(AdminLog.PENDING_KEY, []).append({
+            'admin': admin_user,
+            'action_type': action_type,
+            'details': details,
+            'timestamp': datetime.utcnow(),
+            'target_user': target_user,
+            'target_review': target_review,
+            'target_media_link': target_media_link,
+        })
+        return None
+
+    @staticmethod
+    def flush_pending(session):
+        """Bulk insert the entries buffered by log_action(); runs just before each commit"""
+        from sqlalchemy import inspect
+
+        entries = session.info.pop(AdminLog.PENDING_KEY, None)
+        if not entries:
+            return
+
+        # Flush first so targets created in this transaction have ids and
+        # targets deleted in it are known to be gone
+        session.flush()
+
+        def target_id(target):
+            if target is None:
+                return None
+            state = inspect(target)
+            return None if state.deleted or state.was_deleted else target.id
+
+        session.execute(db.insert(AdminLog), [{
+            'admin_id': entry['admin'].id,
+            'action_type': entry['action_type'],
+            'details': entry['details'],
+            'timestamp': entry['timestamp'],
+            'target_user_id': target_id(entry['target_user']),
+            'target_review_id': target_id(entry['target_review']),
+            'target_media_link_id': target_id(entry['target_media_link']),
+        } for entry in entries])
 
     def __repr__(self):
         return f'<AdminLog {self.action_type} by Admin {self.admin_id} at {self.timestamp}>'
 
 
+@event.listens_for(db.session, 'before_commit')
+def _write_pending_admin_log(session):
+    AdminLog.flush_pending(session)
+
+
+@event.listens_for(db.session, 'after_soft_rollback')
+def _discard_pending_admin_log(session, previous_transaction):
+    session.info.pop(AdminLog.PENDING_KEY, None)
+
+
 class ContentFlag(db.Model):
     """User-reported flags for reviews and media links"""
     __tablename__ = 'content_flags'
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), index=True)  # None once the flagger is deleted
 
     # Content being flagged (one will be set)
-    review_id = db.Column(db.Integer, db.ForeignKey('review.id'), index=True)
-    media_link_id = db.Column(db.Integer, db.ForeignKey('media_link.id'), index=True)
+    review_id = db.Column(db.Integer, db.ForeignKey('review.id', ondelete='CASCADE'), index=True)
+    media_link_id = db.Column(db.Integer, db.ForeignKey('media_link.id', ondelete='CASCADE'), index=True)
 
     # Flag details
     flag_type = db.Column(db.String(50),
@@ -313,5 +542,252 @@ class ContentFlag(db.Model):
     review = db.relationship('Review', backref='flags')
     media_link = db.relationship('MediaLink', backref='flags')
 
+    # Partial indexes covering only unresolved flags, so pending-flag lookups
+    # stay small no matter how many resolved flags accumulate
+    __table_args__ = (
+        db.Index('ix_content_flags_pending_review_id', 'review_id',
+                 postgresql_where=(is_resolved == False), sqlite_where=(is_resolved == False)),
+        db.Index('ix_content_flags_pending_media_link_id', 'media_link_id',
+                 postgresql_where=(is_resolved == False), sqlite_where=(is_resolved == False)),
+    )
+
+    def __repr__(self):
+        return f'<ContentFlag {self.id} - {self.flag_type}>'
+
+    @staticmethod
+    def pending_flagged_ids(review_ids=(), media_link_ids=()):
+        """
+        Find which of the given reviews and media links have an unresolved flag.
+
+        Args:
+            review_ids: Review IDs to check
+            media_link_ids: MediaLink IDs to check
+
+        Returns:
+            tuple: (set of flagged review IDs, set of flagged media link IDs)
+        """
+        selects = []
+        if review_ids:
+            selects.append(db.select(db.literal('review').label('kind'), ContentFlag.review_id.label('content_id'))
+                           .where(ContentFlag.is_resolved == False, ContentFlag.review_id.in_(review_ids)))
+        if media_link_ids:
+            selects.append(db.select(db.literal('media_link').label('kind'), ContentFlag.media_link_id.label('content_id'))
+                           .where(ContentFlag.is_resolved == False, ContentFlag.media_link_id.in_(media_link_ids)))
+
+        flagged_reviews, flagged_media_links = set(), set()
+        if not selects:
+            return flagged_reviews, flagged_media_links
+
+        # One round trip; UNION ALL lets each half use its own partial index
+        statement = db.union_all(*selects) if len(selects) > 1 else selects[0]
+        for kind, content_id in db.session.execute(statement):
+            (flagged_reviews if kind == 'review' else flagged_media_links).add(content_id)
+        return flagged_reviews, flagged_media_links
+
+
+class StatisticsSnapshot(db.Model):
+    """
+    Precomputed admin statistics. Each refresh stores a new row; the admin
+    statistics page renders from the newest row whose schema_version matches
+    the code, instead of running every aggregate query per page view.
+    """
+    __tablename__ = 'statistics_snapshot'
+
+    id = db.Column(db.Integer, primary_key=True)
+    schema_version = db.Column(db.Integer, nullable=False)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    computed_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # None when run from the CLI
+    data = db.Column(db.JSON, nullable=False)
+
+    computed_by = db.relationship('User', foreign_keys=[computed_by_id])
+
+    def __repr__(self):
+        return f'<StatisticsSnapshot {self.id} v{self.schema_version} at {self.computed_at}>'
+
+
+class DailyActivity(db.Model):
+    """
+    Per-day activity counts by judge state and federal/state court, so growth
+    metrics for any date range sum a few hundred rows instead of scanning the
+    content tables. Counts are filed under the day the content was created and
+    kept current by the submission and moderation handlers through the
+    record_* methods, which add to the session's transaction without committing.
+    """
+    __tablename__ = 'daily_activity'
+
+    day = db.Column(db.Date, primary_key=True)
+    state = db.Column(db.String(2), primary_key=True)  # '' for site-wide counts (new users)
+    is_federal = db.Column(db.Boolean, primary_key=True)
+
+    # Reviews and concern types
+    review_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+    fairness_count = db.Column(db.Integer, default=0, nullable=False)
+    bias_count = db.Column(db.Integer, default=0, nullable=False)
+    temperament_count = db.Column(db.Integer, default=0, nullable=False)
+    concern_count = db.Column(db.Integer, default=0, nullable=False)  # Reviews with any concern
+
+    # Media links (all submitted, and currently verified)
+    media_count = db.Column(db.Integer, default=0, nullable=False)
+    verified_media_count = db.Column(db.Integer, default=0, nullable=False)
+
+    # Registrations (site-wide rows only)
+    user_count = db.Column(db.Integer, default=0, nullable=False)
+
+    COUNT_COLUMNS = ('review_count', 'rating_sum', 'fairness_count', 'bias_count', 'temperament_count',
+                     'concern_count', 'media_count', 'verified_media_count', 'user_count')
+
     def __repr__(self):
-        return f'<ContentFlag {self.id} - {self.flag_type}>'
\ No newline at end of file
+        return f'<DailyActivity {self.day} {self.state or "site"} federal={self.is_federal}>'
+
+    @staticmethod
+    def _day(created_at):
+        # Pending rows have no created_at until flush; the column default is utcnow
+        return (created_at or datetime.utcnow()).date()
+
+    @staticmethod
+    def record(day, state='', is_federal=False, **deltas):
+        """
+        Add deltas (column name -> signed amount) to one day's row, creating it
+        if needed. Runs as a single upsert so concurrent submissions can't lose
+        each other's increments.
+        """
+        deltas = {column: amount for column, amount in deltas.items() if amount}
+        if not deltas:
+            return
+
+        values = dict({column: 0 for column in DailyActivity.COUNT_COLUMNS}, **deltas)
+        values.update(day=day, state=state, is_federal=bool(is_federal))
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            row = db.session.get(DailyActivity, (day, state, bool(is_federal)))
+            if row is None:
+                row = DailyActivity(**values)
+                db.session.add(row)
+            else:
+                for column, amount in deltas.items():
+                    setattr(row, column, getattr(row, column) + amount)
+            return
+
+        statement = insert(DailyActivity).values(**values)
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['day', 'state', 'is_federal'],
+            set_={column: getattr(DailyActivity, column) + statement.excluded[column] for column in deltas}
+        ))
+
+    @staticmethod
+    def review_deltas(review, sign=1):
+        """Counts a review contributes to its day's row, multiplied by sign"""
+        concerns = (review.fairness_concern, review.bias_concern, review.temperament_concern)
+        return {
+            'review_count': sign,
+            'rating_sum': sign * review.rating,
+            'fairness_count': sign if review.fairness_concern else 0,
+            'bias_count': sign if review.bias_concern else 0,
+            'temperament_count': sign if review.temperament_concern else 0,
+            'concern_count': sign if any(concerns) else 0,
+        }
+
+    @staticmethod
+    def media_link_deltas(media_link, sign=1):
+        """Counts a media link contributes to its day's row, multiplied by sign"""
+        return {
+            'media_count': sign,
+            'verified_media_count': sign if media_link.is_verified else 0,
+        }
+
+    @staticmethod
+    def record_review(review, judge=None, sign=1, previous=None):
+        """
+        Count a new review (sign=1) or remove a deleted one (sign=-1). For an
+        edit, pass previous=review_deltas(review, sign=-1) taken before the change.
+        """
+        judge = judge or review.judge
+        deltas = DailyActivity.review_deltas(review, sign)
+        for column, amount in (previous or {}).items():
+            deltas[column] = deltas.get(column, 0) + amount
+        DailyActivity.record(DailyActivity._day(review.created_at), judge.state, judge.is_federal, **deltas)
+
+    @staticmethod
+    def record_media_link(media_link, judge=None, sign=1):
+        """Count a new media link (sign=1) or remove a deleted one (sign=-1)"""
+        judge = judge or media_link.judge
+        DailyActivity.record(DailyActivity._day(media_link.created_at), judge.state, judge.is_federal,
+                             **DailyActivity.media_link_deltas(media_link, sign))
+
+    @staticmethod
+    def record_verification(media_link, sign=1):
+        """Count a media link becoming verified (sign=1) or losing verification (sign=-1)"""
+        judge = media_link.judge
+        DailyActivity.record(DailyActivity._day(media_link.created_at), judge.state, judge.is_federal,
+                             verified_media_count=sign)
+
+    @staticmethod
+    def record_user(user, sign=1):
+        """Count a registration (sign=1) or remove a deleted account (sign=-1)"""
+        DailyActivity.record(DailyActivity._day(user.created_at), user_count=sign)
+
+    @staticmethod
+    def remove_judge(judge):
+        """
+        Remove a deleted judge's reviews and media links. Each table is grouped
+        by day in SQL and subtracted with one INSERT ... SELECT upsert, so the
+        statement count does not grow with the judge's content. Call before
+        the content is deleted.
+        """
+        from sqlalchemy import func, case, literal
+
+        dialect = db.session.get_bind().dialect.name
+
+        def day(column):
+            # Same day boundaries as _day() and the rollup backfill
+            return db.cast(column, db.Date) if dialect == 'postgresql' else func.date(column)
+
+        def negated_count_if(condition):
+            return -func.sum(case((condition, 1), else_=0))
+
+        review_day = day(Review.created_at)
+        media_day = day(MediaLink.created_at)
+        groups = [
+            (review_day, Review.created_at, Review.judge_id, {
+                'review_count': -func.count(Review.id),
+                'rating_sum': -func.sum(Review.rating),
+                'fairness_count': negated_count_if(Review.fairness_concern == True),
+                'bias_count': negated_count_if(Review.bias_concern == True),
+                'temperament_count': negated_count_if(Review.temperament_concern == True),
+                'concern_count': negated_count_if(db.or_(Review.fairness_concern == True,
+                                                         Review.bias_concern == True,
+                                                         Review.temperament_concern == True)),
+            }),
+            (media_day, MediaLink.created_at, MediaLink.judge_id, {
+                'media_count': -func.count(MediaLink.id),
+                'verified_media_count': negated_count_if(MediaLink.is_verified == True),
+            }),
+        ]
+
+        columns = ['day', 'state', 'is_federal', *DailyActivity.COUNT_COLUMNS]
+        for day_expression, created_at, judge_id, deltas in groups:
+            select = db.select(
+                day_expression, literal(judge.state), literal(bool(judge.is_federal)),
+                *[deltas.get(column, literal(0)) for column in DailyActivity.COUNT_COLUMNS]
+            ).where(judge_id == judge.id, created_at.isnot(None)).group_by(day_expression)
+
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert
+            elif dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                for row_day, state, is_federal, *counts in db.session.execute(select):
+                    DailyActivity.record(row_day, state, is_federal, **dict(zip(DailyActivity.COUNT_COLUMNS, counts)))
+                continue
+
+            statement = insert(DailyActivity).from_select(columns, select)
+            db.session.execute(statement.on_conflict_do_update(
+                index_elements=['day', 'state', 'is_federal'],
+                set_={column: getattr(DailyActivity, column) + statement.excluded[column] for column in deltas}
+            ))
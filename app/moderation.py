@@ -0,0 +1,181 @@
+from collections import Counter
+from datetime import datetime
+
+from app import db
+from app.models import (User, UserStats, Judge, JudgeStats, Review, MediaLink, BannedUser, AdminLog,
+                        ContentFlag, DailyActivity, StatisticsSnapshot)
+
+# Bulk moderation works on whole sets of rows with a fixed handful of
+# UPDATE, INSERT and DELETE statements. Nothing here commits: the caller
+# commits once, so an action is applied completely or not at all, and
+# sends any notifications only after that commit succeeds.
+
+
+def _log(admin, action_type, entries):
+    """Insert one admin_log row per (target_user_id, details) pair in a single statement"""
+    if entries:
+        db.session.execute(db.insert(AdminLog), [{
+            'admin_id': admin.id,
+            'action_type': action_type,
+            'target_user_id': target_user_id,
+            'details': details,
+        } for target_user_id, details in entries])
+
+
+def _ban(admin, users, reason):
+    # Flag the accounts and record their banned_user rows, skipping anyone
+    # already banned; returns the users that changed
+    targets = [user for user in users if not user.is_banned]
+    if not targets:
+        return []
+
+    now = datetime.utcnow()
+    db.session.execute(
+        db.update(User).where(User.id.in_([user.id for user in targets])).values(
+            is_banned=True, ban_reason=reason, banned_at=now, banned_by_id=admin.id
+        )
+    )
+    db.session.execute(db.insert(BannedUser), [{
+        'username': user.username,
+        'email': user.email,
+        'user_id': user.id,
+        'ban_reason': reason,
+        'banned_by_id': admin.id,
+        'banned_at': now,
+    } for user in targets])
+    return targets
+
+
+def bulk_ban(admin, users, reason):
+    """
+    Ban every user in users that is not banned yet.
+
+    Returns:
+        list: Users that were banned, for notifications
+    """
+    banned = _ban(admin, users, reason)
+    _log(admin, 'ban_user', [(user.id, f'Bulk banned user. Reason: {reason}') for user in banned])
+    return banned
+
+
+def bulk_unban(admin, users):
+    """
+    Lift the ban on every banned user in users and close their open
+    banned_user records (kept as history).
+
+    Returns:
+        list: Users that were unbanned, for notifications
+    """
+    targets = [user for user in users if user.is_banned]
+    if not targets:
+        return []
+
+    db.session.execute(
+        db.update(User).where(User.id.in_([user.id for user in targets])).values(
+            is_banned=False, ban_reason=None, banned_at=None, banned_by_id=None
+        )
+    )
+    db.session.execute(
+        db.update(BannedUser).where(
+            db.tuple_(BannedUser.username, BannedUser.email).in_([(user.username, user.email) for user in targets]),
+            BannedUser.is_unbanned == False
+        ).values(is_unbanned=True, unbanned_at=datetime.utcnow())
+    )
+    _log(admin, 'unban_user', [(user.id, 'Bulk unbanned user') for user in targets])
+    return targets
+
+
+def bulk_delete(admin, users, reason):
+    """
+    Permanently delete users, banning their username and email first so they
+    cannot re-register. Their reviews and media links are kept anonymously.
+
+    Returns:
+        list: (username, email) of the deleted users
+    """
+    if not users:
+        return []
+
+    user_ids = [user.id for user in users]
+    deleted = [(user.username, user.email) for user in users]
+
+    _ban(admin, users, reason)
+
+    # The log rows outlive the accounts, so they name the user in details
+    # and existing rows about these users stop pointing at them
+    db.session.execute(
+        db.update(AdminLog).where(AdminLog.target_user_id.in_(user_ids)).values(target_user_id=None)
+    )
+    _log(admin, 'delete_user', [(None, f'Deleted user {username} ({email})') for username, email in deleted])
+
+    for day, count in Counter(DailyActivity._day(user.created_at) for user in users).items():
+        DailyActivity.record(day, user_count=-count)
+
+    db.session.execute(db.update(Review).where(Review.user_id.in_(user_ids)).values(user_id=None))
+    db.session.execute(db.update(MediaLink).where(MediaLink.user_id.in_(user_ids)).values(user_id=None))
+    db.session.execute(db.delete(UserStats).where(UserStats.user_id.in_(user_ids)))
+
+    # Everything else that points at the accounts keeps its row without the
+    # user: flags they raised or resolved, bans and log entries they made
+    # (demoted admins), and anyone they banned
+    for column in (ContentFlag.user_id, ContentFlag.resolved_by_id, BannedUser.banned_by_id,
+                   User.banned_by_id, AdminLog.admin_id, StatisticsSnapshot.computed_by_id):
+        db.session.execute(
+            db.update(column.class_).where(column.in_(user_ids)).values({column.key: None}),
+            execution_options={'synchronize_session': False}
+        )
+
+    db.session.execute(db.delete(User).where(User.id.in_(user_ids)))
+    return deleted
+
+
+def delete_judge(admin, judge):
+    """
+    Permanently delete a judge with all of their reviews and media links,
+    the flags on that content and the content's user_stats contribution.
+    Admin log rows about the content are kept with their targets cleared.
+
+    Runs a fixed number of statements however much content the judge has.
+    The same rules are declared as ON DELETE actions on the foreign keys;
+    the explicit statements keep SQLite, which does not enforce them by
+    default, consistent with PostgreSQL.
+    """
+    review_ids = db.select(Review.id).where(Review.judge_id == judge.id)
+    media_link_ids = db.select(MediaLink.id).where(MediaLink.judge_id == judge.id)
+    bulk = {'synchronize_session': False}
+    details = f'Deleted judge {judge.full_name()} (ID: {judge.id}, Court: {judge.court})'
+
+    DailyActivity.remove_judge(judge)
+
+    # Recount the authors' reviews without this judge's, before they go
+    other_reviews = db.select(db.func.count(Review.id)).where(
+        Review.user_id == UserStats.user_id, Review.judge_id != judge.id
+    ).scalar_subquery()
+    db.session.execute(
+        db.update(UserStats).where(
+            UserStats.user_id.in_(db.select(Review.user_id).where(Review.judge_id == judge.id))
+        ).values(review_count=other_reviews, updated_at=datetime.utcnow()),
+        execution_options=bulk
+    )
+
+    db.session.execute(
+        db.delete(ContentFlag).where(
+            db.or_(ContentFlag.review_id.in_(review_ids), ContentFlag.media_link_id.in_(media_link_ids))
+        ),
+        execution_options=bulk
+    )
+    db.session.execute(
+        db.update(AdminLog).where(AdminLog.target_review_id.in_(review_ids)).values(target_review_id=None),
+        execution_options=bulk
+    )
+    db.session.execute(
+        db.update(AdminLog).where(AdminLog.target_media_link_id.in_(media_link_ids)).values(target_media_link_id=None),
+        execution_options=bulk
+    )
+
+    db.session.execute(db.delete(Review).where(Review.judge_id == judge.id), execution_options=bulk)
+    db.session.execute(db.delete(MediaLink).where(MediaLink.judge_id == judge.id), execution_options=bulk)
+    db.session.execute(db.delete(JudgeStats).where(JudgeStats.judge_id == judge.id), execution_options=bulk)
+    db.session.execute(db.delete(Judge).where(Judge.id == judge.id))
+
+    _log(admin, 'delete_judge', [(None, details)])
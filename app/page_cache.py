@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUPageCache:
+    """In-process cache of rendered pages, bounded by entry count and age"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries=1000, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+class RedisPageCache:
+    """Cache shared by every worker process, backed by Redis"""
+
+    name = 'redis'
+
+    def __init__(self, url, ttl=3600, prefix='page_cache:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("PAGE_CACHE_BACKEND is 'redis' but the redis package is not installed")
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self._client.get(self.prefix + key)
+        self._client.incr(self.prefix + ('hits' if value is not None else 'misses'))
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key, value):
+        self._client.set(self.prefix + key, value.encode('utf-8'), ex=self.ttl)
+
+    def delete(self, key):
+        self._client.delete(self.prefix + key)
+
+    def stats(self):
+        hits, misses = self._client.mget(self.prefix + 'hits', self.prefix + 'misses')
+        return {'hits': int(hits or 0), 'misses': int(misses or 0), 'entries': None}
+
+
+class PageCache:
+    """
+    Server-side cache of rendered public pages.
+
+    Each entry is stored with the version of the content it was rendered
+    from (the judge's judge_stats.updated_at) and only served while that
+    version is current, so a worker whose in-process cache never saw an
+    invalidation still cannot serve a stale page. Handlers that change the
+    content also invalidate explicitly to free the entry; the TTL is only a
+    safety net. The backend is picked by PAGE_CACHE_BACKEND: 'memory'
+    (default), 'redis' (uses PAGE_CACHE_URL) or 'none' to disable caching.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend = app.config.get('PAGE_CACHE_BACKEND', 'memory')
+        ttl = app.config.get('PAGE_CACHE_TTL', 3600)
+
+        if backend == 'memory':
+            self.backend = LRUPageCache(max_entries=app.config.get('PAGE_CACHE_MAX_ENTRIES', 1000), ttl=ttl)
+        elif backend == 'redis':
+            self.backend = RedisPageCache(app.config['PAGE_CACHE_URL'], ttl=ttl)
+        elif backend in (None, 'none'):
+            self.backend = None
+        else:
+            raise RuntimeError(f"Unknown PAGE_CACHE_BACKEND: {backend}")
+
+    @staticmethod
+    def _judge_key(judge_id):
+        return f'judge:{judge_id}'
+
+    def get_judge_page(self, judge_id, version):
+        """Return the cached HTML for a judge profile rendered at version, or None"""
+        if self.backend is None:
+            return None
+        entry = self.backend.get(self._judge_key(judge_id))
+        if entry is None:
+            return None
+        entry_version, _, html = entry.partition('\n')
+        return html if entry_version == str(version) else None
+
+    def set_judge_page(self, judge_id, version, html):
+        if self.backend is not None:
+            self.backend.set(self._judge_key(judge_id), f'{version}\n{html}')
+
+    def invalidate_judge(self, *judge_ids):
+        """Drop cached pages for judges whose content just changed (call after commit)"""
+        if self.backend is not None:
+            for judge_id in judge_ids:
+                self.backend.delete(self._judge_key(judge_id))
+
+    def stats(self):
+        """Hit/miss counters for the active backend"""
+        if self.backend is None:
+            return {'backend': 'none', 'hits': 0, 'misses': 0, 'entries': None}
+        return dict(self.backend.stats(), backend=self.backend.name)
@@ -0,0 +1,116 @@
+import base64
+import json
+from collections import namedtuple
+from datetime import datetime, date
+
+from app import db
+
+KeysetPage = namedtuple('KeysetPage', ['items', 'next_cursor', 'prev_cursor'])
+
+
+def encode_cursor(values):
+    """
+    Encode a row's sort key values as an opaque, URL-safe cursor string.
+
+    Args:
+        values (list): Sort key values for one row, in key order
+
+    Returns:
+        str: Cursor suitable for a query string parameter
+    """
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            value = {'dt': value.isoformat()}
+        elif isinstance(value, date):
+            value = {'d': value.isoformat()}
+        encoded.append(value)
+    raw = json.dumps(encoded, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Returns:
+        list or None: Sort key values, or None if the cursor is missing or malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list):
+            return None
+        decoded = []
+        for value in values:
+            if isinstance(value, dict) and 'dt' in value:
+                value = datetime.fromisoformat(value['dt'])
+            elif isinstance(value, dict) and 'd' in value:
+                value = date.fromisoformat(value['d'])
+            elif isinstance(value, (dict, list)):
+                return None
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError):
+        return None
+
+
+def _seek_clause(keys, values, backwards):
+    """
+    Build the row-value comparison "(k1, k2, ...) > (v1, v2, ...)" honouring
+    per-key sort direction, expanded into OR/AND form so it works on every
+    backend (including mixed ASC/DESC orderings).
+    """
+    clauses = []
+    for i, (expr, descending) in enumerate(keys):
+        after = descending == backwards  # ascending forward, or descending backward
+        condition = expr > values[i] if after else expr < values[i]
+        equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+        clauses.append(db.and_(*equal_prefix, condition))
+    return db.or_(*clauses)
+
+
+def keyset_page(query, keys, per_page, after=None, before=None):
+    """
+    Fetch one page of a query using seek (keyset) pagination instead of OFFSET,
+    so the cost of a page does not depend on how deep into the result it is.
+
+    Args:
+        query: SQLAlchemy query to paginate (any existing ORDER BY is replaced)
+        keys (list): (expression, descending) pairs; the last key must be unique, e.g. a primary key
+        per_page (int): Maximum rows per page
+        after (str, optional): Cursor of the last row on the previous page
+        before (str, optional): Cursor of the first row on the following page
+
+    Returns:
+        KeysetPage: items for this page plus cursors for the neighbouring pages (None at either end)
+    """
+    backwards = before is not None
+    cursor = decode_cursor(before if backwards else after)
+    if cursor is not None and len(cursor) != len(keys):
+        cursor = None
+    if cursor is None:
+        backwards = False
+    else:
+        query = query.filter(_seek_clause(keys, cursor, backwards))
+
+    order_by = [expr.asc() if descending == backwards else expr.desc() for expr, descending in keys]
+    rows = query.add_columns(*[expr for expr, _ in keys]).order_by(None).order_by(*order_by).limit(per_page + 1).all()
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        rows.reverse()
+
+    n = len(keys)
+    items = [row[0] if len(row) == n + 1 else tuple(row[:-n]) for row in rows]
+    if not rows:
+        return KeysetPage(items, None, None)
+
+    has_next = True if backwards else has_more
+    has_prev = has_more if backwards else cursor is not None
+    next_cursor = encode_cursor(list(rows[-1][-n:])) if has_next else None
+    prev_cursor = encode_cursor(list(rows[0][-n:])) if has_prev else None
+    return KeysetPage(items, next_cursor, prev_cursor)
@@ -1,13 +1,25 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, jsonify, session
 from flask_login import login_required, current_user
 from wtforms.validators import ValidationError
-from app import db, limiter
-from app.models import Judge, Review, MediaLink, User, ContentFlag
+from app import db, limiter, page_cache
+from app.models import Judge, JudgeStats, Review, MediaLink, User, ContentFlag, DailyActivity, UserStats, AdminLog
 from app.forms import ReviewForm, MediaLinkForm
-from app.court_data import STATES, COURTS_BY_STATE
+from app.court_data import STATES
+from app.court_catalog import courts_for_state, is_valid_court, courts_json, catalog_version
+from app.pagination import keyset_page
+from app.search import search_judges
+from app.http_cache import conditional_page
+from app.geography import geographic_rollup
 
 bp = Blueprint('main', __name__)
 
+JUDGES_PER_PAGE = 50
+SUGGEST_LIMIT = 8
+SUGGEST_MIN_CHARS = 2
+REVIEWS_PER_PAGE = 20
+MEDIA_LINKS_PER_PAGE = 10
+STATE_CHOICES = [('', 'Select a state...')] + STATES
+
 
 @bp.route('/health')
 def health():
@@ -20,34 +32,92 @@ def health():
         return {'status': 'error'}, 500
 
 
+def _has_reviews():
+    """EXISTS clause matching judges with at least one review"""
+    return db.exists().where(Review.judge_id == Judge.id)
+
+
+def _has_verified_media():
+    """EXISTS clause matching judges with at least one verified media link"""
+    return db.exists().where(MediaLink.judge_id == Judge.id, MediaLink.is_verified == True)
+
+
+def _judge_sort_keys(sort_by, rank=None):
+    """
+    Ordered (expression, descending) pairs for a SearchForm sort option.
+    Aggregate keys read from judge_stats, which is outer-joined by the caller.
+    Relevance ordering uses the search rank and falls back to name order when
+    there is no search term.
+    """
+    last_name = db.func.lower(Judge.last_name)
+    first_name = db.func.lower(Judge.first_name)
+    review_count = db.func.coalesce(JudgeStats.review_count, 0)
+    media_count = db.func.coalesce(JudgeStats.verified_media_count, 0)
+    avg_rating = db.func.coalesce(JudgeStats.avg_rating, 0)
+    by_name = [(last_name, False), (first_name, False)]
+
+    if sort_by == 'relevance' and rank is not None:
+        return [(rank, False)] + by_name
+    elif sort_by == 'name_desc':
+        return [(last_name, True), (first_name, True)]
+    elif sort_by == 'rating_desc':
+        return [(avg_rating, True)] + by_name
+    elif sort_by == 'rating_asc':
+        return [(avg_rating, False)] + by_name
+    elif sort_by == 'reviews_desc':
+        return [(review_count, True)] + by_name
+    elif sort_by == 'reviews_asc':
+        return [(review_count, False)] + by_name
+    elif sort_by == 'media_desc':
+        return [(media_count, True)] + by_name
+    elif sort_by == 'documented_desc':
+        return [(review_count + media_count, True)] + by_name
+    return by_name
+
+
 @bp.route('/index', methods=['GET', 'POST'])
 def index():
+    if current_user.is_anonymous and request.method == 'GET':
+        last_deletion, last_modified = _directory_version()
+        return conditional_page(_render_index, last_deletion, last_modified, last_modified=last_modified)
+    return _render_index()
+
+
+def _directory_version():
+    """
+    (last judge deletion, last change) pair identifying the public directory
+    state. Every listing change refreshes a judge_stats row and every judge
+    deletion is logged, so this changes whenever any directory figure does.
+    Both maxima are read from indexes (judge_stats.updated_at, and the few
+    delete_judge rows found through admin_log.action_type).
+    """
+    last_modified = db.select(db.func.max(JudgeStats.updated_at)).scalar_subquery()
+    last_deletion = db.select(db.func.max(AdminLog.id)).where(
+        AdminLog.action_type == 'delete_judge'
+    ).scalar_subquery()
+    last_modified, last_deletion = db.session.execute(db.select(last_modified, last_deletion)).one()
+    return last_deletion, last_modified
+
+
+def _render_index():
     from app.forms import SearchForm
-    form = SearchForm()
+    form = SearchForm(request.values)
 
     # Populate state filter choices
     form.filter_state.choices = [('', 'All States')] + STATES
 
-    # Start with base query
-    query = Judge.query
+    # Start with base query — aggregates come along in the same SELECT
+    query = Judge.query.outerjoin(JudgeStats).options(db.contains_eager(Judge.stats))
 
     # Track active filters for display
     active_filters = []
+    rank = None
 
-    if form.validate_on_submit():
+    if form.validate():
         # Apply search filter
         if form.search_query.data:
             search_query = form.search_query.data
-            query = query.filter(
-                db.or_(
-                    Judge.first_name.ilike(f'%{search_query}%'),
-                    Judge.last_name.ilike(f'%{search_query}%'),
-                    Judge.court.ilike(f'%{search_query}%'),
-                    Judge.city.ilike(f'%{search_query}%'),
-                    Judge.state.ilike(f'%{search_query}%'),
-                    db.func.concat(Judge.first_name, ' ', Judge.last_name).ilike(f'%{search_query}%')
-                )
-            )
+            query, rank = search_judges(query, search_query)
             active_filters.append(('search', f'Search: "{search_query}"'))
 
         # Apply state filter
@@ -71,67 +141,209 @@ def index():
             query = query.filter(Judge.is_retired == True)
             active_filters.append(('retired', 'Retired Only'))
 
-        # Get results with cap
-        judges = query.limit(500).all()
-
-        # Apply content filter (must be done after getting results)
+        # Apply content filter
         if form.filter_content.data == 'has_reviews':
-            judges = [j for j in judges if j.review_count() > 0]
+            query = query.filter(_has_reviews())
             active_filters.append(('content', 'Has Reviews'))
         elif form.filter_content.data == 'has_media':
-            judges = [j for j in judges if j.media_link_count() > 0]
+            query = query.filter(_has_verified_media())
             active_filters.append(('content', 'Has Media'))
         elif form.filter_content.data == 'has_both':
-            judges = [j for j in judges if j.review_count() > 0 and j.media_link_count() > 0]
+            query = query.filter(_has_reviews(), _has_verified_media())
             active_filters.append(('content', 'Has Reviews & Media'))
 
-        # Apply sorting
-        if form.sort_by.data == 'name_asc':
-            judges.sort(key=lambda j: (j.last_name.lower(), j.first_name.lower()))
-        elif form.sort_by.data == 'name_desc':
-            judges.sort(key=lambda j: (j.last_name.lower(), j.first_name.lower()), reverse=True)
-        elif form.sort_by.data == 'rating_desc':
-            judges.sort(key=lambda j: j.average_rating(), reverse=True)
-        elif form.sort_by.data == 'rating_asc':
-            judges.sort(key=lambda j: j.average_rating())
-        elif form.sort_by.data == 'reviews_desc':
-            judges.sort(key=lambda j: j.review_count(), reverse=True)
-        elif form.sort_by.data == 'reviews_asc':
-            judges.sort(key=lambda j: j.review_count())
-        elif form.sort_by.data == 'media_desc':
-            judges.sort(key=lambda j: j.media_link_count(), reverse=True)
-        elif form.sort_by.data == 'documented_desc':
-            judges.sort(key=lambda j: (j.review_count() + j.media_link_count()), reverse=True)
+        sort_by = form.sort_by.data
     else:
-        judges = query.limit(500).all()
-        judges.sort(key=lambda j: (j.last_name.lower(), j.first_name.lower()))
+        sort_by = 'relevance'
+
+    # Seek-based paging on (sort key, id) keeps every page the same cost
+    page = keyset_page(
+        query,
+        _judge_sort_keys(sort_by, rank) + [(Judge.id, False)],
+        per_page=JUDGES_PER_PAGE,
+        after=request.args.get('after'),
+        before=request.args.get('before')
+    )
+
+    # Carry the current filters onto the next/previous page links
+    search_args = {field.name: field.data for field in form
+                   if field.name != 'search_submit' and field.data}
+
+    return render_template('index.html', judges=page.items, form=form, active_filters=active_filters,
+                           next_cursor=page.next_cursor, prev_cursor=page.prev_cursor,
+                           search_args=search_args)
+
+
+@bp.route('/directory')
+def directory():
+    """Judges, reviews and media coverage per state"""
+    last_deletion, last_modified = _directory_version()
+    return conditional_page(_render_directory, last_deletion, last_modified, last_modified=last_modified)
+
+
+def _render_directory():
+    return render_template('directory.html', rollup=geographic_rollup(), state_names=dict(STATES))
+
+
+@bp.route('/directory/<state>')
+def directory_state(state):
+    """Judges, reviews and media coverage per court within a state"""
+    from flask import abort
+    state = state.upper()
+    if state not in dict(STATES):
+        abort(404)
+    last_deletion, last_modified = _directory_version()
+    return conditional_page(lambda: _render_directory_state(state), last_deletion, last_modified,
+                            last_modified=last_modified)
+
+
+def _render_directory_state(state):
+    return render_template('directory_state.html', state=state, state_name=dict(STATES)[state],
+                           rollup=geographic_rollup(by_court=True, state=state))
+
+
+@bp.route('/api/judges/suggest')
+@limiter.limit("60 per minute")
+def suggest_judges():
+    """Typeahead suggestions: top matching judges as compact JSON"""
+
+    search_query = ' '.join(request.args.get('q', '').split())[:100]
+    results = []
+
+    if len(search_query) >= SUGGEST_MIN_CHARS:
+        query = db.session.query(Judge.id, Judge.first_name, Judge.last_name, Judge.court, Judge.state)
+        query, rank = search_judges(query, search_query)
+        order_by = [rank] if rank is not None else []
+        rows = query.order_by(*order_by, Judge.last_name, Judge.first_name, Judge.id).limit(SUGGEST_LIMIT).all()
+        results = [
+            {'id': row.id, 'name': f'{row.first_name} {row.last_name}', 'court': row.court, 'state': row.state}
+            for row in rows
+        ]
+
+    response = jsonify(results)
+    # Suggestions only change when judges are added or renamed, so let
+    # browsers and any CDN reuse them and revalidate via ETag
+    response.headers['Cache-Control'] = 'public, max-age=300, stale-while-revalidate=3600'
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _judge_reviews_page(judge_id, after=None):
+    """One newest-first page of a judge's reviews"""
+    return keyset_page(
+        Review.query.filter(Review.judge_id == judge_id),
+        [(Review.created_at, True), (Review.id, True)],
+        per_page=REVIEWS_PER_PAGE,
+        after=after
+    )
+
+
+def _judge_media_page(judge_id, after=None):
+    """One newest-first page of a judge's verified media links"""
+    return keyset_page(
+        MediaLink.query.filter(MediaLink.judge_id == judge_id, MediaLink.is_verified == True),
+        [(MediaLink.created_at, True), (MediaLink.id, True)],
+        per_page=MEDIA_LINKS_PER_PAGE,
+        after=after
+    )
+
+
+def _mark_pending_flags(reviews=(), media_links=()):
+    """Set has_pending_flag on displayed content (only shown to logged-in users)"""
+    flagged_reviews, flagged_media_links = set(), set()
+    if current_user.is_authenticated:
+        flagged_reviews, flagged_media_links = ContentFlag.pending_flagged_ids(
+            review_ids=[review.id for review in reviews],
+            media_link_ids=[media_link.id for media_link in media_links]
+        )
+    for review in reviews:
+        review.has_pending_flag = review.id in flagged_reviews
+    for media_link in media_links:
+        media_link.has_pending_flag = media_link.id in flagged_media_links
 
-    return render_template('index.html', judges=judges, form=form, active_filters=active_filters)
 
+@bp.app_template_global()
+def courts_url():
+    """URL of the per-state court list endpoint, with __STATE__ as a placeholder for the JS to fill in"""
+    return url_for('main.court_list', state='__STATE__', v=catalog_version())
 
-@bp.route('/judge/<int:judge_id>')
-def judge(judge_id):
-    judge = Judge.query.get_or_404(judge_id)
-    reviews = judge.reviews.limit(200).all()
-    media_links = judge.media_links.limit(200).all() if hasattr(judge.media_links, 'limit') else judge.media_links[:200]
 
-    # Check for pending flags on each review
-    for review in reviews:
-        pending_flag = ContentFlag.query.filter_by(
-            review_id=review.id,
-            is_resolved=False
-        ).first()
-        review.has_pending_flag = pending_flag is not None
+@bp.route('/api/courts/<state>.json')
+@limiter.limit("60 per minute")
+def court_list(state):
+    """Court names for one state, fetched by the submit/edit forms when a state is picked"""
+    from flask import abort
+    payload = courts_json(state.upper())
+    if payload is None:
+        abort(404)
+
+    response = current_app.response_class(payload, mimetype='application/json')
+    if request.args.get('v') == catalog_version():
+        # The versioned URL changes whenever the catalog does, so it never goes stale
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+    response.set_etag(catalog_version())
+    return response.make_conditional(request)
 
-    # Check for pending flags on each media link
-    for media_link in media_links:
-        pending_flag = ContentFlag.query.filter_by(
-            media_link_id=media_link.id,
-            is_resolved=False
-        ).first()
-        media_link.has_pending_flag = pending_flag is not None
 
-    return render_template('judge.html', judge=judge, reviews=reviews, media_links=media_links)
+@bp.route('/judge/<int:judge_id>')
+def judge(judge_id):
+    if current_user.is_anonymous:
+        updated_at = db.session.query(JudgeStats.updated_at).filter(JudgeStats.judge_id == judge_id).scalar()
+        if updated_at is not None:
+            return conditional_page(lambda: _render_judge(judge_id, updated_at), updated_at,
+                                    last_modified=updated_at)
+    return _render_judge(judge_id)
+
+
+def _render_judge(judge_id, version=None):
+    # Anonymous views of the first page are identical for everyone, so serve
+    # them from the page cache, keyed to the judge_stats version they were
+    # rendered from. Pending flashes would be baked into the HTML.
+    cacheable = (version is not None and current_user.is_anonymous and not request.args
+                 and '_flashes' not in session)
+    if cacheable:
+        html = page_cache.get_judge_page(judge_id, version)
+        if html is not None:
+            return html
+
+    judge = Judge.query.options(db.joinedload(Judge.stats)).get_or_404(judge_id)
+
+    # Only one page of each list is rendered; the rest is fetched on demand
+    # from the load-more endpoints below (or via these cursors without JS)
+    review_page = _judge_reviews_page(judge.id, after=request.args.get('reviews_after'))
+    media_page = _judge_media_page(judge.id, after=request.args.get('media_after'))
+    _mark_pending_flags(review_page.items, media_page.items)
+
+    html = render_template('judge.html', judge=judge, review_page=review_page, media_page=media_page)
+    if cacheable:
+        page_cache.set_judge_page(judge_id, version, html)
+    return html
+
+
+@bp.route('/api/judges/<int:judge_id>/reviews')
+@limiter.limit("60 per minute")
+def judge_reviews_more(judge_id):
+    """Next page of a judge's reviews as an HTML fragment for the load more button"""
+    page = _judge_reviews_page(judge_id, after=request.args.get('after'))
+    _mark_pending_flags(reviews=page.items)
+    return jsonify({
+        'html': render_template('judge_review_list.html', reviews=page.items),
+        'next_cursor': page.next_cursor
+    })
+
+
+@bp.route('/api/judges/<int:judge_id>/media')
+@limiter.limit("60 per minute")
+def judge_media_more(judge_id):
+    """Next page of a judge's verified media links as an HTML fragment for the load more button"""
+    page = _judge_media_page(judge_id, after=request.args.get('after'))
+    _mark_pending_flags(media_links=page.items)
+    return jsonify({
+        'html': render_template('judge_media_list.html', media_links=page.items),
+        'next_cursor': page.next_cursor
+    })
 
 
 @bp.route('/submit_review', methods=['GET', 'POST'])
@@ -140,7 +352,7 @@ def judge(judge_id):
 def submit_review():
     form = ReviewForm()
 
-    form.state.choices = [('', 'Select a state...')] + STATES
+    form.state.choices = STATE_CHOICES
     form.court.choices = []  # Will be populated by JavaScript
 
     # Check if judge_id is provided in URL (GET) or hidden field (POST)
@@ -158,11 +370,6 @@ def submit_review():
             form.is_federal.data = prefilled_judge.is_federal
             form.is_retired.data = prefilled_judge.is_retired
 
-    # Populate court choices dynamically
-    if form.state.data or (prefilled_judge and prefilled_judge.state):
-        state = form.state.data or prefilled_judge.state
-        form.court.choices = COURTS_BY_STATE.get(state, [])
-
     if request.method == 'POST':
         if prefilled_judge:
             # PREFILLED JUDGE PATH: Custom validation for review fields
@@ -204,8 +411,8 @@ def submit_review():
                 form.is_federal.data = prefilled_judge.is_federal
                 form.is_retired.data = prefilled_judge.is_retired
                 # Keep court choices populated for prefilled judge
-                form.court.choices = COURTS_BY_STATE.get(prefilled_judge.state, [])
-                return render_template('submit_review.html', form=form, courts_by_state=COURTS_BY_STATE,
+                form.court.choices = courts_for_state(prefilled_judge.state)
+                return render_template('submit_review.html', form=form,
                                        prefilled_judge=prefilled_judge)
 
         else:
@@ -228,6 +435,8 @@ def submit_review():
 
             if not form.court.data:
                 validation_errors.append("Court is required.")
+            elif form.state.data and not is_valid_court(form.state.data, form.court.data):
+                validation_errors.append("Please select a court from the list for the chosen state.")
 
             if not form.city.data or not form.city.data.strip():
                 validation_errors.append("City is required.")
@@ -278,7 +487,8 @@ def submit_review():
                 # Show validation errors using flash banner messages (consistent with media links)
                 for error in validation_errors:
                     flash(error, 'error')  # Red banner messages at top
-                return render_template('submit_review.html', form=form, courts_by_state=COURTS_BY_STATE,
+                form.court.choices = courts_for_state(form.state.data)
+                return render_template('submit_review.html', form=form,
                                        prefilled_judge=prefilled_judge)
 
         # Check if user has already reviewed this judge
@@ -303,7 +513,11 @@ def submit_review():
             court_date=form.court_date.data
         )
         db.session.add(review)
+        JudgeStats.refresh(judge.id)
+        UserStats.refresh(review.user_id)
+        DailyActivity.record_review(review, judge)
         db.session.commit()
+        page_cache.invalidate_judge(judge.id)
 
         # Send admin notification for new review
         try:
@@ -315,7 +529,11 @@ def submit_review():
         flash('Review submitted successfully!')
         return redirect(url_for('main.judge', judge_id=judge.id))
 
-    return render_template('submit_review.html', form=form, courts_by_state=COURTS_BY_STATE,
+    # Court choices are only needed when the form is rendered, not on every POST
+    if form.state.data:
+        form.court.choices = courts_for_state(form.state.data)
+
+    return render_template('submit_review.html', form=form,
                            prefilled_judge=prefilled_judge)
 
 
@@ -325,7 +543,7 @@ def submit_review():
 def submit_media_link():
     form = MediaLinkForm()
 
-    form.state.choices = [('', 'Select a state...')] + STATES
+    form.state.choices = STATE_CHOICES
     form.court.choices = []  # Will be populated by JavaScript
 
     # Check if judge_id is provided in URL (GET) or hidden field (POST)
@@ -343,11 +561,6 @@ def submit_media_link():
             form.is_federal.data = prefilled_judge.is_federal
             form.is_retired.data = prefilled_judge.is_retired
 
-    # Populate court choices dynamically
-    if form.state.data or (prefilled_judge and prefilled_judge.state):
-        state = form.state.data or prefilled_judge.state
-        form.court.choices = COURTS_BY_STATE.get(state, [])
-
     if request.method == 'POST':
         if prefilled_judge:
             # PREFILLED JUDGE PATH: Custom validation to avoid disabled field issues
@@ -404,8 +617,8 @@ def submit_media_link():
                 form.is_federal.data = prefilled_judge.is_federal
                 form.is_retired.data = prefilled_judge.is_retired
                 # Keep court choices populated for prefilled judge
-                form.court.choices = COURTS_BY_STATE.get(prefilled_judge.state, [])
-                return render_template('submit_media.html', form=form, courts_by_state=COURTS_BY_STATE,
+                form.court.choices = courts_for_state(prefilled_judge.state)
+                return render_template('submit_media.html', form=form,
                                        prefilled_judge=prefilled_judge)
 
         else:
@@ -428,6 +641,8 @@ def submit_media_link():
 
             if not form.court.data:
                 validation_errors.append("Court is required.")
+            elif form.state.data and not is_valid_court(form.state.data, form.court.data):
+                validation_errors.append("Please select a court from the list for the chosen state.")
 
             if not form.city.data or not form.city.data.strip():
                 validation_errors.append("City is required.")
@@ -505,7 +720,8 @@ def submit_media_link():
                 # Show validation errors using flash banner messages (consistent with prefilled judges)
                 for error in validation_errors:
                     flash(error, 'error')  # Red banner messages at top
-                return render_template('submit_media.html', form=form, courts_by_state=COURTS_BY_STATE,
+                form.court.choices = courts_for_state(form.state.data)
+                return render_template('submit_media.html', form=form,
                                        prefilled_judge=prefilled_judge)
 
         # Check for duplicate URL for this judge
@@ -530,7 +746,10 @@ def submit_media_link():
             is_verified=False  # Requires admin approval
         )
         db.session.add(media_link)
+        JudgeStats.refresh(judge.id)
+        DailyActivity.record_media_link(media_link, judge)
         db.session.commit()
+        page_cache.invalidate_judge(judge.id)
 
         # Send admin notification for new media link
         try:
@@ -543,7 +762,11 @@ def submit_media_link():
             'Media link submitted successfully! It is pending verification and will appear once approved by our moderation team.')
         return redirect(url_for('main.judge', judge_id=judge.id))
 
-    return render_template('submit_media.html', form=form, courts_by_state=COURTS_BY_STATE,
+    # Court choices are only needed when the form is rendered, not on every POST
+    if form.state.data:
+        form.court.choices = courts_for_state(form.state.data)
+
+    return render_template('submit_media.html', form=form,
                            prefilled_judge=prefilled_judge)
 
 
@@ -581,7 +804,7 @@ def admin_notify_user_issue(content_type, content_id):
 
 @bp.route('/guidelines')
 def guidelines():
-    return render_template('guidelines.html')
+    return conditional_page(lambda: render_template('guidelines.html'))
 
 
 @bp.route('/privacy')
@@ -612,7 +835,7 @@ def support():
 @bp.route('/')
 def home():
     """About/Landing page explaining the platform"""
-    return render_template('about.html')
+    return conditional_page(lambda: render_template('about.html'))
 
 
 @bp.route('/about')
@@ -629,6 +852,15 @@ def robots():
 
 @bp.route('/sitemap.xml')
 def sitemap_xml():
+    from datetime import date
+
+    # <lastmod> is today's date and judges are only ever added or deleted,
+    # so the date plus the judge count and highest id identify the document
+    judge_count, max_judge_id = db.session.query(db.func.count(Judge.id), db.func.max(Judge.id)).one()
+    return conditional_page(_render_sitemap_xml, date.today(), judge_count, max_judge_id)
+
+
+def _render_sitemap_xml():
     from flask import Response
     from datetime import datetime
 
@@ -639,6 +871,7 @@ def sitemap_xml():
     pages = [
         {'loc': url_for('main.about', _external=True), 'priority': '1.0', 'changefreq': 'monthly'},
         {'loc': url_for('main.index', _external=True), 'priority': '0.9', 'changefreq': 'daily'},
+        {'loc': url_for('main.directory', _external=True), 'priority': '0.8', 'changefreq': 'daily'},
         {'loc': url_for('main.guidelines', _external=True), 'priority': '0.8', 'changefreq': 'monthly'},
         {'loc': url_for('main.submit_review', _external=True), 'priority': '0.9', 'changefreq': 'monthly'},
         {'loc': url_for('main.submit_media_link', _external=True), 'priority': '0.9', 'changefreq': 'monthly'},
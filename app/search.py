@@ -0,0 +1,89 @@
+import re
+
+from app import db
+from app.models import Judge
+
+# Indexed document expressions. These must match the index definitions in the
+# "add judge search indexes" migration exactly, or PostgreSQL will not use them.
+PG_SEARCH_TEXT = ("lower(judge.first_name || ' ' || judge.last_name || ' ' || judge.court"
+                  " || ' ' || judge.city || ' ' || judge.state)")
+PG_SEARCH_VECTOR = ("to_tsvector('simple', judge.first_name || ' ' || judge.last_name || ' ' || judge.court"
+                    " || ' ' || judge.city || ' ' || judge.state)")
+
+
+def _terms(search_query):
+    """Split a search string into lowercase word tokens"""
+    return re.findall(r'\w+', search_query.lower())
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _postgres_search(query, search_query, terms):
+    """Trigram substring match OR prefix full-text match, both GIN-indexed"""
+    search_text = db.literal_column(PG_SEARCH_TEXT)
+    search_vector = db.literal_column(PG_SEARCH_VECTOR)
+    ts_query = db.func.to_tsquery('simple', ' & '.join(f'{term}:*' for term in terms))
+
+    query = query.filter(db.or_(
+        search_text.like(db.bindparam('search_pattern', f'%{_escape_like(search_query.lower())}%'), escape='\\'),
+        search_vector.op('@@')(ts_query)
+    ))
+    rank = db.func.ts_rank(search_vector, ts_query) + db.func.word_similarity(db.bindparam('search_term', search_query.lower()), search_text)
+    # ts_rank and word_similarity return real; the page cursor round-trips the
+    # rank as a double, so compare in double precision or ties near a page
+    # boundary never match their own cursor
+    return query, -db.cast(rank, db.Float(precision=53))
+
+
+def _sqlite_search(query, terms):
+    """Prefix match against the judge_fts FTS5 table, ranked by bm25"""
+    match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+    matches = db.text(
+        'SELECT rowid AS judge_id, bm25(judge_fts) AS rank FROM judge_fts WHERE judge_fts MATCH :match'
+    ).bindparams(match=match).columns(judge_id=db.Integer, rank=db.Float).subquery('judge_matches')
+
+    query = query.join(matches, matches.c.judge_id == Judge.id)
+    return query, matches.c.rank
+
+
+def _like_search(query, search_query):
+    """Unindexed substring match for databases without a search index"""
+    pattern = f'%{_escape_like(search_query)}%'
+    query = query.filter(
+        db.or_(
+            Judge.first_name.ilike(pattern, escape='\\'),
+            Judge.last_name.ilike(pattern, escape='\\'),
+            Judge.court.ilike(pattern, escape='\\'),
+            Judge.city.ilike(pattern, escape='\\'),
+            Judge.state.ilike(pattern, escape='\\'),
+            (Judge.first_name + ' ' + Judge.last_name).ilike(pattern, escape='\\')
+        )
+    )
+    return query, None
+
+
+def search_judges(query, search_query):
+    """
+    Restrict a Judge query to rows matching a free-text search over name,
+    court, city and state, using the database's search index.
+
+    Args:
+        query: Judge query to filter
+        search_query (str): Text entered by the user
+
+    Returns:
+        tuple: (filtered query, rank expression) — the rank sorts best match
+        first in ascending order, or is None when no relevance is available
+    """
+    terms = _terms(search_query)
+    if not terms:
+        return _like_search(query, search_query)
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return _postgres_search(query, search_query, terms)
+    if dialect == 'sqlite':
+        return _sqlite_search(query, terms)
+    return _like_search(query, search_query)
@@ -1,7 +1,19 @@
 const courtsDataEl = document.getElementById('courts-data');
-const courtsByState = JSON.parse(courtsDataEl.getAttribute('data-courts'));
 const preselectedCourt = courtsDataEl.getAttribute('data-preselected-court');
 
+const courtsUrl = courtsDataEl.getAttribute('data-courts-url');
+const courtsByState = {};
+
+// Court lists are fetched per state on demand (and cached by the browser)
+function fetchCourts(state) {
+    if (!courtsByState[state]) {
+        courtsByState[state] = fetch(courtsUrl.replace('__STATE__', encodeURIComponent(state)))
+            .then(function(response) { return response.ok ? response.json() : []; })
+            .catch(function() { return []; });
+    }
+    return courtsByState[state];
+}
+
 const stateSelect = document.getElementById('state-select');
 const courtSelect = document.getElementById('court-select');
 
@@ -9,23 +21,26 @@ function updateCourtOptions() {
     const selectedState = stateSelect.value;
 
     courtSelect.innerHTML = '<option value="">Select a court...</option>';
+    courtSelect.disabled = true;
+    if (!selectedState) return;
 
-    if (selectedState && courtsByState[selectedState]) {
-        courtsByState[selectedState].forEach(function(court) {
+    fetchCourts(selectedState).then(function(courts) {
+        // Ignore a late response if the user has since picked another state
+        if (stateSelect.value !== selectedState || !courts.length) return;
+
+        courts.forEach(function(court) {
             const option = document.createElement('option');
-            option.value = court[0];
-            option.text = court[1];
+            option.value = court;
+            option.text = court;
 
-            if (court[0] === preselectedCourt) {
+            if (court === preselectedCourt) {
                 option.selected = true;
             }
 
             courtSelect.appendChild(option);
         });
         courtSelect.disabled = true;
-    } else {
-        courtSelect.disabled = true;
-    }
+    });
 }
 
 stateSelect.addEventListener('change', updateCourtOptions);
@@ -0,0 +1,35 @@
+// "Load more" for the reviews and media link lists on the judge page.
+// Each button links to the next page as a fallback; with JS we fetch the
+// next page as an HTML fragment and append it in place instead.
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('[data-load-more-url]').forEach(function(button) {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+            if (button.classList.contains('is-loading')) return;
+
+            const url = button.getAttribute('data-load-more-url');
+            const cursor = button.getAttribute('data-load-more-cursor');
+            const target = document.getElementById(button.getAttribute('data-load-more-target'));
+            button.classList.add('is-loading');
+
+            fetch(url + '?after=' + encodeURIComponent(cursor))
+                .then(function(response) {
+                    if (!response.ok) throw new Error('Request failed');
+                    return response.json();
+                })
+                .then(function(data) {
+                    target.insertAdjacentHTML('beforeend', data.html);
+                    if (data.next_cursor) {
+                        button.setAttribute('data-load-more-cursor', data.next_cursor);
+                        button.classList.remove('is-loading');
+                    } else {
+                        button.parentNode.remove();
+                    }
+                })
+                .catch(function() {
+                    // Fall back to the plain link
+                    window.location.href = button.href;
+                });
+        });
+    });
+});
@@ -0,0 +1,86 @@
+// Typeahead suggestions for judge name inputs.
+// Inputs opt in with data-suggest-url (the JSON endpoint) and
+// data-suggest-href (a link ending in "0", replaced by the chosen judge id).
+document.addEventListener('DOMContentLoaded', function() {
+    const inputs = document.querySelectorAll('input[data-suggest-url]');
+
+    inputs.forEach(function(input) {
+        const suggestUrl = input.getAttribute('data-suggest-url');
+        const hrefTemplate = input.getAttribute('data-suggest-href');
+        const list = document.createElement('ul');
+        list.className = 'suggest-list';
+        list.hidden = true;
+        input.parentNode.classList.add('suggest-wrapper');
+        input.parentNode.appendChild(list);
+
+        let debounceTimer = null;
+        let lastQuery = '';
+
+        function hideList() {
+            list.hidden = true;
+            list.innerHTML = '';
+        }
+
+        function renderResults(results) {
+            list.innerHTML = '';
+            if (!results.length) {
+                hideList();
+                return;
+            }
+            results.forEach(function(judge) {
+                const item = document.createElement('li');
+                const link = document.createElement('a');
+                link.href = hrefTemplate.replace(/0$/, judge.id);
+                link.className = 'suggest-item';
+
+                const name = document.createElement('span');
+                name.className = 'suggest-name';
+                name.textContent = judge.name;
+
+                const court = document.createElement('span');
+                court.className = 'suggest-court';
+                court.textContent = judge.court + ', ' + judge.state;
+
+                link.appendChild(name);
+                link.appendChild(court);
+                item.appendChild(link);
+                list.appendChild(item);
+            });
+            list.hidden = false;
+        }
+
+        function fetchSuggestions() {
+            const query = input.value.trim();
+            if (query === lastQuery) return;
+            lastQuery = query;
+
+            if (query.length < 2) {
+                hideList();
+                return;
+            }
+
+            fetch(suggestUrl + '?q=' + encodeURIComponent(query))
+                .then(function(response) { return response.ok ? response.json() : []; })
+                .then(function(results) {
+                    // Ignore responses for queries the user has already typed past
+                    if (query === input.value.trim()) {
+                        renderResults(results);
+                    }
+                })
+                .catch(hideList);
+        }
+
+        input.addEventListener('input', function() {
+            clearTimeout(debounceTimer);
+            debounceTimer = setTimeout(fetchSuggestions, 200);
+        });
+
+        input.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') hideList();
+        });
+
+        document.addEventListener('click', function(e) {
+            if (!input.parentNode.contains(e.target)) hideList();
+        });
+    });
+});
@@ -0,0 +1,223 @@
+from datetime import datetime, timedelta
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import func, case
+
+from app import db
+from app.models import Judge, Review, MediaLink, User, StatisticsSnapshot, DailyActivity
+from app.geography import geographic_rollup
+from app.time_buckets import time_series, recent_buckets, bucket_label
+
+# Bump whenever the shape of the snapshot data changes; older rows are ignored
+SNAPSHOT_VERSION = 2
+
+# Older snapshots beyond this many are pruned on refresh
+SNAPSHOTS_KEPT = 20
+
+
+def compute_snapshot():
+    """
+    Compute the date-range-independent aggregates shown on the admin statistics
+    page. Leaderboards are not included; they are read live from app.leaderboards.
+
+    Returns:
+        dict: JSON-serializable metrics
+    """
+    any_concern = db.or_(
+        Review.fairness_concern == True,
+        Review.bias_concern == True,
+        Review.temperament_concern == True
+    )
+
+    # ========== SINGLE-PASS AGGREGATES ==========
+    # Conditional aggregation: each table is scanned once for all of its
+    # summary, concern, rating and federal/retired breakdown figures
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    def avg_if(condition):
+        return func.avg(case((condition, Review.rating)))
+
+    def rounded(value):
+        return round(float(value), 2) if value else 0
+
+    multiple_concern = db.or_(
+        db.and_(Review.fairness_concern == True, Review.bias_concern == True),
+        db.and_(Review.fairness_concern == True, Review.temperament_concern == True),
+        db.and_(Review.bias_concern == True, Review.temperament_concern == True)
+    )
+
+    reviews = db.session.query(
+        func.count(Review.id).label('total'),
+        func.avg(Review.rating).label('avg_rating'),
+        count_if(any_concern).label('any_concern'),
+        count_if(Review.fairness_concern == True).label('fairness'),
+        count_if(Review.bias_concern == True).label('bias'),
+        count_if(Review.temperament_concern == True).label('temperament'),
+        count_if(multiple_concern).label('multiple_concerns'),
+        count_if(Judge.is_federal == True).label('federal_reviews'),
+        count_if(Judge.is_federal == False).label('state_reviews'),
+        avg_if(Judge.is_federal == True).label('federal_avg'),
+        avg_if(Judge.is_federal == False).label('state_avg'),
+        avg_if(Judge.is_retired == True).label('retired_avg'),
+        avg_if(Judge.is_retired == False).label('active_avg'),
+        *[count_if(Review.rating == rating).label(f'rating_{rating}') for rating in range(1, 6)]
+    ).select_from(Review).join(Judge, Review.judge_id == Judge.id).one()
+
+    judges = db.session.query(
+        count_if(Judge.is_federal == True).label('federal'),
+        count_if(Judge.is_federal == False).label('state'),
+        count_if(Judge.is_retired == True).label('retired'),
+        count_if(Judge.is_retired == False).label('active')
+    ).one()
+
+    media = db.session.query(
+        func.count(MediaLink.id).label('total'),
+        count_if(MediaLink.is_verified == False).label('pending')
+    ).one()
+
+    total_users = User.query.filter_by(is_banned=False).count()
+
+    # ========== GEOGRAPHIC DISTRIBUTION ==========
+    # Admins see all media links, including those awaiting verification
+    judges_by_state = geographic_rollup(verified_only=False)
+
+    # ========== TEMPORAL TRENDS (Last 12 months) ==========
+    trend_start, trend_end = recent_buckets(12, 'month')
+    reviews_by_month = time_series(Review.created_at, trend_start, trend_end, 'month')
+    media_by_month = time_series(MediaLink.created_at, trend_start, trend_end, 'month')
+
+    return {
+        # Summary stats
+        'total_users': total_users,
+        'total_reviews': reviews.total,
+        'total_media_links': media.total,
+        'pending_verifications': media.pending,
+        'overall_avg_rating': rounded(reviews.avg_rating),
+        'total_concerns': reviews.any_concern,
+        # Geographic
+        'judges_by_state': [[row.state, row.judge_count, row.review_count, row.media_count]
+                            for row in judges_by_state],
+        # Rating distribution and concerns
+        'rating_distribution': {rating: getattr(reviews, f'rating_{rating}') for rating in range(1, 6)},
+        'concern_breakdown': {
+            'fairness': reviews.fairness,
+            'bias': reviews.bias,
+            'temperament': reviews.temperament
+        },
+        'reviews_with_concerns': reviews.any_concern,
+        'multiple_concerns': reviews.multiple_concerns,
+        # Temporal trends
+        'reviews_by_month': [[bucket_label(month, 'month'), count] for month, count in reviews_by_month],
+        'media_by_month': [[bucket_label(month, 'month'), count] for month, count in media_by_month],
+        # Comparisons
+        'federal_count': judges.federal,
+        'state_count': judges.state,
+        'federal_avg_rating': rounded(reviews.federal_avg),
+        'state_avg_rating': rounded(reviews.state_avg),
+        'federal_review_count': reviews.federal_reviews,
+        'state_review_count': reviews.state_reviews,
+        'retired_count': judges.retired,
+        'active_count': judges.active,
+        'retired_avg_rating': rounded(reviews.retired_avg),
+        'active_avg_rating': rounded(reviews.active_avg),
+    }
+
+
+def growth_metrics(start_date, end_date):
+    """
+    Metrics for the admin-selected date range (whole days, both ends inclusive).
+
+    Counts are summed from the daily_activity rollup. Distinct contributors
+    and first-reviewed judges can't be added up across days, so those two
+    still query the review table, bounded by its created_at index.
+
+    Returns:
+        dict: reviews_in_range, media_in_range, users_in_range, new_reviewed_judges,
+        active_contributors, verifications_in_range
+    """
+    first_day, last_day = start_date.date(), end_date.date()
+    range_start = datetime.combine(first_day, datetime.min.time())
+    range_end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+
+    totals = db.session.query(
+        func.coalesce(func.sum(DailyActivity.review_count), 0).label('reviews'),
+        func.coalesce(func.sum(DailyActivity.media_count), 0).label('media'),
+        func.coalesce(func.sum(DailyActivity.verified_media_count), 0).label('verified'),
+        func.coalesce(func.sum(DailyActivity.user_count), 0).label('users')
+    ).filter(DailyActivity.day >= first_day, DailyActivity.day <= last_day).one()
+
+    # Judges who received their first review in range: reviewed in range with
+    # no earlier review (checked per judge via the judge_id, created_at index)
+    earlier = db.aliased(Review)
+    new_reviewed_judges = db.session.query(func.count(func.distinct(Review.judge_id))).filter(
+        Review.created_at >= range_start,
+        Review.created_at < range_end,
+        ~db.exists().where(earlier.judge_id == Review.judge_id, earlier.created_at < range_start)
+    ).scalar() or 0
+
+    active_contributors = db.session.query(func.count(func.distinct(Review.user_id))).filter(
+        Review.created_at >= range_start,
+        Review.created_at < range_end
+    ).scalar() or 0
+
+    return {
+        'reviews_in_range': totals.reviews,
+        'media_in_range': totals.media,
+        'users_in_range': totals.users,
+        'new_reviewed_judges': new_reviewed_judges,
+        'active_contributors': active_contributors,
+        'verifications_in_range': totals.verified,
+    }
+
+
+def refresh_snapshot(computed_by=None):
+    """
+    Compute and store a new statistics snapshot, pruning old ones.
+
+    Args:
+        computed_by (User, optional): Admin who requested the refresh
+
+    Returns:
+        StatisticsSnapshot: The new snapshot (committed)
+    """
+    snapshot = StatisticsSnapshot(
+        schema_version=SNAPSHOT_VERSION,
+        computed_at=datetime.utcnow(),
+        computed_by_id=computed_by.id if computed_by else None,
+        data=compute_snapshot()
+    )
+    db.session.add(snapshot)
+    db.session.flush()
+
+    StatisticsSnapshot.query.filter(
+        StatisticsSnapshot.id <= snapshot.id - SNAPSHOTS_KEPT
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return snapshot
+
+
+def latest_snapshot():
+    """Newest snapshot usable by this version of the code, or None"""
+    return StatisticsSnapshot.query.filter_by(
+        schema_version=SNAPSHOT_VERSION
+    ).order_by(StatisticsSnapshot.id.desc()).first()
+
+
+def snapshot_context(snapshot):
+    """Template variables for a snapshot"""
+    data = dict(snapshot.data)
+    # JSON object keys are strings; the template indexes ratings by int
+    data['rating_distribution'] = {int(k): v for k, v in data['rating_distribution'].items()}
+    return data
+
+
+stats_cli = AppGroup('stats', help='Admin statistics snapshots.')
+
+
+@stats_cli.command('refresh')
+def refresh_command():
+    """Recompute the admin statistics snapshot."""
+    snapshot = refresh_snapshot()
+    click.echo(f'Statistics snapshot {snapshot.id} computed at {snapshot.computed_at:%Y-%m-%d %H:%M:%S} UTC')
@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, literal_column
+
+from app import db
+
+# Supported bucket sizes; weeks start on Monday, matching PostgreSQL date_trunc
+BUCKETS = ('day', 'week', 'month')
+
+
+def _check_bucket(bucket):
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown time bucket {bucket!r}; expected one of {', '.join(BUCKETS)}")
+
+
+def bucket_expression(column, bucket):
+    """
+    SQL expression truncating a datetime column to the start of its bucket.
+
+    Uses date_trunc on PostgreSQL and date()/strftime() on SQLite. Results
+    are a timestamp or an ISO date string depending on the database; pass
+    them through to_bucket_date() before comparing.
+
+    Args:
+        column: DateTime column to bucket
+        bucket (str): 'day', 'week' or 'month'
+    """
+    _check_bucket(bucket)
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Inline the unit so SELECT and GROUP BY render the identical expression
+        return func.date_trunc(literal_column(f"'{bucket}'"), column)
+    if bucket == 'day':
+        return func.date(column)
+    if bucket == 'week':
+        # Forward to Sunday (or stay on it), then back to that week's Monday
+        return func.date(column, 'weekday 0', '-6 days')
+    return func.strftime('%Y-%m-01', column)
+
+
+def to_bucket_date(value):
+    """Normalize a bucket value returned by the database to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+def bucket_start(value, bucket):
+    """Start date of the bucket containing a date or datetime"""
+    _check_bucket(bucket)
+    if isinstance(value, datetime):
+        value = value.date()
+    if bucket == 'week':
+        return value - timedelta(days=value.weekday())
+    if bucket == 'month':
+        return value.replace(day=1)
+    return value
+
+
+def next_bucket(start, bucket):
+    """Start date of the bucket following the one beginning at start"""
+    if bucket == 'day':
+        return start + timedelta(days=1)
+    if bucket == 'week':
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def bucket_label(start, bucket):
+    """Display label for a bucket: 'YYYY-MM' for months, ISO date otherwise"""
+    if bucket == 'month':
+        return start.strftime('%Y-%m')
+    return start.isoformat()
+
+
+def recent_buckets(count, bucket, now=None):
+    """
+    Range covering the last count buckets, including the current one.
+
+    Returns:
+        tuple: (start, end) datetimes; end is exclusive
+    """
+    start = bucket_start(now or datetime.utcnow(), bucket)
+    end = next_bucket(start, bucket)
+    for _ in range(count - 1):
+        if bucket == 'month':
+            start = (start - timedelta(days=1)).replace(day=1)
+        else:
+            start -= timedelta(days=1 if bucket == 'day' else 7)
+    return datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time())
+
+
+def time_series(column, start, end, bucket='month', criteria=()):
+    """
+    Row counts per time bucket, with empty buckets filled in as zero.
+
+    The range filter compares the raw column, so an index on it can be
+    used; only the grouping is computed per row.
+
+    Args:
+        column: DateTime column of the counted rows, e.g. Review.created_at
+        start (datetime): Inclusive lower bound, rounded down to its bucket
+        end (datetime): Exclusive upper bound
+        bucket (str): 'day', 'week' or 'month'
+        criteria: Extra filter clauses for the counted rows
+
+    Returns:
+        list: (bucket start date, count) pairs in chronological order
+    """
+    expression = bucket_expression(column, bucket)
+    first = bucket_start(start, bucket)
+    if not isinstance(end, datetime):
+        end = datetime.combine(end, datetime.min.time())
+
+    rows = db.session.query(expression, func.count()).filter(
+        column >= datetime.combine(first, datetime.min.time()),
+        column < end,
+        *criteria
+    ).group_by(expression).all()
+    counts = {to_bucket_date(value): count for value, count in rows}
+
+    series = []
+    current = first
+    while datetime.combine(current, datetime.min.time()) < end:
+        series.append((current, counts.get(current, 0)))
+        current = next_bucket(current, bucket)
+    return series
@@ -37,5 +37,18 @@ class Config:
     # Admin email for notifications
     ADMIN_EMAIL = 'Admin@JudgeAccount.com'
 
+    # Identifies the deployed build for HTTP validators on static pages.
+    # Render sets RENDER_GIT_COMMIT; otherwise a digest of templates/static is used.
+    BUILD_HASH = os.environ.get('RENDER_GIT_COMMIT')
+
     # Base URL for constructing links in emails
-    BASE_URL = os.environ.get('BASE_URL', 'http://localhost:5000')
\ No newline at end of file
+    BASE_URL = os.environ.get('BASE_URL', 'http://localhost:5000')
+
+    # Rendered-page cache for anonymous judge profile views.
+    # 'memory' is per worker process; 'redis' shares entries across workers.
+    # Entries are checked against judge_stats.updated_at, so a worker's memory
+    # cache never serves a page another worker has since changed.
+    PAGE_CACHE_BACKEND = os.environ.get('PAGE_CACHE_BACKEND', 'memory')
+    PAGE_CACHE_URL = os.environ.get('PAGE_CACHE_URL')
+    PAGE_CACHE_TTL = 3600
+    PAGE_CACHE_MAX_ENTRIES = 1000
\ No newline at end of file
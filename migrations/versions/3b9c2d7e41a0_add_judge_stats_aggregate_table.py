@@ -0,0 +1,92 @@
+"""add judge_stats aggregate table
+
+Revision ID: 3b9c2d7e41a0
+Revises: ed5ae8f26443
+Create Date: 2026-10-16 09:12:40.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9c2d7e41a0'
+down_revision = 'ed5ae8f26443'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('judge_stats',
+    sa.Column('judge_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('avg_rating', sa.Float(), nullable=False),
+    sa.Column('fairness_count', sa.Integer(), nullable=False),
+    sa.Column('bias_count', sa.Integer(), nullable=False),
+    sa.Column('temperament_count', sa.Integer(), nullable=False),
+    sa.Column('concern_count', sa.Integer(), nullable=False),
+    sa.Column('verified_media_count', sa.Integer(), nullable=False),
+    sa.Column('last_activity_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['judge_id'], ['judge.id'], ),
+    sa.PrimaryKeyConstraint('judge_id')
+    )
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_judge_stats_avg_rating'), ['avg_rating'], unique=False)
+        batch_op.create_index(batch_op.f('ix_judge_stats_review_count'), ['review_count'], unique=False)
+        batch_op.create_index(batch_op.f('ix_judge_stats_verified_media_count'), ['verified_media_count'], unique=False)
+
+    # Backfill one row per existing judge from the current review and media_link tables
+    op.execute("""
+        INSERT INTO judge_stats (
+            judge_id, review_count, rating_sum, avg_rating,
+            fairness_count, bias_count, temperament_count, concern_count,
+            verified_media_count, last_activity_at, updated_at
+        )
+        SELECT
+            j.id,
+            COALESCE(r.review_count, 0),
+            COALESCE(r.rating_sum, 0),
+            CASE WHEN r.review_count > 0 THEN CAST(r.rating_sum AS FLOAT) / r.review_count ELSE 0 END,
+            COALESCE(r.fairness_count, 0),
+            COALESCE(r.bias_count, 0),
+            COALESCE(r.temperament_count, 0),
+            COALESCE(r.concern_count, 0),
+            COALESCE(m.media_count, 0),
+            CASE
+                WHEN m.last_media IS NULL THEN r.last_review
+                WHEN r.last_review IS NULL OR m.last_media > r.last_review THEN m.last_media
+                ELSE r.last_review
+            END,
+            CURRENT_TIMESTAMP
+        FROM judge j
+        LEFT JOIN (
+            SELECT judge_id,
+                   COUNT(*) AS review_count,
+                   SUM(rating) AS rating_sum,
+                   SUM(CASE WHEN fairness_concern THEN 1 ELSE 0 END) AS fairness_count,
+                   SUM(CASE WHEN bias_concern THEN 1 ELSE 0 END) AS bias_count,
+                   SUM(CASE WHEN temperament_concern THEN 1 ELSE 0 END) AS temperament_count,
+                   SUM(CASE WHEN fairness_concern OR bias_concern OR temperament_concern
+                            THEN 1 ELSE 0 END) AS concern_count,
+                   MAX(created_at) AS last_review
+            FROM review
+            GROUP BY judge_id
+        ) r ON r.judge_id = j.id
+        LEFT JOIN (
+            SELECT judge_id, COUNT(*) AS media_count, MAX(created_at) AS last_media
+            FROM media_link
+            WHERE is_verified
+            GROUP BY judge_id
+        ) m ON m.judge_id = j.id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_judge_stats_verified_media_count'))
+        batch_op.drop_index(batch_op.f('ix_judge_stats_review_count'))
+        batch_op.drop_index(batch_op.f('ix_judge_stats_avg_rating'))
+
+    op.drop_table('judge_stats')
@@ -0,0 +1,75 @@
+"""add judge search indexes
+
+Revision ID: 5f7e2a1c9b34
+Revises: 8c41f0a9d2e6
+Create Date: 2026-10-16 11:40:08.207615
+
+PostgreSQL gets pg_trgm and full-text GIN indexes over name, court, city and
+state. SQLite (development) gets an external-content FTS5 table kept in sync
+with the judge table by triggers. The indexed expressions must stay identical
+to those in app/search.py.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f7e2a1c9b34'
+down_revision = '8c41f0a9d2e6'
+branch_labels = None
+depends_on = None
+
+SEARCH_DOCUMENT = "first_name || ' ' || last_name || ' ' || court || ' ' || city || ' ' || state"
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute(f'CREATE INDEX ix_judge_search_trgm ON judge USING gin ((lower({SEARCH_DOCUMENT})) gin_trgm_ops)')
+        op.execute(f"CREATE INDEX ix_judge_search_tsv ON judge USING gin (to_tsvector('simple', {SEARCH_DOCUMENT}))")
+
+    elif dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE judge_fts USING fts5(
+                first_name, last_name, court, city, state,
+                content='judge', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER judge_fts_ai AFTER INSERT ON judge BEGIN
+                INSERT INTO judge_fts(rowid, first_name, last_name, court, city, state)
+                VALUES (new.id, new.first_name, new.last_name, new.court, new.city, new.state);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER judge_fts_ad AFTER DELETE ON judge BEGIN
+                INSERT INTO judge_fts(judge_fts, rowid, first_name, last_name, court, city, state)
+                VALUES ('delete', old.id, old.first_name, old.last_name, old.court, old.city, old.state);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER judge_fts_au AFTER UPDATE ON judge BEGIN
+                INSERT INTO judge_fts(judge_fts, rowid, first_name, last_name, court, city, state)
+                VALUES ('delete', old.id, old.first_name, old.last_name, old.court, old.city, old.state);
+                INSERT INTO judge_fts(rowid, first_name, last_name, court, city, state)
+                VALUES (new.id, new.first_name, new.last_name, new.court, new.city, new.state);
+            END
+        """)
+        op.execute("INSERT INTO judge_fts(judge_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_judge_search_tsv')
+        op.execute('DROP INDEX IF EXISTS ix_judge_search_trgm')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS judge_fts_au')
+        op.execute('DROP TRIGGER IF EXISTS judge_fts_ad')
+        op.execute('DROP TRIGGER IF EXISTS judge_fts_ai')
+        op.execute('DROP TABLE IF EXISTS judge_fts')
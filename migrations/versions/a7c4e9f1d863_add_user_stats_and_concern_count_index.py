@@ -0,0 +1,50 @@
+"""add user_stats table and judge_stats concern_count index
+
+Revision ID: a7c4e9f1d863
+Revises: f3a9d6e2b154
+Create Date: 2026-10-17 10:22:08.406151
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e9f1d863'
+down_revision = 'f3a9d6e2b154'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_stats_review_count'), ['review_count'], unique=False)
+
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_judge_stats_concern_count'), ['concern_count'], unique=False)
+
+    # Backfill a row for every user who has written a review
+    op.execute("""
+        INSERT INTO user_stats (user_id, review_count, updated_at)
+        SELECT user_id, COUNT(*), CURRENT_TIMESTAMP
+        FROM review
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_judge_stats_concern_count'))
+
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_stats_review_count'))
+
+    op.drop_table('user_stats')
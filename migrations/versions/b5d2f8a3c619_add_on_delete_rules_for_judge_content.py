@@ -0,0 +1,73 @@
+"""add on delete rules for judge content
+
+Revision ID: b5d2f8a3c619
+Revises: a7c4e9f1d863
+Create Date: 2026-10-17 14:36:52.118094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d2f8a3c619'
+down_revision = 'a7c4e9f1d863'
+branch_labels = None
+depends_on = None
+
+# The original foreign keys were created unnamed. PostgreSQL named them
+# <table>_<column>_fkey; on SQLite the convention lets batch mode find the
+# reflected constraints by the same names.
+NAMING_CONVENTION = {'fk': '%(table_name)s_%(column_0_name)s_fkey'}
+
+
+def upgrade():
+    with op.batch_alter_table('review', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('review_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('review_judge_id_fkey'), 'judge', ['judge_id'], ['id'], ondelete='CASCADE')
+
+    with op.batch_alter_table('media_link', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('media_link_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('media_link_judge_id_fkey'), 'judge', ['judge_id'], ['id'], ondelete='CASCADE')
+
+    with op.batch_alter_table('judge_stats', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('judge_stats_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('judge_stats_judge_id_fkey'), 'judge', ['judge_id'], ['id'], ondelete='CASCADE')
+
+    with op.batch_alter_table('content_flags', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('content_flags_review_id_fkey', type_='foreignkey')
+        batch_op.drop_constraint('content_flags_media_link_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('content_flags_review_id_fkey'), 'review', ['review_id'], ['id'], ondelete='CASCADE')
+        batch_op.create_foreign_key(batch_op.f('content_flags_media_link_id_fkey'), 'media_link', ['media_link_id'], ['id'], ondelete='CASCADE')
+
+    with op.batch_alter_table('admin_log', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('admin_log_target_review_id_fkey', type_='foreignkey')
+        batch_op.drop_constraint('admin_log_target_media_link_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('admin_log_target_review_id_fkey'), 'review', ['target_review_id'], ['id'], ondelete='SET NULL')
+        batch_op.create_foreign_key(batch_op.f('admin_log_target_media_link_id_fkey'), 'media_link', ['target_media_link_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('admin_log', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('admin_log_target_media_link_id_fkey', type_='foreignkey')
+        batch_op.drop_constraint('admin_log_target_review_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('admin_log_target_media_link_id_fkey'), 'media_link', ['target_media_link_id'], ['id'])
+        batch_op.create_foreign_key(batch_op.f('admin_log_target_review_id_fkey'), 'review', ['target_review_id'], ['id'])
+
+    with op.batch_alter_table('content_flags', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('content_flags_media_link_id_fkey', type_='foreignkey')
+        batch_op.drop_constraint('content_flags_review_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('content_flags_media_link_id_fkey'), 'media_link', ['media_link_id'], ['id'])
+        batch_op.create_foreign_key(batch_op.f('content_flags_review_id_fkey'), 'review', ['review_id'], ['id'])
+
+    with op.batch_alter_table('judge_stats', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('judge_stats_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('judge_stats_judge_id_fkey'), 'judge', ['judge_id'], ['id'])
+
+    with op.batch_alter_table('media_link', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('media_link_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('media_link_judge_id_fkey'), 'judge', ['judge_id'], ['id'])
+
+    with op.batch_alter_table('review', schema=None, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint('review_judge_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(batch_op.f('review_judge_id_fkey'), 'judge', ['judge_id'], ['id'])
@@ -0,0 +1,32 @@
+"""add judge_stats media_count
+
+Revision ID: d8f2b6e4a937
+Revises: c3e7a9d2f451
+Create Date: 2026-10-18 11:05:49.276530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8f2b6e4a937'
+down_revision = 'c3e7a9d2f451'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('media_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from the media_link table, pending and rejected links included
+    op.execute("""
+        UPDATE judge_stats
+        SET media_count = (SELECT COUNT(*) FROM media_link WHERE media_link.judge_id = judge_stats.judge_id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('judge_stats', schema=None) as batch_op:
+        batch_op.drop_column('media_count')
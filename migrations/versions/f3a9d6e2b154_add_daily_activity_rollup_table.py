@@ -0,0 +1,88 @@
+"""add daily_activity rollup table
+
+Revision ID: f3a9d6e2b154
+Revises: e8b3c5d71a42
+Create Date: 2026-10-17 08:54:21.730518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9d6e2b154'
+down_revision = 'e8b3c5d71a42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_activity',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('state', sa.String(length=2), nullable=False),
+    sa.Column('is_federal', sa.Boolean(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('fairness_count', sa.Integer(), nullable=False),
+    sa.Column('bias_count', sa.Integer(), nullable=False),
+    sa.Column('temperament_count', sa.Integer(), nullable=False),
+    sa.Column('concern_count', sa.Integer(), nullable=False),
+    sa.Column('media_count', sa.Integer(), nullable=False),
+    sa.Column('verified_media_count', sa.Integer(), nullable=False),
+    sa.Column('user_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'state', 'is_federal')
+    )
+
+    # Backfill from the existing content; each row is filed under the day it was created
+    if op.get_bind().dialect.name == 'postgresql':
+        day = 'CAST({} AS DATE)'
+    else:
+        day = 'date({})'
+
+    op.execute(f"""
+        INSERT INTO daily_activity (
+            day, state, is_federal, review_count, rating_sum,
+            fairness_count, bias_count, temperament_count, concern_count,
+            media_count, verified_media_count, user_count
+        )
+        SELECT day, state, is_federal,
+               SUM(review_count), SUM(rating_sum),
+               SUM(fairness_count), SUM(bias_count), SUM(temperament_count), SUM(concern_count),
+               SUM(media_count), SUM(verified_media_count), SUM(user_count)
+        FROM (
+            SELECT {day.format('r.created_at')} AS day, j.state AS state,
+                   COALESCE(j.is_federal, FALSE) AS is_federal,
+                   1 AS review_count, r.rating AS rating_sum,
+                   CASE WHEN r.fairness_concern THEN 1 ELSE 0 END AS fairness_count,
+                   CASE WHEN r.bias_concern THEN 1 ELSE 0 END AS bias_count,
+                   CASE WHEN r.temperament_concern THEN 1 ELSE 0 END AS temperament_count,
+                   CASE WHEN r.fairness_concern OR r.bias_concern OR r.temperament_concern
+                        THEN 1 ELSE 0 END AS concern_count,
+                   0 AS media_count, 0 AS verified_media_count, 0 AS user_count
+            FROM review r
+            JOIN judge j ON j.id = r.judge_id
+            WHERE r.created_at IS NOT NULL
+
+            UNION ALL
+
+            SELECT {day.format('m.created_at')}, j.state, COALESCE(j.is_federal, FALSE),
+                   0, 0, 0, 0, 0, 0,
+                   1, CASE WHEN m.is_verified THEN 1 ELSE 0 END, 0
+            FROM media_link m
+            JOIN judge j ON j.id = m.judge_id
+            WHERE m.created_at IS NOT NULL
+
+            UNION ALL
+
+            SELECT {day.format('u.created_at')}, '', FALSE,
+                   0, 0, 0, 0, 0, 0,
+                   0, 0, 1
+            FROM "user" u
+            WHERE u.created_at IS NOT NULL
+        ) activity
+        GROUP BY day, state, is_federal
+    """)
+
+
+def downgrade():
+    op.drop_table('daily_activity')
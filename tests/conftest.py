@@ -0,0 +1,98 @@
+import os
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+
+from config import Config
+from factories import make_user
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+class TestConfig(Config):
+    SECRET_KEY = 'test'
+    # One shared in-memory connection, so the schema built by the migrations
+    # is the one the requests see
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {'poolclass': StaticPool, 'connect_args': {'check_same_thread': False}}
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    RATELIMIT_ENABLED = False
+    SESSION_COOKIE_SECURE = False
+    MAIL_SUPPRESS_SEND = True
+    PAGE_CACHE_BACKEND = 'none'
+
+
+@pytest.fixture
+def app():
+    from flask_migrate import upgrade
+    from app import create_app, db
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        # Build the schema the way deployments do, including the SQLite
+        # full-text table and triggers that only the migrations create
+        upgrade(directory=MIGRATIONS_DIR)
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+class StatementCounter:
+    """Counts statements sent to the database while active"""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_statements(app):
+    """
+    Context manager counting the SQL statements executed inside it, for
+    query-budget assertions:
+
+        with count_statements() as counter:
+            client.get('/admin/flags')
+        assert counter.count <= 4
+    """
+    from app import db
+
+    @contextmanager
+    def counting():
+        counter = StatementCounter()
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            counter.statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    return counting
+
+
+@pytest.fixture
+def admin(app):
+    from app import db
+
+    user = make_user('admin', is_admin=True)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def admin_client(client, admin):
+    client.post('/login', data={'username': 'admin', 'password': 'password1'})
+    return client
@@ -0,0 +1,60 @@
+"""Helpers creating rows for tests; each adds to the session without committing"""
+from datetime import date
+
+
+def make_user(username, is_admin=False, password='password1'):
+    from app import db
+    from app.models import User
+
+    user = User(username=username, email=f'{username}@example.com', is_admin=is_admin)
+    user.set_password(password)
+    db.session.add(user)
+    db.session.flush()
+    return user
+
+
+def make_judge(index, state='AL', court='Alabama Supreme Court', **kwargs):
+    from app import db
+    from app.models import Judge
+
+    values = dict(first_name=f'First{index}', last_name=f'Last{index:03d}', court=court, city='Mobile',
+                  state=state, is_federal=False, is_retired=False)
+    values.update(kwargs)
+    judge = Judge(**values)
+    db.session.add(judge)
+    db.session.flush()
+    return judge
+
+
+def make_review(judge, user=None, rating=3, **concerns):
+    from app import db
+    from app.models import Review
+
+    review = Review(judge_id=judge.id, user_id=user.id if user else None, rating=rating,
+                    fairness_concern=concerns.get('fairness', False), bias_concern=concerns.get('bias', False),
+                    temperament_concern=concerns.get('temperament', False),
+                    review_text='A review long enough to pass validation.', court_date=date(2025, 1, 1))
+    db.session.add(review)
+    return review
+
+
+def make_media_link(judge, user=None, verified=True, index=0):
+    from app import db
+    from app.models import MediaLink
+
+    media_link = MediaLink(judge_id=judge.id, user_id=user.id if user else None, headline='Headline',
+                           news_source='Source', url=f'https://news.example.com/{judge.id}/{index}',
+                           publication_date=date(2025, 1, 1), summary='A summary long enough to pass.',
+                           is_verified=verified)
+    db.session.add(media_link)
+    return media_link
+
+
+def make_flag(user, review=None, media_link=None, flag_type='spam'):
+    from app import db
+    from app.models import ContentFlag
+
+    flag = ContentFlag(user_id=user.id, review_id=review.id if review else None,
+                       media_link_id=media_link.id if media_link else None, flag_type=flag_type)
+    db.session.add(flag)
+    return flag
@@ -0,0 +1,62 @@
+from sqlalchemy import event
+
+from app import db
+from app.models import AdminLog, ContentFlag, Review
+from factories import make_flag, make_judge, make_review, make_user
+
+
+def _seed():
+    author = make_user('author')
+    review = make_review(make_judge(0), author)
+    db.session.flush()
+    flag = make_flag(make_user('flagger'), review=review)
+    db.session.commit()
+    return review.id, flag.id
+
+
+def _count_commits(admin_client, url):
+    commits = []
+
+    def after_commit(session):
+        commits.append(session)
+
+    event.listen(db.session, 'after_commit', after_commit)
+    try:
+        response = admin_client.post(url)
+    finally:
+        event.remove(db.session, 'after_commit', after_commit)
+    assert response.status_code == 302
+    return len(commits)
+
+
+def test_delete_review_commits_once_with_its_log_entry(admin_client):
+    review_id, _ = _seed()
+
+    assert _count_commits(admin_client, f'/admin/delete_review/{review_id}') == 1
+    assert db.session.get(Review, review_id) is None
+    entry = AdminLog.query.filter_by(action_type='delete_review').one()
+    # The target was deleted in the same transaction
+    assert entry.target_review_id is None
+    assert entry.target_user_id is not None
+
+
+def test_dismiss_flag_commits_once_with_its_log_entry(admin_client):
+    _, flag_id = _seed()
+
+    assert _count_commits(admin_client, f'/admin/flag/{flag_id}/dismiss') == 1
+    assert db.session.get(ContentFlag, flag_id).is_resolved
+    assert AdminLog.query.filter_by(action_type='dismiss_flag').count() == 1
+
+
+def test_rolled_back_action_discards_its_log_entry(app, admin):
+    review_id, _ = _seed()
+    review = db.session.get(Review, review_id)
+
+    AdminLog.log_action(admin_user=admin, action_type='delete_review', target_review=review)
+    db.session.rollback()
+    db.session.commit()
+    assert AdminLog.query.count() == 0
+
+    AdminLog.log_action(admin_user=admin, action_type='edit_content', target_review=review)
+    db.session.commit()
+    assert AdminLog.query.one().target_review_id == review_id
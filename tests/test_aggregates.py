@@ -0,0 +1,57 @@
+from app import db
+from app.models import JudgeStats
+from factories import make_judge, make_media_link, make_review
+
+
+def test_judge_stats_refresh_locks_the_judge_before_counting(app, count_statements):
+    judge = make_judge(0)
+    make_review(judge, rating=4, bias=True)
+    make_media_link(judge, verified=False)
+    db.session.flush()
+
+    with count_statements() as counter:
+        stats = JudgeStats.refresh(judge.id)
+        db.session.commit()
+
+    # On PostgreSQL this is SELECT ... FOR NO KEY UPDATE; the counts that
+    # follow then see any refresh for the same judge that committed first
+    assert counter.statements[0].startswith('SELECT judge.id')
+    assert (stats.review_count, stats.rating_sum, stats.bias_count) == (1, 4, 1)
+    assert (stats.verified_media_count, stats.media_count) == (0, 1)
+
+
+def test_judge_stats_refresh_updates_the_existing_row(app):
+    judge = make_judge(0)
+    JudgeStats.refresh(judge.id)
+    db.session.commit()
+
+    make_review(judge, rating=2)
+    make_review(judge, rating=5)
+    db.session.flush()
+    JudgeStats.refresh(judge.id)
+    db.session.commit()
+
+    stats = JudgeStats.query.one()
+    assert (stats.review_count, stats.rating_sum, stats.avg_rating) == (2, 7, 3.5)
+
+
+def test_user_stats_refresh_locks_the_users_before_counting(app, count_statements):
+    from app.models import UserStats
+    from factories import make_user
+
+    judge = make_judge(0)
+    first, second = make_user('first'), make_user('second')
+    make_review(judge, first)
+    make_review(judge, first)
+    db.session.flush()
+
+    with count_statements() as counter:
+        UserStats.refresh(second.id, first.id, None)
+        db.session.commit()
+
+    # Users are locked in id order, so two refreshes over the same users
+    # can't wait on each other
+    assert counter.statements[0].startswith('SELECT user.id')
+    assert 'ORDER BY user.id' in counter.statements[0]
+    counts = dict(db.session.query(UserStats.user_id, UserStats.review_count))
+    assert counts == {first.id: 2, second.id: 0}
@@ -0,0 +1,94 @@
+from app import db
+from app.models import User, BannedUser, AdminLog, ContentFlag, Review, StatisticsSnapshot
+from factories import make_flag, make_judge, make_review, make_user
+
+
+def _user_ids(prefix, count):
+    user_ids = [make_user(f'{prefix}{index}').id for index in range(count)]
+    db.session.commit()
+    return user_ids
+
+
+def _bulk(admin_client, action, user_ids, **form):
+    data = dict(form, bulk_action=action)
+    data['user_ids[]'] = [str(user_id) for user_id in user_ids]
+    return admin_client.post('/admin/users/bulk', data=data)
+
+
+def test_bulk_ban_statement_budget_is_independent_of_user_count(admin_client, count_statements, monkeypatch):
+    import app.email_utils
+    sent = []
+    monkeypatch.setattr(app.email_utils, 'send_emails', sent.extend)
+
+    few, many = _user_ids('few', 2), _user_ids('many', 12)
+    with count_statements() as small:
+        _bulk(admin_client, 'ban', few, bulk_ban_reason='Spam')
+    with count_statements() as large:
+        _bulk(admin_client, 'ban', many, bulk_ban_reason='Spam')
+
+    assert small.count == large.count
+    assert User.query.filter_by(is_banned=True).count() == 14
+    assert BannedUser.query.count() == 14
+    assert AdminLog.query.filter_by(action_type='ban_user').count() == 14
+    # Notifications go out as one batch after the commit
+    assert sorted(recipient for _, recipient, _ in sent)[:2] == ['few0@example.com', 'few1@example.com']
+    assert len(sent) == 14
+
+
+def test_bulk_delete_clears_every_reference_to_the_users(app, admin_client, admin):
+    # Enforce foreign keys as PostgreSQL does (off by default in SQLite)
+    db.session.execute(db.text('PRAGMA foreign_keys = ON'))
+
+    # A demoted admin who banned someone, resolved a flag, wrote a log entry
+    # and refreshed the statistics, and who also flagged content themselves
+    former = make_user('former')
+    victim = make_user('victim')
+    review = make_review(make_judge(0), victim)
+    db.session.flush()
+    victim.ban(former, 'Spam')
+    resolved = make_flag(former, review=review)
+    resolved.is_resolved, resolved.resolved_by_id = True, former.id
+    resolved.resolution_action, resolved.resolved_at = 'dismissed', db.func.now()
+    AdminLog.log_action(admin_user=former, action_type='ban_user', target_user=victim, details='Banned')
+    db.session.add(StatisticsSnapshot(schema_version=1, computed_by_id=former.id, data={}))
+    db.session.commit()
+
+    response = _bulk(admin_client, 'delete', [former.id], bulk_delete_reason='Cleanup')
+    assert response.status_code == 302
+
+    db.session.expire_all()
+    assert db.session.get(User, former.id) is None
+    flag = db.session.get(ContentFlag, resolved.id)
+    assert (flag.user_id, flag.resolved_by_id) == (None, None)
+    assert db.session.get(User, victim.id).banned_by_id is None
+    assert BannedUser.query.filter_by(username='victim').one().banned_by_id is None
+    assert AdminLog.query.filter_by(details='Banned').one().admin_id is None
+    assert StatisticsSnapshot.query.one().computed_by_id is None
+    # The moderation queue still renders flags whose reporter is gone
+    assert 'Deleted user' in admin_client.get('/admin/flags?show_resolved=true').get_data(as_text=True)
+
+
+def test_single_delete_clears_references_like_bulk_delete(app, admin_client, admin):
+    from app.models import DailyActivity
+
+    db.session.execute(db.text('PRAGMA foreign_keys = ON'))
+    member = make_user('member')
+    DailyActivity.record_user(member)
+    review = make_review(make_judge(0), member)
+    db.session.flush()
+    flag = make_flag(member, review=review)
+    AdminLog.log_action(admin_user=admin, action_type='add_admin_note', target_user=member, details='Noted')
+    db.session.commit()
+    member_id, flag_id, review_id = member.id, flag.id, review.id
+
+    response = admin_client.post(f'/admin/user/{member_id}/delete', data={'delete_reason': 'Spam'})
+    assert response.status_code == 302
+
+    db.session.expire_all()
+    assert db.session.get(User, member_id) is None
+    assert db.session.get(ContentFlag, flag_id).user_id is None
+    assert db.session.get(Review, review_id).user_id is None
+    assert AdminLog.query.filter_by(details='Noted').one().target_user_id is None
+    assert AdminLog.query.filter_by(action_type='delete_user').one().details == 'Deleted user member (member@example.com)'
+    assert BannedUser.query.filter_by(username='member', ban_reason='Spam').count() == 1
+    assert db.session.query(db.func.sum(DailyActivity.user_count)).scalar() == 0
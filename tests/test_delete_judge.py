@@ -0,0 +1,65 @@
+from app import db
+from app.models import AdminLog, ContentFlag, DailyActivity, Judge, JudgeStats, MediaLink, Review, UserStats
+from app.moderation import delete_judge
+from factories import make_flag, make_judge, make_media_link, make_review, make_user
+
+
+def _seed(index, reviews, media_links, author, flagger, admin):
+    # A judge whose content is counted, flagged and referenced from the log,
+    # as the submission and moderation handlers leave it
+    judge = make_judge(index, state='AK' if index else 'AL')
+    for _ in range(reviews):
+        DailyActivity.record_review(make_review(judge, author, fairness=True), judge)
+    for link in range(media_links):
+        DailyActivity.record_media_link(make_media_link(judge, author, index=link), judge)
+    db.session.flush()
+    for review in Review.query.filter_by(judge_id=judge.id):
+        make_flag(flagger, review=review)
+        AdminLog.log_action(admin_user=admin, action_type='edit_content', target_review=review)
+    for media_link in MediaLink.query.filter_by(judge_id=judge.id):
+        make_flag(flagger, media_link=media_link)
+        AdminLog.log_action(admin_user=admin, action_type='approve_media_link', target_media_link=media_link)
+    JudgeStats.refresh(judge.id)
+    UserStats.refresh(author.id)
+    db.session.commit()
+    return judge
+
+
+def test_delete_judge_statement_count_is_independent_of_content(app, admin, count_statements):
+    author, flagger = make_user('author'), make_user('flagger')
+    small = _seed(0, 1, 1, author, flagger, admin)
+    large = _seed(1, 25, 10, author, flagger, admin)
+
+    with count_statements() as small_count:
+        delete_judge(admin, small)
+        db.session.commit()
+    with count_statements() as large_count:
+        delete_judge(admin, large)
+        db.session.commit()
+
+    assert small_count.count == large_count.count
+
+
+def test_delete_judge_removes_content_and_its_counts(app, admin):
+    author, flagger = make_user('author'), make_user('flagger')
+    kept = _seed(0, 2, 1, author, flagger, admin)
+    deleted = _seed(1, 3, 2, author, flagger, admin)
+    deleted_id = deleted.id
+
+    delete_judge(admin, deleted)
+    db.session.commit()
+
+    assert db.session.get(Judge, deleted_id) is None
+    assert db.session.get(JudgeStats, deleted_id) is None
+    assert Review.query.count() == 2 and MediaLink.query.count() == 1
+    assert ContentFlag.query.count() == 3
+    assert db.session.get(UserStats, author.id).review_count == 2
+    # Log rows about the deleted content stay, without their targets
+    assert AdminLog.query.filter_by(action_type='edit_content', target_review_id=None).count() == 3
+    assert AdminLog.query.filter_by(action_type='delete_judge').count() == 1
+
+    totals = {state: (review_count, media_count) for state, review_count, media_count in db.session.query(
+        DailyActivity.state, db.func.sum(DailyActivity.review_count), db.func.sum(DailyActivity.media_count)
+    ).group_by(DailyActivity.state)}
+    assert totals == {'AL': (2, 1), 'AK': (0, 0)}
+    assert db.session.get(Judge, kept.id) is not None
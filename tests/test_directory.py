@@ -0,0 +1,47 @@
+from factories import make_judge, make_review
+
+
+def _seed():
+    from app import db
+    from app.models import JudgeStats
+
+    judges = [make_judge(index) for index in range(3)]
+    for judge in judges:
+        JudgeStats.refresh(judge.id)
+    db.session.commit()
+    return judges
+
+
+def test_directory_version_reads_indexes(app):
+    from app import db
+    from app.routes import _directory_version
+
+    _seed()
+    plans = []
+    for statement in ('SELECT max(updated_at) FROM judge_stats',
+                      "SELECT max(id) FROM admin_log WHERE action_type = 'delete_judge'"):
+        plans.extend(row[-1] for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {statement}')))
+    assert not [plan for plan in plans if plan.startswith('SCAN')], plans
+    assert _directory_version()[1] is not None
+
+
+def test_directory_etag_changes_on_content_change_and_judge_deletion(client, admin):
+    from app import db
+    from app.models import JudgeStats
+    from app.moderation import delete_judge
+
+    judges = _seed()
+    etag = client.get('/directory').headers['ETag']
+    assert client.get('/directory').headers['ETag'] == etag
+
+    make_review(judges[0])
+    db.session.flush()
+    JudgeStats.refresh(judges[0].id)
+    db.session.commit()
+    reviewed = client.get('/directory').headers['ETag']
+    assert reviewed != etag
+
+    # Deleting a judge that is not the most recently updated one
+    delete_judge(admin, judges[1])
+    db.session.commit()
+    assert client.get('/directory').headers['ETag'] != reviewed
@@ -0,0 +1,31 @@
+import csv
+import io
+
+from app import db
+from app.exports import export_chunks
+from factories import make_judge, make_review, make_user
+
+
+def _export(dataset):
+    return list(csv.reader(io.StringIO(''.join(export_chunks(dataset, 'csv')))))
+
+
+def test_csv_export_neutralizes_formulas(app):
+    user = make_user('@author')
+    judge = make_judge(0, first_name='=cmd')
+    review = make_review(judge, user)
+    review.review_text = '+SUM(1,2) and a review long enough'
+    db.session.flush()
+    make_review(make_judge(1), rating=-1).review_text = '\tTabbed'
+    db.session.commit()
+
+    header, first, second = _export('reviews')
+    row = dict(zip(header, first))
+    assert row['judge_name'] == "'=cmd Last000"
+    assert row['username'] == "'@author"
+    assert row['review_text'] == "'+SUM(1,2) and a review long enough"
+    # Numbers are written as they are; only text is prefixed
+    second = dict(zip(header, second))
+    assert second['rating'] == '-1'
+    assert second['review_text'] == "'\tTabbed"
+    assert second['username'] == ''
@@ -0,0 +1,49 @@
+from app import db
+from app.geography import geographic_rollup
+from app.models import JudgeStats
+from factories import make_judge, make_media_link, make_review
+
+
+def _seed():
+    # Two courts in AL, one judge in AK, and an AL judge with no content yet
+    courts = [('AL', 'Alabama Supreme Court'), ('AL', 'Mobile County Court'), ('AK', 'Alaska Supreme Court')]
+    for index, (state, court) in enumerate(courts):
+        judge = make_judge(index, state=state, court=court)
+        for rating in (2, 4, 5):
+            make_review(judge, rating=rating)
+        make_media_link(judge, verified=True, index=0)
+        make_media_link(judge, verified=True, index=1)
+        make_media_link(judge, verified=False, index=2)
+        db.session.flush()
+        JudgeStats.refresh(judge.id)
+    make_judge(3, state='AL')
+    db.session.commit()
+
+
+def test_state_rollup_does_not_multiply_reviews_by_media(app):
+    _seed()
+    rows = {row.state: row for row in geographic_rollup()}
+
+    assert rows['AL'].judge_count == 3
+    assert rows['AL'].review_count == 6
+    assert rows['AL'].media_count == 4
+    assert round(rows['AL'].avg_rating, 2) == round(11 / 3, 2)
+    assert (rows['AK'].judge_count, rows['AK'].review_count, rows['AK'].media_count) == (1, 3, 2)
+
+
+def test_rollup_counts_unverified_media_for_admin_statistics(app):
+    _seed()
+    rows = {row.state: row for row in geographic_rollup(verified_only=False)}
+    assert rows['AL'].media_count == 6
+
+
+def test_court_rollup_for_one_state(app, count_statements):
+    _seed()
+    with count_statements() as counter:
+        rows = geographic_rollup(by_court=True, state='AL')
+
+    assert counter.count == 1
+    assert [(row.court, row.judge_count, row.review_count) for row in rows] == [
+        ('Alabama Supreme Court', 2, 3), ('Mobile County Court', 1, 3)
+    ]
+    assert rows[0].avg_rating == 11 / 3
@@ -0,0 +1,70 @@
+import re
+
+from app import db
+from app.models import UserStats
+from factories import make_judge, make_review, make_user
+
+
+def _user_ids(html):
+    ids = []
+    for user_id in re.findall(r'href="/admin/user/(\d+)"', html):
+        if int(user_id) not in ids:
+            ids.append(int(user_id))
+    return ids
+
+
+def _next_link(html):
+    match = re.search(r'href="([^"]*after=[^"]*)"', html)
+    return match.group(1).replace('&amp;', '&') if match else None
+
+
+def _seed(admin):
+    # Review counts 0-2 repeat, so the sort has ties across page boundaries
+    judge = make_judge(0)
+    users = [make_user(f'member{index:02d}') for index in range(12)]
+    for index, user in enumerate(users):
+        for _ in range(index % 3):
+            make_review(judge, user)
+    db.session.flush()
+    UserStats.refresh(*[user.id for user in users])
+    db.session.commit()
+    return {user.id: index % 3 for index, user in enumerate(users)} | {admin.id: 0}
+
+
+def _walk(admin_client, count_statements, url):
+    seen, statements = [], []
+    while url:
+        with count_statements() as counter:
+            html = admin_client.get(url).get_data(as_text=True)
+        statements.append(counter.count)
+        seen.extend(_user_ids(html))
+        url = _next_link(html)
+    return seen, statements
+
+
+def test_user_list_pages_in_review_order(admin, admin_client, count_statements, monkeypatch):
+    from app import auth
+
+    monkeypatch.setattr(auth, 'USERS_PER_PAGE', 5)
+    review_counts = _seed(admin)
+
+    seen, statements = _walk(admin_client, count_statements, '/admin/users?sort_by=reviews_desc')
+
+    assert sorted(seen) == sorted(review_counts)
+    assert len(seen) == len(set(seen))
+    assert [review_counts[user_id] for user_id in seen] == sorted(review_counts.values(), reverse=True)
+    # Every page is the login lookup plus one query, however deep
+    assert len(statements) == 3 and len(set(statements)) == 1
+    assert statements[0] <= 2
+
+
+def test_user_list_filters_carry_onto_later_pages(admin, admin_client, count_statements, monkeypatch):
+    from app import auth
+
+    monkeypatch.setattr(auth, 'USERS_PER_PAGE', 5)
+    _seed(admin)
+
+    seen, _ = _walk(admin_client, count_statements, '/admin/users?search_query=member&sort_by=username_desc')
+    assert len(seen) == 12
+    assert admin.id not in seen
+    assert seen == sorted(seen, reverse=True)
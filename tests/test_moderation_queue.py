@@ -0,0 +1,51 @@
+import re
+
+from factories import make_flag, make_judge, make_media_link, make_review, make_user
+
+# Login lookup, flags page with flaggers and resolvers, then the flagged
+# reviews and media links batched by id
+QUEUE_STATEMENT_BUDGET = 4
+
+
+def _seed(first, count):
+    # count judges, each with a flagged review and a flagged media link
+    from app import db
+
+    flagger = make_user(f'flagger{first}')
+    author = make_user(f'author{first}')
+    for index in range(first, first + count):
+        judge = make_judge(index)
+        review = make_review(judge, author)
+        media_link = make_media_link(judge, author)
+        db.session.flush()
+        make_flag(flagger, review=review)
+        make_flag(flagger, media_link=media_link)
+    db.session.commit()
+
+
+def _queue_statements(admin_client, count_statements, url='/admin/flags'):
+    with count_statements() as counter:
+        response = admin_client.get(url)
+    assert response.status_code == 200
+    return counter.count, response.get_data(as_text=True)
+
+
+def test_queue_statement_budget_is_independent_of_flag_count(admin_client, count_statements):
+    _seed(0, 2)
+    small, _ = _queue_statements(admin_client, count_statements)
+
+    _seed(2, 40)
+    large, _ = _queue_statements(admin_client, count_statements)
+
+    assert small == large
+    assert large <= QUEUE_STATEMENT_BUDGET
+
+
+def test_queue_later_pages_keep_the_budget(admin_client, count_statements):
+    _seed(0, 40)
+    _, html = _queue_statements(admin_client, count_statements)
+    next_link = re.search(r'href="([^"]*after=[^"]*)"', html).group(1).replace('&amp;', '&')
+
+    statements, html = _queue_statements(admin_client, count_statements, next_link)
+    assert statements <= QUEUE_STATEMENT_BUDGET
+    assert 'Last039' not in html and 'Last000' in html
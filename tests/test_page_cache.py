@@ -0,0 +1,49 @@
+from factories import make_judge, make_review
+
+REVIEW_TEXT = 'A review long enough to pass validation.'
+
+
+def _seed_judge():
+    from app import db
+    from app.models import JudgeStats
+
+    judge = make_judge(0)
+    JudgeStats.refresh(judge.id)
+    db.session.commit()
+    return judge
+
+
+def test_judge_page_is_served_from_cache(client, monkeypatch, count_statements):
+    from app import page_cache
+    from app.page_cache import LRUPageCache
+
+    monkeypatch.setattr(page_cache, 'backend', LRUPageCache())
+    judge = _seed_judge()
+
+    client.get(f'/judge/{judge.id}')
+    with count_statements() as counter:
+        response = client.get(f'/judge/{judge.id}')
+
+    assert response.status_code == 200
+    assert page_cache.stats()['hits'] == 1
+    # Only the judge_stats version lookup
+    assert counter.count == 1
+
+
+def test_stale_entry_is_not_served_without_invalidation(client, monkeypatch):
+    # A write handled by another worker refreshes judge_stats but cannot
+    # invalidate this worker's memory cache
+    from app import db, page_cache
+    from app.models import JudgeStats
+    from app.page_cache import LRUPageCache
+
+    monkeypatch.setattr(page_cache, 'backend', LRUPageCache())
+    judge = _seed_judge()
+    assert REVIEW_TEXT not in client.get(f'/judge/{judge.id}').get_data(as_text=True)
+
+    make_review(judge)
+    db.session.flush()
+    JudgeStats.refresh(judge.id)
+    db.session.commit()
+
+    assert REVIEW_TEXT in client.get(f'/judge/{judge.id}').get_data(as_text=True)
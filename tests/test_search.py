@@ -0,0 +1,55 @@
+import re
+
+from sqlalchemy.dialects import postgresql
+
+from factories import make_judge
+
+
+def _judge_ids(html):
+    # Judge links in page order, each once; /judge/0 is the suggestion template
+    ids = []
+    for judge_id in re.findall(r'href="/judge/(\d+)"', html):
+        if judge_id != '0' and int(judge_id) not in ids:
+            ids.append(int(judge_id))
+    return ids
+
+
+def _next_link(html):
+    match = re.search(r'href="([^"]*after=[^"]*)"', html)
+    return match.group(1).replace('&amp;', '&') if match else None
+
+
+def test_postgres_rank_compares_in_double_precision(app):
+    from app import db
+    from app.models import Judge
+    from app.search import _postgres_search
+
+    _, rank = _postgres_search(db.session.query(Judge), 'alabama', ['alabama'])
+    sql = str(rank.compile(dialect=postgresql.dialect()))
+    assert 'CAST(' in sql and 'AS FLOAT(53))' in sql
+
+
+def test_best_match_pages_through_tied_ranks(app, client, monkeypatch):
+    from app import db, routes
+
+    monkeypatch.setattr(routes, 'JUDGES_PER_PAGE', 7)
+    # Documents of the same length matching the term once, so every match
+    # has the same rank
+    judges = [make_judge(index) for index in range(30)]
+    db.session.commit()
+    ranks = db.session.execute(db.text(
+        "SELECT DISTINCT bm25(judge_fts) FROM judge_fts WHERE judge_fts MATCH 'alabama'"
+    )).scalars().all()
+    assert len(ranks) == 1
+
+    seen = []
+    url = '/index?search_query=alabama&sort_by=relevance'
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        page = _judge_ids(html)
+        assert page, url
+        seen.extend(page)
+        url = _next_link(html)
+
+    assert sorted(seen) == sorted(judge.id for judge in judges)
+    assert len(seen) == len(set(seen))
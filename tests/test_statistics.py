@@ -0,0 +1,58 @@
+from app import db
+from app.models import JudgeStats
+from app.statistics import compute_snapshot
+from factories import make_user, make_judge, make_review, make_media_link
+
+# Statements one snapshot may take: reviews (joined to judges), judges, media
+# links, users, the geographic rollup and the two monthly trend series
+SNAPSHOT_STATEMENT_BUDGET = 7
+
+
+def _seed(first, judges, reviews_per_judge, media_per_judge):
+    users = [make_user(f'user{first}_{i}') for i in range(reviews_per_judge)]
+    for j in range(first, first + judges):
+        judge = make_judge(j, state='AL' if j % 2 else 'AK', is_federal=j % 3 == 0)
+        for k in range(reviews_per_judge):
+            make_review(judge, users[k], rating=k % 5 + 1, fairness=k % 2 == 0, bias=k % 3 == 0)
+        for k in range(media_per_judge):
+            make_media_link(judge, users[0], verified=k % 2 == 0, index=k)
+        db.session.flush()
+        JudgeStats.refresh(judge.id)
+    db.session.commit()
+
+
+def test_snapshot_statement_budget_is_independent_of_data(app, count_statements):
+    _seed(0, judges=2, reviews_per_judge=1, media_per_judge=1)
+    with count_statements() as small:
+        compute_snapshot()
+
+    _seed(2, judges=30, reviews_per_judge=4, media_per_judge=3)
+    with count_statements() as large:
+        compute_snapshot()
+
+    assert small.count == large.count
+    assert large.count <= SNAPSHOT_STATEMENT_BUDGET
+
+
+def test_snapshot_counts(app):
+    _seed(0, judges=4, reviews_per_judge=3, media_per_judge=2)
+    data = compute_snapshot()
+
+    assert data['total_reviews'] == 12
+    assert data['total_media_links'] == 8
+    assert data['pending_verifications'] == 4
+    assert data['concern_breakdown'] == {'fairness': 8, 'bias': 4, 'temperament': 0}
+    assert data['rating_distribution'] == {1: 4, 2: 4, 3: 4, 4: 0, 5: 0}
+    assert sorted(row[:3] for row in data['judges_by_state']) == [['AK', 2, 6], ['AL', 2, 6]]
+
+
+def test_statistics_page_statement_budget(admin_client, count_statements):
+    _seed(0, judges=10, reviews_per_judge=3, media_per_judge=2)
+    admin_client.get('/admin/statistics')  # computes the first snapshot
+
+    with count_statements() as counter:
+        response = admin_client.get('/admin/statistics')
+
+    assert response.status_code == 200
+    # Current user, latest snapshot, six leaderboards and two growth-metric queries
+    assert counter.count <= 10